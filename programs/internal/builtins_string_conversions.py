@@ -174,5 +174,17 @@ nums = [10, 20, 30]
 for n in nums:
     print(bin(n), hex(n), oct(n))
 
+# Parsing with and without a base prefix
+print("int parsing:")
+print(int("0"), int("7"), int("1234567"), int("-98765"))
+print(int("0X1F", 16), int("1f", 16), int("0B101", 2), int("0O17", 8))
+print(int("0x10", 16) + int("010") + int("0", 8))
+print(int("zz", 36), int("-0b11", 2))
+print(int("DeadBeef", 16) - int("deadbeef", 16), int("Zz", 36), int("777", 8))
+print(int("10", 2), int("10", 3), int("a", 11), int("Z", 36), int("09", 10))
+print(int("0b1", 16), int("0x1", 36), int("0o7", 36), int("0B11", 16), int("-0O17", 8))
+print(int("12345678"), int("123456789"), int("-987654321"), int("1000000000"))
+print(int("0000000000000042"), int("-00000007"), int("1073741823") - int("73741823"))
+
 
 print("builtins_string_conversions tests done")
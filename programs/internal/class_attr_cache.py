@@ -0,0 +1,245 @@
+"""Test attribute and method lookups that hit, miss and invalidate the inline cache."""
+
+from __future__ import annotations
+
+
+class Base:
+    kind = "base"
+    def hello(self):
+        return "base hello " + self.name
+    @property
+    def upper(self):
+        return self.name.upper()
+
+class Child(Base):
+    def hello(self):
+        return "child hello " + self.name
+
+class Other:
+    def hello(self):
+        return "other"
+
+def greet(o):
+    return o.hello()
+
+objs = []
+for n in ["a", "b"]:
+    b = Base()
+    b.name = n
+    objs.append(b)
+c = Child()
+c.name = "c"
+objs.append(c)
+objs.append(Other())
+for o in objs:
+    print(greet(o))
+    print(greet(o))
+for o in objs[:3]:
+    print(o.kind, o.upper)
+Base.kind = "changed"
+for o in objs[:3]:
+    print(o.kind)
+c.kind = "mine"
+for o in objs[:3]:
+    print(o.kind)
+Base.hello = Other.hello
+print(greet(objs[0]), greet(c))
+
+
+
+# Many attributes: the per-instance table has to grow several times
+class Bag:
+    pass
+
+
+bag = Bag()
+names = ["a", "b", "c", "d", "e", "f", "g", "h", "i", "j", "k", "l", "m", "n"]
+i = 0
+for n in names:
+    setattr(bag, n, i)
+    i += 1
+print(bag.a, bag.g, bag.n)
+bag.g = 100
+print(bag.g)
+del bag.b
+print(getattr(bag, "c"), hasattr(bag, "n"))
+
+# __init__ / __delitem__ come from per-class slots, refreshed on rebinding
+class Counter:
+    def __init__(self, start):
+        self.value = start
+
+    def __delitem__(self, key):
+        print("del", key, self.value)
+
+
+class SubCounter(Counter):
+    pass
+
+
+def double_init(self, start):
+    self.value = start * 2
+
+
+a = SubCounter(5)
+print(a.value)
+del a[1]
+Counter.__init__ = double_init
+b = SubCounter(5)
+print(b.value)
+del b["x"]
+
+# Implicit dunder calls resolve on the class, including inherited ones
+class Sized:
+    def __len__(self):
+        return 3
+
+    def __eq__(self, other):
+        return len(self) == len(other)
+
+    def __str__(self):
+        return "Sized"
+
+
+class MoreSized(Sized):
+    pass
+
+
+m = MoreSized()
+print(len(m), m == Sized(), str(m))
+
+
+# Class receivers: class names and cls in classmethods
+class Unit:
+    symbol = "u"
+
+    @classmethod
+    def describe(cls):
+        return cls.symbol + "!"
+
+
+class Meter(Unit):
+    symbol = "m"
+
+
+for _ in range(2):
+    print(Unit.describe(), Meter.describe(), Unit.symbol, Meter.symbol)
+Meter.symbol = "M"
+print(Unit.describe(), Meter.describe(), Meter.symbol)
+
+# Inherited lookups see later changes to a base class
+class Kilometer(Meter):
+    pass
+
+
+k = Kilometer()
+print(k.describe(), Kilometer.symbol)
+Unit.symbol = "U"
+Meter.factor = 1000
+print(k.describe(), Kilometer.factor, k.factor, Unit.describe())
+
+# Method call sites cache how the method is called (plain/static/class)
+class Shape:
+    label = "Shape"
+
+    def area(self):
+        return 0
+
+    @staticmethod
+    def kind():
+        return "shape"
+
+    @classmethod
+    def name(cls):
+        return cls.label
+
+
+class Square(Shape):
+    label = "Square"
+
+    def __init__(self, side):
+        self.side = side
+
+    def area(self):
+        return self.side * self.side
+
+
+for shape in [Shape(), Square(3), Square(4), Shape()]:
+    print(shape.area(), shape.kind(), shape.name())
+
+
+def triple_area(self):
+    return 3 * self.side * self.side
+
+
+sq = Square(2)
+print(sq.area())
+Square.area = triple_area
+print(sq.area())
+sq.area = lambda: -1
+print(sq.area(), Square(2).area())
+
+# Polymorphic call sites: more receiver classes than cache entries
+class Circle(Shape):
+    label = "Circle"
+
+    def area(self):
+        return 7
+
+
+class Dot(Shape):
+    label = "Dot"
+
+    @staticmethod
+    def area():
+        return -2
+
+
+class Blob(Shape):
+    label = "Blob"
+
+    @classmethod
+    def area(cls):
+        return len(cls.label)
+
+
+shapes = [Shape(), Square(2), Circle(), Dot(), Blob(), Circle(), Square(5)]
+for _ in range(3):
+    print([s.area() for s in shapes], [s.name() for s in shapes])
+Circle.area = lambda self: 8
+print([s.area() for s in shapes])
+
+# Nested and recursive calls through the same sites, next to methods that
+# keep their args around in a closure
+class Walker:
+    def __init__(self, step):
+        self.step = step
+
+    def plus(self, a, b):
+        return a + b + self.step
+
+    def depth(self, n):
+        if n == 0:
+            return 0
+        return self.plus(self.depth(n - 1), self.plus(n, 0))
+
+    def adder(self, a):
+        return lambda b: a + b + self.step
+
+    def collect(self, items):
+        out = []
+        for item in items:
+            out.append(self.plus(item, self.depth(item)))
+        return out
+
+
+w = Walker(1)
+v = Walker(10)
+print(w.plus(w.plus(1, 2), v.plus(3, 4)))
+print(w.depth(5), v.depth(3))
+f = w.adder(5)
+g = v.adder(6)
+print(f(1), g(1), w.plus(f(2), g(2)))
+print(w.collect([1, 2, 3]), v.collect([4]))
+
+print("class_attr_cache tests done")
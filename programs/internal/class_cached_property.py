@@ -0,0 +1,65 @@
+"""Test functools.cached_property."""
+
+from __future__ import annotations
+
+from functools import cached_property
+
+
+class Circle:
+    def __init__(self, radius):
+        self.radius = radius
+        self.calls = 0
+
+    @cached_property
+    def area(self):
+        self.calls += 1
+        return self.radius * self.radius * 3
+
+    @property
+    def diameter(self):
+        return self.radius * 2
+
+
+c = Circle(2)
+print(c.area)  # 12
+print(c.area)  # 12 (cached)
+print(c.calls)  # 1
+
+# The cache is per instance
+d = Circle(3)
+print(d.area, c.area)  # 27 12
+print(d.calls, c.calls)  # 1 1
+
+# The cached value does not follow later changes
+c.radius = 10
+print(c.area, c.diameter)  # 12 20
+
+# Assigning overrides the cached value
+c.area = 99
+print(c.area)  # 99
+print(c.calls)  # 1
+
+
+# Cached property reading other properties
+class Rect:
+    def __init__(self, w, h):
+        self._w = w
+        self._h = h
+
+    @property
+    def width(self):
+        return self._w
+
+    @cached_property
+    def area(self):
+        return self.width * self._h
+
+
+rects = [Rect(1, 2), Rect(3, 4)]
+total = 0
+for _ in range(3):
+    for r in rects:
+        total += r.area
+print(total)  # 42
+
+print("class_cached_property tests done")
@@ -99,4 +99,40 @@ except AttributeError:
     print("AttributeError: can't set")
 
 
+# Properties whose accessors read other properties (nested accessor calls)
+class Box:
+    def __init__(self, w, h):
+        self._w = w
+        self._h = h
+
+    @property
+    def width(self):
+        return self._w
+
+    @property
+    def height(self):
+        return self._h
+
+    @property
+    def area(self):
+        return self.width * self.height
+
+    @area.setter
+    def area(self, value):
+        self._w = value // self.height
+
+    @property
+    def scaler(self):
+        return lambda k: self.width * k
+
+
+b1 = Box(2, 3)
+b2 = Box(5, 7)
+print(b1.area, b2.area)
+b1.area = 12
+print(b1.width, b1.area, b2.width)
+scale = b2.scaler
+print(b1.area, scale(10))
+
+
 print("class_property tests done")
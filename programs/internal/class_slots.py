@@ -0,0 +1,119 @@
+"""Classes with __slots__ use struct-based instances."""
+
+
+class Point:
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def norm1(self):
+        return abs(self.x) + abs(self.y)
+
+    def shift(self, dx):
+        self.x = self.x + dx
+        return self
+
+
+p = Point(3, -4)
+print(p.x, p.y)
+print(p.norm1())
+p.y = 10
+print(p.y, p.norm1())
+print(p.shift(2).x)
+
+
+def total(points):
+    s = 0
+    for q in points:
+        s = s + q.x * q.y
+    return s
+
+
+pts = [Point(i, i + 1) for i in range(5)]
+print(total(pts))
+print(getattr(pts[2], "y"), hasattr(pts[2], "x"))
+setattr(pts[0], "y", 7)
+pts[1].x = 20
+print(pts[0].y, pts[1].x, total(pts))
+print(isinstance(p, Point), isinstance(p, object))
+
+
+# Methods of a slotted class without subclasses are called directly
+class Vec:
+    __slots__ = ("x", "y")
+    dims = 2
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    @staticmethod
+    def origin_norm():
+        return 0
+
+    @classmethod
+    def dimensions(cls):
+        return cls.dims
+
+    def dot(self, other):
+        return self.x * other.x + self.y * other.y
+
+    def norm2(self):
+        return self.dot(self)
+
+
+v = Vec(3, 4)
+print(v.norm2(), v.dot(Vec(1, 1)), v.origin_norm(), v.dimensions())
+
+
+# A name rebound to another class on some paths keeps dynamic dispatch
+class S:
+    __slots__ = ("v",)
+
+    def __init__(self, v):
+        self.v = v
+
+    def m(self):
+        return self.v * 10
+
+
+class T:
+    __slots__ = ("v",)
+
+    def __init__(self, v):
+        self.v = v
+
+    def m(self):
+        return self.v * 100
+
+
+def h(flag):
+    y = T(4)
+    if flag:
+        y = S(3)
+    return y.m()
+
+
+def h2(flag):
+    y = S(3)
+    if flag:
+        y = T(4)
+    return y.m()
+
+
+def h3(y: S, flag):
+    if flag:
+        y = T(5)
+    return y.m()
+
+
+print(h(False), h(True), h2(False), h2(True), h3(S(2), False), h3(S(2), True))
+
+z = S(1)
+for k in range(3):
+    print(z.m())
+    z = T(k)
+
+print("class_slots tests done")
@@ -0,0 +1,104 @@
+"""Test method calls and attributes on names rebound from a slotted instance."""
+
+
+class P:
+    __slots__ = ("v",)
+
+    def __init__(self, v):
+        self.v = v
+
+    def m(self):
+        return ("P", self.v)
+
+
+class Q:
+    def __init__(self, v):
+        self.v = v
+
+    def m(self):
+        return ("Q", self.v)
+
+
+# Rebound in an if-branch
+def branch(flag):
+    a = P(1)
+    if flag:
+        a = Q(2)
+    return a.m()
+
+
+print(branch(False), branch(True))
+
+# Rebound by a for target
+b = P(3)
+print(b.m())
+for b in [Q(4), P(5), Q(6)]:
+    print(b.m())
+
+# Rebound through global
+c = P(7)
+
+
+def rebind_global():
+    global c
+    c = Q(8)
+
+
+print(c.m())
+rebind_global()
+print(c.m())
+
+
+# Rebound through nonlocal
+def outer():
+    d = P(9)
+
+    def inner():
+        nonlocal d
+        d = Q(10)
+
+    print(d.m())
+    inner()
+    return d.m()
+
+
+print(outer())
+
+# Rebound by a walrus
+e = P(11)
+print(e.m())
+if (e := Q(12)) is not None:
+    print(e.m())
+
+# Deleted and rebound
+f = P(13)
+print(f.m())
+del f
+f = Q(14)
+print(f.m())
+
+# Rebound to a builtin object
+g = P(15)
+print(g.m())
+g = [1, 2]
+g.append(3)
+print(g, g.count(2))
+
+
+# Attribute read and write after rebinding in a branch
+def update(flag):
+    h = P(16)
+    if flag:
+        h = Q(17)
+    h.v = h.v + 10
+    return h.v
+
+
+print(update(False), update(True))
+
+# Attribute read and write after rebinding in a loop
+for k in [P(18), Q(19)]:
+    k.v = k.v * 2
+    print(k.v)
+
+print("class_slots_rebinding tests done")
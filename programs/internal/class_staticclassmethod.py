@@ -78,4 +78,33 @@ f = Factory.create()
 print(f.describe())
 
 
+# Calls resolved at compile time next to ones that must stay dynamic
+class MathUtil:
+    base = 10
+
+    @staticmethod
+    def fact(n):
+        if n <= 1:
+            return 1
+        return n * MathUtil.fact(n - 1)
+
+    @classmethod
+    def scaled(cls, n):
+        return cls.base * n
+
+    @staticmethod
+    def label():
+        return "original"
+
+
+class SubUtil(MathUtil):
+    base = 3
+
+
+print(MathUtil.fact(6), MathUtil.scaled(2), SubUtil.scaled(2), SubUtil.fact(4))
+print(MathUtil.label())
+MathUtil.label = lambda: "replaced"
+print(MathUtil.label())
+
+
 print("class_staticclassmethod tests done")
@@ -95,4 +95,27 @@ class H(G):
 H().test()
 
 
+# super() calls reaching classmethods and staticmethods of the parent
+class Maker:
+    tag = "Maker"
+
+    @classmethod
+    def make(cls, n):
+        return cls.tag + str(n)
+
+    @staticmethod
+    def double(n):
+        return n * 2
+
+
+class SubMaker(Maker):
+    tag = "SubMaker"
+
+    def both(self):
+        return super().make(1) + " " + str(super().double(4))
+
+
+print(SubMaker().both())
+
+
 print("class_super tests done")
@@ -172,3 +172,47 @@ print(f"{'Thingamajig':<15} {'$5.50':>10} {'500':>5}")
 print("\nID Numbers:")
 for id_num in [1, 42, 999, 10000]:
     print(f"  ID-{id_num:06}")
+
+# Separators at every group boundary, with and without sign and fraction
+for n in [1234, 12345, 123456, 1234567890, -1000, -1234567]:
+    print(f"{n:,}", f"[{n:,}]")
+for x in [1234567.891, -98765.4321, 999.25]:
+    print(f"{x:,}", f"{x:,.2f}")
+
+# Precision specs on typed floats, ints and large ints
+big = 2**40
+print(f"{3.14159:.2f} {42:.3f} {big:.1f} {big * 3:.2f} {-7:.2f}")
+
+
+def fmt_pair(a: float, b: int) -> str:
+    return f"{a:.3f}|{b:.2f}|{a + b:.1f}|{a:8.2f}|{b:<4}|"
+
+
+print(fmt_pair(2.5, 7), fmt_pair(-0.375, -3))
+acc = 0.0
+for i in range(4):
+    acc += i * 0.1
+    print(f"{acc:.3f}", f"{i:.1f}")
+
+# Alignment padding of various widths and fill characters
+for w in ["", "ab", "x" * 12]:
+    print(f"[{w:>10}] [{w:<10}] [{w:^10}] [{w:*^11}] [{w:->40}] [{w:_<3}]")
+
+# Multi-stage specs on numbers; the operand's own side effects must survive
+kept = ["start"]
+
+
+def remember(v: float, box: list) -> float:
+    box.append(f"kept-{v}")
+    return v
+
+
+for i in range(3):
+    x = i * 1234.5
+    n = i * 1000000
+    print(f"[{x:>12.2f}] [{n:>14,}] [{remember(x, kept):^14.1f}] [{x:,.2f}] [{i:03}]")
+print(kept)
+
+# Fixed precision: rounding of exact ties, near-ties and signs
+for v in [0.5, 1.5, 2.5, 0.125, -0.125, 0.375, 1.005, 2.675, 0.285, -0.001, 99.995, 4294967295.4, 4294967296.7, 123456.789]:
+    print(f"{v:.0f} {v:.1f} {v:.2f} {v:.3f} {v:.6f} {v:.9f}")
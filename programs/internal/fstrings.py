@@ -81,3 +81,42 @@ print(f"Braces: {{and}}")
 values = [1, 2, 3, 4, 5]
 print(f"Sum of values: {sum(values)}")
 print(f"Length: {len(values)}")
+
+# Integer formatting across digit-count boundaries
+for n in [0, 9, 10, 99, 100, 101, 12345, -1, -10, -100, 1073741823, -1073741824]:
+    print(f"[{n}]")
+big = 2**40
+print(f"{big} {-big} {2**62} {4294967295 + big}")
+print(f"{9223372036854775807} {-9223372036854775807} {4294967296}")
+p = 1
+for k in range(19):
+    print(f"{p - 1} {p} {-p} {p + 1}")
+    p = p * 10
+
+# Constant renderings
+nothing = None
+print(f"{nothing} {True} {False} {[]} {int} {bool} {str} {float} {list} {dict} {tuple} {set} {bytes}")
+flag = str(True) + "!"
+print(flag, flag + str(None) + str(False))
+
+# Interpolating values of statically known types
+def running_total(n: int) -> str:
+    total = 0
+    for k in range(n):
+        total = total + k
+    return f"{total * 2} {total}"
+print(running_total(10))
+ratio = 3.5
+doubled = ratio * 2
+label = "bob"
+print(f"{ratio * 2} {ratio} {doubled} {label} {label + '!'} {ratio / 3}")
+def describe(a: float, b: str) -> str:
+    return f"{a}|{b}|{a + 1}"
+print(describe(2.5, "z"), describe(1.0, ""))
+print(str(ratio), str(ratio * 2), str(label), str(label + "c"), str(1.0 / 3))
+
+# Ints past the i31 range, on both sides of the 32-bit boundary
+big = 4294967295
+small = 1073741823
+print(f"{small} {small + 1} {big} {big + 1} {-big} {big * 3}")
+print(str(small + 1), str(big), str(big * 2), str(-big - 2), str(big * 2 + 3))
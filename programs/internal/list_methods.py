@@ -29,6 +29,16 @@ lst = [1, 2, 3, 2, 4]
 lst.remove(2)  # Removes first occurrence
 print(lst)  # [1, 3, 2, 4]
 
+row_a = [1]
+row_b = [2]
+rows = [row_a, row_b, [3]]
+rows.remove(row_b)  # Removes by identity
+print(rows)  # [[1], [3]]
+
+words = "a b c b".split()
+words.remove("b")
+print(words)  # ['a', 'c', 'b']
+
 
 # pop()
 lst = [1, 2, 3, 4, 5]
@@ -38,6 +48,10 @@ print(lst)  # [1, 2, 3, 4]
 print(lst.pop(0))  # 1 (removes and returns first)
 print(lst)  # [2, 3, 4]
 
+nested = [[1, 2, 3], [4]]
+print(nested[0].pop(1))  # 2 (pop on a non-name target)
+print(nested)  # [[1, 3], [4]]
+
 
 # clear()
 lst = [1, 2, 3]
@@ -107,4 +121,12 @@ matrix = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
 print(matrix[1][1])  # 5
 
 
+# Methods on literal receivers
+print([1, 2, 1, 3, 1].count(1))  # 3
+print("banana".count("an"))  # 2
+print([4, 5].copy())  # [4, 5]
+print({"k": 1}.copy())  # {'k': 1}
+print(list(range(3)).copy())  # [0, 1, 2]
+
+
 print("list_methods tests done")
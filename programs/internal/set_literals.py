@@ -28,3 +28,128 @@ s5 = set()
 print(len(s5))
 s5.add(1)
 print(len(s5))
+
+# Removing elements
+s6 = {1, 2, 3, 4}
+s6.discard(1)
+s6.discard(3)
+s6.discard(99)
+print(len(s6), 2 in s6, 3 in s6)
+s6.remove(4)
+print(len(s6), 4 in s6)
+s7 = set()
+s7.discard(1)
+print(len(s7))
+
+# Printing (small ints iterate in ascending order)
+print({3, 1, 2})
+print(set(), {"a"})
+print(str({5}), type({1}), isinstance({1}, set), isinstance({1}, dict))
+
+# set() from iterables
+print(len(set("abca")), sorted(set("abca")))
+print(set([3, 3, 1]), set({"k": 1}))
+
+# Iteration
+for v in {2, 1}:
+    print(v)
+print(sum({1, 2, 3}), min({4, 2}), max({4, 9}), list({5, 4}))
+
+# Set algebra (operators and methods)
+a = {1, 2, 3}
+b = {2, 3, 4}
+print(a | b, a & b, a - b, a ^ b)
+print(a.union([9]), a.intersection(b), a.difference(b), a.symmetric_difference(b))
+print(a == {3, 2, 1}, a == b, a != b)
+print(a <= {1, 2, 3, 4}, a < a, a >= {1}, a > a)
+print(a.issubset(b), a.issuperset({1, 2}), a.isdisjoint({7}))
+
+
+def combine(x, y):
+    return x | y, x & y, x ^ y, x - y
+
+
+print(combine({1, 2}, {2, 3}))
+print(combine(12, 10))
+
+# Mutating methods
+c = a.copy()
+c.update([7, 8])
+print(len(a), len(c), bool(c))
+c.clear()
+print(c, bool(c))
+p = {42}
+print(p.pop(), len(p))
+
+# Set comprehension
+print({n % 3 for n in range(10)})
+
+# Growing past the initial table size
+big = set()
+for i in range(1000):
+    big.add(i * 7)
+for i in range(500):
+    big.discard(i * 7)
+print(len(big), 693 in big, 3500 in big)
+
+
+class Bag:
+    def __init__(self):
+        self.items = set()
+
+    def put(self, x):
+        self.items.add(x)
+
+
+bag = Bag()
+bag.put("x")
+bag.put("y")
+bag.put("x")
+print(len(bag.items), sorted(bag.items))
+
+# None is a valid element; deleted slots are reused by later adds
+n = {None, 1}
+print(len(n), None in n, 2 in n)
+n.discard(None)
+print(len(n), None in n)
+churn = set()
+for i in range(200):
+    churn.add(i % 7)
+    churn.discard((i + 3) % 7)
+print(len(churn), sorted(churn))
+
+# String sets: algebra and growth across many colliding probes
+words = {"apple", "banana", "cherry", "date"}
+more = {"cherry", "date", "elder", "fig"}
+print(sorted(words | more), sorted(words & more), sorted(words - more))
+big = set()
+half = set()
+for i in range(300):
+    big.add("k" + str(i))
+    if i % 2 == 0:
+        half.add("k" + str(i))
+u = big.copy()
+u.update(half)
+print(len(big - half), len(big & half), half <= big, big <= half, len(u), "k299" in u)
+
+# Lookups try identity first, so a NaN element still finds itself
+nan = float("nan")
+print(nan in {nan, 1.5}, len({nan, nan}))
+
+# A string keeps its hash across memberships; equal strings built
+# separately still match
+words = ["alpha", "beta", "gamma", "alpha"]
+seen = set(words)
+counts = {}
+for w in words:
+    counts[w] = counts.get(w, 0) + 1
+print(len(seen), "al" + "pha" in seen, counts["alpha"], ("be" + "ta") in counts)
+
+# Literals, comprehensions and set(list) are built in one sized pass
+wide = {1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 3, 5, "a", "a", None, None}
+print(len(wide), 12 in wide, "a" in wide, None in wide, 13 in wide)
+evens = {n % 7 for n in range(50)}
+print(len(evens), sorted(evens))
+from_list = set([5, 1, 5, 2, 1])
+from_list.add(9)
+print(len(from_list), sorted(from_list), len(set([])))
@@ -25,6 +25,9 @@ s = "hello world"
 print(s[0:5])
 print(s[6:])
 print(s[::-1])
+print(s[:5], s[3:3], s[8:2], s[5:100], s[20:30], s[11:], s[:])
+for k in range(4):
+    print(s[k:k + 2], s[1:k])
 
 # Slice assignment
 b = [0, 1, 2, 3, 4]
@@ -33,3 +36,11 @@ print(b)
 
 b[2:] = [100]
 print(b)
+
+# Strided and reversed string slices, including out-of-range bounds
+print(s[1::3], s[2:9:2], s[::100], s[3:1:2])
+print(s[::-2], s[8:2:-1], s[8:2:-3], s[-1:-5:-1], s[5::-1])
+print(s[100::-1], s[:-100:-1], s[-100::-1], s[2:-100:-1], s[100:0:-2])
+alphabet = "abcdefghijklmnopqrstuvwxyz0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+for st in [2, 3, 5, 7, 8, 9, 13]:
+    print(st, alphabet[::st], alphabet[1:-1:st], alphabet[4:40:st])
@@ -45,4 +45,47 @@ result3 = sorted(["a", "bbb", "cc"], key=len, reverse=True)
 print(result3)  # ['bbb', 'cc', 'a']
 
 
+# sorted() with key over other iterables; the input is left untouched
+words = ["pear", "fig", "apple", "kiwi"]
+print(sorted(words, key=len), words)  # ['fig', 'pear', 'kiwi', 'apple'] [...]
+print(sorted((5, 3, 9, 1), key=lambda x: x % 4))  # [5, 9, 1, 3]
+print(sorted({"bb", "a", "ccc"}, key=len))  # ['a', 'bb', 'ccc']
+print(sorted("hello", key=lambda c: c))  # ['e', 'h', 'l', 'l', 'o']
+print(sorted({"b": 1, "a": 2}, key=lambda k: k))  # ['a', 'b']
+print(sorted([], key=len))  # []
+
+
+# reverse=True with a key keeps equal keys in their original order
+print(sorted(["b", "a", "cc", "dd"], key=len, reverse=True))  # ['cc', 'dd', 'b', 'a']
+tagged = [(1, "x"), (0, "y"), (1, "z"), (0, "w")]
+tagged.sort(key=lambda p: p[0], reverse=True)
+print(tagged)  # [(1, 'x'), (1, 'z'), (0, 'y'), (0, 'w')]
+
+
+
+# Key sorts over inputs made of natural runs (ascending, descending, mixed)
+runs = [1, 2, 3, 9, 8, 7, 4, 5, 6, 0]
+print(sorted(runs, key=lambda v: v))  # [0, 1, ..., 9]
+print(sorted(runs, key=lambda v: v, reverse=True))  # [9, 8, ..., 0]
+nearly = list(range(40))
+nearly[5] = 33
+nearly[30] = 2
+print(sorted(nearly, key=lambda v: v)[:8])  # [0, 1, 2, 2, 3, 4, 6, 7]
+grouped = [(i % 3, i) for i in range(9)]
+print(sorted(grouped, key=lambda p: p[0]))  # stable within each group
+
+
+
+# Larger shuffled input: insertion-sorted leaves merged into one run
+shuffled = []
+seed = 12345
+for i in range(200):
+    seed = (seed * 1103515245 + 12345) % 2147483648
+    shuffled.append((seed % 10, i))
+by_digit = sorted(shuffled, key=lambda p: p[0])
+print(by_digit[:3], by_digit[-3:])
+by_digit_desc = sorted(shuffled, key=lambda p: p[0], reverse=True)
+print(by_digit_desc[:3], by_digit_desc[-3:])
+
+
 print("sort_advanced tests done")
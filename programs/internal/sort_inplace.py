@@ -0,0 +1,92 @@
+"""Test list.sort() and list.reverse() on array-backed and linked lists."""
+
+from __future__ import annotations
+
+
+# Array-backed lists (list literals)
+nums = [5, 3, 9, 1, 1, 7]
+nums.sort()
+print(nums)  # [1, 1, 3, 5, 7, 9]
+nums.reverse()
+print(nums)  # [9, 7, 5, 3, 1, 1]
+
+empty = []
+empty.sort()
+empty.reverse()
+print(empty)  # []
+
+single = [42]
+single.sort()
+single.reverse()
+print(single)  # [42]
+
+words = ["pear", "apple", "fig", "banana"]
+words.sort()
+print(words)  # ['apple', 'banana', 'fig', 'pear']
+words.sort(key=len)
+print(words)  # ['fig', 'pear', 'apple', 'banana']
+
+
+# Already sorted and reverse-sorted inputs
+ordered = [1, 2, 2, 3]
+ordered.sort()
+print(ordered)  # [1, 2, 2, 3]
+descending = [9, 7, 5, 2]
+descending.sort()
+print(descending)  # [2, 5, 7, 9]
+ties = [9, 7, 7, 2]
+ties.sort()
+print(ties)  # [2, 7, 7, 9]
+
+
+# Linked lists (results of str.split())
+parts = "d b a c e".split()
+parts.sort()
+print(parts)  # ['a', 'b', 'c', 'd', 'e']
+parts.reverse()
+print(parts)  # ['e', 'd', 'c', 'b', 'a']
+
+sized = "bb a ccc dddd".split()
+sized.sort(key=len)
+print(sized)  # ['a', 'bb', 'ccc', 'dddd']
+
+backwards = "z y x w".split()
+backwards.sort()
+print(backwards)  # ['w', 'x', 'y', 'z']
+
+fruits = "pear fig apple kiwi banana plum date".split()
+fruits.sort(key=len)
+print(fruits)  # ['fig', 'pear', 'kiwi', 'plum', 'date', 'apple', 'banana']
+
+lone = "x".split()
+lone.sort()
+lone.reverse()
+print(lone)  # ['x']
+
+
+# Comprehension results
+squares = [x * x for x in [3, -1, 2, -5, 4]]
+squares.sort()
+print(squares)  # [1, 4, 9, 16, 25]
+squares.sort(key=lambda v: -v)
+print(squares)  # [25, 16, 9, 4, 1]
+
+# Key sort is stable: equal keys keep their original order
+tagged = [(2, "a"), (1, "b"), (2, "c"), (1, "d"), (0, "e")]
+tagged.sort(key=lambda t: t[0])
+print(tagged)  # [(0, 'e'), (1, 'b'), (1, 'd'), (2, 'a'), (2, 'c')]
+
+many = [(i * 37) % 101 for i in range(50)]
+many.sort(key=lambda v: v % 7)
+print(many)
+
+# Plain sorts run on a flat array too
+floats = [1.5, 0.5, 2.5, -1.0]
+floats.sort()
+print(floats)  # [-1.0, 0.5, 1.5, 2.5]
+shuffled = [(i * 37) % 101 for i in range(100)]
+shuffled.sort()
+print(shuffled[:5], shuffled[-5:])
+print(sorted("banana"), sorted({"b": 1, "a": 2}), sorted((9, 4, 7)))
+
+print("sort_inplace tests done")
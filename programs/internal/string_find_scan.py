@@ -0,0 +1,32 @@
+"""Test str.find/rfind and `in` over long haystacks."""
+
+base = "abcdefghijklmnopqrstuvwxyz0123456789" * 3
+print(len(base))
+
+# Every needle position and a range of needle lengths, forwards and backwards
+for size in [1, 2, 3, 7, 16, 17, 33]:
+    hits = []
+    for start in range(0, len(base) - size + 1, 5):
+        needle = base[start:start + size]
+        hits.append((base.find(needle), base.rfind(needle), needle in base))
+    print(size, hits)
+
+# Needles whose first and last bytes match often but whose middle differs
+hay = "ab" * 40 + "acb" + "ab" * 40
+for needle in ["acb", "bacba", "aba", "abab", "bab", "ac", "cb", "abx", "a" + "b" * 3]:
+    print(needle, hay.find(needle), hay.rfind(needle), needle in hay)
+
+# Matches at the very start and end, and near the 16-byte boundaries
+for n in [15, 16, 17, 31, 32, 33, 47, 48]:
+    s = "x" * n + "needle" + "y" * n
+    print(n, s.find("needle"), s.rfind("needle"), s.find("xn"), s.rfind("ey"), s.find("x"), s.rfind("y"))
+    print(s.rfind("x"), s.find("y"), s.find("z"), s.rfind("z"), s.rfind(""), s.find(""))
+
+# Repeated occurrences: find sees the first, rfind the last
+s = "-".join(["tok"] * 30)
+print(s.find("tok"), s.rfind("tok"), s.find("-tok-"), s.rfind("-tok-"), s.rfind("k-t"))
+
+# Needle longer than the haystack, and equal strings
+print("short".find("shorter"), "short".rfind("shorter"), "same".find("same"), "same".rfind("same"))
+
+print("string_find_scan tests done")
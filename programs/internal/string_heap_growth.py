@@ -0,0 +1,22 @@
+"""Strings built past the initial linear memory, which must grow on demand."""
+
+# Many small conversions: ints, floats and padded/grouped numbers
+total = 0
+for i in range(120000):
+    total += len(str(i)) + len(f"{i * 1000:,}") + len(f"{i:>12}")
+print(total)
+
+floats = 0
+for i in range(20000):
+    floats += len(str(i / 7)) + len(f"{i / 3:.4f}")
+print(floats)
+
+# A few large results
+word = "Hello" * 50000
+big = "ab" * 400000
+for i in range(4):
+    upper = word.upper()
+    title = word.title()
+    quoted = repr(word)
+    bigger = big * 2
+print(len(upper), upper[:7], title[:12], quoted[:4], len(bigger), bigger[-3:])
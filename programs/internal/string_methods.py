@@ -31,6 +31,11 @@ parts2 = text.split(",", 2)
 print(len(parts2))  # 3
 print(parts2[2])  # three,four
 
+# Parts are allocated back to back, so check neighbours stay intact
+print("a,,b,".split(","))  # ['a', '', 'b', '']
+print("x--y--z".split("--", 1))  # ['x', 'y--z']
+print("x--y--z".split("--")[2] + hex(255))  # z0xff
+
 
 # Joining
 parts = ["a", "b", "c"]
@@ -98,4 +103,70 @@ print("l" in "hello")  # True
 print("x" in "hello")  # False
 
 
+# Case conversion across the 8-byte word boundary and around the letter ranges
+for t in ["", "a", "Hello, World!", "abcdefghijklmnopqrstuvwxyz", "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+          "@[`{ azAZ 09 @[`{", "MiXeD cAsE sTrInG wItH 123 nUmBeRs!!", "x" * 17]:
+    print(t.upper(), t.lower(), t.swapcase())
+
+
+# strip() over runs of whitespace longer than a word, and NUL bytes it keeps
+nul = chr(0)
+for t in ["", " " * 8, " " * 9, "  a  ", chr(9) + chr(10) + chr(13) + " hello world " + chr(13),
+          " " * 20 + "mid" + " " * 20, " " + nul * 8 + " ", "abcdefghij       ",
+          "          abcdefghij", "  ab  cd  ef  gh  ij  "]:
+    r = t.strip()
+    print(len(t), len(r), r == t, r)
+
+
+# Substring search with candidates inside and across 8-byte words
+hay = "the quick brown fox jumps over the lazy dog; the end"
+for n in ["", "t", "dog", "end", "fox jumps over", "cat", "the end!", "lazy dog; the en", ";"]:
+    print(repr(n), n in hay, hay.find(n))
+run = "a" * 30 + "b"
+print("aab" in run, run.find("aab"), run.find("b"), "ba" in run)
+for i in range(12):
+    padded = "." * i + "needle" + "..."
+    print(i, padded.find("needle"), "needle" in padded, padded.find("needlf"))
+
+# Case mapping over every length around the word loop boundaries
+base = "hELLo wORld, fOO bar baz!"
+for i in range(len(base) - 14, len(base) + 1):
+    piece = base[:i]
+    print(i, piece.title(), piece.capitalize(), piece.swapcase(), piece.upper())
+
+for w in ["", "x", "abc", "A" * 20 + "b" * 5, "tHE wORD  wall"]:
+    print(repr(w), [w, w.capitalize(), w.title()])
+
+# title() starts a word after any uncased character, as CPython does
+for w in ["they're bill's friends", "3rd place-winner", "x_y z2a", "ABC123def", "café bar"]:
+    print(w.title())
+
+# capitalize() on strings that are already capitalized, and near misses
+for w in ["True", "Error:", "1abc", "1aBc", "Abcdefghijklmnop", "Abcdefghijklmno" + "Z", "Abcdefgh" + "Ijk"]:
+    print(w, w.capitalize(), w.capitalize() == w, w.capitalize() is w)
+
+# startswith/endswith at every prefix and suffix length, with a mismatch at either end
+url = "http://example.org/path/to/resource.html"
+for n in range(0, len(url) + 1, 3):
+    head = url[:n]
+    tail = url[len(url) - n:]
+    print(n, url.startswith(head), url.endswith(tail), url.startswith(head[:-1] + "#"), url.endswith("#" + tail[1:]))
+
+# strip() results share the original bytes; use them as keys, in concatenation and by index
+words = {}
+for w in ["  key  ", "key", "\tkey\n", "xxkeyxx", "key  ", "  key"]:
+    k = w.strip().strip("x")
+    words[k] = words.get(k, 0) + 1
+    print(repr(k), k == "key", k + "!", k[0], k[-1], len(w.lstrip()), len(w.rstrip()), w.rstrip("x ") + "|")
+print(words)
+plain = "unchanged"
+print(plain.strip() == plain, plain.lstrip("z"), plain.rstrip("z"), plain.strip("xyz"))
+
+# count/replace/split with needles that differ only in their last bytes
+text = "<sep-long-marker>a<sep-long-markeR>b<sep-long-marker><sep-long-marker>c"
+for sep in ["<sep-long-marker>", "<sep-long-markeR>", "<sep-", "r>", "-long-", "<sep-long-marker>c", "nope"]:
+    print(sep, text.count(sep), text.split(sep), text.split(sep, 1), text.replace(sep, "|"), text.replace(sep, "", 2))
+print("abcdefghij" == "abcdefghiJ", "ab" + "cdefghij" == "abcdefghij")
+
+
 print("string_methods tests done")
@@ -116,5 +116,64 @@ print("aaa".count("aa"))  # 1 (non-overlapping)
 print("hello".replace("l", "L"))  # heLLo
 print("aaa".replace("a", "b"))    # bbb
 
+# Concatenation does not disturb shared prefixes
+base = "ab" + "cd"
+left = base + "x"
+right = base + "y"
+print(base, left, right)  # abcd abcdx abcdy
+acc = ""
+for ch in "hello":
+    acc += ch
+    snapshot = acc
+acc += "!"
+print(snapshot, acc)      # hello hello!
+
+# Equality of longer strings: whole words first, then the tail
+long_a = "abcdefghijklmnopqrstuvwxyz"
+long_b = "abcdefghijklmnop" + "qrstuvwxyz"
+print(long_a == long_b, long_a == long_b[:-1] + "Z", long_a[:16] == long_b[:16])
+print(long_a == "abcdefgXijklmnopqrstuvwxyz", long_a[:8] == "abcdefgh")
+
+
+# Ordering decided inside a long common prefix, past it, or by length
+words = ["prefix_common_b", "prefix_common_a", "prefix_common", "prefix_commoz",
+         "prefix_c\u00e9", "Prefix_common_a", "prefix_common_ab", "prefix_commo"]
+print(sorted(words))
+print(long_a < long_b + "a", long_a > "abcdefghijklmnopqrstuvwxy", long_a < "abcdefgi")
+print(long_a < "abcdefghijklMnopqrstuvwxyz", long_a > "abcdefghijklmnopqrstuvwxyzz",
+      long_a + long_a < long_a + "abcdefghijklmnopqrstuvwxy{")
+
 
 print("string_operations tests done")
+
+# Repetition across power-of-two boundaries
+for n in [0, 1, 2, 3, 4, 5, 7, 8, 9, 16, 17, 100]:
+    r = "ab" * n
+    print(n, len(r), r[-4:], r == "".join(["ab"] * n))
+print(len("" * 5), "x" * 1000 == "xxxxxxxxxx" * 100, "abc" * -1 == "")
+
+# Indexing walks both ends of the string
+word = "hello"
+for i in range(-5, 5):
+    print(i, word[i])
+
+# Single characters from chr() and iteration share storage; check they stay intact
+letters = ""
+for code in range(65, 91):
+    letters = letters + chr(code)
+print(letters, len(letters), ord(chr(0)), ord(chr(127)))
+chars = []
+for c in "hello, world":
+    chars.append(c + "")
+print(chars, list(reversed("abcd")), "".join(reversed("xyz")))
+first = chr(120)
+print(first, first + "yz", chr(120), {chr(97): 1, "a": 2})
+
+# Empty strings from literals, slices, strips and conversions are interchangeable
+empty = ""
+acc = ""
+for i in range(3):
+    acc += str(i)
+lookup = {"": 1, "a": 2}
+print(acc, lookup[""], lookup.get(empty), "" == "abc"[5:], "   ".strip() == empty, "x" * 0 == "")
+print(repr(""), [""], f"{''}|{'':>3}|", "".title(), len(str()), "" + "z")
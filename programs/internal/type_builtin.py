@@ -64,4 +64,10 @@ mixed = [1, "two", 3.0]
 print(type(mixed))           # <class 'list'>
 
 
+# Type names as strings (built in one allocation)
+s = str(int) + "|" + str(bool) + "|" + str(type([])) + "|" + repr(dict)
+print(s, len(s))
+print(f"{str} {float} {tuple}")
+
+
 print("type_builtin tests done")
@@ -19,6 +19,18 @@ print(float("3.14"))  # 3.14
 print(float("-2.5"))  # -2.5
 print(float("42.5"))  # 42.5
 print(float("0.001"))  # 0.001
+print(float("0.3"))  # 0.3
+print(float("0.1") + float("0.2"))  # 0.30000000000000004
+print(float("42"), float("-7"), float("1."), float(".5"))  # 42.0 -7.0 1.0 0.5
+print(float("2.675") * 100)  # 267.49999999999997
+print(float("12345678901234567890123"))  # 1.2345678901234568e+22
+print(float("0.30000000000000004") == 0.1 + 0.2)  # True
+# 16-17 significant digits, the shape repr() produces
+for t in ["0.9999999999999999", "9.999999999999999", "8326900850.8531737", "2.2250738585072011"]:
+    print(t, float(t))
+for t in ["32.383276483316237", "7.968919758215943", "332517199864.60992", "443248393.57743883", "919171508.51177132"]:
+    print(t, float(t), float(t) == float(repr(float(t))))
+print(float("9007199254740993"), float("-0.1234567890123456"))
 
 
 # str() called on a string (identity)
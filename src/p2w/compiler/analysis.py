@@ -793,6 +793,19 @@ def is_dict_expr(node: ast.expr) -> bool:
             return False
 
 
+def is_set_expr(node: ast.expr) -> bool:
+    """Check if an expression is known to be a set at compile time."""
+    match node:
+        case ast.Set():
+            return True
+        case ast.SetComp():
+            return True
+        case ast.Call(func=ast.Name(id="set")):
+            return True
+        case _:
+            return False
+
+
 # i31 range limits
 I31_MIN = -(2**30)  # -1073741824
 I31_MAX = 2**30 - 1  # 1073741823
@@ -905,6 +918,186 @@ def collect_class_names(body: list[ast.stmt]) -> set[str]:
     return names
 
 
+def collect_fixed_classes(body: list[ast.stmt]) -> set[str]:
+    """Collect module-level classes whose name only ever means that class.
+
+    A class qualifies when its class statement is the only binding of the
+    name anywhere in the module (no other def, assignment, parameter or
+    import uses it).
+    """
+    class_defs: dict[str, int] = {}
+    rebound: set[str] = set()
+    for node in ast.walk(ast.Module(body=body, type_ignores=[])):
+        match node:
+            case ast.ClassDef(name=name):
+                class_defs[name] = class_defs.get(name, 0) + 1
+            case ast.FunctionDef(name=name) | ast.AsyncFunctionDef(name=name):
+                rebound.add(name)
+            case ast.Name(id=name, ctx=ast.Store() | ast.Del()):
+                rebound.add(name)
+            case ast.arg(arg=name):
+                rebound.add(name)
+            case ast.alias(name=name, asname=asname):
+                rebound.add(asname or name.split(".")[0])
+    return {
+        name
+        for name in collect_class_names(body)
+        if class_defs[name] == 1 and name not in rebound
+    }
+
+
+class _InstanceBindings(_SkipNestedScopes):
+    """Record, per name, the classes of a scope's `name = Class(...)` bindings.
+
+    Any other binding of a name (augmented or tuple assignment, loop and with
+    targets, imports, defs, del, ...) and any global/nonlocal declaration of
+    it, here or in a nested scope, marks it as unknown.
+    """
+
+    def __init__(self, class_names: set[str]) -> None:
+        self.class_names = class_names
+        self.classes: dict[str, set[str]] = {}
+        self.unknown: set[str] = set()
+
+    def _constructed_class(self, value: ast.expr | None) -> str | None:
+        match value:
+            case ast.Call(func=ast.Name(id=class_name)) if (
+                class_name in self.class_names
+            ):
+                return class_name
+        return None
+
+    def _bind(self, target: ast.expr, value: ast.expr | None) -> None:
+        class_name = self._constructed_class(value)
+        if isinstance(target, ast.Name) and class_name is not None:
+            self.classes.setdefault(target.id, set()).add(class_name)
+        else:
+            self.visit(target)
+
+    def _visit_nested(self, node: ast.AST) -> None:
+        for inner in ast.walk(node):
+            if isinstance(inner, (ast.Global, ast.Nonlocal)):
+                self.unknown.update(inner.names)
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        for target in node.targets:
+            self._bind(target, node.value)
+        self.visit(node.value)
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        if node.value is not None:
+            self._bind(node.target, node.value)
+            self.visit(node.value)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if isinstance(node.ctx, (ast.Store, ast.Del)):
+            self.unknown.add(node.id)
+
+    def visit_Global(self, node: ast.Global) -> None:
+        self.unknown.update(node.names)
+
+    def visit_Nonlocal(self, node: ast.Nonlocal) -> None:
+        self.unknown.update(node.names)
+
+    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
+        if node.name is not None:
+            self.unknown.add(node.name)
+        self.generic_visit(node)
+
+    def visit_alias(self, node: ast.alias) -> None:
+        self.unknown.add(node.asname or node.name.split(".")[0])
+
+    def visit_match_case(self, node: ast.match_case) -> None:
+        self.unknown.update(collect_pattern_names(node.pattern))
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.unknown.add(node.name)
+        self._visit_nested(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self.unknown.add(node.name)
+        self._visit_nested(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.unknown.add(node.name)
+        self._visit_nested(node)
+
+    def visit_Lambda(self, node: ast.Lambda) -> None:
+        self._visit_nested(node)
+
+
+def collect_fixed_instances(
+    body: list[ast.stmt],
+    class_names: set[str],
+    args: ast.arguments | None = None,
+    self_class: str | None = None,
+) -> dict[str, str]:
+    """Collect names of a scope that always hold an instance of one class.
+
+    A name qualifies when every binding of it in the scope is `name =
+    Class(...)` with the same class from class_names. Parameters count as
+    bindings: of self_class for the first one when given (a method's self),
+    of the annotated class when annotated with one, of nothing known
+    otherwise. Unlike the slotted instance tracking, this holds on every
+    path through the scope.
+    """
+    bindings = _InstanceBindings(class_names)
+    for stmt in body:
+        bindings.visit(stmt)
+    if args is not None:
+        params = [*args.posonlyargs, *args.args, *args.kwonlyargs]
+        for i, arg in enumerate(params):
+            if i == 0 and self_class is not None:
+                bindings.classes.setdefault(arg.arg, set()).add(self_class)
+                continue
+            match arg.annotation:
+                case ast.Name(id=class_name) if class_name in class_names:
+                    bindings.classes.setdefault(arg.arg, set()).add(class_name)
+                case _:
+                    bindings.unknown.add(arg.arg)
+        for rest in (args.vararg, args.kwarg):
+            if rest is not None:
+                bindings.unknown.add(rest.arg)
+    return {
+        name: next(iter(classes))
+        for name, classes in bindings.classes.items()
+        if len(classes) == 1 and name not in bindings.unknown
+    }
+
+
+def collect_base_class_names(body: list[ast.stmt]) -> set[str]:
+    """Collect names used as a base class by any class statement."""
+    return {
+        base.id
+        for node in ast.walk(ast.Module(body=body, type_ignores=[]))
+        if isinstance(node, ast.ClassDef)
+        for base in node.bases
+        if isinstance(base, ast.Name)
+    }
+
+
+def collect_assigned_attrs(body: list[ast.stmt]) -> set[str] | None:
+    """Collect attribute names assigned or deleted anywhere in the module.
+
+    Returns None when setattr()/delattr() with a computed name make the set
+    unknowable.
+    """
+    names: set[str] = set()
+    for node in ast.walk(ast.Module(body=body, type_ignores=[])):
+        match node:
+            case ast.Attribute(attr=attr, ctx=ast.Store() | ast.Del()):
+                names.add(attr)
+            case ast.Call(
+                func=ast.Name(id="setattr" | "delattr"),
+                args=[_, ast.Constant(value=str() as attr), *_],
+            ):
+                names.add(attr)
+            case ast.Call(func=ast.Name(id="setattr" | "delattr")):
+                return None
+    return names
+
+
 def collect_slotted_classes(body: list[ast.stmt]) -> dict[str, list[str]]:
     """Collect classes that have __slots__ defined.
 
@@ -44,11 +44,28 @@ def compile_attribute_assignment(
                 type_name = ctx.get_slotted_type_name(class_name)
                 # Field index: 0 is $class, slots start at 1
                 field_idx = slot_idx + 1
+                # The name may have been rebound to another object: keep the
+                # value in $tmp and only store to the field if the type matches
                 ctx.emitter.comment(f"slotted attr: self.{target.attr} = ...")
+                compile_expr(value, ctx)
+                ctx.emitter.line("(local.set $tmp)")
+                compile_expr(target.value, ctx)
+                ctx.emitter.line(f"(ref.test (ref {type_name}))")
+                ctx.emitter.line("(if")
+                ctx.emitter.line("  (then")
                 compile_expr(target.value, ctx)
                 ctx.emitter.emit_ref_cast(type_name)
-                compile_expr(value, ctx)
+                ctx.emitter.emit_local_get("$tmp")
                 ctx.emitter.line(f"(struct.set {type_name} {field_idx})")
+                ctx.emitter.line("  )")
+                ctx.emitter.line("  (else")
+                compile_expr(target.value, ctx)
+                ctx.emitter.emit_string(target.attr)
+                ctx.emitter.emit_local_get("$tmp")
+                ctx.emitter.emit_call("$object_setattr")
+                ctx.emitter.emit_drop()
+                ctx.emitter.line("  )")
+                ctx.emitter.line(")")
                 return
 
     # Standard Python attribute assignment
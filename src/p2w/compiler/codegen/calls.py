@@ -6,7 +6,10 @@ import ast
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from p2w.compiler.analysis import is_dict_expr, is_list_expr, is_string_expr
+from p2w.compiler.builtins import BUILTINS
 from p2w.compiler.codegen.expressions import compile_expr
+from p2w.compiler.codegen.fstrings import compile_value_to_string, has_typed_to_string
 from p2w.compiler.codegen.js_interop import (
     compile_js_method_call,
     is_js_method_call,
@@ -145,7 +148,7 @@ def _compile_direct_user_call(
     Benefits:
     - No need to load the closure and check if it's a class
     - No "__init__" string allocation
-    - Direct call_indirect with known table index
+    - Direct call to the known function (no call_indirect)
 
     Phase 4.1 enhancement: If a specialized version exists, use direct call
     with arguments on the stack (no PAIR chain).
@@ -182,9 +185,9 @@ def _compile_direct_user_call(
     # Pass null environment (module-level functions don't need captured env)
     ctx.emitter.line("(ref.null $ENV)")
 
-    # Direct call via function table
-    ctx.emitter.line(f"(i32.const {table_idx})")
-    ctx.emitter.line("(call_indirect (type $FUNC))")
+    # Direct call: the table slot is known, so name its function instead of
+    # going through call_indirect (lets the engine inline the callee)
+    ctx.emitter.line(f"(call $user_func_{table_idx - len(BUILTINS)})")
 
 
 # String methods
@@ -247,11 +250,33 @@ DICT_METHODS = {
 # Set methods
 SET_METHODS = {
     "add": "$set_add",
-    "remove": "$set_remove",
+    "remove": "$set_discard",
     "discard": "$set_discard",
+    "union": "$set_union",
+    "intersection": "$set_intersection",
+    "difference": "$set_difference",
+    "symmetric_difference": "$set_symmetric_difference",
+    "issubset": "$set_issubset",
+    "issuperset": "$set_issuperset",
+    "isdisjoint": "$set_isdisjoint",
 }
 
 
+def _receiver_method(obj: ast.expr, method: str) -> str | None:
+    """Return the helper for a method on a receiver of statically known type.
+
+    Lets polymorphic methods (count, copy) skip the runtime type dispatch
+    when the receiver is a literal or constructor call.
+    """
+    if is_string_expr(obj):
+        return STRING_METHODS.get(method)
+    if is_list_expr(obj):
+        return LIST_METHODS.get(method)
+    if is_dict_expr(obj):
+        return DICT_METHODS.get(method)
+    return None
+
+
 def compile_call(
     func: ast.expr,
     args: list[ast.expr],
@@ -282,6 +307,18 @@ def compile_call(
             ctx.emitter.emit_call(direct_func)
             return
 
+    # str(x) of a statically typed value: call the typed converter directly
+    if (
+        isinstance(func, ast.Name)
+        and func.id == "str"
+        and len(args) == 1
+        and not keywords
+        and has_typed_to_string(args[0], ctx)
+    ):
+        ctx.emitter.comment("str() of a typed value")
+        compile_value_to_string(args[0], ctx)
+        return
+
     # dict() with kwargs
     if isinstance(func, ast.Name) and func.id == "dict" and keywords:
         _compile_dict_with_kwargs(args, keywords, ctx)
@@ -323,18 +360,21 @@ def compile_call(
                 ctx.emitter.emit_null_eq()
             # Compile the key function
             compile_expr(key_kw.value, ctx)
+            # The key sort orders descending itself (stable, keys computed once)
+            ctx.emitter.emit_i32_const(1 if has_reverse else 0)
             ctx.emitter.emit_call("$sorted_with_key")
+            return
+
+        # sorted without key function
+        # Compile the iterable argument
+        if args:
+            compile_expr(args[0], ctx)
+            ctx.emitter.emit_null_eq()
+            ctx.emitter.emit_struct_new("$PAIR")
         else:
-            # sorted without key function
-            # Compile the iterable argument
-            if args:
-                compile_expr(args[0], ctx)
-                ctx.emitter.emit_null_eq()
-                ctx.emitter.emit_struct_new("$PAIR")
-            else:
-                ctx.emitter.emit_null_eq()
-            ctx.emitter.line("(ref.null $ENV)")
-            ctx.emitter.emit_call("$sorted")
+            ctx.emitter.emit_null_eq()
+        ctx.emitter.line("(ref.null $ENV)")
+        ctx.emitter.emit_call("$sorted")
 
         if has_reverse:
             ctx.emitter.emit_call("$list_reverse")
@@ -410,7 +450,6 @@ def compile_call(
     # General function call
     ctx.emitter.comment("call function or instantiate class")
     compile_expr(func, ctx)
-    ctx.emitter.emit_string("__init__")
 
     # Check for starred expressions in args
     has_starred = any(isinstance(arg, ast.Starred) for arg in args)
@@ -460,14 +499,49 @@ def compile_method_call(
         compile_js_method_call(obj, method, args, ctx)
         return
 
+    # Methods whose binding is known at compile time are called directly
+    # instead of being looked up and dispatched at run time
+    if (
+        isinstance(obj, ast.Name)
+        and (resolved := _resolve_method(obj, method, ctx))
+        and not keywords
+        and not any(isinstance(arg, ast.Starred) for arg in args)
+    ):
+        _compile_resolved_method_call(obj, resolved, method, args, ctx)
+        return
+
     # Check for slotted instance method calls
-    # For slotted classes, method lookup goes directly to the class
+    # For slotted classes, method lookup goes directly to the class. The
+    # slotted-instance tracking ignores control flow, so the name may hold
+    # another object by now: test the struct type and otherwise dispatch
+    # as usual.
     if isinstance(obj, ast.Name):
         class_name = ctx.get_slotted_instance_class(obj.id)
         if class_name:
+            type_name = ctx.get_slotted_type_name(class_name)
+            compile_expr(obj, ctx)
+            ctx.emitter.line(f"(ref.test (ref {type_name}))")
+            ctx.emitter.line("(if (result (ref null eq))")
+            ctx.emitter.line("  (then")
             _compile_slotted_method_call(obj, class_name, method, args, ctx)
+            ctx.emitter.line("  )")
+            ctx.emitter.line("  (else")
+            _compile_dynamic_method_call(obj, method, args, keywords, ctx)
+            ctx.emitter.line("  )")
+            ctx.emitter.line(")")
             return
 
+    _compile_dynamic_method_call(obj, method, args, keywords, ctx)
+
+
+def _compile_dynamic_method_call(
+    obj: ast.expr,
+    method: str,
+    args: list[ast.expr],
+    keywords: list[ast.keyword],
+    ctx: CompilerContext,
+) -> None:
+    """Compile a method call whose receiver type is not known statically."""
     ctx.emitter.comment(f"method call: .{method}()")
 
     # Handle special cases first
@@ -491,11 +565,13 @@ def compile_method_call(
             ctx.emitter.comment("list.sort with key function")
             compile_expr(obj, ctx)
             compile_expr(key_kw.value, ctx)
+            ctx.emitter.emit_i32_const(1 if has_reverse else 0)
             ctx.emitter.emit_call("$list_sort_with_key")
-        else:
-            # sort without key function
-            compile_expr(obj, ctx)
-            ctx.emitter.emit_call("$list_sort_inplace")
+            return
+
+        # sort without key function
+        compile_expr(obj, ctx)
+        ctx.emitter.emit_call("$list_sort_inplace")
 
         if has_reverse:
             ctx.emitter.emit_call("$list_reverse_inplace")
@@ -504,7 +580,7 @@ def compile_method_call(
     if method == "count":
         compile_expr(obj, ctx)
         compile_expr(args[0], ctx)
-        ctx.emitter.emit_call("$method_count")
+        ctx.emitter.emit_call(_receiver_method(obj, method) or "$method_count")
         return
 
     if method == "to_bytes":
@@ -610,7 +686,7 @@ def compile_method_call(
 
     if method == "copy":
         compile_expr(obj, ctx)
-        ctx.emitter.emit_call("$method_copy")
+        ctx.emitter.emit_call(_receiver_method(obj, method) or "$method_copy")
         return
 
     # Generator methods: send and throw (unique to generators)
@@ -720,28 +796,21 @@ def _compile_pop_method(
 
     if args:
         compile_expr(obj, ctx)
-        ctx.emitter.line("(local.set $tmp)  ;; save obj")
         compile_expr(args[0], ctx)
-        ctx.emitter.line("(local.set $tmp2)  ;; save arg")
-
-        ctx.emitter.emit_local_get("$tmp")
-        ctx.emitter.emit_local_get("$tmp2")
         if len(args) >= 2:
             compile_expr(args[1], ctx)
             ctx.emitter.emit_call("$method_pop_arg_default")
         else:
             ctx.emitter.emit_call("$method_pop_arg")
 
-        # Update the variable with the modified list (needed for index 0 case)
-        if isinstance(obj, ast.Name):
-            var_name = obj.id
-            ctx.emitter.emit_local_get("$tmp")
-            ctx.emitter.emit_local_get("$tmp2")
-            ctx.emitter.emit_call("$method_pop_arg_update")
-            if var_name in ctx.local_vars:
-                ctx.emitter.emit_local_set(ctx.local_vars[var_name])
-            elif var_name in ctx.global_vars:
-                ctx.emitter.emit_global_set(f"$global_{var_name}")
+        # Returns (value, updated); store the modified list (index 0 case)
+        var_name = obj.id if isinstance(obj, ast.Name) else None
+        if var_name in ctx.local_vars:
+            ctx.emitter.emit_local_set(ctx.local_vars[var_name])
+        elif var_name in ctx.global_vars:
+            ctx.emitter.emit_global_set(f"$global_{var_name}")
+        else:
+            ctx.emitter.line("drop  ;; discard updated collection")
     else:
         compile_expr(obj, ctx)
         ctx.emitter.emit_call("$list_pop")
@@ -792,25 +861,73 @@ def _compile_user_method_call(
 
     ctx.emitter.comment("user-defined method call")
 
-    # Save object for both method lookup and potential self arg
+    # The object stays on the stack: a method call among the args would
+    # overwrite any scratch local
     compile_expr(obj, ctx)
-    ctx.emitter.line("(local.set $tmp)  ;; save object/super")
+    ctx.emitter.emit_string(method)
 
     # Build args list WITHOUT self (dispatch helper will add self/cls if needed)
     _build_pair_chain(args, ctx)
-    ctx.emitter.line("(local.set $tmp2)  ;; save args")
 
-    # Get the method (may be wrapped in STATICMETHOD/CLASSMETHOD)
-    ctx.emitter.line("(local.get $tmp)  ;; object/super for attr lookup")
-    ctx.emitter.emit_string(method)
-    ctx.emitter.emit_call("$object_getattr")
-    ctx.emitter.line("(local.set $chain_val)  ;; save method")
+    # Look up and call the method through the site's inline cache, which
+    # also handles staticmethod/classmethod/regular dispatch
+    ctx.emitter.emit_global_get(ctx.next_attr_ic(method))
+    ctx.emitter.emit_call("$call_method_ic")
 
-    # Call dispatch helper: handles staticmethod/classmethod/regular
-    ctx.emitter.line("(local.get $tmp)  ;; object")
-    ctx.emitter.line("(local.get $chain_val)  ;; method (possibly wrapped)")
-    ctx.emitter.line("(local.get $tmp2)  ;; args")
-    ctx.emitter.emit_call("$call_method_dispatch")
+
+def _resolve_method(
+    obj: ast.Name, method: str, ctx: CompilerContext
+) -> tuple[str, int, str | None] | None:
+    """Find the method a call site reaches, if it is known at compile time.
+
+    That is the case for static/class methods called as Class.method(...),
+    and for any method called on a name that holds an instance of one
+    slotted class on every path (see collect_fixed_instances), when that
+    class has no subclasses (its method table is then fixed). Returns
+    (class name, func_idx, decorator type).
+    """
+    class_name = ctx.get_fixed_instance_class(obj.id)
+    if class_name is not None:
+        if class_name in ctx.base_classes:
+            return None
+    elif obj.id in ctx.fixed_classes:
+        class_name = obj.id
+    else:
+        return None
+
+    resolved = ctx.resolved_methods.get((class_name, method))
+    if resolved is None:
+        return None
+    func_idx, decorator_type = resolved
+    if class_name == obj.id and decorator_type is None:
+        return None  # Class.method(instance, ...) keeps the generic path
+    return class_name, func_idx, decorator_type
+
+
+def _compile_resolved_method_call(
+    obj: ast.Name,
+    resolved: tuple[str, int, str | None],
+    method: str,
+    args: list[ast.expr],
+    ctx: CompilerContext,
+) -> None:
+    """Compile a call to a method resolved by _resolve_method."""
+    class_name, func_idx, decorator_type = resolved
+    kind = decorator_type or "method"
+    ctx.emitter.comment(f"direct {kind} call: {class_name}.{method}()")
+
+    # Regular methods receive the instance, classmethods the class
+    if decorator_type is None:
+        compile_expr(obj, ctx)
+    elif decorator_type == "classmethod":
+        compile_expr(ast.Name(id=class_name, ctx=ast.Load()), ctx)
+    _build_pair_chain(args, ctx)
+    if decorator_type != "staticmethod":
+        ctx.emitter.emit_struct_new("$PAIR")
+
+    # Methods are closures over a null environment
+    ctx.emitter.line("(ref.null $ENV)")
+    ctx.emitter.line(f"(call $user_func_{func_idx})")
 
 
 def _compile_dict_with_kwargs(
@@ -877,7 +994,7 @@ def _compile_slotted_class_instantiation(
     1. Creates a struct with class ref and null fields
     2. Stores it to $tmp
     3. Builds args PAIR chain with self prepended
-    4. Looks up __init__ from class methods
+    4. Reads __init__ from the class's dunder slot
     5. Calls __init__ via indirect call
     6. Returns the instance from $tmp
     """
@@ -906,11 +1023,10 @@ def _compile_slotted_class_instantiation(
         ctx.emitter.emit_struct_new("$PAIR")
     ctx.emitter.line("(local.set $tmp2)  ;; save args with self")
 
-    # Look up __init__ from class methods
+    # Read __init__ from the class's dunder slot
     ctx.emitter.emit_global_get(f"$global_{class_name}")
     ctx.emitter.emit_ref_cast("$CLASS")
-    ctx.emitter.emit_string("__init__")
-    ctx.emitter.emit_call("$class_lookup_method")
+    ctx.emitter.emit_call("$class_init_slot")
     ctx.emitter.emit_ref_cast("$CLOSURE")
     ctx.emitter.line("(local.set $chain_val)  ;; save __init__ closure")
 
@@ -982,7 +1098,6 @@ def _compile_call_with_kwargs(
 
     # Compile the function itself
     ctx.emitter.emit_local_get(ctx.local_vars[func_name])
-    ctx.emitter.emit_string("__init__")
 
     # Find the kwargs dict (kw.arg is None)
     kwargs_dict = next(kw for kw in keywords if kw.arg is None)
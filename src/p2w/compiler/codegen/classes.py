@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 
 from p2w.compiler.analysis import (
     collect_comprehension_locals,
+    collect_fixed_instances,
     collect_iter_locals,
     collect_local_vars,
     collect_with_locals,
@@ -29,7 +30,8 @@ def _get_method_decorator_info(
 
     Returns:
         (decorator_type, property_name) where decorator_type is one of
-        "staticmethod", "classmethod", "property", "setter", "deleter", or None.
+        "staticmethod", "classmethod", "property", "cached_property", "setter",
+        "deleter", or None.
         property_name is set for setter/deleter to indicate which property they belong to.
     """
     decorator_type = None
@@ -40,6 +42,7 @@ def _get_method_decorator_info(
                 "staticmethod",
                 "classmethod",
                 "property",
+                "cached_property",
             }:
                 decorator_type = name
             case ast.Attribute(value=ast.Name(id=prop_name), attr=attr) if attr in {
@@ -52,6 +55,47 @@ def _get_method_decorator_info(
     return decorator_type, property_name
 
 
+# Decorators whose methods become $PROPERTY accessors
+_PROPERTY_DECORATORS = {"property", "cached_property", "setter", "deleter"}
+
+# Decorators whose methods become $METHOD_WRAPPER, with the wrapper's kind
+_METHOD_WRAPPER_KINDS = {"staticmethod": 2, "classmethod": 3}
+
+
+# Nodes that may read a method's args chain (through its ENV) after the
+# prologue has copied the parameters into locals
+_ARGS_CAPTURING_NODES = (
+    ast.Lambda,
+    ast.FunctionDef,
+    ast.AsyncFunctionDef,
+    ast.ClassDef,
+    ast.GeneratorExp,
+    ast.Yield,
+    ast.YieldFrom,
+    ast.Await,
+)
+
+
+def _args_stay_local(method_def: ast.FunctionDef) -> bool:
+    """Check if a method is done with its args chain after the prologue.
+
+    Such a method can be called with a reused (scratch) args chain.
+    """
+    return not any(
+        isinstance(node, _ARGS_CAPTURING_NODES)
+        for stmt in method_def.body
+        for node in ast.walk(stmt)
+    )
+
+
+def _attr_table_capacity(count: int) -> int:
+    """Smallest power of two >= 8 that keeps count at or below 75% load."""
+    capacity = 8
+    while count * 4 > capacity * 3:
+        capacity *= 2
+    return capacity
+
+
 def compile_class_def(
     name: str,
     bases: list[ast.expr],
@@ -63,7 +107,7 @@ def compile_class_def(
 
     # Collect methods and class attributes
     # methods list: (name, FunctionDef, decorator_type, property_name)
-    # decorator_type is "staticmethod", "classmethod", "property", "setter", "deleter", or None
+    # decorator_type is "staticmethod", "classmethod", one of _PROPERTY_DECORATORS, or None
     # property_name is set for setter/deleter to indicate which property they belong to
     methods: list[tuple[str, ast.FunctionDef, str | None, str | None]] = []
     class_attrs: list[tuple[str, ast.expr]] = []
@@ -96,6 +140,7 @@ def compile_class_def(
     # Pre-declare the class name so methods can reference it (e.g., Counter.count)
     # Treat class names as globals so they're accessible from method bodies
     ctx.global_vars.add(name)
+    ctx.class_receivers.add(name)
     if name not in ctx.local_vars:
         local_wasm_name = f"$var_{name}"
         ctx.local_vars[name] = local_wasm_name
@@ -103,21 +148,65 @@ def compile_class_def(
     # Emit each method
     # method_indices: (name, func_idx, decorator_type, property_name)
     method_indices: list[tuple[str, int, str | None, str | None]] = []
+    # Property accessors that may be called with the shared scratch args chain
+    shared_args_funcs: set[int] = set()
     saved_current_class = ctx.current_class
     ctx.current_class = name  # Track class for super(Class, self) support
 
-    for method_name, method_def, decorator_type, property_name in methods:
+    # Methods that call sites may resolve at compile time: the class name
+    # and the method's attribute are never rebound, and the method is the
+    # final binding of its name in the class body
+    direct_call_methods: set[int] = set()
+    if name in ctx.fixed_classes and ctx.assigned_attrs is not None:
+        final_bindings = {method_name: i for i, (method_name, *_) in enumerate(methods)}
+        final_bindings.update((attr_name, -1) for attr_name, _ in class_attrs)
+        direct_call_methods = {
+            i
+            for i, (method_name, _, decorator_type, _) in enumerate(methods)
+            if (decorator_type is None or decorator_type in _METHOD_WRAPPER_KINDS)
+            and final_bindings[method_name] == i
+            and method_name not in ctx.assigned_attrs
+        }
+
+    for method_pos, (
+        method_name,
+        method_def,
+        decorator_type,
+        property_name,
+    ) in enumerate(methods):
         saved_stream = ctx.emitter.stream
         saved_indent = ctx.emitter.indent
         saved_locals = ctx.local_vars
+        saved_fixed_instances = ctx.fixed_instances
 
         ctx.emitter.stream = StringIO()
         ctx.emitter.indent = 0
         ctx.local_vars = {}
+        # A slotted class's methods receive its instances as their first
+        # argument (static and class methods do not)
+        self_class = (
+            name
+            if name in ctx.slotted_classes
+            and decorator_type not in _METHOD_WRAPPER_KINDS
+            else None
+        )
+        ctx.fixed_instances = collect_fixed_instances(
+            method_def.body, set(ctx.slotted_classes), method_def.args, self_class
+        )
         func_idx = len(ctx.user_funcs)
         ctx.user_funcs.append(ctx.emitter.stream)
 
         method_indices.append((method_name, func_idx, decorator_type, property_name))
+        if method_pos in direct_call_methods:
+            ctx.resolved_methods[name, method_name] = (func_idx, decorator_type)
+        if decorator_type in _PROPERTY_DECORATORS and _args_stay_local(method_def):
+            shared_args_funcs.add(func_idx)
+        elif (
+            decorator_type is None
+            and method_def.args.vararg is None
+            and _args_stay_local(method_def)
+        ):
+            ctx.shared_args_methods.add(func_idx)
 
         ctx.emitter.line(
             f"(func $user_func_{func_idx} "
@@ -185,6 +274,11 @@ def compile_class_def(
         if name in ctx.slotted_classes and param_names and param_names[0] == "self":
             ctx.register_slotted_instance("self", name)
 
+        # The first parameter of a classmethod is the class
+        saved_class_receivers = ctx.class_receivers.copy()
+        if decorator_type == "classmethod" and param_names:
+            ctx.class_receivers.add(param_names[0])
+
         ctx.emitter.comment("method prologue")
         ctx.emitter.line(
             "(local.set $env (struct.new $ENV (local.get $env) (local.get $args)))"
@@ -210,6 +304,7 @@ def compile_class_def(
 
         ctx.lexical_env.pop_frame()
         ctx.slotted_instances = saved_slotted_instances  # Restore
+        ctx.class_receivers = saved_class_receivers
 
         ctx.emitter.indent -= 2
         ctx.emitter.line(")")
@@ -217,6 +312,7 @@ def compile_class_def(
         ctx.emitter.stream = saved_stream
         ctx.emitter.indent = saved_indent
         ctx.local_vars = saved_locals
+        ctx.fixed_instances = saved_fixed_instances
 
     ctx.current_class = saved_current_class  # Restore after compiling methods
 
@@ -226,11 +322,14 @@ def compile_class_def(
     # Collect properties and their getter/setter/deleter indices
     # property_info: {prop_name: {"getter": func_idx, "setter": func_idx, "deleter": func_idx}}
     property_info: dict[str, dict[str, int]] = {}
+    cached_properties: set[str] = set()
     for method_name, func_idx, decorator_type, property_name in method_indices:
-        if decorator_type == "property":
+        if decorator_type in {"property", "cached_property"}:
             if method_name not in property_info:
                 property_info[method_name] = {}
             property_info[method_name]["getter"] = func_idx
+            if decorator_type == "cached_property":
+                cached_properties.add(method_name)
         elif decorator_type == "setter" and property_name:
             if property_name not in property_info:
                 property_info[property_name] = {}
@@ -244,37 +343,48 @@ def compile_class_def(
     property_methods: set[str] = set()
     property_methods.update(property_info)
 
+    # The class dict is built from parallel key/value arrays; names come
+    # first, in the same order as the values emitted below
+    entry_names = [
+        method_name
+        for method_name, _, decorator_type, _ in method_indices
+        if decorator_type not in _PROPERTY_DECORATORS
+    ]
+    entry_names.extend(property_info)
+    entry_names.extend(attr_name for attr_name, _ in class_attrs)
+
+    ctx.emitter.emit_string(name)
+    for entry_name in entry_names:
+        ctx.emitter.emit_string(entry_name)
+    ctx.emitter.line(
+        f"(array.new_fixed $ATTR_KEYS {len(entry_names)})  ;; class dict keys"
+    )
+
     # Add regular methods (excluding properties)
     for method_name, func_idx, decorator_type, property_name in method_indices:
         # Skip property-related methods
-        if decorator_type in {"property", "setter", "deleter"}:
+        if decorator_type in _PROPERTY_DECORATORS:
             continue
 
-        ctx.emitter.emit_string(method_name)
         table_idx = len(BUILTINS) + func_idx
-        if decorator_type == "staticmethod":
-            # STATICMETHOD: (closure, padding) - closure is field 0
+        if decorator_type in _METHOD_WRAPPER_KINDS:
+            # METHOD_WRAPPER: (kind, closure)
             ctx.emitter.line(
-                f"(struct.new $CLOSURE (ref.null $ENV) (i32.const {table_idx}))"
+                f"(i32.const {_METHOD_WRAPPER_KINDS[decorator_type]})  ;; kind"
             )
-            ctx.emitter.line("(i32.const 0)  ;; padding")
-            ctx.emitter.line("(struct.new $STATICMETHOD)  ;; wrap as staticmethod")
-        elif decorator_type == "classmethod":
-            # CLASSMETHOD: (padding, closure) - closure is field 1
-            ctx.emitter.line("(i32.const 0)  ;; padding")
             ctx.emitter.line(
                 f"(struct.new $CLOSURE (ref.null $ENV) (i32.const {table_idx}))"
             )
-            ctx.emitter.line("(struct.new $CLASSMETHOD)  ;; wrap as classmethod")
+            ctx.emitter.line(
+                f"(struct.new $METHOD_WRAPPER)  ;; wrap as {decorator_type}"
+            )
         else:
             ctx.emitter.line(
                 f"(struct.new $CLOSURE (ref.null $ENV) (i32.const {table_idx}))"
             )
-        ctx.emitter.line("(struct.new $PAIR)  ;; method name-closure pair")
 
     # Add properties
     for prop_name, info in property_info.items():
-        ctx.emitter.emit_string(prop_name)
         # PROPERTY: (getter, setter, deleter)
         if "getter" in info:
             table_idx = len(BUILTINS) + info["getter"]
@@ -300,33 +410,24 @@ def compile_class_def(
             )
         else:
             ctx.emitter.line("(ref.null $CLOSURE)  ;; no deleter")
+        flags = sum(
+            bit
+            for kind, bit in (("getter", 1), ("setter", 2), ("deleter", 4))
+            if kind in info and info[kind] in shared_args_funcs
+        )
+        if prop_name in cached_properties:
+            flags |= 8
+        ctx.emitter.line(f"(i32.const {flags})  ;; property flags")
         ctx.emitter.line("(struct.new $PROPERTY)  ;; wrap as property")
-        ctx.emitter.line("(struct.new $PAIR)  ;; property name-descriptor pair")
 
     # Add class attributes
-    for attr_name, attr_value in class_attrs:
-        ctx.emitter.emit_string(attr_name)
+    for _, attr_value in class_attrs:
         compile_expr(attr_value, ctx)
-        ctx.emitter.line("(struct.new $PAIR)  ;; class attr name-value pair")
-
-    ctx.emitter.line("(ref.null eq)  ;; methods dict terminator")
-    # Count regular methods (excluding property-related ones)
-    regular_method_count = sum(
-        1
-        for _, _, dt, _ in method_indices
-        if dt not in {"property", "setter", "deleter"}
+    ctx.emitter.line(
+        f"(array.new_fixed $ARRAY_ANY {len(entry_names)})  ;; class dict values"
     )
-    for _ in range(regular_method_count):
-        ctx.emitter.line("(struct.new $PAIR)  ;; methods dict entry")
-    # Count properties
-    for _ in property_info:
-        ctx.emitter.line("(struct.new $PAIR)  ;; property entry")
-    for _ in class_attrs:
-        ctx.emitter.line("(struct.new $PAIR)  ;; class attr entry")
-
-    ctx.emitter.line("(local.set $tmp)  ;; save methods dict")
-    ctx.emitter.emit_string(name)
-    ctx.emitter.line("(local.get $tmp)  ;; methods dict")
+    ctx.emitter.line(f"(i32.const {_attr_table_capacity(len(entry_names))})")
+    ctx.emitter.emit_call("$attr_table_from_arrays")
     # Handle base class
     if bases and len(bases) > 0:
         base = bases[0]
@@ -342,6 +443,8 @@ def compile_class_def(
                 ctx.emitter.line("(ref.cast (ref null $CLASS))  ;; base class")
     else:
         ctx.emitter.line("(ref.null $CLASS)  ;; no base class")
+    ctx.emitter.line("(ref.null eq) (ref.null eq) (i32.const 0)  ;; dunder slots")
+    ctx.emitter.line("(ref.null $ATTR_TABLE) (i32.const 0)  ;; lookup memo")
     ctx.emitter.line(f"(struct.new $CLASS)  ;; class {name}")
 
     # Store to local variable
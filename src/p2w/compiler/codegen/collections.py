@@ -63,11 +63,13 @@ def compile_tuple(elements: list[ast.expr], ctx: CompilerContext) -> None:
 def compile_set(elements: list[ast.expr], ctx: CompilerContext) -> None:
     """Compile set literal."""
 
-    ctx.emitter.comment("set literal")
-    ctx.emitter.emit_list_terminator()
+    # All items at once, so the table is sized a single time
+    ctx.emitter.comment("set literal (hash table)")
     for element in elements:
         compile_expr(element, ctx)
-        ctx.emitter.emit_set_add()
+    ctx.emitter.line(f"(array.new_fixed $ARRAY_ANY {len(elements)})")
+    ctx.emitter.emit_i32_const(len(elements))
+    ctx.emitter.emit_call("$set_from_array")
 
 
 def compile_dict(
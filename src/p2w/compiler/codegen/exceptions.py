@@ -224,7 +224,7 @@ def _try(node: ast.Try, ctx: CompilerContext) -> None:
         # exception and fall through into the handler dispatch below.
         ctx.emitter.comment("synthesize StopIteration exception")
         ctx.emitter.line(
-            "(struct.new $EXCEPTION (call $make_stop_iteration_str) "
+            "(struct.new $EXCEPTION (global.get $str_StopIteration) "
             "(ref.null eq) (ref.null eq) (ref.null eq))"
         )
         ctx.emitter.indent_dec()
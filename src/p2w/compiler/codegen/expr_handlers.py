@@ -14,6 +14,7 @@ from p2w.compiler.analysis import (
     is_float_expr,
     is_large_int_constant,
     is_list_expr,
+    is_set_expr,
     is_string_expr,
     is_tuple_expr,
     is_unknown_type,
@@ -28,7 +29,12 @@ from p2w.compiler.codegen.collections import (
     compile_tuple,
 )
 from p2w.compiler.codegen.expressions import compile_expr
-from p2w.compiler.codegen.fstrings import compile_fstring
+from p2w.compiler.codegen.fstrings import (
+    compile_fstring,
+    compile_value_to_precision_string,
+    compile_value_to_string,
+    converts_to_fresh_string,
+)
 from p2w.compiler.codegen.functions import compile_lambda
 from p2w.compiler.codegen.operators import compile_compare
 from p2w.compiler.codegen.subscript import compile_subscript
@@ -163,6 +169,21 @@ def _operation_might_overflow(
             return False
 
 
+# Set helpers for the bitwise operators on set operands
+_SET_BINOPS: dict[type[ast.operator], str] = {
+    ast.BitAnd: "$set_intersection",
+    ast.BitOr: "$set_union",
+    ast.BitXor: "$set_symmetric_difference",
+}
+
+# Runtime dispatch for the bitwise operators on operands of unknown type
+_BITWISE_DISPATCH: dict[type[ast.operator], str] = {
+    ast.BitAnd: "$bitand_dispatch",
+    ast.BitOr: "$bitor_dispatch",
+    ast.BitXor: "$bitxor_dispatch",
+}
+
+
 @compile_expr.register
 def _binop(node: ast.BinOp, ctx: CompilerContext) -> None:
     """Compile binary operation."""
@@ -352,6 +373,14 @@ def _binop(node: ast.BinOp, ctx: CompilerContext) -> None:
                 return
 
         case ast.Sub():
+            # Set difference
+            if is_set_expr(left):
+                ctx.emitter.comment("set difference")
+                compile_expr(left, ctx)
+                compile_expr(right, ctx)
+                ctx.emitter.emit_call("$set_difference")
+                return
+
             # Runtime dispatch for unknown types (variables, function calls, etc.)
             if is_unknown_type(left) or is_unknown_type(right):
                 ctx.emitter.comment("runtime-dispatch sub")
@@ -360,6 +389,23 @@ def _binop(node: ast.BinOp, ctx: CompilerContext) -> None:
                 ctx.emitter.emit_call("$sub_dispatch")
                 return
 
+        case ast.BitAnd() | ast.BitOr() | ast.BitXor():
+            # Set intersection / union / symmetric difference
+            if is_set_expr(left) or is_set_expr(right):
+                ctx.emitter.comment("set algebra")
+                compile_expr(left, ctx)
+                compile_expr(right, ctx)
+                ctx.emitter.emit_call(_SET_BINOPS[type(op)])
+                return
+
+            # Runtime dispatch for unknown types (int or set operands)
+            if is_unknown_type(left) or is_unknown_type(right):
+                ctx.emitter.comment("runtime-dispatch bitwise")
+                compile_expr(left, ctx)
+                compile_expr(right, ctx)
+                ctx.emitter.emit_call(_BITWISE_DISPATCH[type(op)])
+                return
+
         # Note: ast.Div() is handled early (lines 203-209) with unconditional return
 
         case ast.FloorDiv():
@@ -1065,7 +1111,7 @@ def _setcomp(node: ast.SetComp, ctx: CompilerContext) -> None:
     # First build as a list
     compile_listcomp(node.elt, node.generators, ctx)
     # Then convert to set (removes duplicates)
-    ctx.emitter.emit_call("$list_to_set")
+    ctx.emitter.emit_call("$set_from_iterable")
 
 
 @compile_expr.register
@@ -1137,16 +1183,37 @@ def _attribute(node: ast.Attribute, ctx: CompilerContext) -> None:
                     type_name = ctx.get_slotted_type_name(class_name)
                     # Field index: 0 is $class, slots start at 1
                     field_idx = slot_idx + 1
+                    # The name may have been rebound to another object, so
+                    # test the struct type before the direct field read
                     ctx.emitter.comment(f"slotted attr: {var_name}.{node.attr}")
                     compile_expr(node.value, ctx)
+                    ctx.emitter.line(f"(ref.test (ref {type_name}))")
+                    ctx.emitter.line("(if (result (ref null eq))")
+                    ctx.emitter.line("  (then")
+                    compile_expr(node.value, ctx)
                     ctx.emitter.emit_ref_cast(type_name)
                     ctx.emitter.line(f"(struct.get {type_name} {field_idx})")
+                    ctx.emitter.line("  )")
+                    ctx.emitter.line("  (else")
+                    _compile_generic_attribute(node, ctx)
+                    ctx.emitter.line("  )")
+                    ctx.emitter.line(")")
                     return
 
+    _compile_generic_attribute(node, ctx)
+
+
+def _compile_generic_attribute(node: ast.Attribute, ctx: CompilerContext) -> None:
+    """Compile attribute access through the inline-cached getattr."""
     ctx.emitter.comment(f"attribute access: .{node.attr}")
     compile_expr(node.value, ctx)
     ctx.emitter.emit_string(node.attr)
-    ctx.emitter.emit_call("$object_getattr")
+    ctx.emitter.emit_global_get(ctx.next_attr_ic(node.attr))
+    match node.value:
+        case ast.Name(id=var_name) if var_name in ctx.class_receivers:
+            ctx.emitter.emit_call("$class_getattr_ic")
+        case _:
+            ctx.emitter.emit_call("$object_getattr_ic")
 
 
 def _is_js_object_access(node: ast.expr, ctx: CompilerContext) -> bool:
@@ -1213,13 +1280,14 @@ def _joinedstr(node: ast.JoinedStr, ctx: CompilerContext) -> None:
 @compile_expr.register
 def _formattedvalue(node: ast.FormattedValue, ctx: CompilerContext) -> None:
     """Compile formatted value inside f-string."""
-    compile_expr(node.value, ctx)
-
     # Check for format specifier
     format_spec = _extract_format_spec(node)
     if format_spec:
-        _compile_formatted_with_spec(format_spec, ctx)
+        _compile_formatted_with_spec(node.value, format_spec, ctx)
+    elif node.conversion == -1:
+        compile_value_to_string(node.value, ctx)
     else:
+        compile_expr(node.value, ctx)
         ctx.emitter.emit_call("$value_to_string")
 
 
@@ -1297,17 +1365,31 @@ def _parse_format_spec(spec: str) -> dict:
     return result
 
 
-def _compile_formatted_with_spec(spec: str, ctx: CompilerContext) -> None:
+def _compile_formatted_with_spec(
+    value: ast.expr, spec: str, ctx: CompilerContext
+) -> None:
     """Compile value formatting with a format specification."""
     parsed = _parse_format_spec(spec)
+    # A freshly converted string that later stages replace is garbage:
+    # remember where it starts and rewind the heap to there at the end
+    rewind = (parsed["comma"] or parsed["width"] > 0) and converts_to_fresh_string(
+        value, ctx
+    )
 
     # Handle precision for floats first (before converting to string)
     if parsed["precision"] >= 0:
         ctx.emitter.comment(f"format with precision {parsed['precision']}")
-        ctx.emitter.emit_i32_const(parsed["precision"])
-        ctx.emitter.emit_call("$format_precision")
+        compile_value_to_precision_string(value, parsed["precision"], ctx)
     else:
-        ctx.emitter.emit_call("$value_to_string")
+        compile_value_to_string(value, ctx)
+
+    if rewind:
+        ctx.emitter.emit_local_set("$tmp")
+        ctx.emitter.emit_local_get("$tmp")
+        ctx.emitter.emit_ref_cast("$STRING")
+        ctx.emitter.emit_struct_get("$STRING", 0)
+        ctx.emitter.emit_local_get("$tmp")
+        ctx.emitter.emit_ref_cast("$STRING")
 
     # Handle thousands separator
     if parsed["comma"]:
@@ -1327,6 +1409,9 @@ def _compile_formatted_with_spec(spec: str, ctx: CompilerContext) -> None:
         ctx.emitter.emit_i32_const(align_code)
         ctx.emitter.emit_call("$format_align")
 
+    if rewind:
+        ctx.emitter.emit_call("$arena_rewind")
+
 
 # =============================================================================
 # Walrus Operator
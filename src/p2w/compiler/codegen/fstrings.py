@@ -6,6 +6,8 @@ import ast
 from typing import TYPE_CHECKING
 
 from p2w.compiler.codegen.expressions import compile_expr
+from p2w.compiler.codegen.variables import _emit_raw_f64_value
+from p2w.compiler.types import F64Type, FloatType, NativeType, StringType
 
 if TYPE_CHECKING:
     from p2w.compiler.context import CompilerContext
@@ -28,10 +30,73 @@ def compile_fstring(values: list[ast.expr], ctx: CompilerContext) -> None:
             case ast.FormattedValue():
                 compile_expr(value, ctx)
             case _:
-                compile_expr(value, ctx)
-                ctx.emitter.emit_call("$value_to_string")
+                compile_value_to_string(value, ctx)
 
     # Concatenate
     if len(values) > 1:
         for _ in range(len(values) - 1):
             ctx.emitter.emit_call("$string_concat")
+
+
+def has_typed_to_string(expr: ast.expr, ctx: CompilerContext) -> bool:
+    """Check if `compile_value_to_string` can skip `$value_to_string` for `expr`."""
+    if isinstance(expr, ast.Name) and expr.id in ctx.native_locals:
+        return True
+    return isinstance(ctx.get_expr_type(expr), StringType | FloatType | F64Type)
+
+
+def converts_to_fresh_string(expr: ast.expr, ctx: CompilerContext) -> bool:
+    """Check if converting `expr` always allocates a new string.
+
+    True for the numeric fast paths of `compile_value_to_string` and
+    `compile_value_to_precision_string`, whose converters never return a
+    shared or interned string.
+    """
+    if isinstance(expr, ast.Name) and expr.id in ctx.native_locals:
+        return True
+    return isinstance(ctx.get_expr_type(expr), FloatType | F64Type)
+
+
+def compile_value_to_string(expr: ast.expr, ctx: CompilerContext) -> None:
+    """Compile `expr` and convert it to a $STRING.
+
+    When the static type is known, the typed converter is called directly
+    instead of going through the `$value_to_string` type-test ladder.
+    """
+    match (expr, ctx.get_expr_type(expr)):
+        case (ast.Name(id=name), _) if name in ctx.native_locals:
+            ctx.emitter.emit_local_get(ctx.get_native_local_name(name))
+            match ctx.native_locals[name]:
+                case NativeType.I32:
+                    ctx.emitter.emit_call("$i32_to_string")
+                case NativeType.I64:
+                    ctx.emitter.emit_call("$i64_to_string")
+                case NativeType.F64:
+                    ctx.emitter.emit_call("$f64_to_str")
+        case (_, StringType()):
+            compile_expr(expr, ctx)
+            ctx.emitter.emit_ref_cast("$STRING")
+        case (_, FloatType() | F64Type()):
+            _emit_raw_f64_value(expr, ctx)
+            ctx.emitter.emit_call("$f64_to_str")
+        case _:
+            compile_expr(expr, ctx)
+            ctx.emitter.emit_call("$value_to_string")
+
+
+def compile_value_to_precision_string(
+    expr: ast.expr, precision: int, ctx: CompilerContext
+) -> None:
+    """Compile `expr` formatted with `precision` decimals (`{expr:.Nf}`).
+
+    Statically float values skip the `$format_precision` type tests and go
+    straight to `$f64_format_precision_str` with an unboxed f64.
+    """
+    if isinstance(ctx.get_expr_type(expr), FloatType | F64Type):
+        _emit_raw_f64_value(expr, ctx)
+        ctx.emitter.emit_i32_const(precision)
+        ctx.emitter.emit_call("$f64_format_precision_str")
+    else:
+        compile_expr(expr, ctx)
+        ctx.emitter.emit_i32_const(precision)
+        ctx.emitter.emit_call("$format_precision")
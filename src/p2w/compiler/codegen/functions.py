@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 
 from p2w.compiler.analysis import (
     collect_comprehension_locals,
+    collect_fixed_instances,
     collect_global_decls,
     collect_iter_locals,
     collect_local_vars,
@@ -93,6 +94,7 @@ def _compile_specialized_function(
     saved_stream = ctx.emitter.stream
     saved_indent = ctx.emitter.indent
     saved_locals = ctx.local_vars
+    saved_fixed_instances = ctx.fixed_instances
     saved_inferencer = ctx.type_inferencer
     saved_native_locals = ctx.native_locals
     saved_global_decls = ctx.current_global_decls
@@ -127,6 +129,7 @@ def _compile_specialized_function(
     ctx.emitter.stream = StringIO()
     ctx.emitter.indent = 0
     ctx.local_vars = {}
+    ctx.fixed_instances = collect_fixed_instances(body, set(ctx.slotted_classes), args)
     len(ctx.spec_func_code)
     ctx.spec_func_code.append(ctx.emitter.stream)
 
@@ -259,6 +262,7 @@ def _compile_specialized_function(
     ctx.emitter.stream = saved_stream
     ctx.emitter.indent = saved_indent
     ctx.local_vars = saved_locals
+    ctx.fixed_instances = saved_fixed_instances
     ctx.type_inferencer = saved_inferencer
     ctx.native_locals = saved_native_locals
     ctx.current_global_decls = saved_global_decls
@@ -317,6 +321,7 @@ def compile_function_def(
     saved_stream = ctx.emitter.stream
     saved_indent = ctx.emitter.indent
     saved_locals = ctx.local_vars
+    saved_fixed_instances = ctx.fixed_instances
     saved_global_decls = ctx.current_global_decls
     saved_nonlocal_decls = ctx.current_nonlocal_decls
     saved_cell_vars = ctx.cell_vars
@@ -358,6 +363,7 @@ def compile_function_def(
     ctx.emitter.stream = StringIO()
     ctx.emitter.indent = 0
     ctx.local_vars = {}
+    ctx.fixed_instances = collect_fixed_instances(body, set(ctx.slotted_classes), args)
     func_idx = len(ctx.user_funcs)
     ctx.user_funcs.append(ctx.emitter.stream)
 
@@ -596,6 +602,7 @@ def compile_function_def(
     ctx.emitter.stream = saved_stream
     ctx.emitter.indent = saved_indent
     ctx.local_vars = saved_locals
+    ctx.fixed_instances = saved_fixed_instances
     ctx.current_global_decls = saved_global_decls
     ctx.current_nonlocal_decls = saved_nonlocal_decls
     ctx.cell_vars = saved_cell_vars
@@ -211,6 +211,7 @@ def compile_generator_function(
     saved_stream = ctx.emitter.stream
     saved_indent = ctx.emitter.indent
     saved_locals = ctx.local_vars
+    saved_fixed_instances = ctx.fixed_instances
     saved_global_decls = ctx.current_global_decls
     saved_nonlocal_decls = ctx.current_nonlocal_decls
 
@@ -221,6 +222,7 @@ def compile_generator_function(
     ctx.emitter.stream = StringIO()
     ctx.emitter.indent = 0
     ctx.local_vars = {}
+    ctx.fixed_instances = {}
     body_func_idx = len(ctx.user_funcs)
     ctx.user_funcs.append(ctx.emitter.stream)
 
@@ -287,6 +289,7 @@ def compile_generator_function(
     ctx.emitter.stream = saved_stream
     ctx.emitter.indent = saved_indent
     ctx.local_vars = saved_locals
+    ctx.fixed_instances = saved_fixed_instances
 
     # Now compile the wrapper function (creates and returns GENERATOR)
     ctx.emitter.stream = StringIO()
@@ -364,6 +367,7 @@ def compile_generator_function(
     ctx.emitter.stream = saved_stream
     ctx.emitter.indent = saved_indent
     ctx.local_vars = saved_locals
+    ctx.fixed_instances = saved_fixed_instances
     ctx.current_global_decls = saved_global_decls
     ctx.current_nonlocal_decls = saved_nonlocal_decls
 
@@ -26,6 +26,7 @@ def compile_lambda(args: ast.arguments, body: ast.expr, ctx: CompilerContext) ->
     saved_stream = ctx.emitter.stream
     saved_indent = ctx.emitter.indent
     saved_locals = ctx.local_vars
+    saved_fixed_instances = ctx.fixed_instances
     saved_inferencer = ctx.type_inferencer
 
     # Create type inferencer for lambda - just infer the body expression type
@@ -35,6 +36,7 @@ def compile_lambda(args: ast.arguments, body: ast.expr, ctx: CompilerContext) ->
     ctx.emitter.stream = StringIO()
     ctx.emitter.indent = 0
     ctx.local_vars = {}
+    ctx.fixed_instances = {}
     func_idx = len(ctx.user_funcs)
     ctx.user_funcs.append(ctx.emitter.stream)
 
@@ -97,6 +99,7 @@ def compile_lambda(args: ast.arguments, body: ast.expr, ctx: CompilerContext) ->
     ctx.emitter.stream = saved_stream
     ctx.emitter.indent = saved_indent
     ctx.local_vars = saved_locals
+    ctx.fixed_instances = saved_fixed_instances
     ctx.type_inferencer = saved_inferencer
 
     if captured_vars:
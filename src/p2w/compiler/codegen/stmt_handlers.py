@@ -247,9 +247,8 @@ def _functiondef(node: ast.FunctionDef, ctx: CompilerContext) -> None:
             ctx.emitter.emit_struct_new("$PAIR")  # wrap function in args list
             # Store args temporarily
             ctx.emitter.line("(local.set $tmp)")
-            # call_or_instantiate(callable, init_name, args, env)
+            # call_or_instantiate(callable, args, env)
             compile_expr(decorator, ctx)  # callable
-            ctx.emitter.emit_null_eq()  # init_name (null for functions)
             ctx.emitter.line("(local.get $tmp)")  # args
             ctx.emitter.line("(ref.null $ENV)")  # env override
             ctx.emitter.emit_call("$call_or_instantiate")
@@ -321,6 +320,10 @@ def _importfrom(node: ast.ImportFrom, ctx: CompilerContext) -> None:
     """Compile import from statement."""
     if node.module == "__future__":
         pass  # Ignore __future__ imports
+    elif node.module == "functools" and all(
+        alias.name == "cached_property" and alias.asname is None for alias in node.names
+    ):
+        pass  # Decorator handled natively by the class compiler
     else:
         msg = f"Import not supported: {node.module}"
         raise NotImplementedError(msg)
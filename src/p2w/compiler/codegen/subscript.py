@@ -12,6 +12,7 @@ from p2w.compiler.types import (
     IntType,
     ListType,
     NativeType,
+    StringType,
 )
 
 if TYPE_CHECKING:
@@ -579,6 +580,25 @@ def _compile_slice_index(
             ctx.emitter.emit_i31_get_s()
 
 
+def _is_fast_string_slice(
+    container: ast.expr, slc: ast.Slice, ctx: CompilerContext
+) -> bool:
+    """Check for `s[a:b]` on a str with no step and absent or constant >= 0 bounds."""
+    if slc.step is not None:
+        return False
+    if not isinstance(ctx.get_expr_type(container), StringType):
+        return False
+    return all(
+        bound is None
+        or (
+            isinstance(bound, ast.Constant)
+            and type(bound.value) is int
+            and 0 <= bound.value < 0x7FFFFFFF
+        )
+        for bound in (slc.lower, slc.upper)
+    )
+
+
 def compile_slice(container: ast.expr, slc: ast.Slice, ctx: CompilerContext) -> None:
     """Compile slice access.
 
@@ -586,6 +606,15 @@ def compile_slice(container: ast.expr, slc: ast.Slice, ctx: CompilerContext) ->
     The helper function handles the defaults differently based on step sign.
     """
 
+    if _is_fast_string_slice(container, slc, ctx):
+        ctx.emitter.comment("slice (str, constant non-negative bounds)")
+        compile_expr(container, ctx)
+        ctx.emitter.emit_ref_cast("$STRING")
+        _compile_slice_index(slc.lower, 0, ctx)
+        _compile_slice_index(slc.upper, 0x7FFFFFFF, ctx)
+        ctx.emitter.emit_call("$string_slice_fast")
+        return
+
     ctx.emitter.comment("slice")
     compile_expr(container, ctx)
 
@@ -103,8 +103,10 @@ def compile_var_load(name: str, ctx: CompilerContext) -> None:
         ctx.emitter.comment("builtin object class")
         ctx.emitter.line(
             "(struct.new $CLASS "
-            "(struct.new $STRING (i32.const 0) (i32.const 0)) "
-            "(ref.null eq) (ref.null $CLASS))"
+            "(global.get $str_empty) "
+            "(call $attr_table_new (i32.const 8)) (ref.null $CLASS) "
+            "(ref.null eq) (ref.null eq) (i32.const 0) "
+            "(ref.null $ATTR_TABLE) (i32.const 0))"
         )
         return
 
@@ -8,8 +8,12 @@ from typing import TYPE_CHECKING
 
 from p2w.compiler.analysis import (
     collect_all_global_refs,
+    collect_assigned_attrs,
+    collect_base_class_names,
     collect_class_names,
     collect_comprehension_locals,
+    collect_fixed_classes,
+    collect_fixed_instances,
     collect_function_names,
     collect_iter_locals,
     collect_local_vars,
@@ -25,7 +29,13 @@ from p2w.compiler.inference import TypeInferencer
 from p2w.compiler.inlining import inline_functions
 from p2w.compiler.types import NativeType
 from p2w.emitter import WATEmitter
-from p2w.wat import HELPERS_CODE, IMPORTS_CODE, POST_TYPES_GLOBALS, TYPES_CODE
+from p2w.wat import (
+    HELPERS_CODE,
+    IMPORTS_CODE,
+    POST_TYPES_GLOBALS,
+    RUNTIME_STRINGS_DATA,
+    TYPES_CODE,
+)
 
 # Enable function inlining optimization (Phase 3)
 ENABLE_INLINING = True
@@ -70,14 +80,20 @@ def compile_module(body: list[ast.stmt], stream: TextIO) -> None:
     # Collect slotted classes (classes with __slots__)
     ctx.slotted_classes = collect_slotted_classes(body)
 
+    # Classes whose methods can be resolved at compile time
+    ctx.fixed_classes = collect_fixed_classes(body)
+    ctx.base_classes = collect_base_class_names(body)
+    ctx.assigned_attrs = collect_assigned_attrs(body)
+    ctx.global_fixed_instances = collect_fixed_instances(body, set(ctx.slotted_classes))
+
     emitter.line("(module")
     emitter.indent += 2
 
     # Imports
-    emitter.text(IMPORTS_CODE)
+    emitter.runtime_text(IMPORTS_CODE)
 
     # Type definitions
-    emitter.text(TYPES_CODE)
+    emitter.runtime_text(TYPES_CODE)
 
     # Generate struct types for slotted classes
     if ctx.slotted_classes:
@@ -87,7 +103,7 @@ def compile_module(body: list[ast.stmt], stream: TextIO) -> None:
             _emit_slotted_class_type(class_name, slots, emitter)
 
     # Post-type globals (like Ellipsis singleton)
-    emitter.text(POST_TYPES_GLOBALS)
+    emitter.runtime_text(POST_TYPES_GLOBALS)
 
     # Emit wasm globals
     if ctx.global_vars:
@@ -105,10 +121,10 @@ def compile_module(body: list[ast.stmt], stream: TextIO) -> None:
 
     # Builtin functions
     for builtin in BUILTINS:
-        emitter.text(builtin.code)
+        emitter.runtime_text(builtin.code)
 
     # Helper functions
-    emitter.text(HELPERS_CODE)
+    emitter.runtime_text(HELPERS_CODE)
 
     # Generate slotted dispatch getattr (must come after helpers)
     _emit_slotted_dispatch_getattr(ctx)
@@ -133,6 +149,9 @@ def compile_module(body: list[ast.stmt], stream: TextIO) -> None:
         emitter.line("")
         emitter.text(func_stream.getvalue())
 
+    # Attribute inline caches allocated while compiling the code above
+    _compile_attr_inline_caches(ctx)
+
     # Function table
     _compile_function_table(ctx)
 
@@ -148,10 +167,12 @@ def _compile_user_code(body: list[ast.stmt], ctx: CompilerContext) -> None:
     saved_stream = ctx.emitter.stream
     saved_indent = ctx.emitter.indent
     saved_locals = ctx.local_vars
+    saved_fixed_instances = ctx.fixed_instances
 
     ctx.emitter.stream = StringIO()
     ctx.emitter.indent = 0
     ctx.local_vars = {}
+    ctx.fixed_instances = ctx.global_fixed_instances
     func_idx = len(ctx.user_funcs)
     ctx.user_funcs.append(ctx.emitter.stream)
 
@@ -251,6 +272,7 @@ def _compile_user_code(body: list[ast.stmt], ctx: CompilerContext) -> None:
     ctx.emitter.stream = saved_stream
     ctx.emitter.indent = saved_indent
     ctx.local_vars = saved_locals
+    ctx.fixed_instances = saved_fixed_instances
     ctx.native_locals = saved_native_locals
 
 
@@ -344,8 +366,38 @@ def _compile_event_callback(ctx: CompilerContext) -> None:
     ctx.emitter.line(")")
 
 
+def hash_name(name: str) -> int:
+    """Hash an attribute name the way the runtime's $hash_string does.
+
+    32-bit FNV-1a over the UTF-8 bytes, as an unsigned value.
+    """
+    value = 2166136261
+    for byte in name.encode():
+        value = ((value ^ byte) * 16777619) & 0xFFFFFFFF
+    return value
+
+
+def _compile_attr_inline_caches(ctx: CompilerContext) -> None:
+    """Emit one $ATTR_IC global per cached attribute lookup site.
+
+    Each cache carries the hash of its attribute name, so lookups at the
+    site do not rehash the name.
+    """
+    if not ctx.attr_ic_names:
+        return
+    ctx.emitter.line("")
+    ctx.emitter.comment("Attribute inline caches (see $object_getattr_ic)")
+    for i, name in enumerate(ctx.attr_ic_names):
+        ctx.emitter.line(
+            f"(global $attr_ic_{i} (ref $ATTR_IC) (struct.new $ATTR_IC "
+            f"(ref.null $CLASS) (i32.const 0) (ref.null eq) "
+            f"(i32.const 0) (ref.null $CLOSURE) (ref.null $FUNC) (ref.null $ATTR_IC) "
+            f"(i32.const {hash_name(name)})))  ;; .{name}"
+        )
+
+
 def _compile_function_table(ctx: CompilerContext) -> None:
-    """Compile function table and element sections."""
+    """Compile function table, element sections and $shared_args_methods."""
     ctx.emitter.line("")
     total_funcs = len(BUILTINS) + len(ctx.user_funcs)
     ctx.emitter.line(f"(table {total_funcs} funcref)")
@@ -358,12 +410,27 @@ def _compile_function_table(ctx: CompilerContext) -> None:
         ctx.emitter.line(f"(elem (i32.const {elem_idx}) $user_func_{i})")
         elem_idx += 1
 
+    # Bitmap over table indices of methods that accept a reused head cell
+    words = [0] * ((total_funcs + 31) // 32)
+    for func_idx in ctx.shared_args_methods:
+        table_idx = len(BUILTINS) + func_idx
+        words[table_idx // 32] |= 1 << (table_idx % 32)
+    ctx.emitter.line(
+        f"(global $shared_args_methods (ref $ARRAY_I32) "
+        f"(array.new_fixed $ARRAY_I32 {len(words)}"
+        + "".join(f" (i32.const {word})" for word in words)
+        + "))"
+    )
+
 
 def _compile_memory_section(ctx: CompilerContext) -> None:
     """Compile memory and data sections."""
     ctx.emitter.line("")
     ctx.emitter.line('(memory (export "memory") 16)')
 
+    # Runtime string literals referenced by the helper globals
+    ctx.emitter.text(RUNTIME_STRINGS_DATA)
+
     if ctx.emitter.string_map:
         sorted_strings = sorted(ctx.emitter.string_map.items(), key=lambda x: x[1][0])
         for s, (offset, _length) in sorted_strings:
@@ -429,22 +496,24 @@ def _emit_slotted_dispatch_getattr(ctx: CompilerContext) -> None:
     """Generate $slotted_dispatch_getattr function for runtime attribute access.
 
     This function is called by $object_getattr when it encounters a slotted
-    instance. It dispatches to the correct struct field based on the attribute
-    name and the runtime type of the object.
+    instance whose class was not known at compile time (known receivers get a
+    direct struct.get). It tests the runtime type and tail-calls a getter
+    specialized for that class, which compares the name against per-slot
+    string constants.
 
     Generated code looks like:
+        (global $slot_name_Record_x (ref $STRING) (struct.new $STRING ...))
         (func $slotted_dispatch_getattr (param $obj (ref null eq)) (param $name (ref null eq)) (result (ref null eq))
-          ;; Check if obj is Record
           (if (ref.test (ref $SLOTTED_Record) (local.get $obj))
-            (then
-              ;; Check each slot name
-              (if (call $strings_equal (ref.cast (ref $STRING) (local.get $name)) (struct.new $STRING offset len))
-                (then (return (struct.get $SLOTTED_Record 1 (ref.cast (ref $SLOTTED_Record) (local.get $obj))))))
-              ...
-            )
-          )
+            (then (return_call $slotted_getattr_Record ...)))
           (ref.null eq)  ;; Not found
         )
+        (func $slotted_getattr_Record (param $obj (ref $SLOTTED_Record)) (param $name (ref $STRING)) (result (ref null eq))
+          (if (call $strings_equal (local.get $name) (global.get $slot_name_Record_x))
+            (then (return (struct.get $SLOTTED_Record 1 (local.get $obj)))))
+          ...
+          (call $class_lookup_method ...)  ;; methods
+        )
     """
     emitter = ctx.emitter
 
@@ -462,6 +531,17 @@ def _emit_slotted_dispatch_getattr(ctx: CompilerContext) -> None:
         _emit_slotted_dispatch_setattr(ctx)
         return
 
+    # Slot names are compared on every dynamic access: build them once
+    emitter.line("")
+    emitter.comment("Slot name constants for the slotted dispatch functions")
+    for class_name, slots in ctx.slotted_classes.items():
+        for slot_name in slots:
+            str_offset, str_len = emitter.intern_string(slot_name)
+            emitter.line(
+                f"(global $slot_name_{class_name}_{slot_name} (ref $STRING) "
+                f"(struct.new $STRING (i32.const {str_offset}) (i32.const {str_len}) (i32.const 0)))"
+            )
+
     emitter.line("")
     emitter.comment(
         "Slotted dispatch getattr - runtime attribute access for slotted instances"
@@ -471,51 +551,47 @@ def _emit_slotted_dispatch_getattr(ctx: CompilerContext) -> None:
         "(param $name (ref null eq)) (result (ref null eq))"
     )
     emitter.indent += 2
+    for class_name in ctx.slotted_classes:
+        type_name = f"$SLOTTED_{class_name}"
+        emitter.line(f"(if (ref.test (ref {type_name}) (local.get $obj))")
+        emitter.line(
+            f"  (then (return_call $slotted_getattr_{class_name} "
+            f"(ref.cast (ref {type_name}) (local.get $obj)) "
+            "(ref.cast (ref $STRING) (local.get $name)))))"
+        )
+    # Not found in any slotted type
+    emitter.line("(ref.null eq)")
+    emitter.indent -= 2
+    emitter.line(")")
 
     for class_name, slots in ctx.slotted_classes.items():
         type_name = f"$SLOTTED_{class_name}"
-
-        # Check if obj is this slotted type
-        emitter.line(f"(if (ref.test (ref {type_name}) (local.get $obj))")
-        emitter.indent += 2
-        emitter.line("(then")
+        emitter.line("")
+        emitter.line(
+            f"(func $slotted_getattr_{class_name} (param $obj (ref {type_name})) "
+            "(param $name (ref $STRING)) (result (ref null eq))"
+        )
         emitter.indent += 2
 
         # Check each slot name
         for idx, slot_name in enumerate(slots):
             field_idx = idx + 1  # Field 0 is $class
-            # Get the string offset for this slot name
-            str_offset, str_len = emitter.intern_string(slot_name)
-
             emitter.line(
-                f"(if (call $strings_equal "
-                f"(ref.cast (ref $STRING) (local.get $name)) "
-                f"(struct.new $STRING (i32.const {str_offset}) (i32.const {str_len})))"
+                f"(if (call $strings_equal (local.get $name) "
+                f"(global.get $slot_name_{class_name}_{slot_name}))"
             )
-            emitter.indent += 2
             emitter.line(
-                f"(then (return (struct.get {type_name} {field_idx} "
-                f"(ref.cast (ref {type_name}) (local.get $obj))))))"
+                f"  (then (return (struct.get {type_name} {field_idx} (local.get $obj)))))"
             )
-            emitter.indent -= 2
 
         # Also check class methods (for method calls on slotted instances)
         emitter.line(
-            "(return (call $class_lookup_method "
-            "(struct.get $INSTANCE_BASE 0 (ref.cast (ref $INSTANCE_BASE) (local.get $obj))) "
-            "(local.get $name)))"
+            f"(call $class_lookup_method (struct.get {type_name} 0 (local.get $obj)) "
+            "(local.get $name))"
         )
-
-        emitter.indent -= 2
-        emitter.line(")")
         emitter.indent -= 2
         emitter.line(")")
 
-    # Not found in any slotted type
-    emitter.line("(ref.null eq)")
-    emitter.indent -= 2
-    emitter.line(")")
-
     # Also generate setattr dispatch
     _emit_slotted_dispatch_setattr(ctx)
 
@@ -548,53 +624,51 @@ def _emit_slotted_dispatch_setattr(ctx: CompilerContext) -> None:
         "(param $name (ref null eq)) (param $value (ref null eq)) (result (ref null eq))"
     )
     emitter.indent += 2
+    for class_name in ctx.slotted_classes:
+        type_name = f"$SLOTTED_{class_name}"
+        emitter.line(f"(if (ref.test (ref {type_name}) (local.get $obj))")
+        emitter.line(
+            f"  (then (return_call $slotted_setattr_{class_name} "
+            f"(ref.cast (ref {type_name}) (local.get $obj)) "
+            "(ref.cast (ref $STRING) (local.get $name)) (local.get $value))))"
+        )
+    # Not a slotted type - return obj unchanged
+    emitter.line("(local.get $obj)")
+    emitter.indent -= 2
+    emitter.line(")")
 
     for class_name, slots in ctx.slotted_classes.items():
         type_name = f"$SLOTTED_{class_name}"
-
-        # Check if obj is this slotted type
-        emitter.line(f"(if (ref.test (ref {type_name}) (local.get $obj))")
-        emitter.indent += 2
-        emitter.line("(then")
+        emitter.line("")
+        emitter.line(
+            f"(func $slotted_setattr_{class_name} (param $obj (ref {type_name})) "
+            "(param $name (ref $STRING)) (param $value (ref null eq)) "
+            "(result (ref null eq))"
+        )
         emitter.indent += 2
 
         # Check each slot name
         for idx, slot_name in enumerate(slots):
             field_idx = idx + 1  # Field 0 is $class
-            # Get the string offset for this slot name
-            str_offset, str_len = emitter.intern_string(slot_name)
-
             emitter.line(
-                f"(if (call $strings_equal "
-                f"(ref.cast (ref $STRING) (local.get $name)) "
-                f"(struct.new $STRING (i32.const {str_offset}) (i32.const {str_len})))"
+                f"(if (call $strings_equal (local.get $name) "
+                f"(global.get $slot_name_{class_name}_{slot_name}))"
             )
             emitter.indent += 2
             emitter.line("(then")
-            emitter.indent += 2
             emitter.line(
-                f"(struct.set {type_name} {field_idx} "
-                f"(ref.cast (ref {type_name}) (local.get $obj)) "
-                f"(local.get $value))"
+                f"  (struct.set {type_name} {field_idx} (local.get $obj) "
+                "(local.get $value))"
             )
-            emitter.line("(return (local.get $obj))")
-            emitter.indent -= 2
+            emitter.line("  (return (local.get $obj))")
             emitter.line(")")
             emitter.indent -= 2
             emitter.line(")")
 
         # Slot not found - return obj unchanged (shouldn't happen in valid code)
-        emitter.line("(return (local.get $obj))")
-
+        emitter.line("(local.get $obj)")
         emitter.indent -= 2
         emitter.line(")")
-        emitter.indent -= 2
-        emitter.line(")")
-
-    # Not a slotted type - return obj unchanged
-    emitter.line("(local.get $obj)")
-    emitter.indent -= 2
-    emitter.line(")")
 
 
 # Keep WasmCompiler for backward compatibility
@@ -166,6 +166,35 @@ class CompilerContext:
     # This persists across function compilations for module-level globals
     global_slotted_instances: dict[str, str] = field(default_factory=dict)
 
+    # Variables of the current scope (and module-level globals) that hold an
+    # instance of one class on every path, so calls on them resolve statically
+    fixed_instances: dict[str, str] = field(default_factory=dict)
+    global_fixed_instances: dict[str, str] = field(default_factory=dict)
+
+    # Attribute name of each inline cache ($attr_ic_N globals) allocated so far
+    attr_ic_names: list[str] = field(default_factory=list)
+
+    # User functions (indices into user_funcs) that are done with their args
+    # chain after the prologue; call sites may pass them a reused head cell
+    shared_args_methods: set[int] = field(default_factory=set)
+
+    # Classes whose name is bound by their class statement alone, names used
+    # as base classes, and the attribute names assigned anywhere (None if
+    # setattr/delattr is used)
+    fixed_classes: set[str] = field(default_factory=set)
+    base_classes: set[str] = field(default_factory=set)
+    assigned_attrs: set[str] | None = None
+
+    # Methods of fixed classes whose binding is known at compile time:
+    # (class name, method name) -> (func_idx, decorator type or None)
+    resolved_methods: dict[tuple[str, str], tuple[int, str | None]] = field(
+        default_factory=dict
+    )
+
+    # Names expected to hold a class (class names, cls in classmethods);
+    # attribute reads on them use $class_getattr_ic, which tests $CLASS first
+    class_receivers: set[str] = field(default_factory=set)
+
     def next_label_id(self) -> int:
         """Generate a unique label ID."""
         label_id = self._label_counter
@@ -178,6 +207,12 @@ class CompilerContext:
         self._with_counter += 1
         return with_id
 
+    def next_attr_ic(self, attr_name: str) -> str:
+        """Allocate an attribute inline cache global, return its WASM name."""
+        ic_name = f"$attr_ic_{len(self.attr_ic_names)}"
+        self.attr_ic_names.append(attr_name)
+        return ic_name
+
     def get_expr_type(self, node: ast.expr) -> BaseType:
         """Get inferred type for expression.
 
@@ -265,3 +300,15 @@ class CompilerContext:
             return self.slotted_instances[var_name]
         # Check global scope
         return self.global_slotted_instances.get(var_name)
+
+    def get_fixed_instance_class(self, var_name: str) -> str | None:
+        """Get the class a variable holds on every path, if known.
+
+        Locals use the current scope's analysis; names captured from an
+        enclosing function are unknown; other names are module globals.
+        """
+        if var_name in self.local_vars:
+            return self.fixed_instances.get(var_name)
+        if self.lexical_env.contains(var_name):
+            return None
+        return self.global_fixed_instances.get(var_name)
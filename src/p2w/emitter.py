@@ -7,9 +7,21 @@ between AST traversal/analysis and code generation.
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TextIO
 
 
+def _indent_block(code: str, indent: int) -> str:
+    """Strip a multi-line WAT block and indent each of its lines."""
+    pad = " " * indent
+    return "".join(f"{pad}{ln}\n" for ln in code.strip().split("\n"))
+
+
+# The runtime (imports, types, builtins, helpers) is the same for every
+# module, so it is rendered once per indentation level
+_indent_runtime_block = cache(_indent_block)
+
+
 class WATEmitter:
     """Generates WebAssembly Text (WAT) code.
 
@@ -45,8 +57,11 @@ class WATEmitter:
 
     def text(self, code: str) -> None:
         """Emit multi-line WAT code, preserving internal structure."""
-        for ln in code.strip().split("\n"):
-            self.stream.write(" " * self.indent + ln + "\n")
+        self.stream.write(_indent_block(code, self.indent))
+
+    def runtime_text(self, code: str) -> None:
+        """Emit a constant runtime WAT block (rendered once and reused)."""
+        self.stream.write(_indent_runtime_block(code, self.indent))
 
     def comment(self, text: str) -> None:
         """Emit a WAT comment."""
@@ -78,8 +93,13 @@ class WATEmitter:
 
     def emit_string(self, s: str) -> None:
         """Emit a string constant reference."""
+        if not s:
+            self.line("(global.get $str_empty)")
+            return
         offset, length = self.intern_string(s)
-        self.line(f"(struct.new $STRING (i32.const {offset}) (i32.const {length}))")
+        self.line(
+            f"(struct.new $STRING (i32.const {offset}) (i32.const {length}) (i32.const 0))"
+        )
 
     def intern_bytes(self, data: bytes) -> tuple[int, int]:
         """Intern a bytes constant, returning (offset, length).
@@ -192,10 +212,6 @@ class WATEmitter:
             self.line(f"  (i32.const {count})")
             self.line(")")
 
-    def emit_set_add(self) -> None:
-        """Emit call to $set_add (adds element to set with deduplication)."""
-        self.line("(call $set_add)")
-
     def emit_list_reverse(self) -> None:
         """Emit call to $list_reverse."""
         self.line("call $list_reverse")
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from .builtins import BUILTINS_CODE
 from .helpers import HELPERS_CODE
-from .imports import IMPORTS_CODE, POST_TYPES_GLOBALS
+from .imports import IMPORTS_CODE, POST_TYPES_GLOBALS, RUNTIME_STRINGS_DATA
 from .types import TYPES_CODE
 
 __all__ = [
@@ -16,5 +16,6 @@ __all__ = [
     "HELPERS_CODE",
     "IMPORTS_CODE",
     "POST_TYPES_GLOBALS",
+    "RUNTIME_STRINGS_DATA",
     "TYPES_CODE",
 ]
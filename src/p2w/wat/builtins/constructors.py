@@ -31,11 +31,15 @@ INT_CODE = """
     (then (return (ref.i31 (i32.trunc_f64_s
       (struct.get $FLOAT 0 (ref.cast (ref $FLOAT) (local.get $val)))))))
   )
-  ;; String - parse with base
+  ;; String - parse with base (decimal goes straight to the fast path)
   (if (ref.test (ref $STRING) (local.get $val))
-    (then (return (ref.i31 (call $parse_int_base
-      (ref.cast (ref $STRING) (local.get $val))
-      (local.get $base)))))
+    (then
+      (if (ref.is_null (local.get $arg2))
+        (then (return (ref.i31 (call $parse_int_base10
+          (ref.cast (ref $STRING) (local.get $val)))))))
+      (return (ref.i31 (call $parse_int_base
+        (ref.cast (ref $STRING) (local.get $val))
+        (local.get $base)))))
   )
   ;; Default return 0
   (ref.i31 (i32.const 0))
@@ -61,13 +65,12 @@ STR_CODE = """
 (func $str (param $args (ref null eq)) (param $env (ref null $ENV)) (result (ref null eq))
   (local $val (ref null eq))
   (local $method_result (ref null eq))
-  (local $method_name (ref $STRING))
   (local $offset i32)
   (local $bytes_off i32)
   (local $bytes_len i32)
   (local $i i32)
   (if (ref.is_null (local.get $args))
-    (then (return (struct.new $STRING (i32.const 0) (i32.const 0))))
+    (then (return (global.get $str_empty)))
   )
   (local.set $val (struct.get $PAIR 0 (ref.cast (ref $PAIR) (local.get $args))))
 
@@ -93,7 +96,7 @@ STR_CODE = """
             )
           )
           (global.set $string_heap (i32.add (local.get $offset) (local.get $bytes_len)))
-          (return (struct.new $STRING (local.get $offset) (local.get $bytes_len)))
+          (return (struct.new $STRING (local.get $offset) (local.get $bytes_len) (i32.const 0)))
         )
       )
     )
@@ -102,23 +105,11 @@ STR_CODE = """
   ;; Check for OBJECT with __str__ special method
   (if (ref.test (ref $OBJECT) (local.get $val))
     (then
-      ;; Create string "__str__" (7 chars: 95,95,115,116,114,95,95)
-      (local.set $offset (global.get $string_heap))
-      (i32.store8 (local.get $offset) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 115))  ;; s
-      (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 116))  ;; t
-      (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 114))  ;; r
-      (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 6)) (i32.const 95))  ;; _
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 7)))
-      (local.set $method_name (struct.new $STRING (local.get $offset) (i32.const 7)))
-
-      ;; Call __str__(self) - args = (PAIR self null)
-      (local.set $method_result (call $object_call_method
+      ;; Call __str__(self)
+      (local.set $method_result (call $object_call_method_fast
         (local.get $val)
-        (local.get $method_name)
-        (struct.new $PAIR (local.get $val) (ref.null eq))
+        (global.get $str___str__)
+        (ref.null eq)
         (local.get $env)
       ))
       ;; If method returned a value, use it
@@ -185,6 +176,14 @@ LIST_CODE = """
   (if (ref.test (ref $EMPTY_LIST) (local.get $val))
     (then (return (struct.new $EMPTY_LIST)))
   )
+  ;; If $SET, collect its elements into a $LIST
+  (if (ref.test (ref $SET) (local.get $val))
+    (then
+      (return (call $list (struct.new $PAIR
+        (call $set_elements (ref.cast (ref $SET) (local.get $val)))
+        (ref.null eq)) (ref.null $ENV)))
+    )
+  )
   ;; If TUPLE, convert to PAIR chain
   (if (ref.test (ref $TUPLE) (local.get $val))
     (then (return (call $tuple_to_pair (ref.cast (ref $TUPLE) (local.get $val)))))
@@ -209,11 +208,11 @@ LIST_CODE = """
           (local.set $char_off (global.get $string_heap))
           (i32.store8 (local.get $char_off)
             (i32.load8_u (i32.add (local.get $off) (local.get $i))))
-          (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 1)))
+          (global.set $string_heap (i32.add (local.get $char_off) (i32.const 1)))
           ;; Prepend to result
           (local.set $result
             (struct.new $PAIR
-              (struct.new $STRING (local.get $char_off) (i32.const 1))
+              (struct.new $STRING (local.get $char_off) (i32.const 1) (i32.const 0))
               (local.get $result)))
           (local.set $i (i32.sub (local.get $i) (i32.const 1)))
           (br $loop)
@@ -281,6 +280,10 @@ TUPLE_CODE = """
   (if (ref.test (ref $EMPTY_LIST) (local.get $val))
     (then (return (struct.new $EMPTY_LIST)))
   )
+  ;; If $SET, its elements as a fresh PAIR chain
+  (if (ref.test (ref $SET) (local.get $val))
+    (then (return (call $copy_list (local.get $val))))
+  )
   ;; If STRING, convert to tuple of single-character strings
   (if (ref.test (ref $STRING) (local.get $val))
     (then
@@ -301,11 +304,11 @@ TUPLE_CODE = """
           (local.set $char_off (global.get $string_heap))
           (i32.store8 (local.get $char_off)
             (i32.load8_u (i32.add (local.get $off) (local.get $i))))
-          (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 1)))
+          (global.set $string_heap (i32.add (local.get $char_off) (i32.const 1)))
           ;; Prepend to result
           (local.set $result
             (struct.new $PAIR
-              (struct.new $STRING (local.get $char_off) (i32.const 1))
+              (struct.new $STRING (local.get $char_off) (i32.const 1) (i32.const 0))
               (local.get $result)))
           (local.set $i (i32.sub (local.get $i) (i32.const 1)))
           (br $loop)
@@ -321,53 +324,12 @@ TUPLE_CODE = """
 
 SET_CODE = """
 (func $set (param $args (ref null eq)) (param $env (ref null $ENV)) (result (ref null eq))
-  (local $val (ref null eq))
-  (local $current (ref null eq))
-  (local $result (ref null eq))
-  (local $elem (ref null eq))
   ;; No args: return empty set
   (if (ref.is_null (local.get $args))
-    (then (return (struct.new $EMPTY_LIST)))
-  )
-  (local.set $val (struct.get $PAIR 0 (ref.cast (ref $PAIR) (local.get $args))))
-  ;; If $LIST (array-backed), use list_to_set
-  (if (ref.test (ref $LIST) (local.get $val))
-    (then (return (call $list_to_set (local.get $val))))
+    (then (return (call $set_new)))
   )
-  ;; If already a PAIR chain, deduplicate it
-  (if (ref.test (ref $PAIR) (local.get $val))
-    (then
-      ;; Build deduplicated result by iterating and checking for duplicates
-      (local.set $result (ref.null eq))
-      (local.set $current (local.get $val))
-      (block $done
-        (loop $loop
-          (br_if $done (ref.is_null (local.get $current)))
-          (if (i32.eqz (ref.test (ref $PAIR) (local.get $current)))
-            (then (br $done))
-          )
-          (local.set $elem (struct.get $PAIR 0 (ref.cast (ref $PAIR) (local.get $current))))
-          ;; Check if elem is already in result
-          (if (i32.eqz (call $list_contains (local.get $elem) (local.get $result)))
-            (then
-              ;; Add to result
-              (local.set $result (struct.new $PAIR (local.get $elem) (local.get $result)))
-            )
-          )
-          (local.set $current (struct.get $PAIR 1 (ref.cast (ref $PAIR) (local.get $current))))
-          (br $loop)
-        )
-      )
-      ;; Reverse to maintain original order (first occurrence)
-      (return (call $list_reverse (local.get $result)))
-    )
-  )
-  ;; If $EMPTY_LIST, return new empty set
-  (if (ref.test (ref $EMPTY_LIST) (local.get $val))
-    (then (return (struct.new $EMPTY_LIST)))
-  )
-  ;; For other types, return empty set
-  (struct.new $EMPTY_LIST)
+  ;; set(iterable): hash every element into a new set (drops duplicates)
+  (call $set_from_iterable (struct.get $PAIR 0 (ref.cast (ref $PAIR) (local.get $args))))
 )
 """
 
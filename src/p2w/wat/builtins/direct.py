@@ -13,8 +13,6 @@ LEN_DIRECT_CODE = """
 ;; len_1: direct single-arg len (no PAIR unpacking)
 (func $len_1 (param $val (ref null eq)) (result (ref null eq))
   (local $method_result (ref null eq))
-  (local $method_name (ref $STRING))
-  (local $offset i32)
   ;; Check for null
   (if (ref.is_null (local.get $val))
     (then (return (ref.i31 (i32.const 0))))
@@ -54,11 +52,11 @@ LEN_DIRECT_CODE = """
       (return (ref.i31 (struct.get $STRING 1 (ref.cast (ref $STRING) (local.get $val)))))
     )
   )
-  ;; SET length (hash table count)
+  ;; SET length (live entries)
   (if (ref.test (ref $SET) (local.get $val))
     (then
-      (return (ref.i31 (struct.get $HASHTABLE $count
-        (struct.get $SET $table (ref.cast (ref $SET) (local.get $val))))))
+      (return (ref.i31 (struct.get $SET $used
+        (ref.cast (ref $SET) (local.get $val)))))
     )
   )
   ;; EMPTY_LIST marker
@@ -68,22 +66,11 @@ LEN_DIRECT_CODE = """
   ;; OBJECT: try __len__ method
   (if (ref.test (ref $OBJECT) (local.get $val))
     (then
-      ;; Create string "__len__"
-      (local.set $offset (global.get $string_heap))
-      (i32.store8 (local.get $offset) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 108))  ;; l
-      (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 101))  ;; e
-      (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 110))  ;; n
-      (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 6)) (i32.const 95))  ;; _
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 7)))
-      (local.set $method_name (struct.new $STRING (local.get $offset) (i32.const 7)))
       ;; Try to call __len__ method
-      (local.set $method_result (call $object_call_method
+      (local.set $method_result (call $object_call_method_fast
         (local.get $val)
-        (local.get $method_name)
-        (struct.new $PAIR (local.get $val) (ref.null eq))
+        (global.get $str___len__)
+        (ref.null eq)
         (ref.null $ENV)
       ))
       (if (i32.eqz (ref.is_null (local.get $method_result)))
@@ -170,12 +157,12 @@ CHR_DIRECT_CODE = """
       (local.set $offset (global.get $string_heap))
       (i32.store8 (local.get $offset) (local.get $code))
       (global.set $string_heap (i32.add (local.get $offset) (i32.const 1)))
-      (return (struct.new $STRING (local.get $offset) (i32.const 1)))
+      (return (struct.new $STRING (local.get $offset) (i32.const 1) (i32.const 0)))
     )
   )
   ;; Error case - return empty string
   (local.set $offset (global.get $string_heap))
-  (struct.new $STRING (local.get $offset) (i32.const 0))
+  (struct.new $STRING (local.get $offset) (i32.const 0) (i32.const 0))
 )
 """
 
@@ -87,6 +87,12 @@ ISINSTANCE_CODE = """
           (return (i32.const 0))
         )
       )
+      ;; set = 20: check if obj is $SET
+      (if (i32.eq (local.get $func_idx) (i32.const 20))
+        (then
+          (return (ref.test (ref $SET) (local.get $obj)))
+        )
+      )
       ;; bytes = 30: check if obj is $BYTES
       (if (i32.eq (local.get $func_idx) (i32.const 30))
         (then
@@ -483,6 +489,12 @@ TYPE_CODE = """
       (return (struct.new $CLOSURE (ref.null $ENV) (i32.const 19)))
     )
   )
+  ;; For SET, return set CLOSURE (index 20)
+  (if (ref.test (ref $SET) (local.get $obj))
+    (then
+      (return (struct.new $CLOSURE (ref.null $ENV) (i32.const 20)))
+    )
+  )
   ;; For BYTES, return bytes CLOSURE (index 30)
   (if (ref.test (ref $BYTES) (local.get $obj))
     (then
@@ -93,33 +93,21 @@ PRINT_CODE = """
   ;; null (None)
   (if (ref.is_null (local.get $v))
     (then
-      ;; print "None"
-      (call $write_char (i32.const 78))   ;; N
-      (call $write_char (i32.const 111))  ;; o
-      (call $write_char (i32.const 110))  ;; n
-      (call $write_char (i32.const 101))  ;; e
+      (call $emit_string (global.get $str_None))
       (return)
     )
   )
   ;; $EMPTY_LIST - print "[]"
   (if (ref.test (ref $EMPTY_LIST) (local.get $v))
     (then
-      (call $write_char (i32.const 91))   ;; [
-      (call $write_char (i32.const 93))   ;; ]
+      (call $emit_string (global.get $str_empty_list))
       (return)
     )
   )
   ;; $ELLIPSIS - print "Ellipsis"
   (if (ref.test (ref $ELLIPSIS) (local.get $v))
     (then
-      (call $write_char (i32.const 69))   ;; E
-      (call $write_char (i32.const 108))  ;; l
-      (call $write_char (i32.const 108))  ;; l
-      (call $write_char (i32.const 105))  ;; i
-      (call $write_char (i32.const 112))  ;; p
-      (call $write_char (i32.const 115))  ;; s
-      (call $write_char (i32.const 105))  ;; i
-      (call $write_char (i32.const 115))  ;; s
+      (call $emit_string (global.get $str_Ellipsis))
       (return)
     )
   )
@@ -140,23 +128,8 @@ PRINT_CODE = """
   ;; bool
   (if (ref.test (ref $BOOL) (local.get $v))
     (then
-      (if (struct.get $BOOL 0 (ref.cast (ref $BOOL) (local.get $v)))
-        (then
-          ;; True
-          (call $write_char (i32.const 84))   ;; T
-          (call $write_char (i32.const 114))  ;; r
-          (call $write_char (i32.const 117))  ;; u
-          (call $write_char (i32.const 101))  ;; e
-        )
-        (else
-          ;; False
-          (call $write_char (i32.const 70))   ;; F
-          (call $write_char (i32.const 97))   ;; a
-          (call $write_char (i32.const 108))  ;; l
-          (call $write_char (i32.const 115))  ;; s
-          (call $write_char (i32.const 101))  ;; e
-        )
-      )
+      (call $emit_string (select (result (ref $STRING)) (global.get $str_True) (global.get $str_False)
+        (struct.get $BOOL 0 (ref.cast (ref $BOOL) (local.get $v)))))
       (return)
     )
   )
@@ -213,6 +186,13 @@ PRINT_CODE = """
       (return)
     )
   )
+  ;; $SET - print {elem, ...} (or set() when empty)
+  (if (ref.test (ref $SET) (local.get $v))
+    (then
+      (call $emit_string (call $set_to_string (ref.cast (ref $SET) (local.get $v))))
+      (return)
+    )
+  )
   ;; $CLOSURE - print as type (for type() builtin)
   (if (ref.test (ref $CLOSURE) (local.get $v))
     (then
@@ -232,106 +212,29 @@ PRINT_CODE = """
 )
 
 ;; emit_type_name: print type name based on builtin function index
-;; Indices: 6=int, 7=bool, 8=str, 11=float, 13=list, 18=dict, 19=tuple, 30=bytes
+;; The interned "<class '...'>" text comes from $builtin_class_strings
 (func $emit_type_name (param $idx i32)
-  ;; Print "<class '"
-  (call $write_char (i32.const 60))   ;; <
-  (call $write_char (i32.const 99))   ;; c
-  (call $write_char (i32.const 108))  ;; l
-  (call $write_char (i32.const 97))   ;; a
-  (call $write_char (i32.const 115))  ;; s
-  (call $write_char (i32.const 115))  ;; s
-  (call $write_char (i32.const 32))   ;; space
-  (call $write_char (i32.const 39))   ;; '
-  ;; Print type name based on index
-  (if (i32.eq (local.get $idx) (i32.const 6))
-    (then
-      (call $write_char (i32.const 105))  ;; i
-      (call $write_char (i32.const 110))  ;; n
-      (call $write_char (i32.const 116))  ;; t
-    )
-  )
-  (if (i32.eq (local.get $idx) (i32.const 7))
-    (then
-      (call $write_char (i32.const 98))   ;; b
-      (call $write_char (i32.const 111))  ;; o
-      (call $write_char (i32.const 111))  ;; o
-      (call $write_char (i32.const 108))  ;; l
-    )
-  )
-  (if (i32.eq (local.get $idx) (i32.const 8))
-    (then
-      (call $write_char (i32.const 115))  ;; s
-      (call $write_char (i32.const 116))  ;; t
-      (call $write_char (i32.const 114))  ;; r
-    )
-  )
-  (if (i32.eq (local.get $idx) (i32.const 11))
-    (then
-      (call $write_char (i32.const 102))  ;; f
-      (call $write_char (i32.const 108))  ;; l
-      (call $write_char (i32.const 111))  ;; o
-      (call $write_char (i32.const 97))   ;; a
-      (call $write_char (i32.const 116))  ;; t
-    )
-  )
-  (if (i32.eq (local.get $idx) (i32.const 13))
+  (local $cls_str (ref null $STRING))
+  (if (i32.lt_u (local.get $idx) (array.len (global.get $builtin_class_strings)))
     (then
-      (call $write_char (i32.const 108))  ;; l
-      (call $write_char (i32.const 105))  ;; i
-      (call $write_char (i32.const 115))  ;; s
-      (call $write_char (i32.const 116))  ;; t
+      (local.set $cls_str (array.get $ARRAY_STRING (global.get $builtin_class_strings) (local.get $idx)))
     )
   )
-  (if (i32.eq (local.get $idx) (i32.const 18))
+  (if (ref.is_null (local.get $cls_str))
     (then
-      (call $write_char (i32.const 100))  ;; d
-      (call $write_char (i32.const 105))  ;; i
-      (call $write_char (i32.const 99))   ;; c
-      (call $write_char (i32.const 116))  ;; t
-    )
-  )
-  (if (i32.eq (local.get $idx) (i32.const 19))
-    (then
-      (call $write_char (i32.const 116))  ;; t
-      (call $write_char (i32.const 117))  ;; u
-      (call $write_char (i32.const 112))  ;; p
-      (call $write_char (i32.const 108))  ;; l
-      (call $write_char (i32.const 101))  ;; e
-    )
-  )
-  (if (i32.eq (local.get $idx) (i32.const 30))
-    (then
-      (call $write_char (i32.const 98))   ;; b
-      (call $write_char (i32.const 121))  ;; y
-      (call $write_char (i32.const 116))  ;; t
-      (call $write_char (i32.const 101))  ;; e
-      (call $write_char (i32.const 115))  ;; s
+      (call $emit_string (global.get $str_class_prefix))
+      (call $emit_string (global.get $str_class_suffix))
+      (return)
     )
   )
-  ;; Print "'>"
-  (call $write_char (i32.const 39))   ;; '
-  (call $write_char (i32.const 62))   ;; >
+  (call $emit_string (ref.as_non_null (local.get $cls_str)))
 )
 
 ;; emit_class_type: print <class 'ClassName'> for user-defined classes
 (func $emit_class_type (param $cls (ref $CLASS))
-  (local $name (ref $STRING))
-  ;; Print "<class '"
-  (call $write_char (i32.const 60))   ;; <
-  (call $write_char (i32.const 99))   ;; c
-  (call $write_char (i32.const 108))  ;; l
-  (call $write_char (i32.const 97))   ;; a
-  (call $write_char (i32.const 115))  ;; s
-  (call $write_char (i32.const 115))  ;; s
-  (call $write_char (i32.const 32))   ;; space
-  (call $write_char (i32.const 39))   ;; '
-  ;; Print class name
-  (local.set $name (struct.get $CLASS 0 (local.get $cls)))
-  (call $emit_string (local.get $name))
-  ;; Print "'>"
-  (call $write_char (i32.const 39))   ;; '
-  (call $write_char (i32.const 62))   ;; >
+  (call $emit_string (global.get $str_class_prefix))
+  (call $emit_string (struct.get $CLASS 0 (local.get $cls)))
+  (call $emit_string (global.get $str_class_suffix))
 )
 
 ;; is_list_pair: check if PAIR is a list element (cdr is PAIR or null)
@@ -564,18 +467,14 @@ PRINT_CODE = """
   ;; null (None)
   (if (ref.is_null (local.get $v))
     (then
-      (call $write_char (i32.const 78))   ;; N
-      (call $write_char (i32.const 111))  ;; o
-      (call $write_char (i32.const 110))  ;; n
-      (call $write_char (i32.const 101))  ;; e
+      (call $emit_string (global.get $str_None))
       (return)
     )
   )
   ;; $EMPTY_LIST - print "[]"
   (if (ref.test (ref $EMPTY_LIST) (local.get $v))
     (then
-      (call $write_char (i32.const 91))   ;; [
-      (call $write_char (i32.const 93))   ;; ]
+      (call $emit_string (global.get $str_empty_list))
       (return)
     )
   )
@@ -6,8 +6,6 @@ LEN_CODE = """
 (func $len (param $args (ref null eq)) (param $env (ref null $ENV)) (result (ref null eq))
   (local $val (ref null eq))
   (local $method_result (ref null eq))
-  (local $method_name (ref $STRING))
-  (local $offset i32)
   ;; Get first argument
   (if (ref.is_null (local.get $args))
     (then
@@ -19,23 +17,11 @@ LEN_CODE = """
   ;; Check for OBJECT with __len__ special method
   (if (ref.test (ref $OBJECT) (local.get $val))
     (then
-      ;; Create string "__len__" (7 chars: 95,95,108,101,110,95,95)
-      (local.set $offset (global.get $string_heap))
-      (i32.store8 (local.get $offset) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 108))  ;; l
-      (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 101))  ;; e
-      (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 110))  ;; n
-      (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 6)) (i32.const 95))  ;; _
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 7)))
-      (local.set $method_name (struct.new $STRING (local.get $offset) (i32.const 7)))
-
-      ;; Call __len__(self) - args = (PAIR self null)
-      (local.set $method_result (call $object_call_method
+      ;; Call __len__(self)
+      (local.set $method_result (call $object_call_method_fast
         (local.get $val)
-        (local.get $method_name)
-        (struct.new $PAIR (local.get $val) (ref.null eq))
+        (global.get $str___len__)
+        (ref.null eq)
         (local.get $env)
       ))
       ;; If method returned a value, use it
@@ -65,6 +51,13 @@ LEN_CODE = """
         (struct.get $DICT $table (ref.cast (ref $DICT) (local.get $val))))))
     )
   )
+  ;; $SET (live entries)
+  (if (ref.test (ref $SET) (local.get $val))
+    (then
+      (return (ref.i31 (struct.get $SET $used
+        (ref.cast (ref $SET) (local.get $val)))))
+    )
+  )
   ;; PAIR chain (list/tuple)
   (if (ref.test (ref $PAIR) (local.get $val))
     (then
@@ -155,6 +148,15 @@ MIN_CODE = """
           (return (local.get $result))
         )
       )
+      ;; $SET: walk its elements as a PAIR chain
+      (if (ref.test (ref $SET) (local.get $first_arg))
+        (then
+          (local.set $first_arg (call $set_elements (ref.cast (ref $SET) (local.get $first_arg))))
+          (if (ref.is_null (local.get $first_arg))
+            (then (return (ref.null eq)))  ;; Empty set
+          )
+        )
+      )
       ;; Slow path: check if iterable (PAIR, etc)
       (if (ref.test (ref $PAIR) (local.get $first_arg))
         (then (local.set $current (local.get $first_arg)))
@@ -262,6 +264,15 @@ MAX_CODE = """
           (return (local.get $result))
         )
       )
+      ;; $SET: walk its elements as a PAIR chain
+      (if (ref.test (ref $SET) (local.get $first_arg))
+        (then
+          (local.set $first_arg (call $set_elements (ref.cast (ref $SET) (local.get $first_arg))))
+          (if (ref.is_null (local.get $first_arg))
+            (then (return (ref.null eq)))  ;; Empty set
+          )
+        )
+      )
       ;; Slow path: check if iterable (PAIR, etc)
       (if (ref.test (ref $PAIR) (local.get $first_arg))
         (then (local.set $current (local.get $first_arg)))
@@ -620,59 +631,10 @@ FILTER_CODE = """
 
 SORTED_CODE = """
 (func $sorted (param $args (ref null eq)) (param $env (ref null $ENV)) (result (ref null eq))
-  (local $list (ref null eq))
-  (local $result (ref null eq))
-  (local $current (ref null eq))
-  (local $changed i32)
-  (local $a (ref null eq))
-  (local $b (ref null eq))
-  (local $tmp (ref null eq))
-  ;; Get argument
   (if (ref.is_null (local.get $args))
     (then (return (struct.new $EMPTY_LIST)))
   )
-  (local.set $list (struct.get $PAIR 0 (ref.cast (ref $PAIR) (local.get $args))))
-  ;; Copy list first (sorted returns new list)
-  (local.set $result (call $copy_list (local.get $list)))
-  ;; Handle empty list - return early
-  (if (ref.test (ref $EMPTY_LIST) (local.get $result))
-    (then (return (local.get $result)))
-  )
-  (if (ref.is_null (local.get $result))
-    (then (return (struct.new $EMPTY_LIST)))
-  )
-  ;; Bubble sort
-  (local.set $changed (i32.const 1))
-  (block $sort_done
-    (loop $sort_loop
-      (br_if $sort_done (i32.eqz (local.get $changed)))
-      (local.set $changed (i32.const 0))
-      (local.set $current (local.get $result))
-      (block $pass_done
-        (loop $pass
-          (br_if $pass_done (ref.is_null (local.get $current)))
-          (br_if $pass_done (ref.is_null (struct.get $PAIR 1 (ref.cast (ref $PAIR) (local.get $current)))))
-          (local.set $a (struct.get $PAIR 0 (ref.cast (ref $PAIR) (local.get $current))))
-          (local.set $b (struct.get $PAIR 0 (ref.cast (ref $PAIR)
-            (struct.get $PAIR 1 (ref.cast (ref $PAIR) (local.get $current))))))
-          ;; Compare and swap if needed
-          (if (call $compare_values (local.get $a) (local.get $b))
-            (then
-              ;; Swap
-              (struct.set $PAIR 0 (ref.cast (ref $PAIR) (local.get $current)) (local.get $b))
-              (struct.set $PAIR 0 (ref.cast (ref $PAIR)
-                (struct.get $PAIR 1 (ref.cast (ref $PAIR) (local.get $current)))) (local.get $a))
-              (local.set $changed (i32.const 1))
-            )
-          )
-          (local.set $current (struct.get $PAIR 1 (ref.cast (ref $PAIR) (local.get $current))))
-          (br $pass)
-        )
-      )
-      (br $sort_loop)
-    )
-  )
-  (local.get $result)
+  (call $sorted_values (struct.get $PAIR 0 (ref.cast (ref $PAIR) (local.get $args))))
 )
 """
 
@@ -8,60 +8,59 @@ CHR_CODE = """
   (local $offset i32)
   (local $len i32)
   (if (ref.is_null (local.get $args))
-    (then (return (struct.new $STRING (i32.const 0) (i32.const 0))))
+    (then (return (global.get $str_empty)))
   )
   (local.set $code (i31.get_s (ref.cast (ref i31)
     (struct.get $PAIR 0 (ref.cast (ref $PAIR) (local.get $args))))))
+  ;; ASCII: a view into $str_ascii, nothing written to the string heap
+  (if (i32.lt_u (local.get $code) (i32.const 0x80))
+    (then
+      (return (struct.new $STRING
+        (i32.add (struct.get $STRING 0 (global.get $str_ascii)) (local.get $code))
+        (i32.const 1) (i32.const 0)))
+    )
+  )
   (local.set $offset (global.get $string_heap))
 
-  ;; UTF-8 encoding
-  (if (i32.lt_u (local.get $code) (i32.const 0x80))
+  ;; UTF-8 encoding (2-4 bytes)
+  (if (i32.lt_u (local.get $code) (i32.const 0x800))
     (then
-      ;; 1-byte: 0xxxxxxx (ASCII)
-      (i32.store8 (local.get $offset) (local.get $code))
-      (local.set $len (i32.const 1))
+      ;; 2-byte: 110xxxxx 10xxxxxx
+      (i32.store8 (local.get $offset)
+        (i32.or (i32.const 0xC0) (i32.shr_u (local.get $code) (i32.const 6))))
+      (i32.store8 (i32.add (local.get $offset) (i32.const 1))
+        (i32.or (i32.const 0x80) (i32.and (local.get $code) (i32.const 0x3F))))
+      (local.set $len (i32.const 2))
     )
     (else
-      (if (i32.lt_u (local.get $code) (i32.const 0x800))
+      (if (i32.lt_u (local.get $code) (i32.const 0x10000))
         (then
-          ;; 2-byte: 110xxxxx 10xxxxxx
+          ;; 3-byte: 1110xxxx 10xxxxxx 10xxxxxx
           (i32.store8 (local.get $offset)
-            (i32.or (i32.const 0xC0) (i32.shr_u (local.get $code) (i32.const 6))))
+            (i32.or (i32.const 0xE0) (i32.shr_u (local.get $code) (i32.const 12))))
           (i32.store8 (i32.add (local.get $offset) (i32.const 1))
+            (i32.or (i32.const 0x80) (i32.and (i32.shr_u (local.get $code) (i32.const 6)) (i32.const 0x3F))))
+          (i32.store8 (i32.add (local.get $offset) (i32.const 2))
             (i32.or (i32.const 0x80) (i32.and (local.get $code) (i32.const 0x3F))))
-          (local.set $len (i32.const 2))
+          (local.set $len (i32.const 3))
         )
         (else
-          (if (i32.lt_u (local.get $code) (i32.const 0x10000))
-            (then
-              ;; 3-byte: 1110xxxx 10xxxxxx 10xxxxxx
-              (i32.store8 (local.get $offset)
-                (i32.or (i32.const 0xE0) (i32.shr_u (local.get $code) (i32.const 12))))
-              (i32.store8 (i32.add (local.get $offset) (i32.const 1))
-                (i32.or (i32.const 0x80) (i32.and (i32.shr_u (local.get $code) (i32.const 6)) (i32.const 0x3F))))
-              (i32.store8 (i32.add (local.get $offset) (i32.const 2))
-                (i32.or (i32.const 0x80) (i32.and (local.get $code) (i32.const 0x3F))))
-              (local.set $len (i32.const 3))
-            )
-            (else
-              ;; 4-byte: 11110xxx 10xxxxxx 10xxxxxx 10xxxxxx
-              (i32.store8 (local.get $offset)
-                (i32.or (i32.const 0xF0) (i32.shr_u (local.get $code) (i32.const 18))))
-              (i32.store8 (i32.add (local.get $offset) (i32.const 1))
-                (i32.or (i32.const 0x80) (i32.and (i32.shr_u (local.get $code) (i32.const 12)) (i32.const 0x3F))))
-              (i32.store8 (i32.add (local.get $offset) (i32.const 2))
-                (i32.or (i32.const 0x80) (i32.and (i32.shr_u (local.get $code) (i32.const 6)) (i32.const 0x3F))))
-              (i32.store8 (i32.add (local.get $offset) (i32.const 3))
-                (i32.or (i32.const 0x80) (i32.and (local.get $code) (i32.const 0x3F))))
-              (local.set $len (i32.const 4))
-            )
-          )
+          ;; 4-byte: 11110xxx 10xxxxxx 10xxxxxx 10xxxxxx
+          (i32.store8 (local.get $offset)
+            (i32.or (i32.const 0xF0) (i32.shr_u (local.get $code) (i32.const 18))))
+          (i32.store8 (i32.add (local.get $offset) (i32.const 1))
+            (i32.or (i32.const 0x80) (i32.and (i32.shr_u (local.get $code) (i32.const 12)) (i32.const 0x3F))))
+          (i32.store8 (i32.add (local.get $offset) (i32.const 2))
+            (i32.or (i32.const 0x80) (i32.and (i32.shr_u (local.get $code) (i32.const 6)) (i32.const 0x3F))))
+          (i32.store8 (i32.add (local.get $offset) (i32.const 3))
+            (i32.or (i32.const 0x80) (i32.and (local.get $code) (i32.const 0x3F))))
+          (local.set $len (i32.const 4))
         )
       )
     )
   )
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $len)))
-  (struct.new $STRING (local.get $offset) (local.get $len))
+  (global.set $string_heap (i32.add (local.get $offset) (local.get $len)))
+  (struct.new $STRING (local.get $offset) (local.get $len) (i32.const 0))
 )
 """
 
@@ -82,34 +81,19 @@ REPR_CODE = """
 (func $repr (param $args (ref null eq)) (param $env (ref null $ENV)) (result (ref null eq))
   (local $val (ref null eq))
   (local $method_result (ref null eq))
-  (local $method_name (ref $STRING))
-  (local $offset i32)
   (if (ref.is_null (local.get $args))
-    (then (return (struct.new $STRING (i32.const 0) (i32.const 0))))
+    (then (return (global.get $str_empty)))
   )
   (local.set $val (struct.get $PAIR 0 (ref.cast (ref $PAIR) (local.get $args))))
 
   ;; Check for OBJECT with __repr__ special method
   (if (ref.test (ref $OBJECT) (local.get $val))
     (then
-      ;; Create string "__repr__" (8 chars: 95,95,114,101,112,114,95,95)
-      (local.set $offset (global.get $string_heap))
-      (i32.store8 (local.get $offset) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 114))  ;; r
-      (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 101))  ;; e
-      (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 112))  ;; p
-      (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 114))  ;; r
-      (i32.store8 (i32.add (local.get $offset) (i32.const 6)) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 7)) (i32.const 95))  ;; _
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 8)))
-      (local.set $method_name (struct.new $STRING (local.get $offset) (i32.const 8)))
-
-      ;; Call __repr__(self) - args = (PAIR self null)
-      (local.set $method_result (call $object_call_method
+      ;; Call __repr__(self)
+      (local.set $method_result (call $object_call_method_fast
         (local.get $val)
-        (local.get $method_name)
-        (struct.new $PAIR (local.get $val) (ref.null eq))
+        (global.get $str___repr__)
+        (ref.null eq)
         (local.get $env)
       ))
       ;; If method returned a value, use it
@@ -143,19 +127,20 @@ HEX_CODE = """
   (local $temp i32)
   ;; Get argument
   (if (ref.is_null (local.get $args))
-    (then (return (struct.new $STRING (global.get $string_heap) (i32.const 0))))
+    (then (return (global.get $str_empty)))
   )
   (local.set $val (struct.get $PAIR 0 (ref.cast (ref $PAIR) (local.get $args))))
   (local.set $n (i31.get_s (ref.cast (ref i31) (local.get $val))))
+  (local.set $start (global.get $string_heap))
   ;; Handle zero
   (if (i32.eqz (local.get $n))
     (then
-      (local.set $dst (global.get $string_heap))
+      (local.set $dst (local.get $start))
       (i32.store8 (local.get $dst) (i32.const 48))  ;; '0'
       (i32.store8 (i32.add (local.get $dst) (i32.const 1)) (i32.const 120))  ;; 'x'
       (i32.store8 (i32.add (local.get $dst) (i32.const 2)) (i32.const 48))  ;; '0'
       (global.set $string_heap (i32.add (local.get $dst) (i32.const 3)))
-      (return (struct.new $STRING (local.get $dst) (i32.const 3)))
+      (return (struct.new $STRING (local.get $dst) (i32.const 3) (i32.const 0)))
     )
   )
   ;; Handle negative
@@ -164,7 +149,7 @@ HEX_CODE = """
     (then (local.set $n (i32.sub (i32.const 0) (local.get $n))))
   )
   ;; Write hex digits in reverse, starting from a temp position
-  (local.set $dst (i32.add (global.get $string_heap) (i32.const 20)))
+  (local.set $dst (i32.add (local.get $start) (i32.const 20)))
   (local.set $len (i32.const 0))
   (block $done
     (loop $loop
@@ -195,10 +180,9 @@ HEX_CODE = """
     )
   )
   ;; Copy to final position
-  (local.set $start (global.get $string_heap))
   (memory.copy (local.get $start) (local.get $dst) (local.get $len))
   (global.set $string_heap (i32.add (local.get $start) (local.get $len)))
-  (struct.new $STRING (local.get $start) (local.get $len))
+  (struct.new $STRING (local.get $start) (local.get $len) (i32.const 0))
 )
 """
 
@@ -214,19 +198,20 @@ BIN_CODE = """
   (local $len i32)
   ;; Get argument
   (if (ref.is_null (local.get $args))
-    (then (return (struct.new $STRING (global.get $string_heap) (i32.const 0))))
+    (then (return (global.get $str_empty)))
   )
   (local.set $val (struct.get $PAIR 0 (ref.cast (ref $PAIR) (local.get $args))))
   (local.set $n (i31.get_s (ref.cast (ref i31) (local.get $val))))
+  (local.set $start (global.get $string_heap))
   ;; Handle zero
   (if (i32.eqz (local.get $n))
     (then
-      (local.set $dst (global.get $string_heap))
+      (local.set $dst (local.get $start))
       (i32.store8 (local.get $dst) (i32.const 48))  ;; '0'
       (i32.store8 (i32.add (local.get $dst) (i32.const 1)) (i32.const 98))  ;; 'b'
       (i32.store8 (i32.add (local.get $dst) (i32.const 2)) (i32.const 48))  ;; '0'
       (global.set $string_heap (i32.add (local.get $dst) (i32.const 3)))
-      (return (struct.new $STRING (local.get $dst) (i32.const 3)))
+      (return (struct.new $STRING (local.get $dst) (i32.const 3) (i32.const 0)))
     )
   )
   ;; Handle negative
@@ -235,7 +220,7 @@ BIN_CODE = """
     (then (local.set $n (i32.sub (i32.const 0) (local.get $n))))
   )
   ;; Write binary digits in reverse
-  (local.set $dst (i32.add (global.get $string_heap) (i32.const 40)))
+  (local.set $dst (i32.add (local.get $start) (i32.const 40)))
   (local.set $len (i32.const 0))
   (block $done
     (loop $loop
@@ -263,10 +248,9 @@ BIN_CODE = """
     )
   )
   ;; Copy to final position
-  (local.set $start (global.get $string_heap))
   (memory.copy (local.get $start) (local.get $dst) (local.get $len))
   (global.set $string_heap (i32.add (local.get $start) (local.get $len)))
-  (struct.new $STRING (local.get $start) (local.get $len))
+  (struct.new $STRING (local.get $start) (local.get $len) (i32.const 0))
 )
 """
 
@@ -282,19 +266,20 @@ OCT_CODE = """
   (local $len i32)
   ;; Get argument
   (if (ref.is_null (local.get $args))
-    (then (return (struct.new $STRING (global.get $string_heap) (i32.const 0))))
+    (then (return (global.get $str_empty)))
   )
   (local.set $val (struct.get $PAIR 0 (ref.cast (ref $PAIR) (local.get $args))))
   (local.set $n (i31.get_s (ref.cast (ref i31) (local.get $val))))
+  (local.set $start (global.get $string_heap))
   ;; Handle zero
   (if (i32.eqz (local.get $n))
     (then
-      (local.set $dst (global.get $string_heap))
+      (local.set $dst (local.get $start))
       (i32.store8 (local.get $dst) (i32.const 48))  ;; '0'
       (i32.store8 (i32.add (local.get $dst) (i32.const 1)) (i32.const 111))  ;; 'o'
       (i32.store8 (i32.add (local.get $dst) (i32.const 2)) (i32.const 48))  ;; '0'
       (global.set $string_heap (i32.add (local.get $dst) (i32.const 3)))
-      (return (struct.new $STRING (local.get $dst) (i32.const 3)))
+      (return (struct.new $STRING (local.get $dst) (i32.const 3) (i32.const 0)))
     )
   )
   ;; Handle negative
@@ -303,7 +288,7 @@ OCT_CODE = """
     (then (local.set $n (i32.sub (i32.const 0) (local.get $n))))
   )
   ;; Write octal digits in reverse
-  (local.set $dst (i32.add (global.get $string_heap) (i32.const 20)))
+  (local.set $dst (i32.add (local.get $start) (i32.const 20)))
   (local.set $len (i32.const 0))
   (block $done
     (loop $loop
@@ -331,10 +316,9 @@ OCT_CODE = """
     )
   )
   ;; Copy to final position
-  (local.set $start (global.get $string_heap))
   (memory.copy (local.get $start) (local.get $dst) (local.get $len))
   (global.set $string_heap (i32.add (local.get $start) (local.get $len)))
-  (struct.new $STRING (local.get $start) (local.get $len))
+  (struct.new $STRING (local.get $start) (local.get $len) (i32.const 0))
 )
 """
 
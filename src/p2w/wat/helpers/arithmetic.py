@@ -172,6 +172,11 @@ ARITHMETIC_CODE = """
   (local $fa f64)
   (local $fb f64)
 
+  ;; Set difference
+  (if (ref.test (ref $SET) (local.get $a))
+    (then (return (call $set_difference (local.get $a) (local.get $b))))
+  )
+
   ;; Check if both are floats
   (if (i32.and
         (ref.test (ref $FLOAT) (local.get $a))
@@ -221,6 +226,39 @@ ARITHMETIC_CODE = """
 )
 
 
+;; bitand_dispatch / bitor_dispatch / bitxor_dispatch: runtime-dispatch
+;; bitwise operators - set algebra when the left operand is a set,
+;; otherwise i31 integer ops
+(func $bitand_dispatch (param $a (ref null eq)) (param $b (ref null eq)) (result (ref null eq))
+  (if (ref.test (ref $SET) (local.get $a))
+    (then (return (call $set_intersection (local.get $a) (local.get $b))))
+  )
+  (ref.i31 (i32.and
+    (i31.get_s (ref.cast (ref i31) (local.get $a)))
+    (i31.get_s (ref.cast (ref i31) (local.get $b)))))
+)
+
+
+(func $bitor_dispatch (param $a (ref null eq)) (param $b (ref null eq)) (result (ref null eq))
+  (if (ref.test (ref $SET) (local.get $a))
+    (then (return (call $set_union (local.get $a) (local.get $b))))
+  )
+  (ref.i31 (i32.or
+    (i31.get_s (ref.cast (ref i31) (local.get $a)))
+    (i31.get_s (ref.cast (ref i31) (local.get $b)))))
+)
+
+
+(func $bitxor_dispatch (param $a (ref null eq)) (param $b (ref null eq)) (result (ref null eq))
+  (if (ref.test (ref $SET) (local.get $a))
+    (then (return (call $set_symmetric_difference (local.get $a) (local.get $b))))
+  )
+  (ref.i31 (i32.xor
+    (i31.get_s (ref.cast (ref i31) (local.get $a)))
+    (i31.get_s (ref.cast (ref i31) (local.get $b)))))
+)
+
+
 ;; div_dispatch: runtime-dispatch division operation (true division, returns float)
 (func $div_dispatch (param $a (ref null eq)) (param $b (ref null eq)) (result (ref null eq))
   (local $fa f64)
@@ -367,20 +405,15 @@ ARITHMETIC_CODE = """
 ;; Calls __matmul__ on the left operand, or __rmatmul__ on the right if not found
 (func $matmul_dispatch (param $a (ref null eq)) (param $b (ref null eq)) (result (ref null eq))
   (local $result (ref null eq))
-  (local $method (ref null eq))
-  (local $args (ref null eq))
 
   ;; Check if left operand is an OBJECT
   (if (ref.test (ref $OBJECT) (local.get $a))
     (then
-      ;; Build args list: (self, other, null) = (a, b, null)
-      (local.set $args (struct.new $PAIR (local.get $a)
-        (struct.new $PAIR (local.get $b) (ref.null eq))))
-      ;; Call __matmul__ method
-      (local.set $result (call $object_call_method
+      ;; Call __matmul__(self, other); the helper prepends self
+      (local.set $result (call $object_call_method_fast
         (local.get $a)
-        (call $make_string_matmul)
-        (local.get $args)
+        (global.get $str___matmul__)
+        (struct.new $PAIR (local.get $b) (ref.null eq))
         (ref.null $ENV)))
       (if (i32.eqz (ref.is_null (local.get $result)))
         (then (return (local.get $result)))
@@ -391,14 +424,11 @@ ARITHMETIC_CODE = """
   ;; Try __rmatmul__ on right operand
   (if (ref.test (ref $OBJECT) (local.get $b))
     (then
-      ;; Build args list: (self, other, null) = (b, a, null)
-      (local.set $args (struct.new $PAIR (local.get $b)
-        (struct.new $PAIR (local.get $a) (ref.null eq))))
-      ;; Call __rmatmul__ method
-      (local.set $result (call $object_call_method
+      ;; Call __rmatmul__(self, other); the helper prepends self
+      (local.set $result (call $object_call_method_fast
         (local.get $b)
-        (call $make_string_rmatmul)
-        (local.get $args)
+        (global.get $str___rmatmul__)
+        (struct.new $PAIR (local.get $a) (ref.null eq))
         (ref.null $ENV)))
       (return (local.get $result))
     )
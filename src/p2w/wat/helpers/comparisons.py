@@ -19,31 +19,45 @@ COMPARISONS_CODE = """
   (if (ref.is_null (local.get $b))
     (then (return (i32.const 1)))  ;; anything > null
   )
+  ;; Same-type fast paths: b is only tested once a has matched, so the
+  ;; common homogeneous case costs two ref.tests instead of six.
   ;; Both i31 (integers)
-  (if (i32.and (ref.test (ref i31) (local.get $a)) (ref.test (ref i31) (local.get $b)))
+  (if (ref.test (ref i31) (local.get $a))
     (then
-      (return (i32.gt_s
-        (i31.get_s (ref.cast (ref i31) (local.get $a)))
-        (i31.get_s (ref.cast (ref i31) (local.get $b)))))
+      (if (ref.test (ref i31) (local.get $b))
+        (then
+          (return (i32.gt_s
+            (i31.get_s (ref.cast (ref i31) (local.get $a)))
+            (i31.get_s (ref.cast (ref i31) (local.get $b)))))
+        )
+      )
     )
   )
   ;; Both floats
-  (if (i32.and (ref.test (ref $FLOAT) (local.get $a)) (ref.test (ref $FLOAT) (local.get $b)))
+  (if (ref.test (ref $FLOAT) (local.get $a))
     (then
-      (return (f64.gt
-        (struct.get $FLOAT 0 (ref.cast (ref $FLOAT) (local.get $a)))
-        (struct.get $FLOAT 0 (ref.cast (ref $FLOAT) (local.get $b)))))
+      (if (ref.test (ref $FLOAT) (local.get $b))
+        (then
+          (return (f64.gt
+            (struct.get $FLOAT 0 (ref.cast (ref $FLOAT) (local.get $a)))
+            (struct.get $FLOAT 0 (ref.cast (ref $FLOAT) (local.get $b)))))
+        )
+      )
     )
   )
   ;; Both strings - use lexicographic comparison
-  (if (i32.and (ref.test (ref $STRING) (local.get $a)) (ref.test (ref $STRING) (local.get $b)))
+  (if (ref.test (ref $STRING) (local.get $a))
     (then
-      ;; $strings_compare returns -1/0/1; we want 1 if a > b
-      (return (i32.gt_s
-        (call $strings_compare
-          (ref.cast (ref $STRING) (local.get $a))
-          (ref.cast (ref $STRING) (local.get $b)))
-        (i32.const 0)))
+      (if (ref.test (ref $STRING) (local.get $b))
+        (then
+          ;; $strings_compare returns -1/0/1; we want 1 if a > b
+          (return (i32.gt_s
+            (call $strings_compare
+              (ref.cast (ref $STRING) (local.get $a))
+              (ref.cast (ref $STRING) (local.get $b)))
+            (i32.const 0)))
+        )
+      )
     )
   )
   ;; Mixed int/float
@@ -69,6 +83,37 @@ COMPARISONS_CODE = """
 )
 
 
+;; values_equal_fast: key equality for hash lookups
+;; Identity first (like CPython's containers, so a NaN key finds itself), then
+;; the common key types without the full $values_equal dispatch: distinct
+;; i31s are never equal, and two strings go straight to $strings_equal.
+(func $values_equal_fast (param $a (ref null eq)) (param $b (ref null eq)) (result i32)
+  (if (ref.eq (local.get $a) (local.get $b))
+    (then (return (i32.const 1)))
+  )
+  (if (ref.test (ref i31) (local.get $a))
+    (then
+      (if (ref.test (ref i31) (local.get $b))
+        (then (return (i32.const 0)))
+      )
+    )
+    (else
+      (if (ref.test (ref $STRING) (local.get $a))
+        (then
+          (if (ref.test (ref $STRING) (local.get $b))
+            (then
+              (return_call $strings_equal
+                (ref.cast (ref $STRING) (local.get $a))
+                (ref.cast (ref $STRING) (local.get $b))))
+          )
+        )
+      )
+    )
+  )
+  (return_call $values_equal (local.get $a) (local.get $b))
+)
+
+
 ;; values_equal: compare two values for equality
 (func $values_equal (param $a (ref null eq)) (param $b (ref null eq)) (result i32)
   (local $cdr_a (ref null eq))
@@ -76,8 +121,6 @@ COMPARISONS_CODE = """
   (local $a_is_list i32)
   (local $b_is_list i32)
   (local $eq_result (ref null eq))
-  (local $method_name (ref $STRING))
-  (local $offset i32)
   ;; Both null
   (if (i32.and (ref.is_null (local.get $a)) (ref.is_null (local.get $b)))
     (then (return (i32.const 1)))
@@ -226,6 +269,14 @@ COMPARISONS_CODE = """
         (local.get $b)))
     )
   )
+  ;; Both $SET - same size and every element of a is in b
+  (if (i32.and (ref.test (ref $SET) (local.get $a)) (ref.test (ref $SET) (local.get $b)))
+    (then
+      (return (call $set_equals
+        (ref.cast (ref $SET) (local.get $a))
+        (ref.cast (ref $SET) (local.get $b))))
+    )
+  )
   ;; Both $LIST (array-backed lists) - compare element by element
   (if (i32.and (ref.test (ref $LIST) (local.get $a)) (ref.test (ref $LIST) (local.get $b)))
     (then
@@ -314,25 +365,11 @@ COMPARISONS_CODE = """
   ;; Check for OBJECT with __eq__ special method
   (if (ref.test (ref $OBJECT) (local.get $a))
     (then
-      ;; Create string "__eq__" (6 chars: 95,95,101,113,95,95)
-      (local.set $offset (global.get $string_heap))
-      (i32.store8 (local.get $offset) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 101))  ;; e
-      (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 113))  ;; q
-      (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 95))  ;; _
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 6)))
-      (local.set $method_name (struct.new $STRING (local.get $offset) (i32.const 6)))
-
-      ;; Call __eq__(self, other) - args = (PAIR self (PAIR other null))
-      (local.set $eq_result (call $object_call_method
+      ;; Call __eq__(self, other)
+      (local.set $eq_result (call $object_call_method_fast
         (local.get $a)
-        (local.get $method_name)
-        (struct.new $PAIR
-          (local.get $a)
-          (struct.new $PAIR (local.get $b) (ref.null eq))
-        )
+        (global.get $str___eq__)
+        (struct.new $PAIR (local.get $b) (ref.null eq))
         (ref.null $ENV)
       ))
 
@@ -366,31 +403,15 @@ COMPARISONS_CODE = """
 ;; compare_lt: compare two values for less than, dispatching to __lt__ for objects
 (func $compare_lt (param $a (ref null eq)) (param $b (ref null eq)) (result i32)
   (local $result (ref null eq))
-  (local $method_name (ref $STRING))
-  (local $offset i32)
 
   ;; Check for OBJECT with __lt__ special method
   (if (ref.test (ref $OBJECT) (local.get $a))
     (then
-      ;; Create string "__lt__" (6 chars: 95,95,108,116,95,95)
-      (local.set $offset (global.get $string_heap))
-      (i32.store8 (local.get $offset) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 108))  ;; l
-      (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 116))  ;; t
-      (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 95))  ;; _
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 6)))
-      (local.set $method_name (struct.new $STRING (local.get $offset) (i32.const 6)))
-
       ;; Call __lt__(self, other)
-      (local.set $result (call $object_call_method
+      (local.set $result (call $object_call_method_fast
         (local.get $a)
-        (local.get $method_name)
-        (struct.new $PAIR
-          (local.get $a)
-          (struct.new $PAIR (local.get $b) (ref.null eq))
-        )
+        (global.get $str___lt__)
+        (struct.new $PAIR (local.get $b) (ref.null eq))
         (ref.null $ENV)
       ))
 
@@ -413,6 +434,15 @@ COMPARISONS_CODE = """
     )
   )
 
+  ;; Set proper subset test
+  (if (i32.and (ref.test (ref $SET) (local.get $a)) (ref.test (ref $SET) (local.get $b)))
+    (then
+      (return (call $set_is_proper_subset
+        (ref.cast (ref $SET) (local.get $a))
+        (ref.cast (ref $SET) (local.get $b))))
+    )
+  )
+
   ;; String comparison
   (if (i32.and (ref.test (ref $STRING) (local.get $a)) (ref.test (ref $STRING) (local.get $b)))
     (then
@@ -445,31 +475,15 @@ COMPARISONS_CODE = """
 ;; compare_gt: compare two values for greater than, dispatching to __gt__ for objects
 (func $compare_gt (param $a (ref null eq)) (param $b (ref null eq)) (result i32)
   (local $result (ref null eq))
-  (local $method_name (ref $STRING))
-  (local $offset i32)
 
   ;; Check for OBJECT with __gt__ special method
   (if (ref.test (ref $OBJECT) (local.get $a))
     (then
-      ;; Create string "__gt__" (6 chars: 95,95,103,116,95,95)
-      (local.set $offset (global.get $string_heap))
-      (i32.store8 (local.get $offset) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 103))  ;; g
-      (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 116))  ;; t
-      (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 95))  ;; _
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 6)))
-      (local.set $method_name (struct.new $STRING (local.get $offset) (i32.const 6)))
-
       ;; Call __gt__(self, other)
-      (local.set $result (call $object_call_method
+      (local.set $result (call $object_call_method_fast
         (local.get $a)
-        (local.get $method_name)
-        (struct.new $PAIR
-          (local.get $a)
-          (struct.new $PAIR (local.get $b) (ref.null eq))
-        )
+        (global.get $str___gt__)
+        (struct.new $PAIR (local.get $b) (ref.null eq))
         (ref.null $ENV)
       ))
 
@@ -492,6 +506,15 @@ COMPARISONS_CODE = """
     )
   )
 
+  ;; Set proper superset test
+  (if (i32.and (ref.test (ref $SET) (local.get $a)) (ref.test (ref $SET) (local.get $b)))
+    (then
+      (return (call $set_is_proper_subset
+        (ref.cast (ref $SET) (local.get $b))
+        (ref.cast (ref $SET) (local.get $a))))
+    )
+  )
+
   ;; String comparison
   (if (i32.and (ref.test (ref $STRING) (local.get $a)) (ref.test (ref $STRING) (local.get $b)))
     (then
@@ -524,31 +547,15 @@ COMPARISONS_CODE = """
 ;; compare_le: compare two values for less than or equal, dispatching to __le__ for objects
 (func $compare_le (param $a (ref null eq)) (param $b (ref null eq)) (result i32)
   (local $result (ref null eq))
-  (local $method_name (ref $STRING))
-  (local $offset i32)
 
   ;; Check for OBJECT with __le__ special method
   (if (ref.test (ref $OBJECT) (local.get $a))
     (then
-      ;; Create string "__le__" (6 chars: 95,95,108,101,95,95)
-      (local.set $offset (global.get $string_heap))
-      (i32.store8 (local.get $offset) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 108))  ;; l
-      (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 101))  ;; e
-      (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 95))  ;; _
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 6)))
-      (local.set $method_name (struct.new $STRING (local.get $offset) (i32.const 6)))
-
       ;; Call __le__(self, other)
-      (local.set $result (call $object_call_method
+      (local.set $result (call $object_call_method_fast
         (local.get $a)
-        (local.get $method_name)
-        (struct.new $PAIR
-          (local.get $a)
-          (struct.new $PAIR (local.get $b) (ref.null eq))
-        )
+        (global.get $str___le__)
+        (struct.new $PAIR (local.get $b) (ref.null eq))
         (ref.null $ENV)
       ))
 
@@ -571,6 +578,15 @@ COMPARISONS_CODE = """
     )
   )
 
+  ;; Set subset test
+  (if (i32.and (ref.test (ref $SET) (local.get $a)) (ref.test (ref $SET) (local.get $b)))
+    (then
+      (return (call $set_is_subset
+        (ref.cast (ref $SET) (local.get $a))
+        (ref.cast (ref $SET) (local.get $b))))
+    )
+  )
+
   ;; String comparison
   (if (i32.and (ref.test (ref $STRING) (local.get $a)) (ref.test (ref $STRING) (local.get $b)))
     (then
@@ -603,31 +619,15 @@ COMPARISONS_CODE = """
 ;; compare_ge: compare two values for greater than or equal, dispatching to __ge__ for objects
 (func $compare_ge (param $a (ref null eq)) (param $b (ref null eq)) (result i32)
   (local $result (ref null eq))
-  (local $method_name (ref $STRING))
-  (local $offset i32)
 
   ;; Check for OBJECT with __ge__ special method
   (if (ref.test (ref $OBJECT) (local.get $a))
     (then
-      ;; Create string "__ge__" (6 chars: 95,95,103,101,95,95)
-      (local.set $offset (global.get $string_heap))
-      (i32.store8 (local.get $offset) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 103))  ;; g
-      (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 101))  ;; e
-      (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 95))  ;; _
-      (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 95))  ;; _
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 6)))
-      (local.set $method_name (struct.new $STRING (local.get $offset) (i32.const 6)))
-
       ;; Call __ge__(self, other)
-      (local.set $result (call $object_call_method
+      (local.set $result (call $object_call_method_fast
         (local.get $a)
-        (local.get $method_name)
-        (struct.new $PAIR
-          (local.get $a)
-          (struct.new $PAIR (local.get $b) (ref.null eq))
-        )
+        (global.get $str___ge__)
+        (struct.new $PAIR (local.get $b) (ref.null eq))
         (ref.null $ENV)
       ))
 
@@ -650,6 +650,15 @@ COMPARISONS_CODE = """
     )
   )
 
+  ;; Set superset test
+  (if (i32.and (ref.test (ref $SET) (local.get $a)) (ref.test (ref $SET) (local.get $b)))
+    (then
+      (return (call $set_is_subset
+        (ref.cast (ref $SET) (local.get $b))
+        (ref.cast (ref $SET) (local.get $a))))
+    )
+  )
+
   ;; String comparison
   (if (i32.and (ref.test (ref $STRING) (local.get $a)) (ref.test (ref $STRING) (local.get $b)))
     (then
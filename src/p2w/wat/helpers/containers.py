@@ -202,6 +202,14 @@ CONTAINERS_CODE = """
       (return (i32.const 0))
     )
   )
+  ;; Check if it's a set (hash lookup)
+  (if (ref.test (ref $SET) (local.get $container))
+    (then
+      (return (call $set_contains
+        (ref.cast (ref $SET) (local.get $container))
+        (local.get $item)))
+    )
+  )
   ;; Check if it's a dict (PAIR of PAIRs)
   (if (call $is_dict (local.get $container))
     (then
@@ -42,6 +42,13 @@ CORE_CODE = """
         (struct.get $DICT $table (ref.cast (ref $DICT) (local.get $v))))))
     )
   )
+  ;; $SET: empty set is falsy
+  (if (ref.test (ref $SET) (local.get $v))
+    (then
+      (return (i32.eqz (struct.get $SET $used
+        (ref.cast (ref $SET) (local.get $v)))))
+    )
+  )
   ;; $LIST (array-backed): empty list is falsy
   (if (ref.test (ref $LIST) (local.get $v))
     (then
@@ -176,7 +183,8 @@ CORE_CODE = """
 
 
 ;; ensure_memory: ensure there is at least $needed bytes available from $string_heap
-;; Grows memory if necessary. Each WASM page is 65536 bytes.
+;; Grows memory if necessary. Each WASM page is 65536 bytes. Callers that
+;; allocate several spans reserve their total once up front.
 (func $ensure_memory (param $needed i32)
   (local $current_end i32)
   (local $mem_size i32)
@@ -184,8 +192,13 @@ CORE_CODE = """
   (local $grow_result i32)
   ;; Calculate where the allocation would end
   (local.set $current_end (i32.add (global.get $string_heap) (local.get $needed)))
+  ;; Fast path: within the memory size seen by the last call
+  (if (i32.le_u (local.get $current_end) (global.get $string_heap_limit))
+    (then (return))
+  )
   ;; Get current memory size in bytes (memory.size returns pages)
   (local.set $mem_size (i32.mul (memory.size) (i32.const 65536)))
+  (global.set $string_heap_limit (local.get $mem_size))
   ;; If we have enough space, return
   (if (i32.le_u (local.get $current_end) (local.get $mem_size))
     (then (return))
@@ -202,6 +215,20 @@ CORE_CODE = """
   ;; Grow memory
   (local.set $grow_result (memory.grow (local.get $pages_needed)))
   ;; Note: grow_result is -1 on failure, but we don't handle that for now
+  (global.set $string_heap_limit (i32.mul (memory.size) (i32.const 65536)))
+)
+
+
+;; arena_rewind: free everything allocated on the string heap since $mark
+;; except $keep, which is moved down to start at $mark. Only for callers
+;; that know nothing else references strings allocated after $mark (e.g.
+;; the intermediate strings of one f-string format spec).
+(func $arena_rewind (param $mark i32) (param $keep (ref $STRING)) (result (ref $STRING))
+  (local $len i32)
+  (local.set $len (struct.get $STRING 1 (local.get $keep)))
+  (memory.copy (local.get $mark) (struct.get $STRING 0 (local.get $keep)) (local.get $len))
+  (global.set $string_heap (i32.add (local.get $mark) (local.get $len)))
+  (struct.new $STRING (local.get $mark) (local.get $len) (i32.const 0))
 )
 
 """
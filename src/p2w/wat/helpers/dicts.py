@@ -18,6 +18,10 @@ DICTS_CODE = """
   (local $hash i32)
   (local $i i32)
 
+  ;; Strings are immutable, so a hash computed once stays valid
+  (local.set $hash (struct.get $STRING $hash (local.get $s)))
+  (if (local.get $hash) (then (return (local.get $hash))))
+
   (local.set $offset (struct.get $STRING 0 (local.get $s)))
   (local.set $len (struct.get $STRING 1 (local.get $s)))
   (local.set $hash (i32.const 2166136261))  ;; FNV offset basis
@@ -37,6 +41,7 @@ DICTS_CODE = """
       (br $loop)
     )
   )
+  (struct.set $STRING $hash (local.get $s) (local.get $hash))
   (local.get $hash)
 )
 
@@ -135,7 +140,7 @@ DICTS_CODE = """
                   (local.get $hash))
         (then
           ;; Check key equality
-          (if (call $values_equal
+          (if (call $values_equal_fast
                 (struct.get $ENTRY $key (ref.cast (ref $ENTRY) (local.get $entry)))
                 (local.get $key))
             (then
@@ -179,7 +184,7 @@ DICTS_CODE = """
       (if (i32.eq (struct.get $ENTRY $hash (ref.cast (ref $ENTRY) (local.get $entry)))
                   (local.get $hash))
         (then
-          (if (call $values_equal
+          (if (call $values_equal_fast
                 (struct.get $ENTRY $key (ref.cast (ref $ENTRY) (local.get $entry)))
                 (local.get $key))
             (then (return (i32.const 1)))
@@ -223,7 +228,7 @@ DICTS_CODE = """
         (if (i32.eq (struct.get $ENTRY $hash (ref.cast (ref $ENTRY) (local.get $entry)))
                     (local.get $hash))
           (then
-            (if (call $values_equal
+            (if (call $values_equal_fast
                   (struct.get $ENTRY $key (ref.cast (ref $ENTRY) (local.get $entry)))
                   (local.get $key))
               (then
@@ -285,7 +290,7 @@ DICTS_CODE = """
       (if (i32.eq (struct.get $ENTRY $hash (ref.cast (ref $ENTRY) (local.get $entry)))
                   (local.get $hash))
         (then
-          (if (call $values_equal
+          (if (call $values_equal_fast
                 (struct.get $ENTRY $key (ref.cast (ref $ENTRY) (local.get $entry)))
                 (local.get $key))
             (then
@@ -951,6 +956,11 @@ DICTS_CODE = """
     (then (return (local.get $dict)))
   )
 
+  ;; set.update(iterable)
+  (if (ref.test (ref $SET) (local.get $dict))
+    (then (return (call $set_update (ref.cast (ref $SET) (local.get $dict)) (local.get $other))))
+  )
+
   ;; Ensure we have a $DICT
   (if (ref.is_null (local.get $dict))
     (then (local.set $result (call $dict_new)))
@@ -1136,39 +1146,8 @@ DICTS_CODE = """
   (local $key_str (ref $STRING))
   (local $val_str (ref $STRING))
   (local $first i32)
-  (local $offset i32)
-  (local $comma_space (ref $STRING))
-  (local $brace_open (ref $STRING))
-  (local $brace_close (ref $STRING))
-  (local $colon_space (ref $STRING))
-
-  ;; Create "{" string
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 123))  ;; {
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 1)))
-  (local.set $brace_open (struct.new $STRING (local.get $offset) (i32.const 1)))
-
-  ;; Create "}" string
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 125))  ;; }
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 1)))
-  (local.set $brace_close (struct.new $STRING (local.get $offset) (i32.const 1)))
-
-  ;; Create ", " string
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 44))  ;; ,
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 32))  ;; space
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 2)))
-  (local.set $comma_space (struct.new $STRING (local.get $offset) (i32.const 2)))
-
-  ;; Create ": " string
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 58))  ;; :
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 32))  ;; space
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 2)))
-  (local.set $colon_space (struct.new $STRING (local.get $offset) (i32.const 2)))
-
-  (local.set $result (local.get $brace_open))
+
+  (local.set $result (global.get $str_lbrace))
   (local.set $first (i32.const 1))
 
   ;; Get entries
@@ -1190,7 +1169,7 @@ DICTS_CODE = """
 
       (if (i32.eqz (local.get $first))
         (then
-          (local.set $result (call $string_concat (local.get $result) (local.get $comma_space)))
+          (local.set $result (call $string_concat (local.get $result) (global.get $str_comma_space)))
         )
       )
       (local.set $first (i32.const 0))
@@ -1198,7 +1177,7 @@ DICTS_CODE = """
       (local.set $kv (ref.cast (ref $PAIR) (struct.get $PAIR 0 (ref.cast (ref $PAIR) (local.get $current)))))
       (local.set $key_str (call $value_to_string_repr (struct.get $PAIR 0 (local.get $kv))))
       (local.set $result (call $string_concat (local.get $result) (local.get $key_str)))
-      (local.set $result (call $string_concat (local.get $result) (local.get $colon_space)))
+      (local.set $result (call $string_concat (local.get $result) (global.get $str_colon_space)))
       (local.set $val_str (call $value_to_string_repr (struct.get $PAIR 1 (local.get $kv))))
       (local.set $result (call $string_concat (local.get $result) (local.get $val_str)))
 
@@ -1207,7 +1186,7 @@ DICTS_CODE = """
     )
   )
 
-  (call $string_concat (local.get $result) (local.get $brace_close))
+  (call $string_concat (local.get $result) (global.get $str_rbrace))
 )
 
 
@@ -116,23 +116,12 @@ EXCEPTIONS_CODE = """
   )
 
   ;; Concatenate: type + ": " + message
-  (local.set $result (call $string_concat (ref.cast (ref $STRING) (local.get $type_str)) (call $make_string_colon_space)))
+  (local.set $result (call $string_concat (ref.cast (ref $STRING) (local.get $type_str)) (global.get $str_colon_space)))
   (local.set $result (call $string_concat (ref.cast (ref $STRING) (local.get $result)) (ref.cast (ref $STRING) (local.get $msg_str))))
   (ref.cast (ref $STRING) (local.get $result))
 )
 
 
-;; make_string_colon_space: helper to create ": " string
-(func $make_string_colon_space (result (ref $STRING))
-  (local $offset i32)
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 58))  ;; ':'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 32))  ;; ' '
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 2)))
-  (struct.new $STRING (local.get $offset) (i32.const 2))
-)
-
-
 ;; raise_exception: throw an exception (convenience wrapper)
 (func $raise_exception (param $exc (ref $EXCEPTION))
   (throw $PyException (local.get $exc))
@@ -141,175 +130,15 @@ EXCEPTIONS_CODE = """
 
 ;; make_assertion_error: create AssertionError exception
 (func $make_assertion_error (param $message (ref null eq)) (result (ref $EXCEPTION))
-  (call $make_exception (call $make_string_assertion_error) (local.get $message))
-)
-
-
-;; make_string_assertion_error: create "AssertionError" string
-(func $make_string_assertion_error (result (ref $STRING))
-  (local $offset i32)
-  (local.set $offset (global.get $string_heap))
-  ;; "AssertionError" = 14 chars
-  (i32.store8 (local.get $offset) (i32.const 65))  ;; 'A'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 115))  ;; 's'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 115))  ;; 's'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 101))  ;; 'e'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 114))  ;; 'r'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 116))  ;; 't'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 6)) (i32.const 105))  ;; 'i'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 7)) (i32.const 111))  ;; 'o'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 8)) (i32.const 110))  ;; 'n'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 9)) (i32.const 69))   ;; 'E'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 10)) (i32.const 114)) ;; 'r'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 11)) (i32.const 114)) ;; 'r'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 12)) (i32.const 111)) ;; 'o'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 13)) (i32.const 114)) ;; 'r'
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 14)))
-  (struct.new $STRING (local.get $offset) (i32.const 14))
-)
-
-
-;; make_string_attribute_error: create "AttributeError" string
-(func $make_string_attribute_error (result (ref $STRING))
-  (local $offset i32)
-  (local.set $offset (global.get $string_heap))
-  ;; "AttributeError" = 14 chars
-  (i32.store8 (local.get $offset) (i32.const 65))  ;; 'A'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 116))  ;; 't'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 116))  ;; 't'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 114))  ;; 'r'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 105))  ;; 'i'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 98))   ;; 'b'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 6)) (i32.const 117))  ;; 'u'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 7)) (i32.const 116))  ;; 't'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 8)) (i32.const 101))  ;; 'e'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 9)) (i32.const 69))   ;; 'E'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 10)) (i32.const 114)) ;; 'r'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 11)) (i32.const 114)) ;; 'r'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 12)) (i32.const 111)) ;; 'o'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 13)) (i32.const 114)) ;; 'r'
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 14)))
-  (struct.new $STRING (local.get $offset) (i32.const 14))
+  (call $make_exception (global.get $str_AssertionError) (local.get $message))
 )
 
 
 ;; throw_attribute_error: throw an AttributeError exception
 (func $throw_attribute_error (param $message (ref null eq))
   (local $exc (ref $EXCEPTION))
-  (local.set $exc (call $make_exception (call $make_string_attribute_error) (local.get $message)))
+  (local.set $exc (call $make_exception (global.get $str_AttributeError) (local.get $message)))
   (throw $PyException (local.get $exc))
 )
 
-
-;; make_string_cause: create "__cause__" string for exception chaining
-(func $make_string_cause (result (ref $STRING))
-  (local $offset i32)
-  (local.set $offset (global.get $string_heap))
-  ;; "__cause__" = 9 chars
-  (i32.store8 (local.get $offset) (i32.const 95))  ;; '_'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 95))   ;; '_'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 99))   ;; 'c'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 97))   ;; 'a'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 117))  ;; 'u'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 115))  ;; 's'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 6)) (i32.const 101))  ;; 'e'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 7)) (i32.const 95))   ;; '_'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 8)) (i32.const 95))   ;; '_'
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 9)))
-  (struct.new $STRING (local.get $offset) (i32.const 9))
-)
-
-
-;; make_string_args: create "args" string for exception args attribute
-(func $make_string_args (result (ref $STRING))
-  (local $offset i32)
-  (local.set $offset (global.get $string_heap))
-  ;; "args" = 4 chars
-  (i32.store8 (local.get $offset) (i32.const 97))   ;; 'a'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 114))  ;; 'r'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 103))  ;; 'g'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 115))  ;; 's'
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 4)))
-  (struct.new $STRING (local.get $offset) (i32.const 4))
-)
-
-
-;; make_string_matmul: create "__matmul__" string for matrix multiplication
-(func $make_string_matmul (result (ref $STRING))
-  (local $offset i32)
-  (local.set $offset (global.get $string_heap))
-  ;; "__matmul__" = 10 chars
-  (i32.store8 (local.get $offset) (i32.const 95))   ;; '_'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 95))   ;; '_'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 109))  ;; 'm'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 97))   ;; 'a'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 116))  ;; 't'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 109))  ;; 'm'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 6)) (i32.const 117))  ;; 'u'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 7)) (i32.const 108))  ;; 'l'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 8)) (i32.const 95))   ;; '_'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 9)) (i32.const 95))   ;; '_'
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 10)))
-  (struct.new $STRING (local.get $offset) (i32.const 10))
-)
-
-
-;; make_string_rmatmul: create "__rmatmul__" string for reverse matrix multiplication
-(func $make_string_rmatmul (result (ref $STRING))
-  (local $offset i32)
-  (local.set $offset (global.get $string_heap))
-  ;; "__rmatmul__" = 11 chars
-  (i32.store8 (local.get $offset) (i32.const 95))   ;; '_'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 95))   ;; '_'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 114))  ;; 'r'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 109))  ;; 'm'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 97))   ;; 'a'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 116))  ;; 't'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 6)) (i32.const 109))  ;; 'm'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 7)) (i32.const 117))  ;; 'u'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 8)) (i32.const 108))  ;; 'l'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 9)) (i32.const 95))   ;; '_'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 10)) (i32.const 95))  ;; '_'
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 11)))
-  (struct.new $STRING (local.get $offset) (i32.const 11))
-)
-
-
-;; Standard exception type name helpers
-(func $make_value_error_str (result (ref $STRING))
-  (local $offset i32)
-  (local.set $offset (global.get $string_heap))
-  ;; "ValueError" = 10 chars
-  (i32.store8 (local.get $offset) (i32.const 86))  ;; 'V'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 97))   ;; 'a'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 108))  ;; 'l'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 117))  ;; 'u'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 101))  ;; 'e'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 69))   ;; 'E'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 6)) (i32.const 114))  ;; 'r'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 7)) (i32.const 114))  ;; 'r'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 8)) (i32.const 111))  ;; 'o'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 9)) (i32.const 114))  ;; 'r'
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 10)))
-  (struct.new $STRING (local.get $offset) (i32.const 10))
-)
-
-
-(func $make_type_error_str (result (ref $STRING))
-  (local $offset i32)
-  (local.set $offset (global.get $string_heap))
-  ;; "TypeError" = 9 chars
-  (i32.store8 (local.get $offset) (i32.const 84))  ;; 'T'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 121))  ;; 'y'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 112))  ;; 'p'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 101))  ;; 'e'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 69))   ;; 'E'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 114))  ;; 'r'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 6)) (i32.const 114))  ;; 'r'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 7)) (i32.const 111))  ;; 'o'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 8)) (i32.const 114))  ;; 'r'
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 9)))
-  (struct.new $STRING (local.get $offset) (i32.const 9))
-)
-
 """
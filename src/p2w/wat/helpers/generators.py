@@ -86,7 +86,7 @@ GENERATORS_CODE = """
       (local.set $exc_str (ref.cast (ref $STRING) (local.get $exc)))
     )
     (else
-      (local.set $exc_str (call $make_generator_exit_str))
+      (local.set $exc_str (global.get $str_GeneratorExit))
     )
   )
 
@@ -115,37 +115,12 @@ GENERATORS_CODE = """
 )
 
 
-;; Make GeneratorExit string for throw()
-(func $make_generator_exit_str (result (ref $STRING))
-  (local $offset i32)
-  (local.set $offset (global.get $string_heap))
-  ;; "GeneratorExit" = 13 chars
-  (i32.store8 (local.get $offset) (i32.const 71))  ;; 'G'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 101))  ;; 'e'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 110))  ;; 'n'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 101))  ;; 'e'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 114))  ;; 'r'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 97))   ;; 'a'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 6)) (i32.const 116))  ;; 't'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 7)) (i32.const 111))  ;; 'o'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 8)) (i32.const 114))  ;; 'r'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 9)) (i32.const 69))   ;; 'E'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 10)) (i32.const 120)) ;; 'x'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 11)) (i32.const 105)) ;; 'i'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 12)) (i32.const 116)) ;; 't'
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 13)))
-  (struct.new $STRING (local.get $offset) (i32.const 13))
-)
-
-
 ;; method_close: close method with runtime type checking
 ;; If obj is a generator, use generator_close
 ;; If obj is an OBJECT, call its close() method
 ;; Otherwise, return None
 (func $method_close (param $obj (ref null eq)) (result (ref null eq))
   (local $g (ref $GENERATOR))
-  (local $method_name (ref $STRING))
-  (local $offset i32)
 
   ;; Check if it's a generator
   (if (ref.test (ref $GENERATOR) (local.get $obj))
@@ -160,21 +135,11 @@ GENERATORS_CODE = """
   ;; Check if it's an OBJECT with a close method
   (if (ref.test (ref $OBJECT) (local.get $obj))
     (then
-      ;; Create string "close" (5 chars)
-      (local.set $offset (global.get $string_heap))
-      (i32.store8 (local.get $offset) (i32.const 99))  ;; 'c'
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 108))  ;; 'l'
-      (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 111))  ;; 'o'
-      (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 115))  ;; 's'
-      (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 101))  ;; 'e'
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 5)))
-      (local.set $method_name (struct.new $STRING (local.get $offset) (i32.const 5)))
-
-      ;; Call close(self) - args = (PAIR self null)
-      (return (call $object_call_method
+      ;; Call close(self)
+      (return (call $object_call_method_fast
         (local.get $obj)
-        (local.get $method_name)
-        (struct.new $PAIR (local.get $obj) (ref.null eq))
+        (global.get $str_close)
+        (ref.null eq)
         (ref.null $ENV)
       ))
     )
@@ -237,27 +202,4 @@ GENERATORS_CODE = """
   (local.get $result)
 )
 
-
-;; Make StopIteration string for error messages
-(func $make_stop_iteration_str (result (ref $STRING))
-  (local $offset i32)
-  (local.set $offset (global.get $string_heap))
-  ;; "StopIteration" = 13 chars
-  (i32.store8 (local.get $offset) (i32.const 83))  ;; 'S'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 116))  ;; 't'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 111))  ;; 'o'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 112))  ;; 'p'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 73))   ;; 'I'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 116))  ;; 't'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 6)) (i32.const 101))  ;; 'e'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 7)) (i32.const 114))  ;; 'r'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 8)) (i32.const 97))   ;; 'a'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 9)) (i32.const 116))  ;; 't'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 10)) (i32.const 105)) ;; 'i'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 11)) (i32.const 111)) ;; 'o'
-  (i32.store8 (i32.add (local.get $offset) (i32.const 12)) (i32.const 110)) ;; 'n'
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 13)))
-  (struct.new $STRING (local.get $offset) (i32.const 13))
-)
-
 """
@@ -164,7 +164,7 @@ INTEGERS_CODE = """
   (local.set $length (i31.get_s (ref.cast (ref i31) (local.get $len))))
   ;; Allocate memory for bytes
   (local.set $offset (global.get $string_heap))
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $length)))
+  (global.set $string_heap (i32.add (local.get $offset) (local.get $length)))
   ;; Write bytes in big-endian order (MSB first)
   (local.set $i (i32.const 0))
   (block $done
@@ -196,7 +196,7 @@ INTEGERS_CODE = """
   (local.set $length (i31.get_s (ref.cast (ref i31) (local.get $len))))
   ;; Allocate memory for bytes
   (local.set $offset (global.get $string_heap))
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $length)))
+  (global.set $string_heap (i32.add (local.get $offset) (local.get $length)))
   ;; Write bytes in little-endian order (LSB first)
   (local.set $i (i32.const 0))
   (block $done
@@ -399,9 +399,9 @@ JS_INTEROP_CODE = """
     (struct.get $STRING 1 (ref.cast (ref $STRING) (local.get $prop_str)))
     (local.get $result_offset)))
   ;; Update string heap
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $result_len)))
+  (global.set $string_heap (i32.add (local.get $result_offset) (local.get $result_len)))
   ;; Return result as STRING (or handle if it's an object - TODO: improve this)
-  (struct.new $STRING (local.get $result_offset) (local.get $result_len))
+  (struct.new $STRING (local.get $result_offset) (local.get $result_len) (i32.const 0))
 )
 
 
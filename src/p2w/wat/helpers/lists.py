@@ -240,6 +240,16 @@ LISTS_CODE = """
   (if (ref.test (ref $EMPTY_LIST) (local.get $list))
     (then (return (struct.new $EMPTY_LIST)))
   )
+  ;; Handle $SET -> its elements are already a fresh PAIR chain
+  (if (ref.test (ref $SET) (local.get $list))
+    (then
+      (local.set $result (call $set_elements (ref.cast (ref $SET) (local.get $list))))
+      (if (ref.is_null (local.get $result))
+        (then (return (struct.new $EMPTY_LIST)))
+      )
+      (return (local.get $result))
+    )
+  )
   ;; Handle $LIST (array-backed) -> convert to PAIR chain
   (if (ref.test (ref $LIST) (local.get $list))
     (then
@@ -674,34 +684,11 @@ LISTS_CODE = """
   (local $len i32)
   (local $result (ref $STRING))
   (local $elem_str (ref $STRING))
-  (local $bracket_open (ref $STRING))
-  (local $bracket_close (ref $STRING))
-  (local $comma_space (ref $STRING))
-  (local $offset i32)
 
   (local.set $len (struct.get $LIST $len (local.get $list)))
 
-  ;; Create "[" (1 char)
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 91))  ;; [
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 1)))
-  (local.set $bracket_open (struct.new $STRING (local.get $offset) (i32.const 1)))
-
-  ;; Create "]" (1 char)
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 93))  ;; ]
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 1)))
-  (local.set $bracket_close (struct.new $STRING (local.get $offset) (i32.const 1)))
-
-  ;; Create ", " (2 chars)
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 44))  ;; ,
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 32))  ;; space
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 2)))
-  (local.set $comma_space (struct.new $STRING (local.get $offset) (i32.const 2)))
-
   ;; Start with "["
-  (local.set $result (local.get $bracket_open))
+  (local.set $result (global.get $str_lbracket))
 
   ;; Iterate through elements
   (local.set $i (i32.const 0))
@@ -712,7 +699,7 @@ LISTS_CODE = """
       ;; Add comma before element (except first)
       (if (local.get $i)
         (then
-          (local.set $result (call $string_concat (local.get $result) (local.get $comma_space)))
+          (local.set $result (call $string_concat (local.get $result) (global.get $str_comma_space)))
         )
       )
 
@@ -726,7 +713,7 @@ LISTS_CODE = """
   )
 
   ;; Add "]"
-  (call $string_concat (local.get $result) (local.get $bracket_close))
+  (call $string_concat (local.get $result) (global.get $str_rbracket))
 )
 
 
@@ -968,6 +955,12 @@ LISTS_CODE = """
       (return (call $dict_keys (local.get $iter)))
     )
   )
+  ;; Check if this is a $SET - walk its hash table into a PAIR chain
+  (if (ref.test (ref $SET) (local.get $iter))
+    (then
+      (return (call $set_elements (ref.cast (ref $SET) (local.get $iter))))
+    )
+  )
   ;; Check if this is a $TUPLE - convert to PAIR chain
   (if (ref.test (ref $TUPLE) (local.get $iter))
     (then
@@ -1741,32 +1734,9 @@ LISTS_CODE = """
   (local $elem (ref null eq))
   (local $elem_str (ref $STRING))
   (local $first i32)
-  (local $offset i32)
-  (local $comma_space (ref $STRING))
-  (local $bracket_open (ref $STRING))
-  (local $bracket_close (ref $STRING))
-
-  ;; Create "[" string
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 91))  ;; [
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 1)))
-  (local.set $bracket_open (struct.new $STRING (local.get $offset) (i32.const 1)))
-
-  ;; Create "]" string
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 93))  ;; ]
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 1)))
-  (local.set $bracket_close (struct.new $STRING (local.get $offset) (i32.const 1)))
-
-  ;; Create ", " string
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 44))  ;; ,
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 32))  ;; space
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 2)))
-  (local.set $comma_space (struct.new $STRING (local.get $offset) (i32.const 2)))
 
   ;; Start with "["
-  (local.set $result (local.get $bracket_open))
+  (local.set $result (global.get $str_lbracket))
   (local.set $current (local.get $list))
   (local.set $first (i32.const 1))
 
@@ -1780,7 +1750,7 @@ LISTS_CODE = """
       ;; Add ", " before non-first elements
       (if (i32.eqz (local.get $first))
         (then
-          (local.set $result (call $string_concat (local.get $result) (local.get $comma_space)))
+          (local.set $result (call $string_concat (local.get $result) (global.get $str_comma_space)))
         )
       )
       (local.set $first (i32.const 0))
@@ -1797,7 +1767,7 @@ LISTS_CODE = """
   )
 
   ;; Add "]"
-  (call $string_concat (local.get $result) (local.get $bracket_close))
+  (call $string_concat (local.get $result) (global.get $str_rbracket))
 )
 
 
@@ -1867,6 +1837,10 @@ LISTS_CODE = """
   (if (ref.test (ref $LIST) (local.get $lst))
     (then (return (call $list_v2_pop (ref.cast (ref $LIST) (local.get $lst)))))
   )
+  ;; set.pop() - remove an arbitrary element
+  (if (ref.test (ref $SET) (local.get $lst))
+    (then (return (call $set_pop (ref.cast (ref $SET) (local.get $lst)))))
+  )
 
   ;; PAIR chain fallback
   ;; Single element case
@@ -2073,6 +2047,10 @@ LISTS_CODE = """
   (if (ref.test (ref $LIST) (local.get $lst))
     (then (return (call $list_v2_copy (ref.cast (ref $LIST) (local.get $lst)))))
   )
+  ;; set.copy()
+  (if (ref.test (ref $SET) (local.get $lst))
+    (then (return (call $set_copy (ref.cast (ref $SET) (local.get $lst)))))
+  )
 
   ;; Handle null or empty list
   (if (i32.or (ref.is_null (local.get $lst)) (ref.test (ref $EMPTY_LIST) (local.get $lst)))
@@ -2112,6 +2090,10 @@ LISTS_CODE = """
 
 ;; List method: clear() - remove all items
 (func $list_clear (param $lst (ref null eq)) (result (ref null eq))
+  ;; set.clear() empties the set in place
+  (if (ref.test (ref $SET) (local.get $lst))
+    (then (return (call $set_clear (ref.cast (ref $SET) (local.get $lst)))))
+  )
   ;; We can't truly clear a PAIR chain, but we can return empty list
   ;; The original list is left as garbage for GC
   (struct.new $EMPTY_LIST)  ;; return empty list marker
@@ -2543,6 +2525,10 @@ LISTS_CODE = """
   (if (ref.test (ref $EMPTY_LIST) (local.get $lst))
     (then (return (local.get $lst)))
   )
+  ;; set.remove(item)
+  (if (ref.test (ref $SET) (local.get $lst))
+    (then (return (call $set_discard (local.get $lst) (local.get $item))))
+  )
 
   ;; Handle $LIST type
   (if (ref.test (ref $LIST) (local.get $lst))
@@ -2557,9 +2543,11 @@ LISTS_CODE = """
       (block $found_block
         (loop $search_loop
           (br_if $found_block (i32.ge_s (local.get $i) (local.get $len)))
-          (if (call $value_equals
-                (array.get $ARRAY_ANY (ref.cast (ref $ARRAY_ANY) (local.get $data)) (local.get $i))
-                (local.get $item))
+          (local.set $elem (array.get $ARRAY_ANY (ref.cast (ref $ARRAY_ANY) (local.get $data)) (local.get $i)))
+          ;; Identity implies equality (as in CPython): skip $value_equals
+          (if (if (result i32) (ref.eq (local.get $elem) (local.get $item))
+                (then (i32.const 1))
+                (else (call $value_equals (local.get $elem) (local.get $item))))
             (then
               (local.set $found_idx (local.get $i))
               (br $found_block)
@@ -2605,6 +2593,8 @@ LISTS_CODE = """
         (br_if $not_found (ref.is_null (local.get $current)))
         (local.set $elem (struct.get $PAIR 0 (ref.cast (ref $PAIR) (local.get $current))))
 
+        ;; Identity implies equality (as in CPython): skip $value_equals
+        (br_if $found (ref.eq (local.get $elem) (local.get $item)))
         (if (call $value_equals (local.get $elem) (local.get $item))
           (then (br $found))
         )
@@ -2634,504 +2624,598 @@ LISTS_CODE = """
 
 
 ;; List method: reverse() in place - reverses list by swapping values
+;; Thin shim: dispatches to a per-layout helper so each one only declares
+;; the locals it actually uses.
 (func $list_reverse_inplace (param $lst (ref null eq)) (result (ref null eq))
-  (local $len i32)
-  (local $i i32)
-  (local $current (ref null eq))
-  (local $pair (ref null $PAIR))
-  (local $front (ref null eq))
-  (local $back (ref null eq))
-  (local $front_pair (ref null $PAIR))
-  (local $back_pair (ref null $PAIR))
-  (local $j i32)
-  (local $tmp (ref null eq))
-  (local $list_v2 (ref null $LIST))
-  (local $data (ref null $ARRAY_ANY))
-
   (if (ref.is_null (local.get $lst))
     (then (return (ref.null eq)))
   )
   (if (ref.test (ref $EMPTY_LIST) (local.get $lst))
     (then (return (local.get $lst)))
   )
-
-  ;; Handle $LIST type
   (if (ref.test (ref $LIST) (local.get $lst))
-    (then
-      (local.set $list_v2 (ref.cast (ref $LIST) (local.get $lst)))
-      (local.set $len (struct.get $LIST $len (ref.cast (ref $LIST) (local.get $list_v2))))
-      (local.set $data (struct.get $LIST $data (ref.cast (ref $LIST) (local.get $list_v2))))
-
-      ;; Swap elements from front and back
-      (local.set $i (i32.const 0))
-      (block $done_v2
-        (loop $loop_v2
-          (br_if $done_v2 (i32.ge_s (local.get $i) (i32.div_s (local.get $len) (i32.const 2))))
-          ;; Swap elements at i and (len - 1 - i)
-          (local.set $tmp (array.get $ARRAY_ANY (ref.cast (ref $ARRAY_ANY) (local.get $data)) (local.get $i)))
-          (array.set $ARRAY_ANY (ref.cast (ref $ARRAY_ANY) (local.get $data)) (local.get $i)
-            (array.get $ARRAY_ANY (ref.cast (ref $ARRAY_ANY) (local.get $data))
-              (i32.sub (i32.sub (local.get $len) (i32.const 1)) (local.get $i))))
-          (array.set $ARRAY_ANY (ref.cast (ref $ARRAY_ANY) (local.get $data))
-            (i32.sub (i32.sub (local.get $len) (i32.const 1)) (local.get $i))
-            (local.get $tmp))
-          (local.set $i (i32.add (local.get $i) (i32.const 1)))
-          (br $loop_v2)
-        )
-      )
-      (return (local.get $list_v2))
-    )
+    (then (return_call $list_reverse_inplace_array (ref.cast (ref $LIST) (local.get $lst))))
   )
+  (return_call $list_reverse_inplace_pair (ref.cast (ref $PAIR) (local.get $lst)))
+)
 
-  ;; PAIR chain fallback - Get list length
-  (local.set $len (call $list_len (local.get $lst)))
 
-  ;; Swap elements from front and back
+;; list_reverse_inplace_array: reverse a $LIST by swapping array slots
+(func $list_reverse_inplace_array (param $list (ref $LIST)) (result (ref $LIST))
+  (local $data (ref $ARRAY_ANY))
+  (local $i i32)
+  (local $j i32)
+  (local $tmp (ref null eq))
+
+  (local.set $data (struct.get $LIST $data (local.get $list)))
   (local.set $i (i32.const 0))
+  (local.set $j (i32.sub (struct.get $LIST $len (local.get $list)) (i32.const 1)))
+
+  ;; Swap elements from front and back until the indices meet
   (block $done
     (loop $loop
-      ;; Stop when i >= len/2
-      (br_if $done (i32.ge_s (local.get $i) (i32.div_s (local.get $len) (i32.const 2))))
+      (br_if $done (i32.ge_s (local.get $i) (local.get $j)))
+      (local.set $tmp (array.get $ARRAY_ANY (local.get $data) (local.get $i)))
+      (array.set $ARRAY_ANY (local.get $data) (local.get $i)
+        (array.get $ARRAY_ANY (local.get $data) (local.get $j)))
+      (array.set $ARRAY_ANY (local.get $data) (local.get $j) (local.get $tmp))
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (local.set $j (i32.sub (local.get $j) (i32.const 1)))
+      (br $loop)
+    )
+  )
+  (local.get $list)
+)
 
-      ;; Find element at index i (front)
-      (local.set $front (local.get $lst))
-      (local.set $j (i32.const 0))
-      (block $found_front
-        (loop $find_front
-          (br_if $found_front (i32.ge_s (local.get $j) (local.get $i)))
-          (local.set $front (struct.get $PAIR 1 (ref.cast (ref $PAIR) (local.get $front))))
-          (local.set $j (i32.add (local.get $j) (i32.const 1)))
-          (br $find_front)
-        )
-      )
-      (local.set $front_pair (ref.cast (ref $PAIR) (local.get $front)))
 
-      ;; Find element at index (len - 1 - i) (back)
-      (local.set $back (local.get $lst))
-      (local.set $j (i32.const 0))
-      (block $found_back
-        (loop $find_back
-          (br_if $found_back (i32.ge_s (local.get $j) (i32.sub (i32.sub (local.get $len) (i32.const 1)) (local.get $i))))
-          (local.set $back (struct.get $PAIR 1 (ref.cast (ref $PAIR) (local.get $back))))
-          (local.set $j (i32.add (local.get $j) (i32.const 1)))
-          (br $find_back)
-        )
-      )
-      (local.set $back_pair (ref.cast (ref $PAIR) (local.get $back)))
+;; list_reverse_inplace_pair: reverse a PAIR chain by swapping car values
+;; Buffers the values in a temporary array so the reversal is O(n).
+(func $list_reverse_inplace_pair (param $lst (ref $PAIR)) (result (ref $PAIR))
+  (local $buf (ref $ARRAY_ANY))
+  (local $current (ref null eq))
+  (local $pair (ref $PAIR))
+  (local $i i32)
 
-      ;; Swap values
-      (local.set $tmp (struct.get $PAIR 0 (local.get $front_pair)))
-      (struct.set $PAIR 0 (local.get $front_pair) (struct.get $PAIR 0 (local.get $back_pair)))
-      (struct.set $PAIR 0 (local.get $back_pair) (local.get $tmp))
+  (local.set $buf (array.new_default $ARRAY_ANY (call $list_len (local.get $lst))))
 
+  ;; Collect values front to back
+  (local.set $current (local.get $lst))
+  (local.set $i (i32.const 0))
+  (block $collected
+    (loop $collect
+      (br_if $collected (i32.eqz (ref.test (ref $PAIR) (local.get $current))))
+      (local.set $pair (ref.cast (ref $PAIR) (local.get $current)))
+      (array.set $ARRAY_ANY (local.get $buf) (local.get $i) (struct.get $PAIR 0 (local.get $pair)))
       (local.set $i (i32.add (local.get $i) (i32.const 1)))
-      (br $loop)
+      (local.set $current (struct.get $PAIR 1 (local.get $pair)))
+      (br $collect)
+    )
+  )
+
+  ;; Write them back in reverse order
+  (local.set $current (local.get $lst))
+  (block $done
+    (loop $write
+      (br_if $done (i32.eqz (ref.test (ref $PAIR) (local.get $current))))
+      (local.set $pair (ref.cast (ref $PAIR) (local.get $current)))
+      (local.set $i (i32.sub (local.get $i) (i32.const 1)))
+      (struct.set $PAIR 0 (local.get $pair) (array.get $ARRAY_ANY (local.get $buf) (local.get $i)))
+      (local.set $current (struct.get $PAIR 1 (local.get $pair)))
+      (br $write)
     )
   )
   (local.get $lst)
 )
 
 
-;; List method: sort() in place - simple bubble sort
+;; List method: sort() in place
+;; Thin shim: dispatches to a per-layout helper. Both layouts sort a flat
+;; array with the same stable natural merge sort as key sorts, using the
+;; values themselves as keys.
 (func $list_sort_inplace (param $lst (ref null eq)) (result (ref null eq))
-  (local $swapped i32)
-  (local $current (ref null eq))
-  (local $pair (ref null $PAIR))
-  (local $next_pair (ref null $PAIR))
-  (local $a (ref null eq))
-  (local $b (ref null eq))
-  (local $a_val i32)
-  (local $b_val i32)
-  (local $list_v2 (ref null $LIST))
-  (local $len i32)
-  (local $data (ref null $ARRAY_ANY))
-  (local $i i32)
-  (local $tmp (ref null eq))
-
   (if (ref.is_null (local.get $lst))
     (then (return (ref.null eq)))
   )
   (if (ref.test (ref $EMPTY_LIST) (local.get $lst))
     (then (return (local.get $lst)))
   )
-
-  ;; Handle $LIST type
   (if (ref.test (ref $LIST) (local.get $lst))
-    (then
-      (local.set $list_v2 (ref.cast (ref $LIST) (local.get $lst)))
-      (local.set $len (struct.get $LIST $len (ref.cast (ref $LIST) (local.get $list_v2))))
-      (local.set $data (struct.get $LIST $data (ref.cast (ref $LIST) (local.get $list_v2))))
+    (then (return_call $list_sort_inplace_array (ref.cast (ref $LIST) (local.get $lst))))
+  )
+  (return_call $list_sort_inplace_pair (ref.cast (ref $PAIR) (local.get $lst)))
+)
 
-      ;; Bubble sort on array
-      (block $done_v2
-        (loop $outer_v2
-          (local.set $swapped (i32.const 0))
-          (local.set $i (i32.const 0))
 
-          (block $inner_done_v2
-            (loop $inner_v2
-              (br_if $inner_done_v2 (i32.ge_s (local.get $i) (i32.sub (local.get $len) (i32.const 1))))
+;; list_sort_inplace_array: sort the backing array of a $LIST in place
+(func $list_sort_inplace_array (param $list (ref $LIST)) (result (ref $LIST))
+  (local $len i32)
+  (local $data (ref $ARRAY_ANY))
 
-              (local.set $a (array.get $ARRAY_ANY (ref.cast (ref $ARRAY_ANY) (local.get $data)) (local.get $i)))
-              (local.set $b (array.get $ARRAY_ANY (ref.cast (ref $ARRAY_ANY) (local.get $data)) (i32.add (local.get $i) (i32.const 1))))
+  (local.set $len (struct.get $LIST $len (local.get $list)))
+  (if (i32.le_s (local.get $len) (i32.const 1))
+    (then (return (local.get $list)))
+  )
+  (local.set $data (struct.get $LIST $data (local.get $list)))
+  (call $sort_apply_permutation (local.get $data)
+    (call $sort_permutation_by_keys (local.get $data) (local.get $len) (i32.const 0))
+    (local.get $len))
+  (local.get $list)
+)
 
-              ;; Compare integers
-              (if (i32.and (ref.test (ref i31) (local.get $a))
-                           (ref.test (ref i31) (local.get $b)))
-                (then
-                  (local.set $a_val (i31.get_s (ref.cast (ref i31) (local.get $a))))
-                  (local.set $b_val (i31.get_s (ref.cast (ref i31) (local.get $b))))
-                  (if (i32.gt_s (local.get $a_val) (local.get $b_val))
-                    (then
-                      ;; Swap
-                      (array.set $ARRAY_ANY (ref.cast (ref $ARRAY_ANY) (local.get $data)) (local.get $i) (local.get $b))
-                      (array.set $ARRAY_ANY (ref.cast (ref $ARRAY_ANY) (local.get $data)) (i32.add (local.get $i) (i32.const 1)) (local.get $a))
-                      (local.set $swapped (i32.const 1))
-                    )
-                  )
-                )
-              )
-              ;; Compare strings
-              (if (i32.and (ref.test (ref $STRING) (local.get $a))
-                           (ref.test (ref $STRING) (local.get $b)))
-                (then
-                  (if (i32.gt_s
-                        (call $strings_compare
-                          (ref.cast (ref $STRING) (local.get $a))
-                          (ref.cast (ref $STRING) (local.get $b)))
-                        (i32.const 0))
-                    (then
-                      ;; Swap
-                      (array.set $ARRAY_ANY (ref.cast (ref $ARRAY_ANY) (local.get $data)) (local.get $i) (local.get $b))
-                      (array.set $ARRAY_ANY (ref.cast (ref $ARRAY_ANY) (local.get $data)) (i32.add (local.get $i) (i32.const 1)) (local.get $a))
-                      (local.set $swapped (i32.const 1))
-                    )
-                  )
-                )
-              )
 
-              (local.set $i (i32.add (local.get $i) (i32.const 1)))
-              (br $inner_v2)
-            )
-          )
+;; list_sort_inplace_pair: sort a PAIR chain in place
+;; The values are copied into an array once, sorted there, and written back
+;; into the original nodes, so no comparison walks the chain.
+(func $list_sort_inplace_pair (param $lst (ref $PAIR)) (result (ref $PAIR))
+  (local $items (ref $ARRAY_ANY))
+  (local $perm (ref $ARRAY_I32))
+  (local $len i32)
+  (local $i i32)
+  (local $current (ref null eq))
+  (local $pair (ref $PAIR))
 
-          (br_if $done_v2 (i32.eqz (local.get $swapped)))
-          (br $outer_v2)
-        )
-      )
-      (return (local.get $list_v2))
+  ;; A single node is already sorted
+  (if (ref.is_null (struct.get $PAIR 1 (local.get $lst)))
+    (then (return (local.get $lst)))
+  )
+  (local.set $len (call $list_len (local.get $lst)))
+  (local.set $items (array.new_default $ARRAY_ANY (local.get $len)))
+  (local.set $current (local.get $lst))
+  (block $fill_done
+    (loop $fill_loop
+      (br_if $fill_done (i32.eqz (ref.test (ref $PAIR) (local.get $current))))
+      (local.set $pair (ref.cast (ref $PAIR) (local.get $current)))
+      (array.set $ARRAY_ANY (local.get $items) (local.get $i) (struct.get $PAIR 0 (local.get $pair)))
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (local.set $current (struct.get $PAIR 1 (local.get $pair)))
+      (br $fill_loop)
     )
   )
 
-  ;; Bubble sort
-  (block $done
-    (loop $outer
-      (local.set $swapped (i32.const 0))
-      (local.set $current (local.get $lst))
-
-      (block $inner_done
-        (loop $inner
-          (local.set $pair (ref.cast (ref $PAIR) (local.get $current)))
-          (br_if $inner_done (ref.is_null (struct.get $PAIR 1 (local.get $pair))))
-
-          (local.set $next_pair (ref.cast (ref $PAIR) (struct.get $PAIR 1 (local.get $pair))))
-          (local.set $a (struct.get $PAIR 0 (local.get $pair)))
-          (local.set $b (struct.get $PAIR 0 (local.get $next_pair)))
-
-          ;; Compare integers
-          (if (i32.and (ref.test (ref i31) (local.get $a))
-                       (ref.test (ref i31) (local.get $b)))
-            (then
-              (local.set $a_val (i31.get_s (ref.cast (ref i31) (local.get $a))))
-              (local.set $b_val (i31.get_s (ref.cast (ref i31) (local.get $b))))
-              (if (i32.gt_s (local.get $a_val) (local.get $b_val))
-                (then
-                  ;; Swap
-                  (struct.set $PAIR 0 (local.get $pair) (local.get $b))
-                  (struct.set $PAIR 0 (local.get $next_pair) (local.get $a))
-                  (local.set $swapped (i32.const 1))
-                )
-              )
-            )
-          )
-          ;; Compare strings
-          (if (i32.and (ref.test (ref $STRING) (local.get $a))
-                       (ref.test (ref $STRING) (local.get $b)))
-            (then
-              (if (i32.gt_s
-                    (call $strings_compare
-                      (ref.cast (ref $STRING) (local.get $a))
-                      (ref.cast (ref $STRING) (local.get $b)))
-                    (i32.const 0))
-                (then
-                  ;; Swap
-                  (struct.set $PAIR 0 (local.get $pair) (local.get $b))
-                  (struct.set $PAIR 0 (local.get $next_pair) (local.get $a))
-                  (local.set $swapped (i32.const 1))
-                )
-              )
-            )
-          )
-
-          (local.set $current (struct.get $PAIR 1 (local.get $pair)))
-          (br $inner)
-        )
-      )
+  (local.set $perm (call $sort_permutation_by_keys (local.get $items) (local.get $len) (i32.const 0)))
 
-      (br_if $done (i32.eqz (local.get $swapped)))
-      (br $outer)
+  (local.set $current (local.get $lst))
+  (local.set $i (i32.const 0))
+  (block $copy_done
+    (loop $copy_loop
+      (br_if $copy_done (i32.eqz (ref.test (ref $PAIR) (local.get $current))))
+      (local.set $pair (ref.cast (ref $PAIR) (local.get $current)))
+      (struct.set $PAIR 0 (local.get $pair)
+        (array.get $ARRAY_ANY (local.get $items)
+          (array.get $ARRAY_I32 (local.get $perm) (local.get $i))))
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (local.set $current (struct.get $PAIR 1 (local.get $pair)))
+      (br $copy_loop)
     )
   )
-  (local.get $lst)  ;; Return the sorted list
+  (local.get $lst)
 )
 
 
 ;; List method: sort() in place with key function - Schwartzian transform
-;; Takes list and key closure, returns sorted list (also mutates original)
-(func $list_sort_with_key (param $lst (ref null eq)) (param $key_fn (ref null eq)) (result (ref null eq))
-  (local $swapped i32)
-  (local $current (ref null eq))
-  (local $pair (ref null $PAIR))
-  (local $next_pair (ref null $PAIR))
-  (local $a (ref null eq))
-  (local $b (ref null eq))
-  (local $a_key (ref null eq))
-  (local $b_key (ref null eq))
-  (local $decorated (ref null eq))
-  (local $dec_current (ref null eq))
-  (local $orig_current (ref null eq))
-  (local $closure (ref $CLOSURE))
-  (local $env (ref null $ENV))
-  (local $func_idx i32)
-  (local $args (ref null eq))
-  (local $key_result (ref null eq))
-  (local $dec_pair (ref null $PAIR))
-  (local $item (ref null eq))
-  (local $orig_pair (ref null $PAIR))
-  (local $orig_list_v2 (ref null $LIST))
-  (local $i i32)
-  (local $list_data (ref null $ARRAY_ANY))
-
+;; Takes list, key closure and reverse flag, returns sorted list (also mutates
+;; original). Thin shim: dispatches to a per-layout helper.
+(func $list_sort_with_key (param $lst (ref null eq)) (param $key_fn (ref null eq)) (param $reverse i32) (result (ref null eq))
   (if (ref.is_null (local.get $lst))
     (then (return (ref.null eq)))
   )
   (if (ref.test (ref $EMPTY_LIST) (local.get $lst))
     (then (return (local.get $lst)))
   )
-
-  ;; Convert $LIST to PAIR chain if needed, keeping reference to original
   (if (ref.test (ref $LIST) (local.get $lst))
     (then
-      (local.set $orig_list_v2 (ref.cast (ref $LIST) (local.get $lst)))
-      (local.set $lst (call $list_v2_to_pair (ref.cast (ref $LIST) (local.get $orig_list_v2))))
+      (return_call $list_sort_with_key_array
+        (ref.cast (ref $LIST) (local.get $lst))
+        (ref.cast (ref $CLOSURE) (local.get $key_fn))
+        (local.get $reverse))
     )
   )
+  (return_call $list_sort_with_key_pair
+    (local.get $lst)
+    (ref.cast (ref $CLOSURE) (local.get $key_fn))
+    (local.get $reverse))
+)
 
-  ;; Extract closure info
-  (local.set $closure (ref.cast (ref $CLOSURE) (local.get $key_fn)))
-  (local.set $env (struct.get $CLOSURE 0 (local.get $closure)))
-  (local.set $func_idx (struct.get $CLOSURE 1 (local.get $closure)))
-
-  ;; Step 1: Decorate - create list of (key, item) pairs
-  ;; Build in forward order by appending
-  (local.set $decorated (ref.null eq))
-  (local.set $current (local.get $lst))
-  (block $dec_done
-    (loop $dec_loop
-      (br_if $dec_done (ref.is_null (local.get $current)))
-      (br_if $dec_done (i32.eqz (ref.test (ref $PAIR) (local.get $current))))
-      (local.set $pair (ref.cast (ref $PAIR) (local.get $current)))
-      (local.set $item (struct.get $PAIR 0 (local.get $pair)))
 
-      ;; Call key function: key(item)
-      (local.set $args (struct.new $PAIR (local.get $item) (ref.null eq)))
-      (local.set $key_result
-        (call_indirect (type $FUNC) (local.get $args) (local.get $env) (local.get $func_idx))
-      )
+;; list_sort_with_key_array: sort a $LIST by key without leaving the array
+;; Keys are computed once into a parallel array, a stable merge sort orders an
+;; index permutation by key, and the permutation is applied to $data in place.
+(func $list_sort_with_key_array (param $list (ref $LIST)) (param $closure (ref $CLOSURE)) (param $reverse i32) (result (ref $LIST))
+  (local $data (ref $ARRAY_ANY))
+  (local $keys (ref $ARRAY_ANY))
+  (local $perm (ref $ARRAY_I32))
+  (local $env (ref null $ENV))
+  (local $func_idx i32)
+  (local $len i32)
+  (local $i i32)
 
-      ;; Create decorated pair: (key_result, item) and append
-      (local.set $decorated
-        (call $list_append
-          (local.get $decorated)
-          (struct.new $PAIR (local.get $key_result) (local.get $item))
-        )
-      )
+  (local.set $data (struct.get $LIST $data (local.get $list)))
+  (local.set $len (struct.get $LIST $len (local.get $list)))
+  (local.set $env (struct.get $CLOSURE 0 (local.get $closure)))
+  (local.set $func_idx (struct.get $CLOSURE 1 (local.get $closure)))
 
-      (local.set $current (struct.get $PAIR 1 (local.get $pair)))
-      (br $dec_loop)
+  ;; Decorate: keys[i] = key(data[i])
+  (local.set $keys (array.new_default $ARRAY_ANY (local.get $len)))
+  (local.set $i (i32.const 0))
+  (block $keys_done
+    (loop $keys_loop
+      (br_if $keys_done (i32.ge_s (local.get $i) (local.get $len)))
+      (array.set $ARRAY_ANY (local.get $keys) (local.get $i)
+        (call_indirect (type $FUNC)
+          (struct.new $PAIR (array.get $ARRAY_ANY (local.get $data) (local.get $i)) (ref.null eq))
+          (local.get $env)
+          (local.get $func_idx)))
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (br $keys_loop)
     )
   )
 
-  ;; Convert $decorated to PAIR chain if it became a $LIST
-  (if (ref.test (ref $LIST) (local.get $decorated))
-    (then
-      (local.set $decorated (call $list_v2_to_pair (ref.cast (ref $LIST) (local.get $decorated))))
-    )
+  ;; Key calls are observable, so only the sort itself is skipped for len <= 1
+  (if (i32.le_s (local.get $len) (i32.const 1))
+    (then (return (local.get $list)))
   )
+  (local.set $perm (call $sort_permutation_by_keys (local.get $keys) (local.get $len) (local.get $reverse)))
+  (call $sort_apply_permutation (local.get $data) (local.get $perm) (local.get $len))
+  (local.get $list)
+)
 
-  ;; Step 2: Sort decorated list by key values (bubble sort)
-  (block $sort_done
-    (loop $outer
-      (local.set $swapped (i32.const 0))
-      (local.set $current (local.get $decorated))
-
-      (block $inner_done
-        (loop $inner
-          (br_if $inner_done (ref.is_null (local.get $current)))
-          (local.set $pair (ref.cast (ref $PAIR) (local.get $current)))
-          (br_if $inner_done (ref.is_null (struct.get $PAIR 1 (local.get $pair))))
-
-          (local.set $next_pair (ref.cast (ref $PAIR) (struct.get $PAIR 1 (local.get $pair))))
-
-          ;; Get decorated pairs (key, item)
-          (local.set $a (struct.get $PAIR 0 (local.get $pair)))
-          (local.set $b (struct.get $PAIR 0 (local.get $next_pair)))
 
-          ;; Extract keys from decorated pairs
-          (local.set $a_key (struct.get $PAIR 0 (ref.cast (ref $PAIR) (local.get $a))))
-          (local.set $b_key (struct.get $PAIR 0 (ref.cast (ref $PAIR) (local.get $b))))
+;; sort_apply_permutation: reorder data[0:len] in place so that the new
+;; data[j] is the old data[perm[j]], by following cycles (perm is consumed:
+;; visited slots are marked with perm[j] = j)
+(func $sort_apply_permutation (param $data (ref $ARRAY_ANY)) (param $perm (ref $ARRAY_I32)) (param $len i32)
+  (local $i i32)
+  (local $j i32)
+  (local $k i32)
+  (local $tmp (ref null eq))
 
-          ;; Compare keys using generic compare
-          (if (call $compare_values (local.get $a_key) (local.get $b_key))
-            (then
-              ;; Swap the decorated pairs
-              (struct.set $PAIR 0 (local.get $pair) (local.get $b))
-              (struct.set $PAIR 0 (local.get $next_pair) (local.get $a))
-              (local.set $swapped (i32.const 1))
+  (block $apply_done
+    (loop $apply_loop
+      (br_if $apply_done (i32.ge_s (local.get $i) (local.get $len)))
+      (if (i32.ne (array.get $ARRAY_I32 (local.get $perm) (local.get $i)) (local.get $i))
+        (then
+          (local.set $tmp (array.get $ARRAY_ANY (local.get $data) (local.get $i)))
+          (local.set $j (local.get $i))
+          (block $cycle_done
+            (loop $cycle_loop
+              (local.set $k (array.get $ARRAY_I32 (local.get $perm) (local.get $j)))
+              (array.set $ARRAY_I32 (local.get $perm) (local.get $j) (local.get $j))
+              (if (i32.eq (local.get $k) (local.get $i))
+                (then
+                  (array.set $ARRAY_ANY (local.get $data) (local.get $j) (local.get $tmp))
+                  (br $cycle_done)
+                )
+              )
+              (array.set $ARRAY_ANY (local.get $data) (local.get $j)
+                (array.get $ARRAY_ANY (local.get $data) (local.get $k)))
+              (local.set $j (local.get $k))
+              (br $cycle_loop)
             )
           )
-
-          (local.set $current (struct.get $PAIR 1 (local.get $pair)))
-          (br $inner)
         )
       )
-
-      (br_if $sort_done (i32.eqz (local.get $swapped)))
-      (br $outer)
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (br $apply_loop)
     )
   )
+)
 
-  ;; Step 3: Copy sorted values back to original list
-  ;; If original was a $LIST, copy to its array; otherwise copy to PAIR chain
-  (if (ref.is_null (local.get $orig_list_v2))
-    (then
-      ;; Original was PAIR chain - copy to PAIR chain
-      (local.set $dec_current (local.get $decorated))
-      (local.set $orig_current (local.get $lst))
-      (block $copy_done
-        (loop $copy_loop
-          (br_if $copy_done (ref.is_null (local.get $dec_current)))
-          (br_if $copy_done (ref.is_null (local.get $orig_current)))
-          (br_if $copy_done (i32.eqz (ref.test (ref $PAIR) (local.get $dec_current))))
-          (br_if $copy_done (i32.eqz (ref.test (ref $PAIR) (local.get $orig_current))))
 
-          (local.set $pair (ref.cast (ref $PAIR) (local.get $dec_current)))
-          (local.set $orig_pair (ref.cast (ref $PAIR) (local.get $orig_current)))
+;; sort_key_after: 1 if keys[a] must come strictly after keys[b] in the
+;; requested order (ascending, or descending when $reverse is set)
+(func $sort_key_after (param $keys (ref $ARRAY_ANY)) (param $a i32) (param $b i32) (param $reverse i32) (result i32)
+  (if (result i32) (local.get $reverse)
+    (then
+      (call $compare_values
+        (array.get $ARRAY_ANY (local.get $keys) (local.get $b))
+        (array.get $ARRAY_ANY (local.get $keys) (local.get $a))))
+    (else
+      (call $compare_values
+        (array.get $ARRAY_ANY (local.get $keys) (local.get $a))
+        (array.get $ARRAY_ANY (local.get $keys) (local.get $b)))))
+)
 
-          ;; Get decorated pair (key, item) and extract item
-          (local.set $dec_pair (ref.cast (ref $PAIR) (struct.get $PAIR 0 (local.get $pair))))
-          (local.set $item (struct.get $PAIR 1 (local.get $dec_pair)))
 
-          ;; Copy item to original list
-          (struct.set $PAIR 0 (local.get $orig_pair) (local.get $item))
+;; sort_insertion_range: binary insertion sort of perm[lo:hi] by keys, where
+;; perm[lo:start] is already sorted. Each new index goes after every equal
+;; key (stable); the tail shift is a single array.copy.
+(func $sort_insertion_range (param $keys (ref $ARRAY_ANY)) (param $perm (ref $ARRAY_I32))
+      (param $lo i32) (param $start i32) (param $hi i32) (param $reverse i32)
+  (local $i i32)
+  (local $x i32)
+  (local $left i32)
+  (local $right i32)
+  (local $m i32)
 
-          (local.set $dec_current (struct.get $PAIR 1 (local.get $pair)))
-          (local.set $orig_current (struct.get $PAIR 1 (local.get $orig_pair)))
-          (br $copy_loop)
+  (local.set $i (local.get $start))
+  (block $done
+    (loop $insert
+      (br_if $done (i32.ge_s (local.get $i) (local.get $hi)))
+      (local.set $x (array.get $ARRAY_I32 (local.get $perm) (local.get $i)))
+      ;; First position in perm[lo:i] whose key sorts strictly after x
+      (local.set $left (local.get $lo))
+      (local.set $right (local.get $i))
+      (block $found
+        (loop $search
+          (br_if $found (i32.ge_s (local.get $left) (local.get $right)))
+          (local.set $m (i32.shr_u (i32.add (local.get $left) (local.get $right)) (i32.const 1)))
+          (if (call $sort_key_after (local.get $keys)
+                (array.get $ARRAY_I32 (local.get $perm) (local.get $m)) (local.get $x) (local.get $reverse))
+            (then (local.set $right (local.get $m)))
+            (else (local.set $left (i32.add (local.get $m) (i32.const 1))))
+          )
+          (br $search)
         )
       )
-      (return (local.get $lst))
+      (array.copy $ARRAY_I32 $ARRAY_I32
+        (local.get $perm) (i32.add (local.get $left) (i32.const 1))
+        (local.get $perm) (local.get $left)
+        (i32.sub (local.get $i) (local.get $left)))
+      (array.set $ARRAY_I32 (local.get $perm) (local.get $left) (local.get $x))
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (br $insert)
     )
-    (else
-      ;; Original was $LIST - copy to array
-      (local.set $list_data (struct.get $LIST $data (local.get $orig_list_v2)))
-      (local.set $i (i32.const 0))
-      (local.set $dec_current (local.get $decorated))
-      (block $copy_done_v2
-        (loop $copy_loop_v2
-          (br_if $copy_done_v2 (ref.is_null (local.get $dec_current)))
-          (br_if $copy_done_v2 (i32.eqz (ref.test (ref $PAIR) (local.get $dec_current))))
+  )
+)
 
-          (local.set $pair (ref.cast (ref $PAIR) (local.get $dec_current)))
 
-          ;; Get decorated pair (key, item) and extract item
-          (local.set $dec_pair (ref.cast (ref $PAIR) (struct.get $PAIR 0 (local.get $pair))))
-          (local.set $item (struct.get $PAIR 1 (local.get $dec_pair)))
+;; sort_permutation_by_keys: stable natural merge sort of indices 0..len-1
+;; Returns perm such that keys[perm[0]] <= keys[perm[1]] <= ... (via $compare_values),
+;; or >= when $reverse is set; equal keys keep their order either way, as
+;; with sort(reverse=True) in CPython.
+;; Like Timsort, the input is first split into its natural runs (strictly
+;; descending runs are reversed in place, which keeps the sort stable), then
+;; adjacent runs are merged pairwise until one is left. Already-sorted input
+;; is a single run and costs n-1 comparisons; two runs that are already in
+;; order are copied without merging. Runs shorter than 32 (Timsort's minrun
+;; floor) are extended by binary insertion, so small inputs and the leaves of
+;; random ones never pay merge-pass overhead.
+(func $sort_permutation_by_keys (param $keys (ref $ARRAY_ANY)) (param $len i32) (param $reverse i32) (result (ref $ARRAY_I32))
+  (local $src (ref $ARRAY_I32))
+  (local $dst (ref $ARRAY_I32))
+  (local $swap (ref $ARRAY_I32))
+  (local $runs (ref $ARRAY_I32))
+  (local $nruns i32)
+  (local $run i32)
+  (local $merged i32)
+  (local $lo i32)
+  (local $mid i32)
+  (local $hi i32)
+  (local $l i32)
+  (local $r i32)
+  (local $out i32)
+  (local $i i32)
+  (local $tmp i32)
 
-          ;; Copy item to array
-          (array.set $ARRAY_ANY (local.get $list_data) (local.get $i) (local.get $item))
+  (local.set $src (array.new_default $ARRAY_I32 (local.get $len)))
+  (local.set $dst (array.new_default $ARRAY_I32 (local.get $len)))
+  (local.set $i (i32.const 0))
+  (block $init_done
+    (loop $init_loop
+      (br_if $init_done (i32.ge_s (local.get $i) (local.get $len)))
+      (array.set $ARRAY_I32 (local.get $src) (local.get $i) (local.get $i))
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (br $init_loop)
+    )
+  )
 
-          (local.set $i (i32.add (local.get $i) (i32.const 1)))
-          (local.set $dec_current (struct.get $PAIR 1 (local.get $pair)))
-          (br $copy_loop_v2)
+  ;; Find natural runs; runs[k] is the start of run k, runs[nruns] = len
+  (local.set $runs (array.new_default $ARRAY_I32 (i32.add (local.get $len) (i32.const 1))))
+  (local.set $i (i32.const 0))
+  (block $runs_found
+    (loop $find_run
+      (br_if $runs_found (i32.ge_s (local.get $i) (local.get $len)))
+      (local.set $lo (local.get $i))
+      (array.set $ARRAY_I32 (local.get $runs) (local.get $nruns) (local.get $lo))
+      (local.set $nruns (i32.add (local.get $nruns) (i32.const 1)))
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (if (i32.lt_s (local.get $i) (local.get $len))
+        (then
+          (if (call $sort_key_after (local.get $keys)
+                (i32.sub (local.get $i) (i32.const 1)) (local.get $i) (local.get $reverse))
+            (then
+              ;; Strictly descending run: extend it, then reverse it in place
+              (block $desc_done
+                (loop $desc
+                  (local.set $i (i32.add (local.get $i) (i32.const 1)))
+                  (br_if $desc_done (i32.ge_s (local.get $i) (local.get $len)))
+                  (br_if $desc (call $sort_key_after (local.get $keys)
+                    (i32.sub (local.get $i) (i32.const 1)) (local.get $i) (local.get $reverse)))
+                )
+              )
+              (local.set $l (local.get $lo))
+              (local.set $r (i32.sub (local.get $i) (i32.const 1)))
+              (block $rev_done
+                (loop $rev
+                  (br_if $rev_done (i32.ge_s (local.get $l) (local.get $r)))
+                  (local.set $tmp (array.get $ARRAY_I32 (local.get $src) (local.get $l)))
+                  (array.set $ARRAY_I32 (local.get $src) (local.get $l)
+                    (array.get $ARRAY_I32 (local.get $src) (local.get $r)))
+                  (array.set $ARRAY_I32 (local.get $src) (local.get $r) (local.get $tmp))
+                  (local.set $l (i32.add (local.get $l) (i32.const 1)))
+                  (local.set $r (i32.sub (local.get $r) (i32.const 1)))
+                  (br $rev)
+                )
+              )
+            )
+            (else
+              ;; Non-descending run
+              (block $asc_done
+                (loop $asc
+                  (local.set $i (i32.add (local.get $i) (i32.const 1)))
+                  (br_if $asc_done (i32.ge_s (local.get $i) (local.get $len)))
+                  (br_if $asc (i32.eqz (call $sort_key_after (local.get $keys)
+                    (i32.sub (local.get $i) (i32.const 1)) (local.get $i) (local.get $reverse))))
+                )
+              )
+            )
+          )
+        )
+      )
+      ;; Extend a short run to the minimum run length by insertion
+      (if (i32.lt_s (i32.sub (local.get $i) (local.get $lo)) (i32.const 32))
+        (then
+          (local.set $hi (i32.add (local.get $lo) (i32.const 32)))
+          (if (i32.gt_s (local.get $hi) (local.get $len))
+            (then (local.set $hi (local.get $len)))
+          )
+          (call $sort_insertion_range (local.get $keys) (local.get $src)
+            (local.get $lo) (local.get $i) (local.get $hi) (local.get $reverse))
+          (local.set $i (local.get $hi))
+        )
+      )
+      (br $find_run)
+    )
+  )
+  (array.set $ARRAY_I32 (local.get $runs) (local.get $nruns) (local.get $len))
+
+  ;; Merge adjacent runs pairwise, src -> dst, until a single run remains
+  (block $pass_done
+    (loop $pass_loop
+      (br_if $pass_done (i32.le_s (local.get $nruns) (i32.const 1)))
+      (local.set $run (i32.const 0))
+      (local.set $merged (i32.const 0))
+      (block $pairs_done
+        (loop $pairs_loop
+          (br_if $pairs_done (i32.ge_s (local.get $run) (local.get $nruns)))
+          (local.set $lo (array.get $ARRAY_I32 (local.get $runs) (local.get $run)))
+          (local.set $mid (array.get $ARRAY_I32 (local.get $runs) (i32.add (local.get $run) (i32.const 1))))
+          (array.set $ARRAY_I32 (local.get $runs) (local.get $merged) (local.get $lo))
+          (local.set $merged (i32.add (local.get $merged) (i32.const 1)))
+          ;; An odd run out, or a pair already in order, is copied as-is
+          (if (i32.ge_s (i32.add (local.get $run) (i32.const 1)) (local.get $nruns))
+            (then
+              (array.copy $ARRAY_I32 $ARRAY_I32
+                (local.get $dst) (local.get $lo) (local.get $src) (local.get $lo)
+                (i32.sub (local.get $mid) (local.get $lo)))
+              (br $pairs_done)
+            )
+          )
+          (local.set $hi (array.get $ARRAY_I32 (local.get $runs) (i32.add (local.get $run) (i32.const 2))))
+          (local.set $run (i32.add (local.get $run) (i32.const 2)))
+          (if (i32.eqz (call $sort_key_after (local.get $keys)
+                (array.get $ARRAY_I32 (local.get $src) (i32.sub (local.get $mid) (i32.const 1)))
+                (array.get $ARRAY_I32 (local.get $src) (local.get $mid))
+                (local.get $reverse)))
+            (then
+              (array.copy $ARRAY_I32 $ARRAY_I32
+                (local.get $dst) (local.get $lo) (local.get $src) (local.get $lo)
+                (i32.sub (local.get $hi) (local.get $lo)))
+              (br $pairs_loop)
+            )
+          )
+          ;; Merge src[lo:mid] and src[mid:hi] into dst[lo:hi]
+          (local.set $l (local.get $lo))
+          (local.set $r (local.get $mid))
+          (local.set $out (local.get $lo))
+          (block $merge_done
+            (loop $merge_loop
+              (br_if $merge_done (i32.ge_s (local.get $out) (local.get $hi)))
+              ;; Take from the right run only if the left run is exhausted or
+              ;; its head strictly sorts after the right one (keeps equal keys
+              ;; in order)
+              (if (if (result i32) (i32.ge_s (local.get $l) (local.get $mid))
+                    (then (i32.const 1))
+                    (else
+                      (if (result i32) (i32.ge_s (local.get $r) (local.get $hi))
+                        (then (i32.const 0))
+                        (else
+                          (call $sort_key_after (local.get $keys)
+                            (array.get $ARRAY_I32 (local.get $src) (local.get $l))
+                            (array.get $ARRAY_I32 (local.get $src) (local.get $r))
+                            (local.get $reverse))))))
+                (then
+                  (array.set $ARRAY_I32 (local.get $dst) (local.get $out)
+                    (array.get $ARRAY_I32 (local.get $src) (local.get $r)))
+                  (local.set $r (i32.add (local.get $r) (i32.const 1)))
+                )
+                (else
+                  (array.set $ARRAY_I32 (local.get $dst) (local.get $out)
+                    (array.get $ARRAY_I32 (local.get $src) (local.get $l)))
+                  (local.set $l (i32.add (local.get $l) (i32.const 1)))
+                )
+              )
+              (local.set $out (i32.add (local.get $out) (i32.const 1)))
+              (br $merge_loop)
+            )
+          )
+          (br $pairs_loop)
         )
       )
-      (return (local.get $orig_list_v2))
+      (array.set $ARRAY_I32 (local.get $runs) (local.get $merged) (local.get $len))
+      (local.set $nruns (local.get $merged))
+      (local.set $swap (local.get $src))
+      (local.set $src (local.get $dst))
+      (local.set $dst (local.get $swap))
+      (br $pass_loop)
     )
   )
-  (unreachable)
+  (local.get $src)
 )
 
 
-;; Convert list to set (removes duplicates)
-(func $list_to_set (param $list (ref null eq)) (result (ref null eq))
-  (local $current (ref null eq))
-  (local $pair (ref null $PAIR))
-  (local $result (ref null eq))
-  (local $i i32)
+;; list_sort_with_key_pair: sort a PAIR chain in place by key
+;; The chain length is counted once so the items and keys arrays are allocated
+;; at their final size; sorting then reuses the $LIST permutation sort.
+(func $list_sort_with_key_pair (param $lst (ref null eq)) (param $closure (ref $CLOSURE)) (param $reverse i32) (result (ref null eq))
+  (local $items (ref $ARRAY_ANY))
+  (local $keys (ref $ARRAY_ANY))
+  (local $perm (ref $ARRAY_I32))
+  (local $env (ref null $ENV))
+  (local $func_idx i32)
   (local $len i32)
-  (local $data (ref null $ARRAY_ANY))
+  (local $i i32)
+  (local $current (ref null eq))
+  (local $pair (ref $PAIR))
+  (local $item (ref null eq))
 
-  ;; Start with empty set
-  (local.set $result (ref.null eq))
+  (local.set $env (struct.get $CLOSURE 0 (local.get $closure)))
+  (local.set $func_idx (struct.get $CLOSURE 1 (local.get $closure)))
+  (local.set $len (call $list_len (local.get $lst)))
+  (local.set $items (array.new_default $ARRAY_ANY (local.get $len)))
+  (local.set $keys (array.new_default $ARRAY_ANY (local.get $len)))
 
-  ;; Handle null/empty list
-  (if (ref.is_null (local.get $list))
-    (then (return (ref.null eq)))
-  )
-  (if (ref.test (ref $EMPTY_LIST) (local.get $list))
-    (then (return (ref.null eq)))
+  ;; Decorate: items[i] = node value, keys[i] = key(items[i])
+  (local.set $current (local.get $lst))
+  (local.set $i (i32.const 0))
+  (block $dec_done
+    (loop $dec_loop
+      (br_if $dec_done (i32.eqz (ref.test (ref $PAIR) (local.get $current))))
+      (local.set $pair (ref.cast (ref $PAIR) (local.get $current)))
+      (local.set $item (struct.get $PAIR 0 (local.get $pair)))
+      (array.set $ARRAY_ANY (local.get $items) (local.get $i) (local.get $item))
+      (array.set $ARRAY_ANY (local.get $keys) (local.get $i)
+        (call_indirect (type $FUNC)
+          (struct.new $PAIR (local.get $item) (ref.null eq))
+          (local.get $env)
+          (local.get $func_idx)))
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (local.set $current (struct.get $PAIR 1 (local.get $pair)))
+      (br $dec_loop)
+    )
   )
 
-  ;; Handle $LIST (array-backed)
-  (if (ref.test (ref $LIST) (local.get $list))
-    (then
-      (local.set $data (struct.get $LIST 0 (ref.cast (ref $LIST) (local.get $list))))
-      (local.set $len (struct.get $LIST 1 (ref.cast (ref $LIST) (local.get $list))))
-      (local.set $i (i32.const 0))
-      (block $done_list
-        (loop $loop_list
-          (br_if $done_list (i32.ge_s (local.get $i) (local.get $len)))
-          ;; Add element to set (set_add handles duplicates)
-          (local.set $result
-            (call $set_add (local.get $result)
-              (array.get $ARRAY_ANY (ref.cast (ref $ARRAY_ANY) (local.get $data)) (local.get $i))))
-          (local.set $i (i32.add (local.get $i) (i32.const 1)))
-          (br $loop_list)
-        )
-      )
-      (return (local.get $result))
-    )
+  (if (i32.le_s (local.get $len) (i32.const 1))
+    (then (return (local.get $lst)))
   )
+  (local.set $perm (call $sort_permutation_by_keys (local.get $keys) (local.get $len) (local.get $reverse)))
 
-  ;; Iterate through PAIR chain, adding each element to set
-  (local.set $current (local.get $list))
-  (block $done
-    (loop $loop
-      (br_if $done (ref.is_null (local.get $current)))
-      (if (i32.eqz (ref.test (ref $PAIR) (local.get $current)))
-        (then (br $done))
-      )
+  ;; Undecorate: write items back into the original nodes in sorted order
+  (local.set $current (local.get $lst))
+  (local.set $i (i32.const 0))
+  (block $copy_done
+    (loop $copy_loop
+      (br_if $copy_done (i32.eqz (ref.test (ref $PAIR) (local.get $current))))
       (local.set $pair (ref.cast (ref $PAIR) (local.get $current)))
-      ;; Add element to set (set_add handles duplicates)
-      (local.set $result
-        (call $set_add (local.get $result) (struct.get $PAIR 0 (local.get $pair))))
-      ;; Move to next element
+      (struct.set $PAIR 0 (local.get $pair)
+        (array.get $ARRAY_ANY (local.get $items)
+          (array.get $ARRAY_I32 (local.get $perm) (local.get $i))))
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
       (local.set $current (struct.get $PAIR 1 (local.get $pair)))
-      (br $loop)
+      (br $copy_loop)
     )
   )
-  (local.get $result)
+  (local.get $lst)
 )
 
 """
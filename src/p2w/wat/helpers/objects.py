@@ -4,31 +4,287 @@ from __future__ import annotations
 
 OBJECTS_CODE = """
 
+;; =============================================================================
+;; Attribute tables (instance attributes and class dicts)
+;; =============================================================================
+
+;; attr_table_new: create an empty table; capacity must be a power of two
+(func $attr_table_new (param $capacity i32) (result (ref $ATTR_TABLE))
+  (struct.new $ATTR_TABLE
+    (array.new_default $ATTR_KEYS (local.get $capacity))
+    (array.new_default $ARRAY_I32 (local.get $capacity))
+    (array.new_default $ARRAY_ANY (local.get $capacity))
+    (i32.sub (local.get $capacity) (i32.const 1))
+    (i32.const 0)
+  )
+)
+
+
+;; attr_table_probe: slot holding name, or the empty slot where it would go
+;; The load factor is kept below 75%, so an empty slot always exists.
+(func $attr_table_probe (param $table (ref $ATTR_TABLE)) (param $name (ref $STRING)) (param $hash i32) (result i32)
+  (local $keys (ref $ATTR_KEYS))
+  (local $hashes (ref $ARRAY_I32))
+  (local $mask i32)
+  (local $i i32)
+  (local $key (ref null $STRING))
+
+  (local.set $keys (struct.get $ATTR_TABLE $keys (local.get $table)))
+  (local.set $hashes (struct.get $ATTR_TABLE $hashes (local.get $table)))
+  (local.set $mask (struct.get $ATTR_TABLE $mask (local.get $table)))
+  (local.set $i (i32.and (local.get $hash) (local.get $mask)))
+  (loop $probe
+    (local.set $key (array.get $ATTR_KEYS (local.get $keys) (local.get $i)))
+    (if (ref.is_null (local.get $key))
+      (then (return (local.get $i)))
+    )
+    ;; Only compare bytes when the cached hashes match
+    (if (i32.eq (array.get $ARRAY_I32 (local.get $hashes) (local.get $i)) (local.get $hash))
+      (then
+        (if (call $strings_equal (ref.as_non_null (local.get $key)) (local.get $name))
+          (then (return (local.get $i)))
+        )
+      )
+    )
+    (local.set $i (i32.and (i32.add (local.get $i) (i32.const 1)) (local.get $mask)))
+    (br $probe)
+  )
+  (unreachable)
+)
+
+
+;; attr_table_index: slot index of name, or -1 if absent (or table is null)
+(func $attr_table_index (param $table (ref null $ATTR_TABLE)) (param $name (ref null eq)) (result i32)
+  (local $name_str (ref $STRING))
+
+  (if (ref.is_null (local.get $table))
+    (then (return (i32.const -1)))
+  )
+  (local.set $name_str (ref.cast (ref $STRING) (local.get $name)))
+  (return_call $attr_table_index_hashed
+    (local.get $table)
+    (local.get $name_str)
+    (call $hash_string (local.get $name_str)))
+)
+
+
+;; attr_table_index_hashed: $attr_table_index with the name's hash precomputed
+(func $attr_table_index_hashed (param $table (ref null $ATTR_TABLE)) (param $name (ref null eq)) (param $hash i32) (result i32)
+  (local $i i32)
+
+  (if (ref.is_null (local.get $table))
+    (then (return (i32.const -1)))
+  )
+  (local.set $i (call $attr_table_probe
+    (ref.as_non_null (local.get $table))
+    (ref.cast (ref $STRING) (local.get $name))
+    (local.get $hash)))
+  (if (result i32) (ref.is_null (array.get $ATTR_KEYS (struct.get $ATTR_TABLE $keys (local.get $table)) (local.get $i)))
+    (then (i32.const -1))
+    (else (local.get $i))
+  )
+)
+
+
+;; attr_table_find: (value, 1) for name, or (null, 0) if absent
+;; Callers branch on the flag with a typed if, e.g.
+;;   (if (param (ref null eq)) (then (return)) (else (drop)))
+(func $attr_table_find (param $table (ref null $ATTR_TABLE)) (param $name (ref null eq)) (result (ref null eq) i32)
+  (local $name_str (ref $STRING))
+
+  (if (ref.is_null (local.get $table))
+    (then (return (ref.null eq) (i32.const 0)))
+  )
+  (local.set $name_str (ref.cast (ref $STRING) (local.get $name)))
+  (return_call $attr_table_find_hashed
+    (local.get $table)
+    (local.get $name_str)
+    (call $hash_string (local.get $name_str)))
+)
+
+
+;; attr_table_find_hashed: $attr_table_find with the name's hash precomputed
+(func $attr_table_find_hashed (param $table (ref null $ATTR_TABLE)) (param $name (ref null eq)) (param $hash i32) (result (ref null eq) i32)
+  (local $idx i32)
+
+  (local.set $idx (call $attr_table_index_hashed (local.get $table) (local.get $name) (local.get $hash)))
+  (if (i32.lt_s (local.get $idx) (i32.const 0))
+    (then (return (ref.null eq) (i32.const 0)))
+  )
+  (array.get $ARRAY_ANY (struct.get $ATTR_TABLE $vals (local.get $table)) (local.get $idx))
+  (i32.const 1)
+)
+
+
+;; attr_table_set: insert or overwrite name -> value
+(func $attr_table_set (param $table (ref $ATTR_TABLE)) (param $name (ref null eq)) (param $value (ref null eq))
+  (local $name_str (ref $STRING))
+  (local $hash i32)
+  (local $i i32)
+
+  (local.set $name_str (ref.cast (ref $STRING) (local.get $name)))
+  (local.set $hash (call $hash_string (local.get $name_str)))
+  (local.set $i (call $attr_table_probe (local.get $table) (local.get $name_str) (local.get $hash)))
+
+  ;; Existing key - overwrite the value in place
+  (if (i32.eqz (ref.is_null (array.get $ATTR_KEYS (struct.get $ATTR_TABLE $keys (local.get $table)) (local.get $i))))
+    (then
+      (array.set $ARRAY_ANY (struct.get $ATTR_TABLE $vals (local.get $table)) (local.get $i) (local.get $value))
+      (return)
+    )
+  )
+
+  ;; New key - grow first if it would push the load past 75%
+  (if (i32.gt_u
+        (i32.shl (i32.add (struct.get $ATTR_TABLE $count (local.get $table)) (i32.const 1)) (i32.const 2))
+        (i32.mul (i32.add (struct.get $ATTR_TABLE $mask (local.get $table)) (i32.const 1)) (i32.const 3)))
+    (then
+      (call $attr_table_grow (local.get $table))
+      (local.set $i (call $attr_table_probe (local.get $table) (local.get $name_str) (local.get $hash)))
+    )
+  )
+  (array.set $ATTR_KEYS (struct.get $ATTR_TABLE $keys (local.get $table)) (local.get $i) (local.get $name_str))
+  (array.set $ARRAY_I32 (struct.get $ATTR_TABLE $hashes (local.get $table)) (local.get $i) (local.get $hash))
+  (array.set $ARRAY_ANY (struct.get $ATTR_TABLE $vals (local.get $table)) (local.get $i) (local.get $value))
+  (struct.set $ATTR_TABLE $count (local.get $table)
+    (i32.add (struct.get $ATTR_TABLE $count (local.get $table)) (i32.const 1)))
+)
+
+
+;; attr_table_grow: double the capacity and reinsert every key
+(func $attr_table_grow (param $table (ref $ATTR_TABLE))
+  (local $old_keys (ref $ATTR_KEYS))
+  (local $old_hashes (ref $ARRAY_I32))
+  (local $old_vals (ref $ARRAY_ANY))
+  (local $keys (ref $ATTR_KEYS))
+  (local $hashes (ref $ARRAY_I32))
+  (local $vals (ref $ARRAY_ANY))
+  (local $old_cap i32)
+  (local $mask i32)
+  (local $i i32)
+  (local $j i32)
+  (local $key (ref null $STRING))
+
+  (local.set $old_keys (struct.get $ATTR_TABLE $keys (local.get $table)))
+  (local.set $old_hashes (struct.get $ATTR_TABLE $hashes (local.get $table)))
+  (local.set $old_vals (struct.get $ATTR_TABLE $vals (local.get $table)))
+  (local.set $old_cap (i32.add (struct.get $ATTR_TABLE $mask (local.get $table)) (i32.const 1)))
+  (local.set $mask (i32.sub (i32.shl (local.get $old_cap) (i32.const 1)) (i32.const 1)))
+  (local.set $keys (array.new_default $ATTR_KEYS (i32.add (local.get $mask) (i32.const 1))))
+  (local.set $hashes (array.new_default $ARRAY_I32 (i32.add (local.get $mask) (i32.const 1))))
+  (local.set $vals (array.new_default $ARRAY_ANY (i32.add (local.get $mask) (i32.const 1))))
+
+  (local.set $i (i32.const 0))
+  (block $done
+    (loop $rehash
+      (br_if $done (i32.ge_u (local.get $i) (local.get $old_cap)))
+      (local.set $key (array.get $ATTR_KEYS (local.get $old_keys) (local.get $i)))
+      (if (i32.eqz (ref.is_null (local.get $key)))
+        (then
+          ;; Keys are unique, so only an empty slot is needed
+          (local.set $j (i32.and (array.get $ARRAY_I32 (local.get $old_hashes) (local.get $i)) (local.get $mask)))
+          (block $found
+            (loop $probe
+              (br_if $found (ref.is_null (array.get $ATTR_KEYS (local.get $keys) (local.get $j))))
+              (local.set $j (i32.and (i32.add (local.get $j) (i32.const 1)) (local.get $mask)))
+              (br $probe)
+            )
+          )
+          (array.set $ATTR_KEYS (local.get $keys) (local.get $j) (local.get $key))
+          (array.set $ARRAY_I32 (local.get $hashes) (local.get $j)
+            (array.get $ARRAY_I32 (local.get $old_hashes) (local.get $i)))
+          (array.set $ARRAY_ANY (local.get $vals) (local.get $j)
+            (array.get $ARRAY_ANY (local.get $old_vals) (local.get $i)))
+        )
+      )
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (br $rehash)
+    )
+  )
+
+  (struct.set $ATTR_TABLE $keys (local.get $table) (local.get $keys))
+  (struct.set $ATTR_TABLE $hashes (local.get $table) (local.get $hashes))
+  (struct.set $ATTR_TABLE $vals (local.get $table) (local.get $vals))
+  (struct.set $ATTR_TABLE $mask (local.get $table) (local.get $mask))
+)
+
+
+;; attr_table_from_arrays: build a class dict from the compiler's parallel
+;; name/value arrays; capacity is sized at compile time for the entry count,
+;; and the first entry for a name wins
+(func $attr_table_from_arrays (param $keys (ref $ATTR_KEYS)) (param $vals (ref $ARRAY_ANY)) (param $capacity i32) (result (ref $ATTR_TABLE))
+  (local $table (ref $ATTR_TABLE))
+  (local $n i32)
+  (local $i i32)
+  (local $key (ref $STRING))
+  (local $hash i32)
+  (local $slot i32)
+
+  (local.set $table (call $attr_table_new (local.get $capacity)))
+  (local.set $n (array.len (local.get $keys)))
+  (block $done
+    (loop $insert
+      (br_if $done (i32.ge_u (local.get $i) (local.get $n)))
+      (local.set $key (ref.as_non_null (array.get $ATTR_KEYS (local.get $keys) (local.get $i))))
+      (local.set $hash (call $hash_string (local.get $key)))
+      (local.set $slot (call $attr_table_probe (local.get $table) (local.get $key) (local.get $hash)))
+      (if (ref.is_null (array.get $ATTR_KEYS (struct.get $ATTR_TABLE $keys (local.get $table)) (local.get $slot)))
+        (then
+          (array.set $ATTR_KEYS (struct.get $ATTR_TABLE $keys (local.get $table)) (local.get $slot) (local.get $key))
+          (array.set $ARRAY_I32 (struct.get $ATTR_TABLE $hashes (local.get $table)) (local.get $slot) (local.get $hash))
+          (array.set $ARRAY_ANY (struct.get $ATTR_TABLE $vals (local.get $table)) (local.get $slot)
+            (array.get $ARRAY_ANY (local.get $vals) (local.get $i)))
+          (struct.set $ATTR_TABLE $count (local.get $table)
+            (i32.add (struct.get $ATTR_TABLE $count (local.get $table)) (i32.const 1)))
+        )
+      )
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (br $insert)
+    )
+  )
+  (local.get $table)
+)
+
+
+;; class_refresh_slots: refill the cached dunder slots of a class
+;; The slots are valid while $slots_epoch matches $class_epoch, which is
+;; bumped on every class attribute assignment.
+(func $class_refresh_slots (param $class (ref $CLASS))
+  (if (i32.eq (struct.get $CLASS $slots_epoch (local.get $class)) (global.get $class_epoch))
+    (then (return))
+  )
+  (struct.set $CLASS $init (local.get $class)
+    (call $class_lookup_method (local.get $class) (global.get $str___init__)))
+  (struct.set $CLASS $delitem (local.get $class)
+    (call $class_lookup_method (local.get $class) (global.get $str___delitem__)))
+  (struct.set $CLASS $slots_epoch (local.get $class) (global.get $class_epoch))
+)
+
+
+;; class_init_slot: return the class's __init__ (or null) via its slot
+(func $class_init_slot (param $class (ref $CLASS)) (result (ref null eq))
+  (call $class_refresh_slots (local.get $class))
+  (struct.get $CLASS $init (local.get $class))
+)
+
+
 ;; object_delitem: call __delitem__ on object
 (func $object_delitem (param $obj (ref null eq)) (param $key (ref null eq)) (result (ref null eq))
   (local $method (ref null eq))
-  (local $method_name (ref $STRING))
-  (local $offset i32)
   (local $closure (ref null $CLOSURE))
+  (local $class (ref $CLASS))
 
-  ;; Create "__delitem__" string
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 95))  ;; _
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 95))  ;; _
-  (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 100)) ;; d
-  (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 101)) ;; e
-  (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 108)) ;; l
-  (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 105)) ;; i
-  (i32.store8 (i32.add (local.get $offset) (i32.const 6)) (i32.const 116)) ;; t
-  (i32.store8 (i32.add (local.get $offset) (i32.const 7)) (i32.const 101)) ;; e
-  (i32.store8 (i32.add (local.get $offset) (i32.const 8)) (i32.const 109)) ;; m
-  (i32.store8 (i32.add (local.get $offset) (i32.const 9)) (i32.const 95))  ;; _
-  (i32.store8 (i32.add (local.get $offset) (i32.const 10)) (i32.const 95)) ;; _
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 11)))
-  (local.set $method_name (struct.new $STRING (local.get $offset) (i32.const 11)))
-
-  ;; Look up __delitem__ method
-  (local.set $method (call $object_getattr (local.get $obj) (local.get $method_name)))
+  ;; Look up __delitem__: class slot for plain objects, getattr otherwise
+  (if (ref.test (ref $OBJECT) (local.get $obj))
+    (then
+      (local.set $class (struct.get $OBJECT $class (ref.cast (ref $OBJECT) (local.get $obj))))
+      (call $class_refresh_slots (local.get $class))
+      (local.set $method (struct.get $CLASS $delitem (local.get $class)))
+    )
+    (else
+      (local.set $method (call $object_getattr (local.get $obj) (global.get $str___delitem__)))
+    )
+  )
 
   ;; If method not found, just return the object
   (if (ref.is_null (local.get $method))
@@ -51,37 +307,29 @@ OBJECTS_CODE = """
 
 ;; class_to_string: convert CLASS to string "<class 'ClassName'>"
 (func $class_to_string (param $cls (ref $CLASS)) (result (ref $STRING))
-  (local $offset i32)
-  (local $name (ref $STRING))
-  (local $prefix (ref $STRING))
-  (local $suffix (ref $STRING))
-  (local $result (ref $STRING))
-
-  (local.set $name (struct.get $CLASS 0 (local.get $cls)))
-
-  ;; Create "<class '" prefix (8 chars)
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 60))   ;; <
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 99))   ;; c
-  (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 108))  ;; l
-  (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 97))   ;; a
-  (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 115))  ;; s
-  (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 115))  ;; s
-  (i32.store8 (i32.add (local.get $offset) (i32.const 6)) (i32.const 32))   ;; space
-  (i32.store8 (i32.add (local.get $offset) (i32.const 7)) (i32.const 39))   ;; '
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 8)))
-  (local.set $prefix (struct.new $STRING (local.get $offset) (i32.const 8)))
-
-  ;; Create "'>" suffix (2 chars)
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 39))   ;; '
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 62))   ;; >
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 2)))
-  (local.set $suffix (struct.new $STRING (local.get $offset) (i32.const 2)))
-
-  ;; Concatenate: "<class '" + name + "'>"
-  (local.set $result (call $string_concat (local.get $prefix) (local.get $name)))
-  (call $string_concat (local.get $result) (local.get $suffix))
+  (call $type_name_to_string (struct.get $CLASS 0 (local.get $cls)))
+)
+
+
+;; type_name_to_string: "<class '" + name + "'>"
+;; One allocation: the 8-byte prefix is a single i64 store and the 2-byte
+;; suffix a single i32.store16, both read from the interned literals
+(func $type_name_to_string (param $name (ref $STRING)) (result (ref $STRING))
+  (local $name_len i32)
+  (local $total i32)
+  (local $off i32)
+  (local.set $name_len (struct.get $STRING 1 (local.get $name)))
+  (local.set $total (i32.add (local.get $name_len) (i32.const 10)))
+  (call $ensure_memory (local.get $total))
+  (local.set $off (global.get $string_heap))
+  (global.set $string_heap (i32.add (local.get $off) (local.get $total)))
+  (i64.store (local.get $off)
+    (i64.load (struct.get $STRING 0 (global.get $str_class_prefix))))
+  (memory.copy (i32.add (local.get $off) (i32.const 8))
+    (struct.get $STRING 0 (local.get $name)) (local.get $name_len))
+  (i32.store16 (i32.add (i32.add (local.get $off) (i32.const 8)) (local.get $name_len))
+    (i32.load16_u (struct.get $STRING 0 (global.get $str_class_suffix))))
+  (struct.new $STRING (local.get $off) (local.get $total) (i32.const 0))
 )
 
 
@@ -96,69 +344,49 @@ OBJECTS_CODE = """
 )
 
 
-;; Polymorphic pop with argument - for both list.pop(index) and dict.pop(key)
-;; Returns the popped value
-;; Polymorphic copy - dispatches to list_copy or dict_copy based on type
+;; Polymorphic copy - dispatches to list_copy, dict_copy or set_copy based on type
 (func $method_copy (param $obj (ref null eq)) (result (ref null eq))
   ;; Check if obj is a $DICT wrapper
   (if (ref.test (ref $DICT) (local.get $obj))
     (then (return (call $dict_copy (local.get $obj))))
   )
-  ;; Otherwise it's a list/set - use list_copy
+  ;; set.copy()
+  (if (ref.test (ref $SET) (local.get $obj))
+    (then (return (call $set_copy (ref.cast (ref $SET) (local.get $obj)))))
+  )
+  ;; Otherwise it's a list - use list_copy
   (call $list_copy (local.get $obj))
 )
 
 
-(func $method_pop_arg (param $obj (ref null eq)) (param $arg (ref null eq)) (result (ref null eq))
-  (local $value (ref null eq))
-  (local $updated (ref null eq))
+;; Polymorphic pop with argument - for both list.pop(index) and dict.pop(key)
+;; Returns (popped value, updated collection); the collection differs from
+;; obj only when popping index 0 of a PAIR chain
+(func $method_pop_arg (param $obj (ref null eq)) (param $arg (ref null eq)) (result (ref null eq) (ref null eq))
   ;; Check if obj is a dict (wrapped in $DICT) or if arg is a STRING (heuristic)
   (if (i32.or (ref.test (ref $DICT) (local.get $obj)) (ref.test (ref $STRING) (local.get $arg)))
     (then
-      ;; Call $dict_pop with null default - returns (value, updated_dict)
-      (call $dict_pop (local.get $obj) (local.get $arg) (ref.null eq))
-      (local.set $updated)
-      (local.set $value)
-      ;; Cache the updated dict for $method_pop_arg_update
-      (global.set $tmp_pop_dict (local.get $updated))
-      (return (local.get $value))
+      ;; $dict_pop with null default already returns (value, updated_dict)
+      (return (call $dict_pop (local.get $obj) (local.get $arg) (ref.null eq)))
     )
   )
-  ;; Otherwise treat as list.pop(index)
+  ;; Otherwise treat as list.pop(index): value, then the updated list
   (call $list_pop_at (local.get $obj) (local.get $arg))
+  (call $list_pop_at_rest (local.get $obj) (local.get $arg))
 )
 
 
 ;; Polymorphic pop with default - for dict.pop(key, default)
-(func $method_pop_arg_default (param $obj (ref null eq)) (param $arg (ref null eq)) (param $default (ref null eq)) (result (ref null eq))
-  (local $value (ref null eq))
-  (local $updated (ref null eq))
+;; Returns (popped value, updated collection) like $method_pop_arg
+(func $method_pop_arg_default (param $obj (ref null eq)) (param $arg (ref null eq)) (param $default (ref null eq)) (result (ref null eq) (ref null eq))
   ;; Check if obj is a dict
   (if (i32.or (ref.test (ref $DICT) (local.get $obj)) (ref.test (ref $STRING) (local.get $arg)))
     (then
-      ;; Call $dict_pop with provided default
-      (call $dict_pop (local.get $obj) (local.get $arg) (local.get $default))
-      (local.set $updated)
-      (local.set $value)
-      ;; Cache the updated dict for $method_pop_arg_update
-      (global.set $tmp_pop_dict (local.get $updated))
-      (return (local.get $value))
+      (return (call $dict_pop (local.get $obj) (local.get $arg) (local.get $default)))
     )
   )
   ;; For lists, pop doesn't take a default - just ignore it
   (call $list_pop_at (local.get $obj) (local.get $arg))
-)
-
-
-;; Polymorphic pop update - returns the updated collection after pop
-;; For lists, this handles the pop at index 0 case
-;; For dicts, returns the cached updated dict from $method_pop_arg
-(func $method_pop_arg_update (param $obj (ref null eq)) (param $arg (ref null eq)) (result (ref null eq))
-  ;; If obj is a dict or arg is a STRING, return the cached updated dict
-  (if (i32.or (ref.test (ref $DICT) (local.get $obj)) (ref.test (ref $STRING) (local.get $arg)))
-    (then (return (global.get $tmp_pop_dict)))
-  )
-  ;; Otherwise treat as list.pop(index) - return updated list
   (call $list_pop_at_rest (local.get $obj) (local.get $arg))
 )
 
@@ -167,62 +395,73 @@ OBJECTS_CODE = """
 ;; Object and Class Operations
 ;; =============================================================================
 
-;; unwrap_self: extract real self from SUPER proxy or return object as-is
-;; Used for method calls to ensure we pass the real self, not the super proxy
-(func $unwrap_self (param $obj (ref null eq)) (result (ref null eq))
-  ;; If SUPER, return the wrapped self
-  (if (ref.test (ref $SUPER) (local.get $obj))
-    (then
-      (return (struct.get $SUPER 1 (ref.cast (ref $SUPER) (local.get $obj))))
-    )
-  )
-  ;; Otherwise return as-is
-  (local.get $obj)
-)
-
-
 ;; maybe_call_property_getter: if value is a PROPERTY, call its getter with self
-;; Otherwise return the value as-is
+;; Otherwise return the value as-is. $self is an OBJECT and $name the attribute
+;; name, under which a cached_property stores its result on the instance.
 (func $maybe_call_property_getter
   (param $self (ref null eq))
+  (param $name (ref null eq))
   (param $value (ref null eq))
   (result (ref null eq))
   (local $prop (ref $PROPERTY))
   (local $getter (ref null $CLOSURE))
   (local $args (ref null eq))
+  (local $result (ref null eq))
+  (local $obj_ref (ref $OBJECT))
+  (local $attrs (ref null $ATTR_TABLE))
 
-  ;; Check if value is a PROPERTY
-  (if (result (ref null eq))
-    (ref.test (ref $PROPERTY) (local.get $value))
+  ;; Not a property - return as-is
+  (if (i32.eqz (ref.test (ref $PROPERTY) (local.get $value)))
+    (then (return (local.get $value)))
+  )
+
+  ;; It's a property - call its getter with self
+  (local.set $prop (ref.cast (ref $PROPERTY) (local.get $value)))
+  (local.set $getter (struct.get $PROPERTY 0 (local.get $prop)))
+
+  ;; If getter is null, return null
+  (if (ref.is_null (local.get $getter))
+    (then (return (ref.null eq)))
+  )
+
+  ;; Build args: PAIR(self, null), reusing the scratch chain if allowed
+  (if (i32.and (struct.get $PROPERTY $flags (local.get $prop)) (i32.const 1))
     (then
-      ;; It's a property - call its getter with self
-      (local.set $prop (ref.cast (ref $PROPERTY) (local.get $value)))
-      (local.set $getter (struct.get $PROPERTY 0 (local.get $prop)))
+      (struct.set $PAIR 0 (global.get $scratch_args1) (local.get $self))
+      (local.set $args (global.get $scratch_args1))
+    )
+    (else
+      (local.set $args (struct.new $PAIR
+        (local.get $self)
+        (ref.null eq)
+      ))
+    )
+  )
+  ;; Call the getter
+  (local.set $result
+    (call_indirect (type $FUNC)
+      (local.get $args)
+      (struct.get $CLOSURE 0 (ref.cast (ref $CLOSURE) (local.get $getter)))
+      (struct.get $CLOSURE 1 (ref.cast (ref $CLOSURE) (local.get $getter)))
+    )
+  )
 
-      ;; If getter is null, return null
-      (if (result (ref null eq))
-        (ref.is_null (local.get $getter))
-        (then (ref.null eq))
-        (else
-          ;; Build args: PAIR(self, null)
-          (local.set $args (struct.new $PAIR
-            (local.get $self)
-            (ref.null eq)
-          ))
-          ;; Call the getter
-          (call_indirect (type $FUNC)
-            (local.get $args)
-            (struct.get $CLOSURE 0 (ref.cast (ref $CLOSURE) (local.get $getter)))
-            (struct.get $CLOSURE 1 (ref.cast (ref $CLOSURE) (local.get $getter)))
-          )
+  ;; cached_property: store the result as an instance attribute, which
+  ;; shadows the property on every later read
+  (if (i32.and (struct.get $PROPERTY $flags (local.get $prop)) (i32.const 8))
+    (then
+      (local.set $obj_ref (ref.cast (ref $OBJECT) (local.get $self)))
+      (local.set $attrs (struct.get $OBJECT $attrs (local.get $obj_ref)))
+      (if (ref.is_null (local.get $attrs))
+        (then
+          (local.set $attrs (call $attr_table_new (i32.const 8)))
+          (struct.set $OBJECT $attrs (local.get $obj_ref) (local.get $attrs))
         )
       )
-    )
-    (else
-      ;; Not a property - return as-is
-      (local.get $value)
+      (call $attr_table_set (ref.as_non_null (local.get $attrs)) (local.get $name) (local.get $result))
     )
   )
+  (local.get $result)
 )
 
 
@@ -245,18 +484,35 @@ OBJECTS_CODE = """
       (local.set $prop (ref.cast (ref $PROPERTY) (local.get $attr)))
       (local.set $setter (struct.get $PROPERTY 1 (local.get $prop)))
 
-      ;; If setter is null, raise AttributeError (property is read-only)
+      ;; If setter is null, raise AttributeError (property is read-only);
+      ;; a cached_property is not a data descriptor, so the instance
+      ;; attribute is assigned as usual
       (if (ref.is_null (local.get $setter))
-        (then (call $throw_attribute_error (ref.null eq)))
+        (then
+          (if (i32.and (struct.get $PROPERTY $flags (local.get $prop)) (i32.const 8))
+            (then (return (i32.const 0)))
+          )
+          (call $throw_attribute_error (ref.null eq))
+        )
         (else
-          ;; Build args: PAIR(self, PAIR(value, null))
-          (local.set $args (struct.new $PAIR
-            (local.get $self)
-            (struct.new $PAIR
-              (local.get $value)
-              (ref.null eq)
+          ;; Build args: PAIR(self, PAIR(value, null)), reusing the scratch
+          ;; chain if allowed
+          (if (i32.and (struct.get $PROPERTY $flags (local.get $prop)) (i32.const 2))
+            (then
+              (struct.set $PAIR 0 (global.get $scratch_args2) (local.get $self))
+              (struct.set $PAIR 0 (global.get $scratch_args2_tail) (local.get $value))
+              (local.set $args (global.get $scratch_args2))
             )
-          ))
+            (else
+              (local.set $args (struct.new $PAIR
+                (local.get $self)
+                (struct.new $PAIR
+                  (local.get $value)
+                  (ref.null eq)
+                )
+              ))
+            )
+          )
           ;; Call the setter
           (drop (call_indirect (type $FUNC)
             (local.get $args)
@@ -278,9 +534,35 @@ OBJECTS_CODE = """
 ;; object_getattr: get attribute value from object, class, or super proxy
 ;; Returns null if attribute not found
 (func $object_getattr (param $obj (ref null eq)) (param $name (ref null eq)) (result (ref null eq))
-  (local $attrs (ref null eq))
-  (local $pair (ref null $PAIR))
-  (local $kv (ref null $PAIR))
+  (local $obj_ref (ref $OBJECT))
+
+  ;; Plain instances are by far the most common receiver: test them first
+  ;; ($OBJECT is final, so this is a single exact type check)
+  (if (ref.test (ref $OBJECT) (local.get $obj))
+    (then
+      (local.set $obj_ref (ref.cast (ref $OBJECT) (local.get $obj)))
+      ;; Search instance attributes first
+      (call $attr_table_find (struct.get $OBJECT $attrs (local.get $obj_ref)) (local.get $name))
+      (if (param (ref null eq)) (then (return)) (else (drop)))
+      ;; Not found in instance attrs, try class methods
+      ;; Check if result is a PROPERTY - if so, call its getter with self
+      (return_call $maybe_call_property_getter
+        (local.get $obj)
+        (local.get $name)
+        (call $class_lookup_method
+          (struct.get $OBJECT $class (local.get $obj_ref))
+          (local.get $name)))
+    )
+  )
+
+  ;; Any remaining instance is slotted (OBJECT was handled above)
+  ;; Slotted instances use struct fields instead of attribute dict
+  (if (ref.test (ref $INSTANCE_BASE) (local.get $obj))
+    (then
+      ;; Call generated dispatch function for slotted attribute access
+      (return_call $slotted_dispatch_getattr (local.get $obj) (local.get $name))
+    )
+  )
 
   ;; Check if obj is null - return null (handles super() on class with no parent)
   (if (ref.is_null (local.get $obj))
@@ -312,7 +594,7 @@ OBJECTS_CODE = """
       ;; Check for __cause__ attribute
       (if (call $strings_equal
             (ref.cast (ref $STRING) (local.get $name))
-            (call $make_string_cause))
+            (global.get $str___cause__))
         (then
           (return (struct.get $EXCEPTION $cause (ref.cast (ref $EXCEPTION) (local.get $obj))))
         )
@@ -320,7 +602,7 @@ OBJECTS_CODE = """
       ;; Check for args attribute (message wrapped in a tuple)
       (if (call $strings_equal
             (ref.cast (ref $STRING) (local.get $name))
-            (call $make_string_args))
+            (global.get $str_args))
         (then
           ;; Return message wrapped in a single-element tuple to match Python's e.args
           (return (call $make_tuple_1 (struct.get $EXCEPTION $message (ref.cast (ref $EXCEPTION) (local.get $obj)))))
@@ -341,130 +623,354 @@ OBJECTS_CODE = """
     )
   )
 
-  ;; Check if obj is a slotted instance (INSTANCE_BASE but not OBJECT)
-  ;; Slotted instances use struct fields instead of attribute dict
+  ;; No attributes on other values
+  (ref.null eq)
+)
+
+
+;; object_getattr_ic: $object_getattr with a per-call-site inline cache
+;; For instances, the class-side lookup (MRO walk) is cached for the last
+;; class seen at the site; any class attribute assignment invalidates it.
+;; The instance table is probed with the name hash stored in the cache.
+(func $object_getattr_ic (param $obj (ref null eq)) (param $name (ref null eq)) (param $ic (ref $ATTR_IC)) (result (ref null eq))
+  (local $obj_ref (ref $OBJECT))
+  (local $class (ref $CLASS))
+  (local $value (ref null eq))
+
+  ;; Only plain instances are cached; slotted instances go straight to their
+  ;; generated dispatch, everything else takes the generic path
+  (if (i32.eqz (ref.test (ref $OBJECT) (local.get $obj)))
+    (then
+      (if (ref.test (ref $INSTANCE_BASE) (local.get $obj))
+        (then (return_call $slotted_dispatch_getattr (local.get $obj) (local.get $name)))
+      )
+      (return_call $object_getattr (local.get $obj) (local.get $name))
+    )
+  )
+  (local.set $obj_ref (ref.cast (ref $OBJECT) (local.get $obj)))
+
+  ;; Instance attributes shadow class attributes
+  (call $attr_table_find_hashed
+    (struct.get $OBJECT $attrs (local.get $obj_ref))
+    (local.get $name)
+    (struct.get $ATTR_IC $hash (local.get $ic)))
+  (if (param (ref null eq)) (then (return)) (else (drop)))
+
+  (local.set $class (struct.get $OBJECT $class (local.get $obj_ref)))
   (if (i32.and
-        (ref.test (ref $INSTANCE_BASE) (local.get $obj))
-        (i32.eqz (ref.test (ref $OBJECT) (local.get $obj))))
+        (ref.eq (struct.get $ATTR_IC $class (local.get $ic)) (local.get $class))
+        (i32.eq (struct.get $ATTR_IC $epoch (local.get $ic)) (global.get $class_epoch)))
     (then
-      ;; Call generated dispatch function for slotted attribute access
-      (return (call $slotted_dispatch_getattr (local.get $obj) (local.get $name)))
+      (local.set $value (struct.get $ATTR_IC $value (local.get $ic)))
+    )
+    (else
+      (local.set $value (call $class_lookup_method (local.get $class) (local.get $name)))
+      (struct.set $ATTR_IC $class (local.get $ic) (local.get $class))
+      (struct.set $ATTR_IC $epoch (local.get $ic) (global.get $class_epoch))
+      (struct.set $ATTR_IC $value (local.get $ic) (local.get $value))
     )
   )
+  (return_call $maybe_call_property_getter (local.get $obj) (local.get $name) (local.get $value))
+)
 
-  ;; Get attributes dict from object (instance)
-  (local.set $attrs (struct.get $OBJECT $attrs (ref.cast (ref $OBJECT) (local.get $obj))))
 
-  ;; Search for attribute by name (like dict_get)
-  (block $not_found
-    (loop $search
-      (br_if $not_found (ref.is_null (local.get $attrs)))
-      (local.set $pair (ref.cast (ref $PAIR) (local.get $attrs)))
-      (local.set $kv (ref.cast (ref $PAIR) (struct.get $PAIR 0 (local.get $pair))))
+;; class_getattr_ic: $object_getattr_ic for sites whose receiver is expected
+;; to be a class (class names, cls in classmethods). Tests $CLASS first and
+;; caches the MRO lookup in the same $ATTR_IC entry format (class, epoch, value);
+;; any other receiver falls back to $object_getattr_ic.
+(func $class_getattr_ic (param $obj (ref null eq)) (param $name (ref null eq)) (param $ic (ref $ATTR_IC)) (result (ref null eq))
+  (local $class (ref $CLASS))
+  (local $value (ref null eq))
 
-      ;; Compare key (first element of kv pair)
-      (if (call $strings_equal
-            (ref.cast (ref $STRING) (struct.get $PAIR 0 (local.get $kv)))
-            (ref.cast (ref $STRING) (local.get $name)))
+  (if (i32.eqz (ref.test (ref $CLASS) (local.get $obj)))
+    (then (return_call $object_getattr_ic (local.get $obj) (local.get $name) (local.get $ic)))
+  )
+  (local.set $class (ref.cast (ref $CLASS) (local.get $obj)))
+
+  (if (i32.and
+        (ref.eq (struct.get $ATTR_IC $class (local.get $ic)) (local.get $class))
+        (i32.eq (struct.get $ATTR_IC $epoch (local.get $ic)) (global.get $class_epoch)))
+    (then (return (struct.get $ATTR_IC $value (local.get $ic))))
+  )
+  (local.set $value (call $class_lookup_method (local.get $class) (local.get $name)))
+  (struct.set $ATTR_IC $class (local.get $ic) (local.get $class))
+  (struct.set $ATTR_IC $epoch (local.get $ic) (global.get $class_epoch))
+  (struct.set $ATTR_IC $value (local.get $ic) (local.get $value))
+  (local.get $value)
+)
+
+
+;; call_method_ic: obj.name(*args) through the call site's inline cache
+;; Besides the class-side lookup, the cache records how the method is invoked
+;; (kind) and the unwrapped closure, so a hit on a plain instance calls the
+;; closure directly instead of going through the property check and the
+;; wrapper type tests in $call_method_dispatch. Sites that see several
+;; classes keep a few older entries (see $call_ic_miss).
+(func $call_method_ic (param $obj (ref null eq)) (param $name (ref null eq)) (param $args (ref null eq)) (param $ic (ref $ATTR_IC)) (result (ref null eq))
+  (local $obj_ref (ref $OBJECT))
+  (local $class (ref $CLASS))
+  (local $method (ref null eq))
+  (local $call_args (ref null eq))
+  (local $super (ref null $SUPER))
+
+  (if (i32.eqz (ref.test (ref $OBJECT) (local.get $obj)))
+    (then
+      ;; A super() proxy is unwrapped once, here: the method comes from the
+      ;; proxy's class and is dispatched on the real self
+      (if (ref.test (ref $SUPER) (local.get $obj))
         (then
-          ;; Found - return value (second element of kv pair)
-          (return (struct.get $PAIR 1 (local.get $kv)))
+          (local.set $super (ref.cast (ref $SUPER) (local.get $obj)))
+          (return_call $call_method_dispatch
+            (struct.get $SUPER $self (local.get $super))
+            (call $class_lookup_method (struct.get $SUPER $class (local.get $super)) (local.get $name))
+            (local.get $args))
         )
       )
+      (return_call $call_method_dispatch
+        (local.get $obj)
+        (call $object_getattr_ic (local.get $obj) (local.get $name) (local.get $ic))
+        (local.get $args))
+    )
+  )
+  (local.set $obj_ref (ref.cast (ref $OBJECT) (local.get $obj)))
 
-      ;; Move to next
-      (local.set $attrs (struct.get $PAIR 1 (local.get $pair)))
-      (br $search)
+  ;; Instance attributes shadow class attributes
+  (call $attr_table_find_hashed
+    (struct.get $OBJECT $attrs (local.get $obj_ref))
+    (local.get $name)
+    (struct.get $ATTR_IC $hash (local.get $ic)))
+  (if (param (ref null eq))
+    (then
+      (local.set $method)
+      (return_call $call_method_dispatch (local.get $obj) (local.get $method) (local.get $args))
     )
+    (else (drop))
   )
 
-  ;; Not found in instance attrs, try class methods
-  ;; Check if result is a PROPERTY - if so, call its getter with self
-  (call $maybe_call_property_getter
-    (local.get $obj)
-    (call $class_lookup_method
-      (struct.get $OBJECT $class (ref.cast (ref $OBJECT) (local.get $obj)))
-      (local.get $name)
+  (local.set $class (struct.get $OBJECT $class (local.get $obj_ref)))
+  (if (i32.eqz (i32.and
+        (ref.eq (struct.get $ATTR_IC $class (local.get $ic)) (local.get $class))
+        (i32.eq (struct.get $ATTR_IC $epoch (local.get $ic)) (global.get $class_epoch))))
+    (then (call $call_ic_miss (local.get $ic) (local.get $class) (local.get $name)))
+  )
+
+  ;; One br_table on the cached kind; kinds 1-4 only differ in the argument
+  ;; chain and share one call
+  (block $call
+    (block $generic
+      (block $classmethod
+        (block $staticmethod
+          (block $plain
+            (block $shared
+              (br_table $generic $plain $staticmethod $classmethod $shared $generic
+                (struct.get $ATTR_IC $kind (local.get $ic)))
+            )
+            ;; The callee copies its params out before running anything else,
+            ;; so one head cell serves every such call
+            (struct.set $PAIR 0 (global.get $scratch_method_args) (local.get $obj))
+            (struct.set $PAIR 1 (global.get $scratch_method_args) (local.get $args))
+            (local.set $call_args (global.get $scratch_method_args))
+            (br $call)
+          )
+          (local.set $call_args (struct.new $PAIR (local.get $obj) (local.get $args)))
+          (br $call)
+        )
+        (local.set $call_args (local.get $args))
+        (br $call)
+      )
+      (local.set $call_args (struct.new $PAIR (local.get $class) (local.get $args)))
+      (br $call)
     )
+
+    ;; Properties and other class attributes take the generic path
+    (return_call $call_method_dispatch
+      (local.get $obj)
+      (call $maybe_call_property_getter
+        (local.get $obj) (local.get $name) (struct.get $ATTR_IC $value (local.get $ic)))
+      (local.get $args))
   )
+  ;; The cached function reference skips the table lookup and signature check
+  (return_call_ref $FUNC
+    (local.get $call_args)
+    (struct.get $CLOSURE 0 (struct.get $ATTR_IC $closure (local.get $ic)))
+    (struct.get $ATTR_IC $func (local.get $ic)))
 )
 
 
-;; object_setattr: set attribute value on object or class
-;; Returns the object (for chaining)
-(func $object_setattr (param $obj (ref null eq)) (param $name (ref null eq)) (param $value (ref null eq)) (result (ref null eq))
-  (local $attrs (ref null eq))
-  (local $pair (ref null $PAIR))
-  (local $kv (ref null $PAIR))
-  (local $obj_ref (ref $OBJECT))
-  (local $class_ref (ref $CLASS))
+;; call_ic_miss: make the primary entry of a method call site cache $class
+;; The older entries are probed first and a match is swapped to the front.
+;; Otherwise the primary entry is demoted to the head of the chain (reusing
+;; the oldest entry once the site holds 4) and refilled from the class.
+(func $call_ic_miss (param $ic (ref $ATTR_IC)) (param $class (ref $CLASS)) (param $name (ref null eq))
+  (local $entry (ref null $ATTR_IC))
+  (local $last (ref $ATTR_IC))
+  (local $before_last (ref $ATTR_IC))
+  (local $count i32)
+  (local $method (ref null eq))
 
-  ;; Check if obj is null
-  (if (ref.is_null (local.get $obj))
-    (then (call $throw_attribute_error (ref.null eq)))
+  (local.set $last (local.get $ic))
+  (local.set $before_last (local.get $ic))
+  (local.set $entry (struct.get $ATTR_IC $next (local.get $ic)))
+  (block $missed
+    (loop $probe
+      (br_if $missed (ref.is_null (local.get $entry)))
+      (if (i32.and
+            (ref.eq (struct.get $ATTR_IC $class (local.get $entry)) (local.get $class))
+            (i32.eq (struct.get $ATTR_IC $epoch (local.get $entry)) (global.get $class_epoch)))
+        (then
+          (call $attr_ic_swap (local.get $ic) (ref.as_non_null (local.get $entry)))
+          (return)
+        )
+      )
+      (local.set $count (i32.add (local.get $count) (i32.const 1)))
+      (local.set $before_last (local.get $last))
+      (local.set $last (ref.as_non_null (local.get $entry)))
+      (local.set $entry (struct.get $ATTR_IC $next (local.get $last)))
+      (br $probe)
+    )
   )
 
-  ;; Check if obj is i31 (JS handle) - delegate to JS property setter
-  (if (ref.test (ref i31) (local.get $obj))
+  ;; Demote the primary contents, unless the site has never been filled
+  (if (i32.eqz (ref.is_null (struct.get $ATTR_IC $class (local.get $ic))))
     (then
-      (return (call $js_set_property (local.get $obj) (local.get $name) (local.get $value)))
+      (if (i32.lt_u (local.get $count) (i32.const 3))
+        (then
+          (local.set $entry (struct.new $ATTR_IC
+            (ref.null $CLASS) (i32.const 0) (ref.null eq) (i32.const 0) (ref.null $CLOSURE)
+            (ref.null $FUNC) (ref.null $ATTR_IC) (struct.get $ATTR_IC $hash (local.get $ic))))
+        )
+        (else
+          ;; Evict the oldest entry
+          (struct.set $ATTR_IC $next (local.get $before_last) (ref.null $ATTR_IC))
+          (local.set $entry (local.get $last))
+        )
+      )
+      (call $attr_ic_swap (local.get $ic) (ref.as_non_null (local.get $entry)))
+      (struct.set $ATTR_IC $next (ref.as_non_null (local.get $entry)) (struct.get $ATTR_IC $next (local.get $ic)))
+      (struct.set $ATTR_IC $next (local.get $ic) (local.get $entry))
     )
   )
 
-  ;; Check if obj is SUPER - cannot set attributes on super()
-  (if (ref.test (ref $SUPER) (local.get $obj))
-    (then (call $throw_attribute_error (ref.null eq)))
+  (local.set $method (call $class_lookup_method (local.get $class) (local.get $name)))
+  (struct.set $ATTR_IC $class (local.get $ic) (local.get $class))
+  (struct.set $ATTR_IC $epoch (local.get $ic) (global.get $class_epoch))
+  (struct.set $ATTR_IC $value (local.get $ic) (local.get $method))
+  (call $attr_ic_resolve_call (local.get $ic) (local.get $method))
+)
+
+
+;; attr_ic_swap: exchange the cached contents (not the links) of two entries
+(func $attr_ic_swap (param $a (ref $ATTR_IC)) (param $b (ref $ATTR_IC))
+  (local $class (ref null $CLASS))
+  (local $epoch i32)
+  (local $value (ref null eq))
+  (local $kind i32)
+  (local $closure (ref null $CLOSURE))
+  (local $func (ref null $FUNC))
+
+  (local.set $class (struct.get $ATTR_IC $class (local.get $a)))
+  (local.set $epoch (struct.get $ATTR_IC $epoch (local.get $a)))
+  (local.set $value (struct.get $ATTR_IC $value (local.get $a)))
+  (local.set $kind (struct.get $ATTR_IC $kind (local.get $a)))
+  (local.set $closure (struct.get $ATTR_IC $closure (local.get $a)))
+  (local.set $func (struct.get $ATTR_IC $func (local.get $a)))
+  (struct.set $ATTR_IC $class (local.get $a) (struct.get $ATTR_IC $class (local.get $b)))
+  (struct.set $ATTR_IC $epoch (local.get $a) (struct.get $ATTR_IC $epoch (local.get $b)))
+  (struct.set $ATTR_IC $value (local.get $a) (struct.get $ATTR_IC $value (local.get $b)))
+  (struct.set $ATTR_IC $kind (local.get $a) (struct.get $ATTR_IC $kind (local.get $b)))
+  (struct.set $ATTR_IC $closure (local.get $a) (struct.get $ATTR_IC $closure (local.get $b)))
+  (struct.set $ATTR_IC $func (local.get $a) (struct.get $ATTR_IC $func (local.get $b)))
+  (struct.set $ATTR_IC $class (local.get $b) (local.get $class))
+  (struct.set $ATTR_IC $epoch (local.get $b) (local.get $epoch))
+  (struct.set $ATTR_IC $value (local.get $b) (local.get $value))
+  (struct.set $ATTR_IC $kind (local.get $b) (local.get $kind))
+  (struct.set $ATTR_IC $closure (local.get $b) (local.get $closure))
+  (struct.set $ATTR_IC $func (local.get $b) (local.get $func))
+)
+
+
+;; attr_ic_resolve_call: record how a call site invokes a class attribute
+(func $attr_ic_resolve_call (param $ic (ref $ATTR_IC)) (param $method (ref null eq))
+  (local $wrapper (ref $METHOD_WRAPPER))
+  (local $closure (ref $CLOSURE))
+  (local $idx i32)
+
+  (if (ref.test (ref $CLOSURE) (local.get $method))
+    (then
+      (local.set $closure (ref.cast (ref $CLOSURE) (local.get $method)))
+      (local.set $idx (struct.get $CLOSURE 1 (local.get $closure)))
+      ;; Methods done with their args after the prologue get kind 4
+      (struct.set $ATTR_IC $kind (local.get $ic)
+        (select (i32.const 4) (i32.const 1)
+          (i32.and
+            (i32.shr_u
+              (array.get $ARRAY_I32 (global.get $shared_args_methods)
+                (i32.shr_u (local.get $idx) (i32.const 5)))
+              (i32.and (local.get $idx) (i32.const 31)))
+            (i32.const 1))))
+      (struct.set $ATTR_IC $closure (local.get $ic) (local.get $closure))
+      (struct.set $ATTR_IC $func (local.get $ic)
+        (ref.cast (ref $FUNC) (table.get (local.get $idx))))
+      (return)
+    )
   )
+  (if (ref.test (ref $METHOD_WRAPPER) (local.get $method))
+    (then
+      (local.set $wrapper (ref.cast (ref $METHOD_WRAPPER) (local.get $method)))
+      (struct.set $ATTR_IC $kind (local.get $ic) (struct.get $METHOD_WRAPPER $kind (local.get $wrapper)))
+      (local.set $closure (struct.get $METHOD_WRAPPER $closure (local.get $wrapper)))
+      (struct.set $ATTR_IC $closure (local.get $ic) (local.get $closure))
+      (struct.set $ATTR_IC $func (local.get $ic)
+        (ref.cast (ref $FUNC) (table.get (struct.get $CLOSURE 1 (local.get $closure)))))
+      (return)
+    )
+  )
+  (struct.set $ATTR_IC $kind (local.get $ic) (i32.const 0))
+  (struct.set $ATTR_IC $closure (local.get $ic) (ref.null $CLOSURE))
+  (struct.set $ATTR_IC $func (local.get $ic) (ref.null $FUNC))
+)
 
-  ;; Check if obj is a CLASS - set class attribute
-  (if (ref.test (ref $CLASS) (local.get $obj))
+
+;; object_setattr: set attribute value on object or class
+;; Returns the object (for chaining)
+(func $object_setattr (param $obj (ref null eq)) (param $name (ref null eq)) (param $value (ref null eq)) (result (ref null eq))
+  (local $attrs (ref null $ATTR_TABLE))
+  (local $obj_ref (ref $OBJECT))
+
+  ;; Plain instances are by far the most common receiver: only the other
+  ;; kinds pay for the type ladder below ($OBJECT is final, one exact check)
+  (if (i32.eqz (ref.test (ref $OBJECT) (local.get $obj)))
     (then
-      (local.set $class_ref (ref.cast (ref $CLASS) (local.get $obj)))
-      (local.set $attrs (struct.get $CLASS $methods (local.get $class_ref)))
-
-      ;; Search for existing class attribute
-      (block $class_not_found
-        (block $class_found
-          (loop $class_search
-            (br_if $class_not_found (ref.is_null (local.get $attrs)))
-            (local.set $pair (ref.cast (ref $PAIR) (local.get $attrs)))
-            (local.set $kv (ref.cast (ref $PAIR) (struct.get $PAIR 0 (local.get $pair))))
-
-            (if (call $strings_equal
-                  (ref.cast (ref $STRING) (struct.get $PAIR 0 (local.get $kv)))
-                  (ref.cast (ref $STRING) (local.get $name)))
-              (then
-                ;; Found - update value in place
-                (struct.set $PAIR 1 (local.get $kv) (local.get $value))
-                (br $class_found)
-              )
-            )
+      ;; Any remaining instance is slotted: struct fields instead of a table
+      (if (ref.test (ref $INSTANCE_BASE) (local.get $obj))
+        (then
+          ;; Call generated dispatch function for slotted attribute setting
+          (return_call $slotted_dispatch_setattr (local.get $obj) (local.get $name) (local.get $value))
+        )
+      )
 
-            (local.set $attrs (struct.get $PAIR 1 (local.get $pair)))
-            (br $class_search)
-          )
+      ;; Check if obj is i31 (JS handle) - delegate to JS property setter
+      (if (ref.test (ref i31) (local.get $obj))
+        (then
+          (return_call $js_set_property (local.get $obj) (local.get $name) (local.get $value))
         )
-        ;; Found and updated
-        (return (local.get $obj))
       )
 
-      ;; Not found - add new class attribute at front
-      (local.set $kv (struct.new $PAIR (local.get $name) (local.get $value)))
-      (struct.set $CLASS $methods (local.get $class_ref)
-        (struct.new $PAIR (local.get $kv) (struct.get $CLASS $methods (local.get $class_ref)))
+      ;; Check if obj is a CLASS - set class attribute
+      (if (ref.test (ref $CLASS) (local.get $obj))
+        (then
+          ;; Class attributes are changing: drop all cached class lookups
+          (global.set $class_epoch (i32.add (global.get $class_epoch) (i32.const 1)))
+          (call $attr_table_set
+            (struct.get $CLASS $methods (ref.cast (ref $CLASS) (local.get $obj)))
+            (local.get $name)
+            (local.get $value))
+          (return (local.get $obj))
+        )
       )
-      (return (local.get $obj))
-    )
-  )
 
-  ;; Check if obj is a slotted instance (INSTANCE_BASE but not OBJECT)
-  ;; Slotted instances use struct fields instead of attribute dict
-  (if (i32.and
-        (ref.test (ref $INSTANCE_BASE) (local.get $obj))
-        (i32.eqz (ref.test (ref $OBJECT) (local.get $obj))))
-    (then
-      ;; Call generated dispatch function for slotted attribute setting
-      (return (call $slotted_dispatch_setattr (local.get $obj) (local.get $name) (local.get $value)))
+      ;; null, SUPER and other values cannot take attributes
+      (call $throw_attribute_error (ref.null eq))
     )
   )
 
@@ -487,42 +993,15 @@ OBJECTS_CODE = """
     )
   )
 
+  ;; Set instance attribute, allocating the table on first assignment
   (local.set $attrs (struct.get $OBJECT $attrs (local.get $obj_ref)))
-
-  ;; Search for existing attribute
-  (block $not_found
-    (block $found
-      (loop $search
-        (br_if $not_found (ref.is_null (local.get $attrs)))
-        (local.set $pair (ref.cast (ref $PAIR) (local.get $attrs)))
-        (local.set $kv (ref.cast (ref $PAIR) (struct.get $PAIR 0 (local.get $pair))))
-
-        ;; Compare key
-        (if (call $strings_equal
-              (ref.cast (ref $STRING) (struct.get $PAIR 0 (local.get $kv)))
-              (ref.cast (ref $STRING) (local.get $name)))
-          (then
-            ;; Found - update value in place
-            (struct.set $PAIR 1 (local.get $kv) (local.get $value))
-            (br $found)
-          )
-        )
-
-        (local.set $attrs (struct.get $PAIR 1 (local.get $pair)))
-        (br $search)
-      )
+  (if (ref.is_null (local.get $attrs))
+    (then
+      (local.set $attrs (call $attr_table_new (i32.const 8)))
+      (struct.set $OBJECT $attrs (local.get $obj_ref) (local.get $attrs))
     )
-    ;; Found and updated, return object
-    (return (local.get $obj))
-  )
-
-  ;; Not found - add new attribute at front
-  ;; Create new key-value pair
-  (local.set $kv (struct.new $PAIR (local.get $name) (local.get $value)))
-  ;; Prepend to attrs list
-  (struct.set $OBJECT $attrs (local.get $obj_ref)
-    (struct.new $PAIR (local.get $kv) (struct.get $OBJECT $attrs (local.get $obj_ref)))
   )
+  (call $attr_table_set (ref.as_non_null (local.get $attrs)) (local.get $name) (local.get $value))
 
   (local.get $obj)
 )
@@ -532,26 +1011,21 @@ OBJECTS_CODE = """
 ;; Returns the object
 (func $object_delattr (param $obj (ref null eq)) (param $name (ref null eq)) (result (ref null eq))
   (local $obj_ref (ref $OBJECT))
-  (local $attrs (ref null eq))
-  (local $prev (ref null $PAIR))
-  (local $pair (ref null $PAIR))
-  (local $kv (ref null $PAIR))
+  (local $attrs (ref null $ATTR_TABLE))
+  (local $idx i32)
   (local $prop_attr (ref null eq))
   (local $prop (ref $PROPERTY))
   (local $deleter (ref null $CLOSURE))
   (local $args (ref null eq))
 
-  ;; Check if obj is null or SUPER - cannot delete attributes on super()
-  (if (ref.is_null (local.get $obj))
-    (then (call $throw_attribute_error (ref.null eq)))
-  )
-  (if (ref.test (ref $SUPER) (local.get $obj))
-    (then (call $throw_attribute_error (ref.null eq)))
-  )
-
-  ;; Only handle OBJECT
+  ;; Only handle OBJECT; null and SUPER (super()) cannot delete attributes
   (if (i32.eqz (ref.test (ref $OBJECT) (local.get $obj)))
-    (then (return (local.get $obj)))
+    (then
+      (if (i32.or (ref.is_null (local.get $obj)) (ref.test (ref $SUPER) (local.get $obj)))
+        (then (call $throw_attribute_error (ref.null eq)))
+      )
+      (return (local.get $obj))
+    )
   )
 
   (local.set $obj_ref (ref.cast (ref $OBJECT) (local.get $obj)))
@@ -572,11 +1046,19 @@ OBJECTS_CODE = """
 
       (if (i32.eqz (ref.is_null (local.get $deleter)))
         (then
-          ;; Build args: PAIR(self, null)
-          (local.set $args (struct.new $PAIR
-            (local.get $obj)
-            (ref.null eq)
-          ))
+          ;; Build args: PAIR(self, null), reusing the scratch chain if allowed
+          (if (i32.and (struct.get $PROPERTY $flags (local.get $prop)) (i32.const 4))
+            (then
+              (struct.set $PAIR 0 (global.get $scratch_args1) (local.get $obj))
+              (local.set $args (global.get $scratch_args1))
+            )
+            (else
+              (local.set $args (struct.new $PAIR
+                (local.get $obj)
+                (ref.null eq)
+              ))
+            )
+          )
           ;; Call the deleter
           (drop (call_indirect (type $FUNC)
             (local.get $args)
@@ -591,27 +1073,16 @@ OBJECTS_CODE = """
 
   ;; Not a property - remove from instance attrs
   ;; Note: For simplicity, we just set the value to null rather than removing
-  ;; the entry from the chain (proper deletion would require more complex list surgery)
+  ;; the key (open addressing would need tombstones to keep probes intact)
   (local.set $attrs (struct.get $OBJECT $attrs (local.get $obj_ref)))
-
-  (block $not_found
-    (loop $search
-      (br_if $not_found (ref.is_null (local.get $attrs)))
-      (local.set $pair (ref.cast (ref $PAIR) (local.get $attrs)))
-      (local.set $kv (ref.cast (ref $PAIR) (struct.get $PAIR 0 (local.get $pair))))
-
-      (if (call $strings_equal
-            (ref.cast (ref $STRING) (struct.get $PAIR 0 (local.get $kv)))
-            (ref.cast (ref $STRING) (local.get $name)))
-        (then
-          ;; Found - set value to null (marks as deleted)
-          (struct.set $PAIR 1 (local.get $kv) (ref.null eq))
-          (return (local.get $obj))
-        )
-      )
-
-      (local.set $attrs (struct.get $PAIR 1 (local.get $pair)))
-      (br $search)
+  (local.set $idx (call $attr_table_index (local.get $attrs) (local.get $name)))
+  (if (i32.ge_s (local.get $idx) (i32.const 0))
+    (then
+      ;; Found - set value to null (marks as deleted)
+      (array.set $ARRAY_ANY
+        (struct.get $ATTR_TABLE $vals (ref.as_non_null (local.get $attrs)))
+        (local.get $idx)
+        (ref.null eq))
     )
   )
 
@@ -619,53 +1090,6 @@ OBJECTS_CODE = """
 )
 
 
-;; class_getmethod: get method from class, bound to self
-;; Returns a closure with self captured, or null if not found
-(func $class_getmethod (param $class (ref $CLASS)) (param $name (ref null eq)) (param $self (ref null eq)) (result (ref null eq))
-  (local $methods (ref null eq))
-  (local $pair (ref null $PAIR))
-  (local $kv (ref null $PAIR))
-  (local $method (ref null eq))
-
-  (local.set $methods (struct.get $CLASS $methods (local.get $class)))
-
-  ;; Search for method by name
-  (block $not_found
-    (loop $search
-      (br_if $not_found (ref.is_null (local.get $methods)))
-      (local.set $pair (ref.cast (ref $PAIR) (local.get $methods)))
-      (local.set $kv (ref.cast (ref $PAIR) (struct.get $PAIR 0 (local.get $pair))))
-
-      ;; Compare method name
-      (if (call $strings_equal
-            (ref.cast (ref $STRING) (struct.get $PAIR 0 (local.get $kv)))
-            (ref.cast (ref $STRING) (local.get $name)))
-        (then
-          ;; Found method - create bound method (closure with self in env)
-          (local.set $method (struct.get $PAIR 1 (local.get $kv)))
-          ;; Return a new closure with self bound in environment
-          (return
-            (struct.new $CLOSURE
-              (struct.new $ENV
-                (struct.get $CLOSURE 0 (ref.cast (ref $CLOSURE) (local.get $method)))
-                (struct.new $PAIR (local.get $self) (ref.null eq))
-              )
-              (struct.get $CLOSURE 1 (ref.cast (ref $CLOSURE) (local.get $method)))
-            )
-          )
-        )
-      )
-
-      (local.set $methods (struct.get $PAIR 1 (local.get $pair)))
-      (br $search)
-    )
-  )
-
-  ;; Not found - return null
-  (ref.null eq)
-)
-
-
 ;; object_call_method: call a method on an object
 ;; This is a helper for obj.method(args) calls
 (func $object_call_method (param $obj (ref null eq)) (param $name (ref null eq)) (param $args (ref null eq)) (param $env (ref null $ENV)) (result (ref null eq))
@@ -689,9 +1113,44 @@ OBJECTS_CODE = """
 )
 
 
+;; object_call_method_fast: call a method found on the object's class
+;; Takes args WITHOUT self: the receiver is prepended with a single PAIR and
+;; the raw closure is called directly, so no bound method is allocated.
+;; Like CPython's implicit dunder calls, instance attributes are not consulted.
+(func $object_call_method_fast (param $obj (ref null eq)) (param $name (ref null eq)) (param $args (ref null eq)) (param $env (ref null $ENV)) (result (ref null eq))
+  (local $method (ref null eq))
+  (local $closure (ref $CLOSURE))
+
+  ;; Non-instances go through the generic attribute lookup
+  (if (i32.eqz (ref.test (ref $OBJECT) (local.get $obj)))
+    (then
+      (return_call $object_call_method
+        (local.get $obj)
+        (local.get $name)
+        (struct.new $PAIR (local.get $obj) (local.get $args))
+        (local.get $env))
+    )
+  )
+
+  (local.set $method (call $class_lookup_method
+    (struct.get $OBJECT $class (ref.cast (ref $OBJECT) (local.get $obj)))
+    (local.get $name)))
+  (if (i32.eqz (ref.test (ref $CLOSURE) (local.get $method)))
+    (then (return (ref.null eq)))  ;; Method not found
+  )
+
+  (local.set $closure (ref.cast (ref $CLOSURE) (local.get $method)))
+  (return_call_indirect (type $FUNC)
+    (struct.new $PAIR (local.get $obj) (local.get $args))
+    (struct.get $CLOSURE 0 (local.get $closure))
+    (struct.get $CLOSURE 1 (local.get $closure))
+  )
+)
+
+
 ;; instantiate_class: create a new instance of a class
-;; Takes the class, init method name, args PAIR chain, env - returns the new object
-(func $instantiate_class (param $class (ref $CLASS)) (param $init_name (ref null eq)) (param $args (ref null eq)) (param $env (ref null $ENV)) (result (ref null eq))
+;; Takes the class, args PAIR chain, env - returns the new object
+(func $instantiate_class (param $class (ref $CLASS)) (param $args (ref null eq)) (param $env (ref null $ENV)) (result (ref null eq))
   (local $obj (ref $OBJECT))
   (local $init_method (ref null eq))
   (local $init_closure (ref $CLOSURE))
@@ -700,14 +1159,11 @@ OBJECTS_CODE = """
   ;; Create new object with empty attrs
   (local.set $obj (struct.new $OBJECT
     (local.get $class)
-    (ref.null eq)  ;; empty attrs
+    (ref.null $ATTR_TABLE)  ;; attrs table allocated on first assignment
   ))
 
-  ;; Look up __init__ method directly from class methods dict
-  (local.set $init_method (call $class_lookup_method
-    (local.get $class)
-    (local.get $init_name)
-  ))
+  ;; Read __init__ from the class's dunder slot (no name lookup)
+  (local.set $init_method (call $class_init_slot (local.get $class)))
 
   ;; If __init__ exists, call it with self prepended to args
   (if (ref.test (ref $CLOSURE) (local.get $init_method))
@@ -735,8 +1191,8 @@ OBJECTS_CODE = """
 ;; call_or_instantiate: call a callable (CLOSURE or CLASS) with args
 ;; If callable is a CLASS, instantiate it and call __init__
 ;; If callable is a CLOSURE, call it directly
-;; Takes: callable, init_name (string "__init__"), args
-(func $call_or_instantiate (param $callable (ref null eq)) (param $init_name (ref null eq)) (param $args (ref null eq)) (param $env (ref null $ENV)) (result (ref null eq))
+;; Takes: callable, args, env
+(func $call_or_instantiate (param $callable (ref null eq)) (param $args (ref null eq)) (param $env (ref null $ENV)) (result (ref null eq))
   (local $closure (ref $CLOSURE))
 
   ;; Check if callable is a CLASS
@@ -746,7 +1202,6 @@ OBJECTS_CODE = """
       ;; Class instantiation
       (call $instantiate_class
         (ref.cast (ref $CLASS) (local.get $callable))
-        (local.get $init_name)
         (local.get $args)
         (local.get $env)
       )
@@ -764,13 +1219,47 @@ OBJECTS_CODE = """
 )
 
 
-;; class_lookup_method: look up method by name, searching inheritance chain
-;; Returns the raw closure/value or null
+;; class_lookup_method: find an attribute on a class or its bases
+;; Classes without a base probe their own table. Subclasses memoize what the
+;; MRO walk found (including misses, stored as null) in $lookups, which is
+;; dropped whenever $class_epoch moves (any class attribute assignment).
 (func $class_lookup_method (param $class (ref $CLASS)) (param $name (ref null eq)) (result (ref null eq))
+  (local $lookups (ref null $ATTR_TABLE))
+  (local $value (ref null eq))
+
+  (if (ref.is_null (struct.get $CLASS $base (local.get $class)))
+    (then
+      ;; A miss yields null, which is what callers expect
+      (call $attr_table_find (struct.get $CLASS $methods (local.get $class)) (local.get $name))
+      (drop)
+      (return)
+    )
+  )
+
+  (local.set $lookups (struct.get $CLASS $lookups (local.get $class)))
+  (if (i32.and
+        (i32.eqz (ref.is_null (local.get $lookups)))
+        (i32.eq (struct.get $CLASS $lookups_epoch (local.get $class)) (global.get $class_epoch)))
+    (then
+      (call $attr_table_find (local.get $lookups) (local.get $name))
+      (if (param (ref null eq)) (then (return)) (else (drop)))
+    )
+    (else
+      (local.set $lookups (call $attr_table_new (i32.const 8)))
+      (struct.set $CLASS $lookups (local.get $class) (local.get $lookups))
+      (struct.set $CLASS $lookups_epoch (local.get $class) (global.get $class_epoch))
+    )
+  )
+
+  (local.set $value (call $class_walk_mro (local.get $class) (local.get $name)))
+  (call $attr_table_set (ref.as_non_null (local.get $lookups)) (local.get $name) (local.get $value))
+  (local.get $value)
+)
+
+
+;; class_walk_mro: search a class and its bases for an attribute (null if none)
+(func $class_walk_mro (param $class (ref $CLASS)) (param $name (ref null eq)) (result (ref null eq))
   (local $current_class (ref null $CLASS))
-  (local $methods (ref null eq))
-  (local $pair (ref null $PAIR))
-  (local $kv (ref null $PAIR))
 
   (local.set $current_class (local.get $class))
 
@@ -779,29 +1268,10 @@ OBJECTS_CODE = """
     (loop $class_loop
       (br_if $not_found_anywhere (ref.is_null (local.get $current_class)))
 
-      ;; Search in current class's methods dict
-      (local.set $methods (struct.get $CLASS $methods (local.get $current_class)))
-
-      (block $not_in_this_class
-        (loop $search
-          (br_if $not_in_this_class (ref.is_null (local.get $methods)))
-          (local.set $pair (ref.cast (ref $PAIR) (local.get $methods)))
-          (local.set $kv (ref.cast (ref $PAIR) (struct.get $PAIR 0 (local.get $pair))))
-
-          ;; Compare method name
-          (if (call $strings_equal
-                (ref.cast (ref $STRING) (struct.get $PAIR 0 (local.get $kv)))
-                (ref.cast (ref $STRING) (local.get $name)))
-            (then
-              ;; Found method - return the raw closure/value
-              (return (struct.get $PAIR 1 (local.get $kv)))
-            )
-          )
-
-          (local.set $methods (struct.get $PAIR 1 (local.get $pair)))
-          (br $search)
-        )
-      )
+      ;; Probe current class's dict
+      ;; Found - return the raw closure/value
+      (call $attr_table_find (struct.get $CLASS $methods (local.get $current_class)) (local.get $name))
+      (if (param (ref null eq)) (then (return)) (else (drop)))
 
       ;; Not found in this class, try base class
       (local.set $current_class (struct.get $CLASS 2 (local.get $current_class)))
@@ -815,8 +1285,9 @@ OBJECTS_CODE = """
 
 
 ;; call_method_dispatch: call a method handling @staticmethod/@classmethod
-;; Takes: object, method (possibly wrapped in STATICMETHOD/CLASSMETHOD), args (without self)
-;; Returns the method call result
+;; Takes: object, method (possibly a $METHOD_WRAPPER), args (without self)
+;; Returns the method call result. Each kind of method only picks its closure
+;; and argument chain; all of them share the single call at the end.
 (func $call_method_dispatch
   (param $obj (ref null eq))
   (param $method (ref null eq))
@@ -824,79 +1295,59 @@ OBJECTS_CODE = """
   (result (ref null eq))
   (local $closure (ref null $CLOSURE))
   (local $call_args (ref null eq))
-  (local $class (ref null $CLASS))
-
-  ;; Check if object is i31 (JS handle) - use JS method call
-  (if (ref.test (ref i31) (local.get $obj))
-    (then
-      ;; method parameter contains the method name as STRING when object is JS handle
-      (return (call $js_call_method (local.get $obj) (local.get $method) (local.get $args)))
+  (local $wrapper (ref $METHOD_WRAPPER))
+
+  (block $call
+    ;; Regular method (the common case) - prepend self to args
+    ;; For JS handles the method is the name STRING, so this never matches them
+    (if (ref.test (ref $CLOSURE) (local.get $method))
+      (then
+        (local.set $closure (ref.cast (ref $CLOSURE) (local.get $method)))
+        ;; super() receivers arrive already unwrapped (see $call_method_ic)
+        (local.set $call_args (struct.new $PAIR (local.get $obj) (local.get $args)))
+        (br $call)
+      )
     )
-  )
 
-  ;; Check if method is null
-  (if (ref.is_null (local.get $method))
-    (then (return (ref.null eq)))
-  )
+    ;; Check if object is i31 (JS handle) - use JS method call
+    (if (ref.test (ref i31) (local.get $obj))
+      (then
+        ;; method parameter contains the method name as STRING when object is JS handle
+        (return (call $js_call_method (local.get $obj) (local.get $method) (local.get $args)))
+      )
+    )
 
-  ;; Check for @staticmethod wrapper - call WITHOUT self
-  (if (ref.test (ref $STATICMETHOD) (local.get $method))
-    (then
-      ;; Unwrap the closure from STATICMETHOD (field 0)
-      (local.set $closure
-        (struct.get $STATICMETHOD 0 (ref.cast (ref $STATICMETHOD) (local.get $method))))
-      ;; Call with args as-is (no self prepended)
-      (return (call_indirect (type $FUNC)
-        (local.get $args)
-        (struct.get $CLOSURE 0 (ref.cast (ref $CLOSURE) (local.get $closure)))
-        (struct.get $CLOSURE 1 (ref.cast (ref $CLOSURE) (local.get $closure)))
-      ))
+    ;; Check if method is null
+    (if (ref.is_null (local.get $method))
+      (then (return (ref.null eq)))
     )
-  )
 
-  ;; Check for @classmethod wrapper - prepend CLASS instead of self
-  (if (ref.test (ref $CLASSMETHOD) (local.get $method))
-    (then
-      ;; Unwrap the closure from CLASSMETHOD (field 1, field 0 is tag)
-      (local.set $closure
-        (struct.get $CLASSMETHOD 1 (ref.cast (ref $CLASSMETHOD) (local.get $method))))
-      ;; Get the class from the object
-      (if (ref.test (ref $OBJECT) (local.get $obj))
-        (then
-          (local.set $class
-            (struct.get $OBJECT $class (ref.cast (ref $OBJECT) (local.get $obj))))
-        )
-        (else
-          ;; obj is already a CLASS
-          (local.set $class (ref.cast (ref $CLASS) (local.get $obj)))
-        )
+    ;; Anything else must be a @staticmethod / @classmethod wrapper; branch
+    ;; on its kind (2 or 3, anything else is treated as a classmethod)
+    (local.set $wrapper (ref.cast (ref $METHOD_WRAPPER) (local.get $method)))
+    (local.set $closure (struct.get $METHOD_WRAPPER $closure (local.get $wrapper)))
+    (block $classmethod
+      (block $staticmethod
+        (br_table $classmethod $classmethod $staticmethod $classmethod
+          (struct.get $METHOD_WRAPPER $kind (local.get $wrapper)))
       )
-      ;; Prepend class to args: PAIR(class, args)
-      (local.set $call_args (struct.new $PAIR
-        (local.get $class)
-        (local.get $args)
-      ))
-      ;; Call with (cls, *args)
-      (return (call_indirect (type $FUNC)
-        (local.get $call_args)
-        (struct.get $CLOSURE 0 (ref.cast (ref $CLOSURE) (local.get $closure)))
-        (struct.get $CLOSURE 1 (ref.cast (ref $CLOSURE) (local.get $closure)))
-      ))
+      ;; @staticmethod - call WITHOUT self
+      (local.set $call_args (local.get $args))
+      (br $call)
     )
-  )
 
-  ;; Regular method - prepend self to args
-  (local.set $closure (ref.cast (ref $CLOSURE) (local.get $method)))
-  ;; Unwrap self from SUPER if needed
-  (local.set $call_args (struct.new $PAIR
-    (call $unwrap_self (local.get $obj))
-    (local.get $args)
-  ))
-  ;; Call with (self, *args)
-  (call_indirect (type $FUNC)
+    ;; @classmethod - prepend CLASS instead of self (obj may already be a CLASS)
+    (local.set $call_args (struct.new $PAIR
+      (if (result (ref null $CLASS)) (ref.test (ref $OBJECT) (local.get $obj))
+        (then (struct.get $OBJECT $class (ref.cast (ref $OBJECT) (local.get $obj))))
+        (else (ref.cast (ref $CLASS) (local.get $obj))))
+      (local.get $args)))
+  )
+  ;; struct.get traps on null itself, so $closure needs no ref.as_non_null
+  (return_call_indirect (type $FUNC)
     (local.get $call_args)
-    (struct.get $CLOSURE 0 (ref.cast (ref $CLOSURE) (local.get $closure)))
-    (struct.get $CLOSURE 1 (ref.cast (ref $CLOSURE) (local.get $closure)))
+    (struct.get $CLOSURE 0 (local.get $closure))
+    (struct.get $CLOSURE 1 (local.get $closure))
   )
 )
 
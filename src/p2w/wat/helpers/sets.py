@@ -4,88 +4,492 @@ from __future__ import annotations
 
 SETS_CODE = """
 
-;; Set method: add(item) - add item if not already present
-(func $set_add (param $set (ref null eq)) (param $item (ref null eq)) (result (ref null eq))
-  (local $current (ref null eq))
-  (local $pair (ref null $PAIR))
+;; =============================================================================
+;; Set Operations (open-addressed hash table)
+;; =============================================================================
+;; Slots live in parallel $hashes/$keys arrays. Lookups follow CPython's
+;; probe sequence: scan up to SET_LINEAR_PROBES (9) consecutive slots, then
+;; jump with i = (5*i + 1 + perturb) & mask, perturb >>= 5 (PERTURB_SHIFT).
+;; The consecutive scan stays within one stretch of the i32 hash array, and
+;; the perturbation mixes in the high hash bits so clustered hashes spread.
+;; A null key is a never-used slot, $set_dummy a deleted one; None elements
+;; are stored as $set_none. The table is kept under 60% fill (live + deleted).
+
+;; Create empty set with the minimum capacity (8 slots)
+(func $set_new (result (ref $SET))
+  (call $set_new_sized (i32.const 8))
+)
+
+
+;; Create empty set; capacity must be a power of two
+(func $set_new_sized (param $capacity i32) (result (ref $SET))
+  (struct.new $SET
+    (array.new_default $ARRAY_I32 (local.get $capacity))
+    (array.new_default $ARRAY_ANY (local.get $capacity))
+    (i32.sub (local.get $capacity) (i32.const 1))
+    (i32.const 0)
+    (i32.const 0)
+  )
+)
+
+
+;; set_find: probe for key (in stored form, see $set_key)
+;; Returns (slot, 1) when found, else (slot to insert at, 0); the insert slot
+;; reuses the first deleted slot seen on the way. Equality is only tried when
+;; the cached slot hash matches
+(func $set_find (param $set (ref $SET)) (param $key (ref null eq)) (param $hash i32) (result i32 i32)
+  (local $hashes (ref $ARRAY_I32))
+  (local $keys (ref $ARRAY_ANY))
+  (local $mask i32)
+  (local $perturb i32)
+  (local $start i32)
+  (local $i i32)
+  (local $end i32)
+  (local $free i32)
+  (local $k (ref null eq))
 
-  ;; Handle null or $EMPTY_LIST - create single element set
-  (if (ref.is_null (local.get $set))
-    (then (return (struct.new $PAIR (local.get $item) (ref.null eq))))
+  (local.set $hashes (struct.get $SET $hashes (local.get $set)))
+  (local.set $keys (struct.get $SET $keys (local.get $set)))
+  (local.set $mask (struct.get $SET $mask (local.get $set)))
+  (local.set $perturb (local.get $hash))
+  (local.set $start (i32.and (local.get $hash) (local.get $mask)))
+  (local.set $free (i32.const -1))
+
+  (loop $probe
+    ;; Linear run of up to 9 more slots, unless it would wrap around
+    (local.set $i (local.get $start))
+    (local.set $end (local.get $start))
+    (if (i32.le_u (i32.add (local.get $start) (i32.const 9)) (local.get $mask))
+      (then (local.set $end (i32.add (local.get $start) (i32.const 9))))
+    )
+    (loop $linear
+      (local.set $k (array.get $ARRAY_ANY (local.get $keys) (local.get $i)))
+      (if (ref.is_null (local.get $k))
+        (then
+          (if (i32.ge_s (local.get $free) (i32.const 0))
+            (then (return (local.get $free) (i32.const 0)))
+          )
+          (return (local.get $i) (i32.const 0))
+        )
+      )
+      (if (ref.eq (local.get $k) (global.get $set_dummy))
+        (then
+          (if (i32.lt_s (local.get $free) (i32.const 0))
+            (then (local.set $free (local.get $i)))
+          )
+        )
+        (else
+          (if (i32.eq (array.get $ARRAY_I32 (local.get $hashes) (local.get $i)) (local.get $hash))
+            (then
+              (if (ref.eq (local.get $k) (local.get $key))
+                (then (return (local.get $i) (i32.const 1)))
+              )
+              ;; Equal hashes on two distinct i31s can't happen (an int is its
+              ;; own hash), so only boxed keys reach the equality call
+              (if (i32.eqz (i32.or
+                    (ref.test (ref $SET_MARKER) (local.get $k))
+                    (ref.test (ref $SET_MARKER) (local.get $key))))
+                (then
+                  (if (call $values_equal_fast (local.get $k) (local.get $key))
+                    (then (return (local.get $i) (i32.const 1)))
+                  )
+                )
+              )
+            )
+          )
+        )
+      )
+      (if (i32.lt_u (local.get $i) (local.get $end))
+        (then
+          (local.set $i (i32.add (local.get $i) (i32.const 1)))
+          (br $linear)
+        )
+      )
+    )
+    (local.set $perturb (i32.shr_u (local.get $perturb) (i32.const 5)))
+    (local.set $start (i32.and
+      (i32.add
+        (i32.add (i32.mul (local.get $start) (i32.const 5)) (i32.const 1))
+        (local.get $perturb))
+      (local.get $mask)))
+    (br $probe)
   )
-  (if (ref.test (ref $EMPTY_LIST) (local.get $set))
-    (then (return (struct.new $PAIR (local.get $item) (ref.null eq))))
+  (unreachable)
+)
+
+
+;; Stored form of an element: None becomes $set_none so null can mark
+;; never-used slots
+(func $set_key (param $item (ref null eq)) (result (ref null eq))
+  (if (ref.is_null (local.get $item))
+    (then (return (global.get $set_none)))
+  )
+  (local.get $item)
+)
+
+
+;; Element from its stored form
+(func $set_unkey (param $key (ref null eq)) (result (ref null eq))
+  (if (ref.eq (local.get $key) (global.get $set_none))
+    (then (return (ref.null eq)))
+  )
+  (local.get $key)
+)
+
+
+;; Rebuild the table with room for $used live elements (4x, minimum 8 slots),
+;; dropping deleted slots. Live keys are already distinct, so they are
+;; reinserted from their cached hashes without rehashing or equality checks.
+(func $set_resize (param $set (ref $SET))
+  (local $old_hashes (ref $ARRAY_I32))
+  (local $old_keys (ref $ARRAY_ANY))
+  (local $old_cap i32)
+  (local $capacity i32)
+  (local $i i32)
+  (local $k (ref null eq))
+  (local $hash i32)
+
+  (local.set $old_hashes (struct.get $SET $hashes (local.get $set)))
+  (local.set $old_keys (struct.get $SET $keys (local.get $set)))
+  (local.set $old_cap (array.len (local.get $old_keys)))
+
+  (local.set $capacity (i32.const 8))
+  (block $sized
+    (loop $grow
+      (br_if $sized (i32.gt_u (local.get $capacity)
+        (i32.shl (struct.get $SET $used (local.get $set)) (i32.const 2))))
+      (local.set $capacity (i32.shl (local.get $capacity) (i32.const 1)))
+      (br $grow)
+    )
+  )
+
+  (struct.set $SET $hashes (local.get $set) (array.new_default $ARRAY_I32 (local.get $capacity)))
+  (struct.set $SET $keys (local.get $set) (array.new_default $ARRAY_ANY (local.get $capacity)))
+  (struct.set $SET $mask (local.get $set) (i32.sub (local.get $capacity) (i32.const 1)))
+  (struct.set $SET $fill (local.get $set) (struct.get $SET $used (local.get $set)))
+
+  (block $done
+    (loop $loop
+      (br_if $done (i32.ge_u (local.get $i) (local.get $old_cap)))
+      (local.set $k (array.get $ARRAY_ANY (local.get $old_keys) (local.get $i)))
+      (if (i32.eqz (i32.or
+            (ref.is_null (local.get $k))
+            (ref.eq (local.get $k) (global.get $set_dummy))))
+        (then
+          (local.set $hash (array.get $ARRAY_I32 (local.get $old_hashes) (local.get $i)))
+          (call $set_place (local.get $set) (local.get $k) (local.get $hash))
+        )
+      )
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (br $loop)
+    )
   )
+)
+
 
-  ;; Check if item already exists
-  (local.set $current (local.get $set))
-  (block $not_found
-    (block $found
-      (loop $loop
-        (br_if $not_found (ref.is_null (local.get $current)))
-        ;; Check if it's a PAIR before casting
-        (if (i32.eqz (ref.test (ref $PAIR) (local.get $current)))
-          (then (br $not_found))
+;; Put a key known to be absent into the first never-used slot on its probe
+;; sequence (table has no deleted slots right after a resize). Walks the same
+;; linear-run-then-perturb sequence as $set_find, minus the key comparisons.
+(func $set_place (param $set (ref $SET)) (param $key (ref null eq)) (param $hash i32)
+  (local $keys (ref $ARRAY_ANY))
+  (local $mask i32)
+  (local $perturb i32)
+  (local $start i32)
+  (local $i i32)
+  (local $end i32)
+
+  (local.set $keys (struct.get $SET $keys (local.get $set)))
+  (local.set $mask (struct.get $SET $mask (local.get $set)))
+  (local.set $perturb (local.get $hash))
+  (local.set $start (i32.and (local.get $hash) (local.get $mask)))
+  (block $found
+    (loop $probe
+      (local.set $i (local.get $start))
+      (local.set $end (local.get $start))
+      (if (i32.le_u (i32.add (local.get $start) (i32.const 9)) (local.get $mask))
+        (then (local.set $end (i32.add (local.get $start) (i32.const 9))))
+      )
+      (loop $linear
+        (br_if $found (ref.is_null (array.get $ARRAY_ANY (local.get $keys) (local.get $i))))
+        (if (i32.lt_u (local.get $i) (local.get $end))
+          (then
+            (local.set $i (i32.add (local.get $i) (i32.const 1)))
+            (br $linear)
+          )
         )
-        (local.set $pair (ref.cast (ref $PAIR) (local.get $current)))
-        (if (call $value_equals (struct.get $PAIR 0 (local.get $pair)) (local.get $item))
-          (then (br $found))
+      )
+      (local.set $perturb (i32.shr_u (local.get $perturb) (i32.const 5)))
+      (local.set $start (i32.and
+        (i32.add
+          (i32.add (i32.mul (local.get $start) (i32.const 5)) (i32.const 1))
+          (local.get $perturb))
+        (local.get $mask)))
+      (br $probe)
+    )
+  )
+  (array.set $ARRAY_ANY (local.get $keys) (local.get $i) (local.get $key))
+  (array.set $ARRAY_I32 (struct.get $SET $hashes (local.get $set)) (local.get $i) (local.get $hash))
+)
+
+
+;; Insert item into a $SET (no-op if already present)
+(func $set_insert (param $set (ref $SET)) (param $item (ref null eq))
+  (call $set_insert_hashed (local.get $set)
+    (call $set_key (local.get $item))
+    (call $hash_value (local.get $item)))
+)
+
+
+;; Insert a key in stored form with its known hash (no-op if already
+;; present); set-to-set operations pass the source slot's cached hash
+(func $set_insert_hashed (param $set (ref $SET)) (param $key (ref null eq)) (param $hash i32)
+  (local $slot i32)
+
+  (call $set_find (local.get $set) (local.get $key) (local.get $hash))
+  (if (param i32) (result i32) (then (drop) (return)) (else))
+  (local.set $slot)
+
+  ;; Claiming a never-used slot raises the fill; reusing a deleted one doesn't
+  (if (ref.is_null (array.get $ARRAY_ANY (struct.get $SET $keys (local.get $set)) (local.get $slot)))
+    (then
+      (struct.set $SET $fill (local.get $set)
+        (i32.add (struct.get $SET $fill (local.get $set)) (i32.const 1)))
+    )
+  )
+  (array.set $ARRAY_ANY (struct.get $SET $keys (local.get $set)) (local.get $slot) (local.get $key))
+  (array.set $ARRAY_I32 (struct.get $SET $hashes (local.get $set)) (local.get $slot) (local.get $hash))
+  (struct.set $SET $used (local.get $set)
+    (i32.add (struct.get $SET $used (local.get $set)) (i32.const 1)))
+
+  ;; Keep fill under 60% of the capacity
+  (if (i32.ge_u
+        (i32.mul (struct.get $SET $fill (local.get $set)) (i32.const 5))
+        (i32.mul (i32.add (struct.get $SET $mask (local.get $set)) (i32.const 1)) (i32.const 3)))
+    (then (call $set_resize (local.get $set)))
+  )
+)
+
+
+;; Build a set from the first n items of an array (set literals, lists).
+;; The table is sized once for all of them, so the inserts skip the fill and
+;; resize checks
+(func $set_from_array (param $items (ref $ARRAY_ANY)) (param $n i32) (result (ref $SET))
+  (local $set (ref $SET))
+  (local $capacity i32)
+  (local $i i32)
+  (local $item (ref null eq))
+  (local $key (ref null eq))
+  (local $hash i32)
+  (local $slot i32)
+
+  (local.set $capacity (i32.const 8))
+  (block $sized
+    (loop $grow
+      (br_if $sized (i32.lt_u (i32.mul (local.get $n) (i32.const 5))
+        (i32.mul (local.get $capacity) (i32.const 3))))
+      (local.set $capacity (i32.shl (local.get $capacity) (i32.const 1)))
+      (br $grow)
+    )
+  )
+  (local.set $set (call $set_new_sized (local.get $capacity)))
+
+  (block $done
+    (loop $loop
+      (br_if $done (i32.ge_u (local.get $i) (local.get $n)))
+      (local.set $item (array.get $ARRAY_ANY (local.get $items) (local.get $i)))
+      (local.set $key (call $set_key (local.get $item)))
+      (local.set $hash (call $hash_value (local.get $item)))
+      (call $set_find (local.get $set) (local.get $key) (local.get $hash))
+      (if (param i32)
+        (then (drop))
+        (else
+          (local.set $slot)
+          (array.set $ARRAY_ANY (struct.get $SET $keys (local.get $set)) (local.get $slot) (local.get $key))
+          (array.set $ARRAY_I32 (struct.get $SET $hashes (local.get $set)) (local.get $slot) (local.get $hash))
+          (struct.set $SET $used (local.get $set)
+            (i32.add (struct.get $SET $used (local.get $set)) (i32.const 1)))
         )
-        (local.set $current (struct.get $PAIR 1 (local.get $pair)))
-        (br $loop)
       )
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (br $loop)
     )
-    ;; Found - return set unchanged
-    (return (local.get $set))
   )
+  ;; Nothing was deleted, so every claimed slot is live
+  (struct.set $SET $fill (local.get $set) (struct.get $SET $used (local.get $set)))
+  (local.get $set)
+)
+
 
-  ;; Not found - prepend item to set
-  (struct.new $PAIR (local.get $item) (local.get $set))
+;; Membership test
+(func $set_contains (param $set (ref $SET)) (param $item (ref null eq)) (result i32)
+  (call $set_contains_hashed (local.get $set)
+    (call $set_key (local.get $item))
+    (call $hash_value (local.get $item)))
 )
 
 
-;; Set method: remove(item) - remove item, error if not present
-(func $set_remove (param $set (ref null eq)) (param $item (ref null eq)) (result (ref null eq))
-  ;; For simplicity, same as discard (no error on missing)
-  (call $set_discard (local.get $set) (local.get $item))
+;; Membership of a stored key with a known hash (see $set_insert_hashed)
+(func $set_contains_hashed (param $set (ref $SET)) (param $key (ref null eq)) (param $hash i32) (result i32)
+  (local $slot_found i32)
+  (call $set_find (local.get $set) (local.get $key) (local.get $hash))
+  (local.set $slot_found)
+  (drop)
+  (local.get $slot_found)
 )
 
 
-;; Set method: discard(item) - remove item if present
+;; Set method: add(item) - add item if not already present
+;; Returns the set; a null or $EMPTY_LIST receiver starts a new set
+(func $set_add (param $set (ref null eq)) (param $item (ref null eq)) (result (ref null eq))
+  (local $s (ref $SET))
+  (local.set $s
+    (if (result (ref $SET)) (ref.test (ref $SET) (local.get $set))
+      (then (ref.cast (ref $SET) (local.get $set)))
+      (else (call $set_new))))
+  (call $set_insert (local.get $s) (local.get $item))
+  (local.get $s)
+)
+
+
+;; Set methods: discard(item) / remove(item) - remove item if present
+;; (remove does not raise on a missing item). Returns the set.
 (func $set_discard (param $set (ref null eq)) (param $item (ref null eq)) (result (ref null eq))
-  (local $current (ref null eq))
-  (local $prev (ref null eq))
-  (local $pair (ref null $PAIR))
+  (local $s (ref $SET))
+  (local $slot i32)
 
-  (if (ref.is_null (local.get $set))
-    (then (return (ref.null eq)))
+  (if (i32.eqz (ref.test (ref $SET) (local.get $set)))
+    (then (return (local.get $set)))
   )
+  (local.set $s (ref.cast (ref $SET) (local.get $set)))
+  (call $set_find (local.get $s) (call $set_key (local.get $item)) (call $hash_value (local.get $item)))
+  (if (param i32) (result i32) (i32.eqz) (then (drop) (return (local.get $set))) (else))
+  (local.set $slot)
+  ;; Leave a deleted marker so later probe sequences still pass through
+  (array.set $ARRAY_ANY (struct.get $SET $keys (local.get $s)) (local.get $slot) (global.get $set_dummy))
+  (struct.set $SET $used (local.get $s)
+    (i32.sub (struct.get $SET $used (local.get $s)) (i32.const 1)))
+  (local.get $set)
+)
 
-  ;; Check first element
-  (local.set $pair (ref.cast (ref $PAIR) (local.get $set)))
-  (if (call $value_equals (struct.get $PAIR 0 (local.get $pair)) (local.get $item))
-    (then
-      ;; Remove first element - return rest
-      (return (struct.get $PAIR 1 (local.get $pair)))
+
+;; Set method: clear() - remove all items in place. Returns the set.
+(func $set_clear (param $set (ref $SET)) (result (ref null eq))
+  (struct.set $SET $hashes (local.get $set) (array.new_default $ARRAY_I32 (i32.const 8)))
+  (struct.set $SET $keys (local.get $set) (array.new_default $ARRAY_ANY (i32.const 8)))
+  (struct.set $SET $mask (local.get $set) (i32.const 7))
+  (struct.set $SET $used (local.get $set) (i32.const 0))
+  (struct.set $SET $fill (local.get $set) (i32.const 0))
+  (local.get $set)
+)
+
+
+;; Set method: pop() - remove and return an arbitrary item (the first in
+;; iteration order), or null if the set is empty
+(func $set_pop (param $set (ref $SET)) (result (ref null eq))
+  (local $keys (ref $ARRAY_ANY))
+  (local $k (ref null eq))
+  (local $i i32)
+
+  (local.set $keys (struct.get $SET $keys (local.get $set)))
+  (block $done
+    (loop $loop
+      (br_if $done (i32.ge_u (local.get $i) (array.len (local.get $keys))))
+      (local.set $k (array.get $ARRAY_ANY (local.get $keys) (local.get $i)))
+      (if (i32.eqz (i32.or
+            (ref.is_null (local.get $k))
+            (ref.eq (local.get $k) (global.get $set_dummy))))
+        (then
+          (array.set $ARRAY_ANY (local.get $keys) (local.get $i) (global.get $set_dummy))
+          (struct.set $SET $used (local.get $set)
+            (i32.sub (struct.get $SET $used (local.get $set)) (i32.const 1)))
+          (return (call $set_unkey (local.get $k)))
+        )
+      )
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (br $loop)
     )
   )
+  (ref.null eq)
+)
+
+
+;; Set elements as a PAIR chain, in slot order (so small ints come out
+;; ascending, as in CPython)
+(func $set_elements (param $set (ref $SET)) (result (ref null eq))
+  (local $keys (ref $ARRAY_ANY))
+  (local $k (ref null eq))
+  (local $result (ref null eq))
+  (local $i i32)
 
-  ;; Search rest of set
-  (local.set $prev (local.get $set))
-  (local.set $current (struct.get $PAIR 1 (local.get $pair)))
+  (local.set $keys (struct.get $SET $keys (local.get $set)))
+  (local.set $i (array.len (local.get $keys)))
+  ;; Walk slots backwards, prepending, so the chain reads front to back
   (block $done
     (loop $loop
-      (br_if $done (ref.is_null (local.get $current)))
-      (local.set $pair (ref.cast (ref $PAIR) (local.get $current)))
-      (if (call $value_equals (struct.get $PAIR 0 (local.get $pair)) (local.get $item))
+      (br_if $done (i32.eqz (local.get $i)))
+      (local.set $i (i32.sub (local.get $i) (i32.const 1)))
+      (local.set $k (array.get $ARRAY_ANY (local.get $keys) (local.get $i)))
+      (if (i32.eqz (i32.or
+            (ref.is_null (local.get $k))
+            (ref.eq (local.get $k) (global.get $set_dummy))))
+        (then
+          (local.set $result (struct.new $PAIR
+            (call $set_unkey (local.get $k))
+            (local.get $result)))
+        )
+      )
+      (br $loop)
+    )
+  )
+  (local.get $result)
+)
+
+
+;; Add every element of $src to $set, reusing the cached hashes
+(func $set_merge (param $set (ref $SET)) (param $src (ref $SET))
+  (local $hashes (ref $ARRAY_I32))
+  (local $keys (ref $ARRAY_ANY))
+  (local $k (ref null eq))
+  (local $i i32)
+
+  (local.set $hashes (struct.get $SET $hashes (local.get $src)))
+  (local.set $keys (struct.get $SET $keys (local.get $src)))
+  (block $done
+    (loop $loop
+      (br_if $done (i32.ge_u (local.get $i) (array.len (local.get $keys))))
+      (local.set $k (array.get $ARRAY_ANY (local.get $keys) (local.get $i)))
+      (if (i32.eqz (i32.or
+            (ref.is_null (local.get $k))
+            (ref.eq (local.get $k) (global.get $set_dummy))))
         (then
-          ;; Remove by unlinking
-          (struct.set $PAIR 1 (ref.cast (ref $PAIR) (local.get $prev))
-            (struct.get $PAIR 1 (local.get $pair)))
-          (return (local.get $set))
+          (call $set_insert_hashed (local.get $set) (local.get $k)
+            (array.get $ARRAY_I32 (local.get $hashes) (local.get $i)))
         )
       )
-      (local.set $prev (local.get $current))
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (br $loop)
+    )
+  )
+)
+
+
+;; Set method: update(iterable) - add every item of iterable. Returns the set.
+(func $set_update (param $set (ref $SET)) (param $other (ref null eq)) (result (ref $SET))
+  (local $current (ref null eq))
+  (local $pair (ref $PAIR))
+
+  (if (ref.test (ref $SET) (local.get $other))
+    (then
+      (call $set_merge (local.get $set) (ref.cast (ref $SET) (local.get $other)))
+      (return (local.get $set))
+    )
+  )
+  (local.set $current (call $iter_prepare (local.get $other)))
+  (block $done
+    (loop $loop
+      (br_if $done (i32.eqz (ref.test (ref $PAIR) (local.get $current))))
+      (local.set $pair (ref.cast (ref $PAIR) (local.get $current)))
+      (call $set_insert (local.get $set) (struct.get $PAIR 0 (local.get $pair)))
       (local.set $current (struct.get $PAIR 1 (local.get $pair)))
       (br $loop)
     )
@@ -94,38 +498,211 @@ SETS_CODE = """
 )
 
 
-;; =============================================================================
-;; Set V2 Operations (using hash table)
-;; =============================================================================
+;; Build a new set from any iterable (set(), set comprehensions)
+(func $set_from_iterable (param $iter (ref null eq)) (result (ref $SET))
+  (local $list (ref $LIST))
+  (if (ref.test (ref $LIST) (local.get $iter))
+    (then
+      (local.set $list (ref.cast (ref $LIST) (local.get $iter)))
+      (return_call $set_from_array
+        (struct.get $LIST $data (local.get $list))
+        (struct.get $LIST $len (local.get $list)))
+    )
+  )
+  (call $set_update (call $set_new) (local.get $iter))
+)
+
 
-;; Create empty set with default capacity
-(func $set_v2_new (result (ref $SET))
-  (struct.new $SET (call $hashtable_new (i32.const 16)))
+;; Set method: copy() - shallow copy; the slot arrays are copied as-is, so
+;; nothing is rehashed or reprobed
+(func $set_copy (param $set (ref $SET)) (result (ref null eq))
+  (local $copy (ref $SET))
+  (local $cap i32)
+
+  (local.set $cap (i32.add (struct.get $SET $mask (local.get $set)) (i32.const 1)))
+  (local.set $copy (call $set_new_sized (local.get $cap)))
+  (array.copy $ARRAY_I32 $ARRAY_I32
+    (struct.get $SET $hashes (local.get $copy)) (i32.const 0)
+    (struct.get $SET $hashes (local.get $set)) (i32.const 0)
+    (local.get $cap))
+  (array.copy $ARRAY_ANY $ARRAY_ANY
+    (struct.get $SET $keys (local.get $copy)) (i32.const 0)
+    (struct.get $SET $keys (local.get $set)) (i32.const 0)
+    (local.get $cap))
+  (struct.set $SET $used (local.get $copy) (struct.get $SET $used (local.get $set)))
+  (struct.set $SET $fill (local.get $copy) (struct.get $SET $fill (local.get $set)))
+  (local.get $copy)
 )
 
 
-;; Add value to set
-(func $set_v2_add (param $set (ref $SET)) (param $value (ref null eq))
-  ;; For sets, we store value as both key and value (or just use null for value)
-  (call $hashtable_set (struct.get $SET $table (local.get $set)) (local.get $value) (local.get $value))
+;; Set method: union(other) / set | other
+(func $set_union (param $a (ref null eq)) (param $b (ref null eq)) (result (ref null eq))
+  (call $set_update (call $set_update (call $set_new) (local.get $a)) (local.get $b))
 )
 
 
-;; Check if value exists in set
-(func $set_v2_contains (param $set (ref $SET)) (param $value (ref null eq)) (result i32)
-  (call $hashtable_contains (struct.get $SET $table (local.get $set)) (local.get $value))
+;; Elements of $a whose membership in $b equals $keep, as a new set
+;; Probes $b and fills the result with $a's cached hashes
+(func $set_filter (param $a (ref $SET)) (param $b (ref $SET)) (param $keep i32) (result (ref $SET))
+  (local $result (ref $SET))
+  (local $hashes (ref $ARRAY_I32))
+  (local $keys (ref $ARRAY_ANY))
+  (local $k (ref null eq))
+  (local $hash i32)
+  (local $i i32)
+
+  (local.set $result (call $set_new))
+  (local.set $hashes (struct.get $SET $hashes (local.get $a)))
+  (local.set $keys (struct.get $SET $keys (local.get $a)))
+  (block $done
+    (loop $loop
+      (br_if $done (i32.ge_u (local.get $i) (array.len (local.get $keys))))
+      (local.set $k (array.get $ARRAY_ANY (local.get $keys) (local.get $i)))
+      (if (i32.eqz (i32.or
+            (ref.is_null (local.get $k))
+            (ref.eq (local.get $k) (global.get $set_dummy))))
+        (then
+          (local.set $hash (array.get $ARRAY_I32 (local.get $hashes) (local.get $i)))
+          (if (i32.eq
+                (call $set_contains_hashed (local.get $b) (local.get $k) (local.get $hash))
+                (local.get $keep))
+            (then (call $set_insert_hashed (local.get $result) (local.get $k) (local.get $hash)))
+          )
+        )
+      )
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (br $loop)
+    )
+  )
+  (local.get $result)
+)
+
+
+;; Coerce an iterable argument to a $SET (sets are used as-is)
+(func $set_of (param $v (ref null eq)) (result (ref $SET))
+  (if (ref.test (ref $SET) (local.get $v))
+    (then (return (ref.cast (ref $SET) (local.get $v))))
+  )
+  (call $set_from_iterable (local.get $v))
+)
+
+
+;; Set method: intersection(other) / set & other
+(func $set_intersection (param $a (ref null eq)) (param $b (ref null eq)) (result (ref null eq))
+  (call $set_filter (call $set_of (local.get $a)) (call $set_of (local.get $b)) (i32.const 1))
+)
+
+
+;; Set method: difference(other) / set - other
+(func $set_difference (param $a (ref null eq)) (param $b (ref null eq)) (result (ref null eq))
+  (call $set_filter (call $set_of (local.get $a)) (call $set_of (local.get $b)) (i32.const 0))
+)
+
+
+;; Set method: symmetric_difference(other) / set ^ other
+(func $set_symmetric_difference (param $a (ref null eq)) (param $b (ref null eq)) (result (ref null eq))
+  (local $self (ref $SET))
+  (local $other (ref $SET))
+  (local.set $self (call $set_of (local.get $a)))
+  (local.set $other (call $set_of (local.get $b)))
+  (call $set_update
+    (call $set_filter (local.get $self) (local.get $other) (i32.const 0))
+    (call $set_filter (local.get $other) (local.get $self) (i32.const 0)))
+)
+
+
+;; True if every element of $a is in $b (probed with $a's cached hashes)
+(func $set_is_subset (param $a (ref $SET)) (param $b (ref $SET)) (result i32)
+  (local $hashes (ref $ARRAY_I32))
+  (local $keys (ref $ARRAY_ANY))
+  (local $k (ref null eq))
+  (local $i i32)
+
+  (if (i32.gt_u (struct.get $SET $used (local.get $a)) (struct.get $SET $used (local.get $b)))
+    (then (return (i32.const 0)))
+  )
+  (local.set $hashes (struct.get $SET $hashes (local.get $a)))
+  (local.set $keys (struct.get $SET $keys (local.get $a)))
+  (block $done
+    (loop $loop
+      (br_if $done (i32.ge_u (local.get $i) (array.len (local.get $keys))))
+      (local.set $k (array.get $ARRAY_ANY (local.get $keys) (local.get $i)))
+      (if (i32.eqz (i32.or
+            (ref.is_null (local.get $k))
+            (ref.eq (local.get $k) (global.get $set_dummy))))
+        (then
+          (if (i32.eqz (call $set_contains_hashed (local.get $b) (local.get $k)
+                (array.get $ARRAY_I32 (local.get $hashes) (local.get $i))))
+            (then (return (i32.const 0)))
+          )
+        )
+      )
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (br $loop)
+    )
+  )
+  (i32.const 1)
 )
 
 
-;; Remove value from set
-(func $set_v2_remove (param $set (ref $SET)) (param $value (ref null eq)) (result i32)
-  (call $hashtable_delete (struct.get $SET $table (local.get $set)) (local.get $value))
+;; True if $a is a subset of $b with fewer elements
+(func $set_is_proper_subset (param $a (ref $SET)) (param $b (ref $SET)) (result i32)
+  (i32.and
+    (i32.lt_u (struct.get $SET $used (local.get $a)) (struct.get $SET $used (local.get $b)))
+    (call $set_is_subset (local.get $a) (local.get $b)))
 )
 
 
-;; Get set length
-(func $set_v2_len (param $set (ref $SET)) (result i32)
-  (call $hashtable_len (struct.get $SET $table (local.get $set)))
+;; Set method: issubset(other) / set <= other
+(func $set_issubset (param $a (ref null eq)) (param $b (ref null eq)) (result (ref null eq))
+  (struct.new $BOOL (call $set_is_subset (call $set_of (local.get $a)) (call $set_of (local.get $b))))
+)
+
+
+;; Set method: issuperset(other) / set >= other
+(func $set_issuperset (param $a (ref null eq)) (param $b (ref null eq)) (result (ref null eq))
+  (struct.new $BOOL (call $set_is_subset (call $set_of (local.get $b)) (call $set_of (local.get $a))))
+)
+
+
+;; Set method: isdisjoint(other)
+(func $set_isdisjoint (param $a (ref null eq)) (param $b (ref null eq)) (result (ref null eq))
+  (struct.new $BOOL (i32.eqz (struct.get $SET $used
+    (call $set_filter (call $set_of (local.get $a)) (call $set_of (local.get $b)) (i32.const 1)))))
+)
+
+
+;; Set equality: same size and $a is a subset of $b
+(func $set_equals (param $a (ref $SET)) (param $b (ref $SET)) (result i32)
+  (i32.and
+    (i32.eq (struct.get $SET $used (local.get $a)) (struct.get $SET $used (local.get $b)))
+    (call $set_is_subset (local.get $a) (local.get $b)))
+)
+
+
+;; set_to_string: "{1, 2}" using element reprs, "set()" when empty
+(func $set_to_string (param $set (ref $SET)) (result (ref $STRING))
+  (local $result (ref $STRING))
+  (local $current (ref null eq))
+  (local $pair (ref $PAIR))
+
+  (local.set $current (call $set_elements (local.get $set)))
+  (if (ref.is_null (local.get $current))
+    (then (return (global.get $str_empty_set)))
+  )
+  (local.set $result (global.get $str_lbrace))
+  (block $done
+    (loop $loop
+      (local.set $pair (ref.cast (ref $PAIR) (local.get $current)))
+      (local.set $result (call $string_concat (local.get $result)
+        (call $value_to_string_repr (struct.get $PAIR 0 (local.get $pair)))))
+      (local.set $current (struct.get $PAIR 1 (local.get $pair)))
+      (br_if $done (ref.is_null (local.get $current)))
+      (local.set $result (call $string_concat (local.get $result) (global.get $str_comma_space)))
+      (br $loop)
+    )
+  )
+  (call $string_concat (local.get $result) (global.get $str_rbrace))
 )
 
 """
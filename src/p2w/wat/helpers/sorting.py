@@ -4,13 +4,128 @@ from __future__ import annotations
 
 SORTING_CODE = """
 
-;; sorted(iterable, key=func) - returns new sorted list using key function
-(func $sorted_with_key (param $iterable (ref null eq)) (param $key_fn (ref null eq)) (result (ref null eq))
-  (local $result (ref null eq))
-  ;; Copy the list first
-  (local.set $result (call $copy_list (local.get $iterable)))
-  ;; Sort with key function
-  (call $list_sort_with_key (local.get $result) (local.get $key_fn))
+;; sort_gather: the items of an iterable in a fresh array of exactly their
+;; count (one array.copy for a $LIST or $TUPLE, one walk otherwise)
+(func $sort_gather (param $iterable (ref null eq)) (result (ref $ARRAY_ANY))
+  (local $items (ref $ARRAY_ANY))
+  (local $current (ref null eq))
+  (local $pair (ref $PAIR))
+  (local $len i32)
+  (local $i i32)
+
+  (if (ref.test (ref $LIST) (local.get $iterable))
+    (then
+      (local.set $len (struct.get $LIST $len (ref.cast (ref $LIST) (local.get $iterable))))
+      (local.set $items (array.new_default $ARRAY_ANY (local.get $len)))
+      (array.copy $ARRAY_ANY $ARRAY_ANY
+        (local.get $items) (i32.const 0)
+        (struct.get $LIST $data (ref.cast (ref $LIST) (local.get $iterable))) (i32.const 0)
+        (local.get $len))
+      (return (local.get $items))
+    )
+  )
+  (if (ref.test (ref $TUPLE) (local.get $iterable))
+    (then
+      (local.set $len (struct.get $TUPLE $len (ref.cast (ref $TUPLE) (local.get $iterable))))
+      (local.set $items (array.new_default $ARRAY_ANY (local.get $len)))
+      (array.copy $ARRAY_ANY $ARRAY_ANY
+        (local.get $items) (i32.const 0)
+        (struct.get $TUPLE $data (ref.cast (ref $TUPLE) (local.get $iterable))) (i32.const 0)
+        (local.get $len))
+      (return (local.get $items))
+    )
+  )
+  (local.set $current (call $iter_prepare (local.get $iterable)))
+  (local.set $items (array.new_default $ARRAY_ANY (call $list_len (local.get $current))))
+  (block $walk_done
+    (loop $walk
+      (br_if $walk_done (i32.eqz (ref.test (ref $PAIR) (local.get $current))))
+      (local.set $pair (ref.cast (ref $PAIR) (local.get $current)))
+      (array.set $ARRAY_ANY (local.get $items) (local.get $i) (struct.get $PAIR 0 (local.get $pair)))
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (local.set $current (struct.get $PAIR 1 (local.get $pair)))
+      (br $walk)
+    )
+  )
+  (local.get $items)
+)
+
+
+;; sort_permuted_list: new $LIST of items in permutation order
+(func $sort_permuted_list (param $items (ref $ARRAY_ANY)) (param $perm (ref $ARRAY_I32)) (result (ref $LIST))
+  (local $out (ref $ARRAY_ANY))
+  (local $len i32)
+  (local $i i32)
+
+  (local.set $len (array.len (local.get $perm)))
+  (local.set $out (array.new_default $ARRAY_ANY (local.get $len)))
+  (block $out_done
+    (loop $out_loop
+      (br_if $out_done (i32.ge_s (local.get $i) (local.get $len)))
+      (array.set $ARRAY_ANY (local.get $out) (local.get $i)
+        (array.get $ARRAY_ANY (local.get $items)
+          (array.get $ARRAY_I32 (local.get $perm) (local.get $i))))
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (br $out_loop)
+    )
+  )
+  (struct.new $LIST (local.get $out) (local.get $len) (local.get $len))
+)
+
+
+;; sorted(iterable) - returns new sorted list, sorting a flat array of the
+;; items with the values themselves as keys
+(func $sorted_values (param $iterable (ref null eq)) (result (ref null eq))
+  (local $items (ref $ARRAY_ANY))
+  (local $len i32)
+
+  (local.set $items (call $sort_gather (local.get $iterable)))
+  (local.set $len (array.len (local.get $items)))
+  (if (i32.eqz (local.get $len))
+    (then (return (struct.new $EMPTY_LIST)))
+  )
+  (call $sort_permuted_list (local.get $items)
+    (call $sort_permutation_by_keys (local.get $items) (local.get $len) (i32.const 0)))
+)
+
+
+;; sorted(iterable, key=func[, reverse=True]) - returns new sorted list using
+;; key function
+;; Fused copy + sort: the items are gathered straight into an array with
+;; their keys in a parallel array, and the result $LIST is filled from the
+;; sort permutation.
+(func $sorted_with_key (param $iterable (ref null eq)) (param $key_fn (ref null eq)) (param $reverse i32) (result (ref null eq))
+  (local $closure (ref $CLOSURE))
+  (local $items (ref $ARRAY_ANY))
+  (local $keys (ref $ARRAY_ANY))
+  (local $len i32)
+  (local $i i32)
+
+  (local.set $closure (ref.cast (ref $CLOSURE) (local.get $key_fn)))
+  (local.set $items (call $sort_gather (local.get $iterable)))
+  (local.set $len (array.len (local.get $items)))
+  (if (i32.eqz (local.get $len))
+    (then (return (struct.new $EMPTY_LIST)))
+  )
+
+  ;; Decorate: keys[i] = key(items[i])
+  (local.set $keys (array.new_default $ARRAY_ANY (local.get $len)))
+  (block $keys_done
+    (loop $keys_loop
+      (br_if $keys_done (i32.ge_s (local.get $i) (local.get $len)))
+      (array.set $ARRAY_ANY (local.get $keys) (local.get $i)
+        (call_indirect (type $FUNC)
+          (struct.new $PAIR (array.get $ARRAY_ANY (local.get $items) (local.get $i)) (ref.null eq))
+          (struct.get $CLOSURE 0 (local.get $closure))
+          (struct.get $CLOSURE 1 (local.get $closure))))
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (br $keys_loop)
+    )
+  )
+
+  ;; Undecorate straight into the result list
+  (call $sort_permuted_list (local.get $items)
+    (call $sort_permutation_by_keys (local.get $keys) (local.get $len) (local.get $reverse)))
 )
 
 """
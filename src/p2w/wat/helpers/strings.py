@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+# Emit a 16-byte SIMD (simd128) stride in the string comparisons
+ENABLE_SIMD_STRINGS = True
+
 STRINGS_CODE = """
 
 ;; parse_int_base: parse string as integer with given base (2-36)
@@ -15,6 +18,9 @@ STRINGS_CODE = """
   (local $char2 i32)
   (local $digit i32)
   (local $neg i32)
+  (if (i32.eq (local.get $base) (i32.const 10))
+    (then (return_call $parse_int_base10 (local.get $str)))
+  )
   (local.set $offset (struct.get $STRING 0 (local.get $str)))
   (local.set $len (struct.get $STRING 1 (local.get $str)))
   (local.set $result (i32.const 0))
@@ -28,39 +34,22 @@ STRINGS_CODE = """
       (local.set $i (i32.const 1))
     )
   )
-  ;; Check for prefix (0x, 0b, 0o) - need at least 2 more chars after current position
+  ;; Check for prefix (0x, 0b, 0o) - need at least 2 more chars after current position.
+  ;; $str_int_prefix_bases maps each ASCII byte to the base whose prefix
+  ;; letter it is, so one load decides whether "0" + char2 is this base's prefix.
   (if (i32.ge_s (i32.sub (local.get $len) (local.get $i)) (i32.const 2))
     (then
       (local.set $char (i32.load8_u (i32.add (local.get $offset) (local.get $i))))
       (local.set $char2 (i32.load8_u (i32.add (local.get $offset) (i32.add (local.get $i) (i32.const 1)))))
-      ;; Check for '0' prefix
-      (if (i32.eq (local.get $char) (i32.const 48))  ;; '0'
-        (then
-          ;; Check for 0x or 0X (hex, base 16)
-          (if (i32.and
-                (i32.eq (local.get $base) (i32.const 16))
-                (i32.or
-                  (i32.eq (local.get $char2) (i32.const 120))  ;; 'x'
-                  (i32.eq (local.get $char2) (i32.const 88)))) ;; 'X'
-            (then (local.set $i (i32.add (local.get $i) (i32.const 2))))
-          )
-          ;; Check for 0b or 0B (binary, base 2)
-          (if (i32.and
-                (i32.eq (local.get $base) (i32.const 2))
-                (i32.or
-                  (i32.eq (local.get $char2) (i32.const 98))   ;; 'b'
-                  (i32.eq (local.get $char2) (i32.const 66)))) ;; 'B'
-            (then (local.set $i (i32.add (local.get $i) (i32.const 2))))
-          )
-          ;; Check for 0o or 0O (octal, base 8)
-          (if (i32.and
-                (i32.eq (local.get $base) (i32.const 8))
-                (i32.or
-                  (i32.eq (local.get $char2) (i32.const 111))  ;; 'o'
-                  (i32.eq (local.get $char2) (i32.const 79)))) ;; 'O'
-            (then (local.set $i (i32.add (local.get $i) (i32.const 2))))
-          )
-        )
+      (if (i32.and
+            (i32.and
+              (i32.eq (local.get $char) (i32.const 48))  ;; '0'
+              (i32.lt_u (local.get $char2) (i32.const 128)))
+            (i32.eq (local.get $base)
+              (i32.load8_u (i32.add
+                (struct.get $STRING 0 (global.get $str_int_prefix_bases))
+                (i32.and (local.get $char2) (i32.const 127))))))
+        (then (local.set $i (i32.add (local.get $i) (i32.const 2))))
       )
     )
   )
@@ -69,26 +58,20 @@ STRINGS_CODE = """
     (loop $loop
       (br_if $done (i32.ge_s (local.get $i) (local.get $len)))
       (local.set $char (i32.load8_u (i32.add (local.get $offset) (local.get $i))))
-      ;; Convert char to digit value
-      (if (i32.and (i32.ge_u (local.get $char) (i32.const 48))   ;; '0'
-                   (i32.le_u (local.get $char) (i32.const 57)))  ;; '9'
-        (then (local.set $digit (i32.sub (local.get $char) (i32.const 48))))
-        (else
-          (if (i32.and (i32.ge_u (local.get $char) (i32.const 97))   ;; 'a'
-                       (i32.le_u (local.get $char) (i32.const 122))) ;; 'z'
-            (then (local.set $digit (i32.add (i32.sub (local.get $char) (i32.const 97)) (i32.const 10))))
-            (else
-              (if (i32.and (i32.ge_u (local.get $char) (i32.const 65))   ;; 'A'
-                           (i32.le_u (local.get $char) (i32.const 90))) ;; 'Z'
-                (then (local.set $digit (i32.add (i32.sub (local.get $char) (i32.const 65)) (i32.const 10))))
-                (else (br $done))  ;; Invalid char
-              )
-            )
-          )
-        )
-      )
+      ;; Convert char to digit value without branching: decimal digits map to
+      ;; 0..9, letters (either case, via | 32) to 10..35, anything else to 36,
+      ;; which no base (2-36) accepts.
+      (local.set $char2 (i32.sub (i32.or (local.get $char) (i32.const 32)) (i32.const 97)))
+      (local.set $digit
+        (select
+          (i32.sub (local.get $char) (i32.const 48))
+          (select
+            (i32.add (local.get $char2) (i32.const 10))
+            (i32.const 36)
+            (i32.lt_u (local.get $char2) (i32.const 26)))
+          (i32.lt_u (i32.sub (local.get $char) (i32.const 48)) (i32.const 10))))
       ;; Check digit is valid for base
-      (br_if $done (i32.ge_s (local.get $digit) (local.get $base)))
+      (br_if $done (i32.ge_u (local.get $digit) (local.get $base)))
       ;; result = result * base + digit
       (local.set $result (i32.add
         (i32.mul (local.get $result) (local.get $base))
@@ -106,158 +89,123 @@ STRINGS_CODE = """
 
 
 ;; parse_float: parse string as float (e.g., "3.14", "-2.5")
+;; Digits go into one i64 mantissa with a decimal exponent. When the mantissa
+;; is exact in an f64 (<= 2^53) and the scale is an exact power of ten
+;; (<= 10^22), one division rounds correctly; other inputs (long mantissas,
+;; digits past the i64 limit, tiny scales) take $parse_float_digits.
 (func $parse_float (param $str (ref $STRING)) (result f64)
-  (local $offset i32)
-  (local $len i32)
-  (local $i i32)
-  (local $char i32)
-  (local $int_part f64)
-  (local $frac_part f64)
-  (local $frac_divisor f64)
+  (local $p i32)
+  (local $end i32)
+  (local $d i32)
+  (local $mant i64)
+  (local $exp i32)
+  (local $start i32)
   (local $neg i32)
-  (local $in_frac i32)
-  (local.set $offset (struct.get $STRING 0 (local.get $str)))
-  (local.set $len (struct.get $STRING 1 (local.get $str)))
-  (local.set $int_part (f64.const 0))
-  (local.set $frac_part (f64.const 0))
-  (local.set $frac_divisor (f64.const 1))
-  (local.set $i (i32.const 0))
-  (local.set $neg (i32.const 0))
-  (local.set $in_frac (i32.const 0))
+  (local $result f64)
+  (local.set $p (struct.get $STRING 0 (local.get $str)))
+  (local.set $end (i32.add (local.get $p) (struct.get $STRING 1 (local.get $str))))
   ;; Check for negative sign
-  (if (i32.and (i32.gt_s (local.get $len) (i32.const 0))
-               (i32.eq (i32.load8_u (local.get $offset)) (i32.const 45)))
+  (if (i32.and (i32.lt_u (local.get $p) (local.get $end))
+               (i32.eq (i32.load8_u (local.get $p)) (i32.const 45)))
     (then
       (local.set $neg (i32.const 1))
-      (local.set $i (i32.const 1))
+      (local.set $p (i32.add (local.get $p) (i32.const 1)))
     )
   )
-  ;; Parse number
-  (block $done
-    (loop $loop
-      (br_if $done (i32.ge_s (local.get $i) (local.get $len)))
-      (local.set $char (i32.load8_u (i32.add (local.get $offset) (local.get $i))))
-      ;; Check for decimal point
-      (if (i32.eq (local.get $char) (i32.const 46))  ;; '.'
+  (local.set $start (local.get $p))
+  ;; Integer digits; once the mantissa is full, each extra digit is a power of ten
+  (block $int_done
+    (loop $int_loop
+      (br_if $int_done (i32.ge_u (local.get $p) (local.get $end)))
+      (local.set $d (i32.sub (i32.load8_u (local.get $p)) (i32.const 48)))
+      (br_if $int_done (i32.gt_u (local.get $d) (i32.const 9)))
+      (if (i64.lt_u (local.get $mant) (i64.const 1000000000000000000))
         (then
-          (local.set $in_frac (i32.const 1))
-          (local.set $i (i32.add (local.get $i) (i32.const 1)))
-          (br $loop)
-        )
+          (local.set $mant (i64.add (i64.mul (local.get $mant) (i64.const 10))
+                                    (i64.extend_i32_u (local.get $d)))))
+        (else (local.set $exp (i32.add (local.get $exp) (i32.const 1))))
       )
-      ;; Check for digit
-      (if (i32.and (i32.ge_u (local.get $char) (i32.const 48))
-                   (i32.le_u (local.get $char) (i32.const 57)))
-        (then
-          (if (local.get $in_frac)
+      (local.set $p (i32.add (local.get $p) (i32.const 1)))
+      (br $int_loop)
+    )
+  )
+  ;; Fraction digits; digits past the mantissa's precision are dropped
+  (if (i32.and (i32.lt_u (local.get $p) (local.get $end))
+               (i32.eq (i32.load8_u (local.get $p)) (i32.const 46)))  ;; '.'
+    (then
+      (local.set $p (i32.add (local.get $p) (i32.const 1)))
+      (block $frac_done
+        (loop $frac_loop
+          (br_if $frac_done (i32.ge_u (local.get $p) (local.get $end)))
+          (local.set $d (i32.sub (i32.load8_u (local.get $p)) (i32.const 48)))
+          (br_if $frac_done (i32.gt_u (local.get $d) (i32.const 9)))
+          (if (i64.lt_u (local.get $mant) (i64.const 1000000000000000000))
             (then
-              ;; Fractional part
-              (local.set $frac_divisor (f64.mul (local.get $frac_divisor) (f64.const 10)))
-              (local.set $frac_part (f64.add (local.get $frac_part)
-                (f64.div
-                  (f64.convert_i32_u (i32.sub (local.get $char) (i32.const 48)))
-                  (local.get $frac_divisor))))
-            )
-            (else
-              ;; Integer part
-              (local.set $int_part (f64.add
-                (f64.mul (local.get $int_part) (f64.const 10))
-                (f64.convert_i32_u (i32.sub (local.get $char) (i32.const 48)))))
+              (local.set $mant (i64.add (i64.mul (local.get $mant) (i64.const 10))
+                                        (i64.extend_i32_u (local.get $d))))
+              (local.set $exp (i32.sub (local.get $exp) (i32.const 1)))
             )
           )
+          (local.set $p (i32.add (local.get $p) (i32.const 1)))
+          (br $frac_loop)
         )
-        (else (br $done))  ;; Non-digit
       )
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
-      (br $loop)
     )
   )
-  ;; Combine parts and apply sign
-  (if (result f64) (local.get $neg)
-    (then (f64.neg (f64.add (local.get $int_part) (local.get $frac_part))))
-    (else (f64.add (local.get $int_part) (local.get $frac_part)))
+  (if (i32.and
+        (i64.le_u (local.get $mant) (i64.const 9007199254740992))  ;; 2^53
+        (i32.le_u (i32.sub (i32.const 0) (local.get $exp)) (i32.const 22)))
+    (then
+      ;; Both operands exact, so the division is the only rounding
+      (local.set $result (f64.div (f64.convert_i64_u (local.get $mant))
+        (array.get $ARRAY_F64 (global.get $pow10_f64) (i32.sub (i32.const 0) (local.get $exp))))))
+    (else
+      (local.set $result (call $parse_float_digits (local.get $start) (local.get $end))))
   )
+  ;; Apply sign
+  (select (f64.neg (local.get $result)) (local.get $result) (local.get $neg))
 )
 
 
-;; strings_equal: compare two STRING structs byte by byte
-(func $strings_equal (param $a (ref $STRING)) (param $b (ref $STRING)) (result i32)
-  (local $offset_a i32)
-  (local $offset_b i32)
-  (local $len_a i32)
-  (local $len_b i32)
-  (local $i i32)
-  (local.set $offset_a (struct.get $STRING 0 (local.get $a)))
-  (local.set $len_a (struct.get $STRING 1 (local.get $a)))
-  (local.set $offset_b (struct.get $STRING 0 (local.get $b)))
-  (local.set $len_b (struct.get $STRING 1 (local.get $b)))
-  ;; Different lengths - not equal
-  (if (i32.ne (local.get $len_a) (local.get $len_b))
-    (then (return (i32.const 0)))
-  )
-  ;; Compare byte by byte
-  (local.set $i (i32.const 0))
-  (block $done
-    (loop $loop
-      (br_if $done (i32.ge_u (local.get $i) (local.get $len_a)))
-      (if (i32.ne
-            (i32.load8_u (i32.add (local.get $offset_a) (local.get $i)))
-            (i32.load8_u (i32.add (local.get $offset_b) (local.get $i))))
-        (then (return (i32.const 0)))
-      )
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
-      (br $loop)
+;; parse_float_digits: accumulate the unsigned digits in [$p, $end) a digit at
+;; a time (integer part by multiply-add, fraction by successive divisors)
+(func $parse_float_digits (param $p i32) (param $end i32) (result f64)
+  (local $d i32)
+  (local $int_part f64)
+  (local $frac_part f64)
+  (local $frac_divisor f64)
+  (local.set $frac_divisor (f64.const 1))
+  (block $int_done
+    (loop $int_loop
+      (br_if $int_done (i32.ge_u (local.get $p) (local.get $end)))
+      (local.set $d (i32.sub (i32.load8_u (local.get $p)) (i32.const 48)))
+      (br_if $int_done (i32.gt_u (local.get $d) (i32.const 9)))
+      (local.set $int_part (f64.add
+        (f64.mul (local.get $int_part) (f64.const 10))
+        (f64.convert_i32_u (local.get $d))))
+      (local.set $p (i32.add (local.get $p) (i32.const 1)))
+      (br $int_loop)
     )
   )
-  (i32.const 1)
-)
-
-
-;; strings_compare: compare two STRING structs lexicographically
-;; Returns: -1 if a < b, 0 if a == b, 1 if a > b
-(func $strings_compare (param $a (ref $STRING)) (param $b (ref $STRING)) (result i32)
-  (local $offset_a i32)
-  (local $offset_b i32)
-  (local $len_a i32)
-  (local $len_b i32)
-  (local $min_len i32)
-  (local $i i32)
-  (local $char_a i32)
-  (local $char_b i32)
-  (local.set $offset_a (struct.get $STRING 0 (local.get $a)))
-  (local.set $len_a (struct.get $STRING 1 (local.get $a)))
-  (local.set $offset_b (struct.get $STRING 0 (local.get $b)))
-  (local.set $len_b (struct.get $STRING 1 (local.get $b)))
-  ;; Get minimum length
-  (local.set $min_len (local.get $len_a))
-  (if (i32.lt_u (local.get $len_b) (local.get $len_a))
-    (then (local.set $min_len (local.get $len_b)))
-  )
-  ;; Compare byte by byte
-  (local.set $i (i32.const 0))
-  (block $done
-    (loop $loop
-      (br_if $done (i32.ge_u (local.get $i) (local.get $min_len)))
-      (local.set $char_a (i32.load8_u (i32.add (local.get $offset_a) (local.get $i))))
-      (local.set $char_b (i32.load8_u (i32.add (local.get $offset_b) (local.get $i))))
-      (if (i32.lt_u (local.get $char_a) (local.get $char_b))
-        (then (return (i32.const -1)))
-      )
-      (if (i32.gt_u (local.get $char_a) (local.get $char_b))
-        (then (return (i32.const 1)))
+  (if (i32.and (i32.lt_u (local.get $p) (local.get $end))
+               (i32.eq (i32.load8_u (local.get $p)) (i32.const 46)))  ;; '.'
+    (then
+      (local.set $p (i32.add (local.get $p) (i32.const 1)))
+      (block $frac_done
+        (loop $frac_loop
+          (br_if $frac_done (i32.ge_u (local.get $p) (local.get $end)))
+          (local.set $d (i32.sub (i32.load8_u (local.get $p)) (i32.const 48)))
+          (br_if $frac_done (i32.gt_u (local.get $d) (i32.const 9)))
+          (local.set $frac_divisor (f64.mul (local.get $frac_divisor) (f64.const 10)))
+          (local.set $frac_part (f64.add (local.get $frac_part)
+            (f64.div (f64.convert_i32_u (local.get $d)) (local.get $frac_divisor))))
+          (local.set $p (i32.add (local.get $p) (i32.const 1)))
+          (br $frac_loop)
+        )
       )
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
-      (br $loop)
     )
   )
-  ;; All compared bytes are equal - shorter string is less
-  (if (i32.lt_u (local.get $len_a) (local.get $len_b))
-    (then (return (i32.const -1)))
-  )
-  (if (i32.gt_u (local.get $len_a) (local.get $len_b))
-    (then (return (i32.const 1)))
-  )
-  (i32.const 0)
+  (f64.add (local.get $int_part) (local.get $frac_part))
 )
 
 
@@ -270,19 +218,19 @@ STRINGS_CODE = """
   (local.set $offset (struct.get $STRING 0 (local.get $s)))
   (local.set $len (struct.get $STRING 1 (local.get $s)))
 
-  ;; Handle negative index
-  (if (i32.lt_s (local.get $idx) (i32.const 0))
-    (then
-      (local.set $idx (i32.add (local.get $len) (local.get $idx)))
-    )
-  )
+  ;; Handle negative index without a branch
+  (local.set $idx
+    (select
+      (i32.add (local.get $len) (local.get $idx))
+      (local.get $idx)
+      (i32.lt_s (local.get $idx) (i32.const 0))))
 
-  ;; Bounds check
-  (if (i32.or (i32.lt_s (local.get $idx) (i32.const 0)) (i32.ge_s (local.get $idx) (local.get $len)))
+  ;; Bounds check: an index still negative is huge unsigned, so one compare
+  (if (i32.ge_u (local.get $idx) (local.get $len))
     (then (return (ref.null eq)))
   )
   ;; Return STRING pointing directly into source string (no copy needed)
-  (struct.new $STRING (i32.add (local.get $offset) (local.get $idx)) (i32.const 1))
+  (struct.new $STRING (i32.add (local.get $offset) (local.get $idx)) (i32.const 1) (i32.const 0))
 )
 
 
@@ -290,7 +238,7 @@ STRINGS_CODE = """
 (func $string_repeat (param $s (ref null eq)) (param $n (ref null eq)) (result (ref null eq))
   (local $str (ref null $STRING))
   (local $count i32)
-  (local $i i32)
+  (local $copied i32)
   (local $src_off i32)
   (local $src_len i32)
   (local $dst_off i32)
@@ -304,31 +252,64 @@ STRINGS_CODE = """
   (local.set $count (i31.get_s (ref.cast (ref i31) (local.get $n))))
 
   (if (i32.le_s (local.get $count) (i32.const 0))
-    (then (return (struct.new $STRING (global.get $string_heap) (i32.const 0))))
+    (then (return (global.get $str_empty)))
   )
 
   (local.set $src_off (struct.get $STRING 0 (local.get $str)))
   (local.set $src_len (struct.get $STRING 1 (local.get $str)))
   (local.set $total_len (i32.mul (local.get $src_len) (local.get $count)))
+  (if (i32.eqz (local.get $total_len))
+    (then (return (local.get $str)))
+  )
 
-  ;; Allocate new string
+  ;; Allocate new string (one reservation covers every doubling copy)
+  (call $ensure_memory (local.get $total_len))
   (local.set $dst_off (global.get $string_heap))
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $total_len)))
+  (global.set $string_heap (i32.add (local.get $dst_off) (local.get $total_len)))
 
-  ;; Copy n times
-  (local.set $i (i32.const 0))
+  ;; Copy the source once, then double the copied prefix ($copied bytes)
+  ;; until more than half is done, and finish with one partial copy
+  (memory.copy (local.get $dst_off) (local.get $src_off) (local.get $src_len))
+  (local.set $copied (local.get $src_len))
   (block $done
     (loop $loop
-      (br_if $done (i32.ge_s (local.get $i) (local.get $count)))
+      (br_if $done (i32.gt_u (local.get $copied) (i32.sub (local.get $total_len) (local.get $copied))))
       (memory.copy
-        (i32.add (local.get $dst_off) (i32.mul (local.get $i) (local.get $src_len)))
-        (local.get $src_off)
-        (local.get $src_len))
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+        (i32.add (local.get $dst_off) (local.get $copied))
+        (local.get $dst_off)
+        (local.get $copied))
+      (local.set $copied (i32.shl (local.get $copied) (i32.const 1)))
       (br $loop)
     )
   )
-  (struct.new $STRING (local.get $dst_off) (local.get $total_len))
+  (memory.copy
+    (i32.add (local.get $dst_off) (local.get $copied))
+    (local.get $dst_off)
+    (i32.sub (local.get $total_len) (local.get $copied)))
+  (struct.new $STRING (local.get $dst_off) (local.get $total_len) (i32.const 0))
+)
+
+
+;; string_slice_fast: s[lower:upper] with step 1 for 0 <= lower; upper is
+;; clamped to the length. Called directly for constant non-negative bounds.
+(func $string_slice_fast (param $str (ref $STRING)) (param $lower i32) (param $upper i32) (result (ref $STRING))
+  (local $src_len i32)
+  (local $dest_offset i32)
+  (local $dest_len i32)
+  (local.set $src_len (struct.get $STRING 1 (local.get $str)))
+  (if (i32.gt_u (local.get $upper) (local.get $src_len))
+    (then (local.set $upper (local.get $src_len)))
+  )
+  (local.set $dest_len (i32.sub (local.get $upper) (local.get $lower)))
+  (if (i32.le_s (local.get $dest_len) (i32.const 0))
+    (then (return (global.get $str_empty)))
+  )
+  (local.set $dest_offset (global.get $string_heap))
+  (global.set $string_heap (i32.add (local.get $dest_offset) (local.get $dest_len)))
+  (memory.copy (local.get $dest_offset)
+    (i32.add (struct.get $STRING 0 (local.get $str)) (local.get $lower))
+    (local.get $dest_len))
+  (struct.new $STRING (local.get $dest_offset) (local.get $dest_len) (i32.const 0))
 )
 
 
@@ -339,7 +320,7 @@ STRINGS_CODE = """
   (local $dest_offset i32)
   (local $i i32)
   (local $dest_len i32)
-  (local $step_count i32)
+  (local $p i32)
   ;; Get string info
   (local.set $src_offset (struct.get $STRING 0 (local.get $str)))
   (local.set $src_len (struct.get $STRING 1 (local.get $str)))
@@ -363,28 +344,31 @@ STRINGS_CODE = """
           )
         )
       )
+      ;; Clamp once so the loop only tests i > upper: lower to the last
+      ;; character, upper to "before start" (-1)
+      (if (i32.ge_s (local.get $lower) (local.get $src_len))
+        (then (local.set $lower (i32.sub (local.get $src_len) (i32.const 1))))
+      )
+      (if (i32.lt_s (local.get $upper) (i32.const -1))
+        (then (local.set $upper (i32.const -1)))
+      )
       ;; Build reverse string
       (local.set $dest_offset (global.get $string_heap))
       (local.set $dest_len (i32.const 0))
       (local.set $i (local.get $lower))
       (block $done
         (loop $loop
-          (br_if $done (i32.lt_s (local.get $i) (i32.const 0)))
-          (if (i32.ne (local.get $upper) (i32.const -1))
-            (then (br_if $done (i32.le_s (local.get $i) (local.get $upper))))
-          )
-          ;; Copy character
+          (br_if $done (i32.le_s (local.get $i) (local.get $upper)))
           (i32.store8
             (i32.add (local.get $dest_offset) (local.get $dest_len))
             (i32.load8_u (i32.add (local.get $src_offset) (local.get $i))))
           (local.set $dest_len (i32.add (local.get $dest_len) (i32.const 1)))
-          ;; Step backwards
           (local.set $i (i32.add (local.get $i) (local.get $step)))
           (br $loop)
         )
       )
-      (global.set $string_heap (i32.add (global.get $string_heap) (local.get $dest_len)))
-      (return (struct.new $STRING (local.get $dest_offset) (local.get $dest_len)))
+      (global.set $string_heap (i32.add (local.get $dest_offset) (local.get $dest_len)))
+      (return (struct.new $STRING (local.get $dest_offset) (local.get $dest_len) (i32.const 0)))
     )
   )
   ;; Positive step
@@ -416,206 +400,311 @@ STRINGS_CODE = """
   ;; Calculate length
   (local.set $dest_len (i32.sub (local.get $upper) (local.get $lower)))
   (if (i32.le_s (local.get $dest_len) (i32.const 0))
-    (then (return (struct.new $STRING (i32.const 0) (i32.const 0))))
+    (then (return (global.get $str_empty)))
   )
   ;; Fast path for step=1: use memory.copy instead of byte-by-byte loop
   (if (i32.eq (local.get $step) (i32.const 1))
-    (then
-      (local.set $dest_offset (global.get $string_heap))
-      (global.set $string_heap (i32.add (global.get $string_heap) (local.get $dest_len)))
-      (memory.copy (local.get $dest_offset) (i32.add (local.get $src_offset) (local.get $lower)) (local.get $dest_len))
-      (return (struct.new $STRING (local.get $dest_offset) (local.get $dest_len)))
-    )
+    (then (return_call $string_slice_fast (local.get $str) (local.get $lower) (local.get $upper)))
   )
-  ;; General case for step > 1: byte-by-byte with step
+  ;; General case for step > 1: strided byte copy
   (local.set $dest_offset (global.get $string_heap))
   (local.set $dest_len (i32.const 0))
   (local.set $i (local.get $lower))
-  (local.set $step_count (i32.const 0))
+  ;; For steps up to 8, while 8 more elements remain, gather them into an
+  ;; i64 (little-endian, first element in the low byte) and write them with
+  ;; a single store
+  (block $gathered
+    (br_if $gathered (i32.gt_u (local.get $step) (i32.const 8)))
+    (loop $gather
+      (br_if $gathered (i32.ge_s
+        (i32.add (local.get $i) (i32.mul (local.get $step) (i32.const 7)))
+        (local.get $upper)))
+      (local.set $p (i32.add (local.get $src_offset) (local.get $i)))
+      (i32.add (local.get $dest_offset) (local.get $dest_len))
+      (i64.load8_u (local.get $p))
+          (i64.or (i64.shl (i64.load8_u (local.tee $p (i32.add (local.get $p) (local.get $step)))) (i64.const 8)))
+          (i64.or (i64.shl (i64.load8_u (local.tee $p (i32.add (local.get $p) (local.get $step)))) (i64.const 16)))
+          (i64.or (i64.shl (i64.load8_u (local.tee $p (i32.add (local.get $p) (local.get $step)))) (i64.const 24)))
+          (i64.or (i64.shl (i64.load8_u (local.tee $p (i32.add (local.get $p) (local.get $step)))) (i64.const 32)))
+          (i64.or (i64.shl (i64.load8_u (local.tee $p (i32.add (local.get $p) (local.get $step)))) (i64.const 40)))
+          (i64.or (i64.shl (i64.load8_u (local.tee $p (i32.add (local.get $p) (local.get $step)))) (i64.const 48)))
+          (i64.or (i64.shl (i64.load8_u (local.tee $p (i32.add (local.get $p) (local.get $step)))) (i64.const 56)))
+      (i64.store)
+      (local.set $dest_len (i32.add (local.get $dest_len) (i32.const 8)))
+      (local.set $i (i32.add (local.get $i) (i32.shl (local.get $step) (i32.const 3))))
+      (br $gather)
+    )
+  )
   (block $done2
     (loop $loop2
       (br_if $done2 (i32.ge_s (local.get $i) (local.get $upper)))
-      ;; Only include if step_count == 0
-      (if (i32.eq (local.get $step_count) (i32.const 0))
-        (then
-          (i32.store8
-            (i32.add (local.get $dest_offset) (local.get $dest_len))
-            (i32.load8_u (i32.add (local.get $src_offset) (local.get $i))))
-          (local.set $dest_len (i32.add (local.get $dest_len) (i32.const 1)))
-        )
-      )
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
-      (local.set $step_count (i32.add (local.get $step_count) (i32.const 1)))
-      (if (i32.ge_s (local.get $step_count) (local.get $step))
-        (then (local.set $step_count (i32.const 0)))
-      )
+      (i32.store8
+        (i32.add (local.get $dest_offset) (local.get $dest_len))
+        (i32.load8_u (i32.add (local.get $src_offset) (local.get $i))))
+      (local.set $dest_len (i32.add (local.get $dest_len) (i32.const 1)))
+      (local.set $i (i32.add (local.get $i) (local.get $step)))
       (br $loop2)
     )
   )
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $dest_len)))
-  (struct.new $STRING (local.get $dest_offset) (local.get $dest_len))
+  (global.set $string_heap (i32.add (local.get $dest_offset) (local.get $dest_len)))
+  (struct.new $STRING (local.get $dest_offset) (local.get $dest_len) (i32.const 0))
 )
 
 
-;; value_to_string: convert any value to a STRING for f-strings
-(func $value_to_string (param $v (ref null eq)) (result (ref $STRING))
-  (local $offset i32)
-  (local $len i32)
-  (local $num i32)
-  (local $num64 i64)
-  (local $neg i32)
-  (local $start i32)
-  (local $i i32)
-  (local $digit i32)
-  ;; null -> "None"
-  (if (ref.is_null (local.get $v))
-    (then
-      ;; Write "None" to heap
-      (local.set $offset (global.get $string_heap))
-      (i32.store8 (local.get $offset) (i32.const 78))  ;; N
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 111))  ;; o
-      (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 110))  ;; n
-      (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 101))  ;; e
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 4)))
-      (return (struct.new $STRING (local.get $offset) (i32.const 4)))
+;; digits10_u64: number of decimal digits in unsigned $n (1 for zero).
+;; bits * 1233 >> 12 approximates log10(2^bits) from below; one compare
+;; against $pow10_u64 corrects it. $n | 1 keeps zero at one digit.
+(func $digits10_u64 (param $n i64) (result i32)
+  (local $t i32)
+  (local.set $n (i64.or (local.get $n) (i64.const 1)))
+  (local.set $t (i32.shr_u
+    (i32.mul
+      (i32.sub (i32.const 64) (i32.wrap_i64 (i64.clz (local.get $n))))
+      (i32.const 1233))
+    (i32.const 12)))
+  (i32.sub
+    (i32.add (local.get $t) (i32.const 1))
+    (i64.lt_u (local.get $n) (array.get $ARRAY_I64 (global.get $pow10_u64) (local.get $t))))
+)
+
+
+;; write_digits_u32: write the decimal digits of unsigned $num so that they
+;; end just before $end, two at a time from $str_digit_pairs ("00".."99")
+(func $write_digits_u32 (param $num i32) (param $end i32)
+  (local $pairs i32)
+  (local $quot i32)
+  (local.set $pairs (struct.get $STRING 0 (global.get $str_digit_pairs)))
+  (block $done
+    (loop $loop
+      (br_if $done (i32.lt_u (local.get $num) (i32.const 100)))
+      (local.set $quot (i32.div_u (local.get $num) (i32.const 100)))
+      (local.set $end (i32.sub (local.get $end) (i32.const 2)))
+      (i32.store16 (local.get $end) (i32.load16_u (i32.add (local.get $pairs)
+        (i32.shl (i32.sub (local.get $num) (i32.mul (local.get $quot) (i32.const 100))) (i32.const 1)))))
+      (local.set $num (local.get $quot))
+      (br $loop)
     )
   )
-  ;; Already a string - return as-is
-  (if (ref.test (ref $STRING) (local.get $v))
-    (then (return (ref.cast (ref $STRING) (local.get $v))))
+  ;; Last one or two digits
+  (if (i32.ge_u (local.get $num) (i32.const 10))
+    (then
+      (local.set $end (i32.sub (local.get $end) (i32.const 2)))
+      (i32.store16 (local.get $end) (i32.load16_u (i32.add (local.get $pairs)
+        (i32.shl (local.get $num) (i32.const 1))))))
+    (else
+      (local.set $end (i32.sub (local.get $end) (i32.const 1)))
+      (i32.store8 (local.get $end) (i32.add (local.get $num) (i32.const 48))))
   )
-  ;; Integer - convert to decimal string
-  (if (ref.test (ref i31) (local.get $v))
+)
+
+
+;; i32_to_string: decimal representation of a signed i32
+(func $i32_to_string (param $num i32) (result (ref $STRING))
+  (local $start i32)
+  (local $end i32)
+  (call $ensure_memory (i32.const 11))  ;; "-2147483648"
+  (local.set $start (global.get $string_heap))
+  (local.set $end (local.get $start))
+  ;; Handle negative (i32 min stays negative but is read as unsigned below)
+  (if (i32.lt_s (local.get $num) (i32.const 0))
     (then
-      (local.set $num (i31.get_s (ref.cast (ref i31) (local.get $v))))
-      (local.set $offset (global.get $string_heap))
-      (local.set $start (local.get $offset))
-      ;; Handle negative
-      (if (i32.lt_s (local.get $num) (i32.const 0))
-        (then
-          (i32.store8 (local.get $offset) (i32.const 45))  ;; -
-          (local.set $offset (i32.add (local.get $offset) (i32.const 1)))
-          (local.set $num (i32.sub (i32.const 0) (local.get $num)))
-          (local.set $neg (i32.const 1))
-        )
-      )
-      ;; Handle zero
-      (if (i32.eqz (local.get $num))
-        (then
-          (i32.store8 (local.get $offset) (i32.const 48))  ;; 0
-          (global.set $string_heap (i32.add (local.get $offset) (i32.const 1)))
-          (return (struct.new $STRING (local.get $start) (i32.const 1)))
-        )
-      )
-      ;; Convert digits (reversed)
-      (local.set $i (local.get $offset))
-      (block $done
-        (loop $loop
-          (br_if $done (i32.eqz (local.get $num)))
-          (local.set $digit (i32.rem_u (local.get $num) (i32.const 10)))
-          (i32.store8 (local.get $i) (i32.add (i32.const 48) (local.get $digit)))
-          (local.set $i (i32.add (local.get $i) (i32.const 1)))
-          (local.set $num (i32.div_u (local.get $num) (i32.const 10)))
-          (br $loop)
-        )
-      )
-      ;; Reverse the digits
-      (local.set $len (i32.sub (local.get $i) (local.get $offset)))
-      (call $reverse_bytes (local.get $offset) (local.get $len))
-      (global.set $string_heap (local.get $i))
-      (return (struct.new $STRING (local.get $start) (i32.sub (local.get $i) (local.get $start))))
+      (i32.store8 (local.get $start) (i32.const 45))  ;; -
+      (local.set $end (i32.add (local.get $start) (i32.const 1)))
+      (local.set $num (i32.sub (i32.const 0) (local.get $num)))
     )
   )
-  ;; INT64 (large integer) - convert to decimal string
-  (if (ref.test (ref $INT64) (local.get $v))
+  ;; Digits are written right to left, ending digit-count bytes after the sign
+  (local.set $end (i32.add (local.get $end)
+    (call $digits10_u64 (i64.extend_i32_u (local.get $num)))))
+  (call $write_digits_u32 (local.get $num) (local.get $end))
+  (global.set $string_heap (local.get $end))
+  (struct.new $STRING (local.get $start) (i32.sub (local.get $end) (local.get $start)) (i32.const 0))
+)
+
+
+;; i64_to_string: decimal representation of a signed i64
+(func $i64_to_string (param $num64 i64) (result (ref $STRING))
+  (local $start i32)
+  (local $end i32)
+  (local $i i32)
+  (local $quot64 i64)
+  (call $ensure_memory (i32.const 20))  ;; "-9223372036854775808"
+  (local.set $start (global.get $string_heap))
+  (local.set $end (local.get $start))
+  ;; Handle negative
+  (if (i64.lt_s (local.get $num64) (i64.const 0))
     (then
-      (local.set $num64 (struct.get $INT64 0 (ref.cast (ref $INT64) (local.get $v))))
-      (local.set $offset (global.get $string_heap))
-      (local.set $start (local.get $offset))
-      ;; Handle negative
-      (if (i64.lt_s (local.get $num64) (i64.const 0))
-        (then
-          (i32.store8 (local.get $offset) (i32.const 45))  ;; -
-          (local.set $offset (i32.add (local.get $offset) (i32.const 1)))
-          (local.set $num64 (i64.sub (i64.const 0) (local.get $num64)))
-          (local.set $neg (i32.const 1))
-        )
-      )
-      ;; Handle zero
-      (if (i64.eqz (local.get $num64))
-        (then
-          (i32.store8 (local.get $offset) (i32.const 48))  ;; 0
-          (global.set $string_heap (i32.add (local.get $offset) (i32.const 1)))
-          (return (struct.new $STRING (local.get $start) (i32.const 1)))
-        )
-      )
-      ;; Convert digits (reversed)
-      (local.set $i (local.get $offset))
-      (block $done
-        (loop $loop
-          (br_if $done (i64.eqz (local.get $num64)))
-          (local.set $digit (i32.wrap_i64 (i64.rem_u (local.get $num64) (i64.const 10))))
-          (i32.store8 (local.get $i) (i32.add (i32.const 48) (local.get $digit)))
-          (local.set $i (i32.add (local.get $i) (i32.const 1)))
-          (local.set $num64 (i64.div_u (local.get $num64) (i64.const 10)))
-          (br $loop)
-        )
-      )
-      ;; Reverse the digits
-      (local.set $len (i32.sub (local.get $i) (local.get $offset)))
-      (call $reverse_bytes (local.get $offset) (local.get $len))
-      (global.set $string_heap (local.get $i))
-      (return (struct.new $STRING (local.get $start) (i32.sub (local.get $i) (local.get $start))))
+      (i32.store8 (local.get $start) (i32.const 45))  ;; -
+      (local.set $end (i32.add (local.get $start) (i32.const 1)))
+      (local.set $num64 (i64.sub (i64.const 0) (local.get $num64)))
     )
   )
-  ;; Bool
-  (if (ref.test (ref $BOOL) (local.get $v))
-    (then
-      (if (struct.get $BOOL 0 (ref.cast (ref $BOOL) (local.get $v)))
-        (then
-          ;; "True"
-          (local.set $offset (global.get $string_heap))
-          (i32.store8 (local.get $offset) (i32.const 84))
-          (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 114))
-          (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 117))
-          (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 101))
-          (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 4)))
-          (return (struct.new $STRING (local.get $offset) (i32.const 4)))
-        )
-        (else
-          ;; "False"
-          (local.set $offset (global.get $string_heap))
-          (i32.store8 (local.get $offset) (i32.const 70))
-          (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 97))
-          (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 108))
-          (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 115))
-          (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 101))
-          (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 5)))
-          (return (struct.new $STRING (local.get $offset) (i32.const 5)))
-        )
-      )
+  ;; Digits are written right to left, ending digit-count bytes after the
+  ;; sign; two per i64 division until the rest fits in 32 bits
+  (local.set $end (i32.add (local.get $end) (call $digits10_u64 (local.get $num64))))
+  (local.set $i (local.get $end))
+  (block $done
+    (loop $loop
+      (br_if $done (i64.le_u (local.get $num64) (i64.const 0xFFFFFFFF)))
+      (local.set $quot64 (i64.div_u (local.get $num64) (i64.const 100)))
+      (local.set $i (i32.sub (local.get $i) (i32.const 2)))
+      (i32.store16 (local.get $i) (i32.load16_u (i32.add
+        (struct.get $STRING 0 (global.get $str_digit_pairs))
+        (i32.shl
+          (i32.wrap_i64 (i64.sub (local.get $num64) (i64.mul (local.get $quot64) (i64.const 100))))
+          (i32.const 1)))))
+      (local.set $num64 (local.get $quot64))
+      (br $loop)
     )
   )
+  (call $write_digits_u32 (i32.wrap_i64 (local.get $num64)) (local.get $i))
+  (global.set $string_heap (local.get $end))
+  (struct.new $STRING (local.get $start) (i32.sub (local.get $end) (local.get $start)) (i32.const 0))
+)
+
+
+;; f64_to_str: repr-style text of a float (via the f64_to_string host import)
+(func $f64_to_str (param $val f64) (result (ref $STRING))
+  (local $offset i32)
+  (local $len i32)
+  (call $ensure_memory (i32.const 32))  ;; longest repr is 24 bytes
+  (local.set $offset (global.get $string_heap))
+  (local.set $len (call $f64_to_string (local.get $val) (local.get $offset)))
+  (global.set $string_heap (i32.add (local.get $offset) (local.get $len)))
+  (struct.new $STRING (local.get $offset) (local.get $len) (i32.const 0))
+)
+
+
+;; f64_format_precision_str: fixed-point text of a float with $precision
+;; decimals. Common cases are done here: |val| * 10^precision is rounded to
+;; an integer m (ties to even, like CPython) and m's digits are written with
+;; the point spliced in. Larger values and precisions go to the
+;; f64_format_precision host import.
+(func $f64_format_precision_str (param $val f64) (param $precision i32) (result (ref $STRING))
+  (local $offset i32)
+  (local $len i32)
+  (local $scaled f64)
+  (local $m i64)
+  (local $q i64)
+  (local $scale i64)
+  (local $neg i32)
+  (local $int_end i32)
+  (local $to_tie f64)
+  ;; At most 309 integer digits, sign, point and the decimals
+  (call $ensure_memory (i32.add (local.get $precision) (i32.const 312)))
+  (local.set $offset (global.get $string_heap))
+  (block $slow
+    (br_if $slow (i32.gt_u (local.get $precision) (i32.const 9)))
+    (local.set $scaled (f64.mul (f64.abs (local.get $val))
+      (array.get $ARRAY_F64 (global.get $pow10_f64) (local.get $precision))))
+    ;; Below 2^53 every integer is exact (false for NaN and inf too)
+    (br_if $slow (i32.eqz (f64.lt (local.get $scaled) (f64.const 0x1p53))))
+    (local.set $m (i64.trunc_f64_u (f64.nearest (local.get $scaled))))
+    ;; The product is off by at most 2^-53 * scaled, so a fraction that
+    ;; close to .5 is decided on the exact product (rounding error added back)
+    (local.set $to_tie (f64.sub (f64.sub (local.get $scaled) (f64.trunc (local.get $scaled))) (f64.const 0.5)))
+    (if (f64.le (f64.abs (local.get $to_tie)) (f64.mul (local.get $scaled) (f64.const 0x1p-52)))
+      (then
+        (local.set $to_tie (f64.add (local.get $to_tie)
+          (call $f64_mul_error (f64.abs (local.get $val))
+            (array.get $ARRAY_F64 (global.get $pow10_f64) (local.get $precision))
+            (local.get $scaled))))
+        (local.set $m (i64.add (i64.trunc_f64_u (f64.trunc (local.get $scaled)))
+          (i64.extend_i32_u
+            (select
+              (f64.gt (local.get $to_tie) (f64.const 0))
+              ;; An exact tie rounds to even
+              (i32.wrap_i64 (i64.and (i64.trunc_f64_u (f64.trunc (local.get $scaled))) (i64.const 1)))
+              (f64.ne (local.get $to_tie) (f64.const 0))))))
+      )
+    )
+    (local.set $scale (array.get $ARRAY_I64 (global.get $pow10_u64) (local.get $precision)))
+    (local.set $q (i64.div_u (local.get $m) (local.get $scale)))
+    (br_if $slow (i64.gt_u (local.get $q) (i64.const 0xFFFFFFFF)))
+    ;; Sign from the sign bit, so -0.001 gives "-0.00" as in CPython
+    (local.set $neg (i64.lt_s (i64.reinterpret_f64 (local.get $val)) (i64.const 0)))
+    (i32.store8 (local.get $offset) (i32.const 45))  ;; '-', overwritten if positive
+    (local.set $int_end (i32.add (i32.add (local.get $offset) (local.get $neg))
+      (call $digits10_u64 (local.get $q))))
+    (call $write_digits_u32 (i32.wrap_i64 (local.get $q)) (local.get $int_end))
+    (local.set $len (i32.sub (local.get $int_end) (local.get $offset)))
+    (if (local.get $precision)
+      (then
+        ;; '.', then the decimals right-aligned over a run of '0'
+        (i32.store8 (local.get $int_end) (i32.const 46))
+        (memory.fill (i32.add (local.get $int_end) (i32.const 1)) (i32.const 48) (local.get $precision))
+        (local.set $len (i32.add (local.get $len) (i32.add (local.get $precision) (i32.const 1))))
+        (call $write_digits_u32
+          (i32.wrap_i64 (i64.sub (local.get $m) (i64.mul (local.get $q) (local.get $scale))))
+          (i32.add (local.get $offset) (local.get $len)))
+      )
+    )
+    (global.set $string_heap (i32.add (local.get $offset) (local.get $len)))
+    (return (struct.new $STRING (local.get $offset) (local.get $len) (i32.const 0)))
+  )
+  (local.set $len (call $f64_format_precision (local.get $val) (local.get $precision) (local.get $offset)))
+  (global.set $string_heap (i32.add (local.get $offset) (local.get $len)))
+  (struct.new $STRING (local.get $offset) (local.get $len) (i32.const 0))
+)
+
+
+;; f64_mul_error: the exact rounding error $a * $b - $p of the product
+;; $p = $a * $b (Dekker's two-product, splitting each factor in halves)
+(func $f64_mul_error (param $a f64) (param $b f64) (param $p f64) (result f64)
+  (local $c f64)
+  (local $a_hi f64)
+  (local $a_lo f64)
+  (local $b_hi f64)
+  (local $b_lo f64)
+  (local.set $c (f64.mul (local.get $a) (f64.const 134217729)))  ;; 2^27 + 1
+  (local.set $a_hi (f64.sub (local.get $c) (f64.sub (local.get $c) (local.get $a))))
+  (local.set $a_lo (f64.sub (local.get $a) (local.get $a_hi)))
+  (local.set $c (f64.mul (local.get $b) (f64.const 134217729)))
+  (local.set $b_hi (f64.sub (local.get $c) (f64.sub (local.get $c) (local.get $b))))
+  (local.set $b_lo (f64.sub (local.get $b) (local.get $b_hi)))
+  (f64.add
+    (f64.add
+      (f64.add
+        (f64.sub (f64.mul (local.get $a_hi) (local.get $b_hi)) (local.get $p))
+        (f64.mul (local.get $a_hi) (local.get $b_lo)))
+      (f64.mul (local.get $a_lo) (local.get $b_hi)))
+    (f64.mul (local.get $a_lo) (local.get $b_lo)))
+)
+
+
+;; value_to_string: convert any value to a STRING for f-strings
+;; (the compiler calls the typed converters above directly when it knows
+;; the static type)
+(func $value_to_string (param $v (ref null eq)) (result (ref $STRING))
+  ;; Already a string - return as-is (most common, so tested first; a
+  ;; successful cast branches straight out of the function)
+  (drop (br_on_cast 0 (ref null eq) (ref $STRING) (local.get $v)))
+  ;; Integer - convert to decimal string
+  (if (ref.test (ref i31) (local.get $v))
+    (then (return_call $i32_to_string (i31.get_s (ref.cast (ref i31) (local.get $v)))))
+  )
+  ;; null -> "None"
+  (if (ref.is_null (local.get $v))
+    (then (return (global.get $str_None)))
+  )
   ;; Float - use host function to convert
   (if (ref.test (ref $FLOAT) (local.get $v))
+    (then (return_call $f64_to_str (struct.get $FLOAT 0 (ref.cast (ref $FLOAT) (local.get $v)))))
+  )
+  ;; Bool
+  (if (ref.test (ref $BOOL) (local.get $v))
     (then
-      (local.set $offset (global.get $string_heap))
-      (local.set $len (call $f64_to_string
-        (struct.get $FLOAT 0 (ref.cast (ref $FLOAT) (local.get $v)))
-        (local.get $offset)))
-      (global.set $string_heap (i32.add (local.get $offset) (local.get $len)))
-      (return (struct.new $STRING (local.get $offset) (local.get $len)))
+      (return (select (result (ref $STRING)) (global.get $str_True) (global.get $str_False)
+        (struct.get $BOOL 0 (ref.cast (ref $BOOL) (local.get $v)))))
     )
   )
+  ;; INT64 (large integer) - convert to decimal string
+  (if (ref.test (ref $INT64) (local.get $v))
+    (then (return_call $i64_to_string (struct.get $INT64 0 (ref.cast (ref $INT64) (local.get $v)))))
+  )
   ;; EMPTY_LIST - return "[]"
   (if (ref.test (ref $EMPTY_LIST) (local.get $v))
-    (then
-      (local.set $offset (global.get $string_heap))
-      (i32.store8 (local.get $offset) (i32.const 91))  ;; [
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 93))  ;; ]
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 2)))
-      (return (struct.new $STRING (local.get $offset) (i32.const 2)))
-    )
+    (then (return (global.get $str_empty_list)))
   )
   ;; $LIST (array-backed list) - convert to "[elem, elem, ...]"
   (if (ref.test (ref $LIST) (local.get $v))
@@ -641,6 +730,12 @@ STRINGS_CODE = """
       (return (call $dict_to_string (local.get $v)))
     )
   )
+  ;; SET - convert to "{elem, ...}" (or "set()" when empty)
+  (if (ref.test (ref $SET) (local.get $v))
+    (then
+      (return (call $set_to_string (ref.cast (ref $SET) (local.get $v))))
+    )
+  )
   ;; SUPER - return "<super: <class 'X'"
   (if (ref.test (ref $SUPER) (local.get $v))
     (then
@@ -660,171 +755,51 @@ STRINGS_CODE = """
     )
   )
   ;; Default: empty string
-  (struct.new $STRING (i32.const 0) (i32.const 0))
+  (global.get $str_empty)
 )
 
 
 ;; super_to_string: convert SUPER to string "<super: <class 'ClassName'"
+;; Copies the interned prefix and the class name into one heap span
 (func $super_to_string (param $sup (ref $SUPER)) (result (ref $STRING))
-  (local $offset i32)
-  (local $class (ref $CLASS))
-  (local $class_name (ref $STRING))
-  (local $prefix (ref $STRING))
-  (local $result (ref $STRING))
-
-  (local.set $class (struct.get $SUPER 0 (local.get $sup)))
-  (local.set $class_name (struct.get $CLASS 0 (local.get $class)))
-
-  ;; Create "<super: <class '" prefix (16 chars)
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 60))  ;; <
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 115))  ;; s
-  (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 117))  ;; u
-  (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 112))  ;; p
-  (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 101))  ;; e
-  (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 114))  ;; r
-  (i32.store8 (i32.add (local.get $offset) (i32.const 6)) (i32.const 58))   ;; :
-  (i32.store8 (i32.add (local.get $offset) (i32.const 7)) (i32.const 32))   ;; space
-  (i32.store8 (i32.add (local.get $offset) (i32.const 8)) (i32.const 60))   ;; <
-  (i32.store8 (i32.add (local.get $offset) (i32.const 9)) (i32.const 99))   ;; c
-  (i32.store8 (i32.add (local.get $offset) (i32.const 10)) (i32.const 108)) ;; l
-  (i32.store8 (i32.add (local.get $offset) (i32.const 11)) (i32.const 97))  ;; a
-  (i32.store8 (i32.add (local.get $offset) (i32.const 12)) (i32.const 115)) ;; s
-  (i32.store8 (i32.add (local.get $offset) (i32.const 13)) (i32.const 115)) ;; s
-  (i32.store8 (i32.add (local.get $offset) (i32.const 14)) (i32.const 32))  ;; space
-  (i32.store8 (i32.add (local.get $offset) (i32.const 15)) (i32.const 39))  ;; '
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 16)))
-  (local.set $prefix (struct.new $STRING (local.get $offset) (i32.const 16)))
-
-  ;; Concatenate prefix + class_name
-  (call $string_concat (local.get $prefix) (local.get $class_name))
+  (local $name (ref $STRING))
+  (local $prefix_len i32)
+  (local $name_len i32)
+  (local $total i32)
+  (local $off i32)
+  (local.set $name (struct.get $CLASS 0 (struct.get $SUPER 0 (local.get $sup))))
+  (local.set $prefix_len (struct.get $STRING 1 (global.get $str_super_prefix)))
+  (local.set $name_len (struct.get $STRING 1 (local.get $name)))
+  (local.set $total (i32.add (local.get $prefix_len) (local.get $name_len)))
+  (call $ensure_memory (local.get $total))
+  (local.set $off (global.get $string_heap))
+  (global.set $string_heap (i32.add (local.get $off) (local.get $total)))
+  (memory.copy (local.get $off)
+    (struct.get $STRING 0 (global.get $str_super_prefix)) (local.get $prefix_len))
+  (memory.copy (i32.add (local.get $off) (local.get $prefix_len))
+    (struct.get $STRING 0 (local.get $name)) (local.get $name_len))
+  (struct.new $STRING (local.get $off) (local.get $total) (i32.const 0))
 )
 
 
 ;; closure_type_to_string: convert CLOSURE func index to type string "<class 'typename'>"
+;; Returns the interned string from $builtin_class_strings (no allocation)
 (func $closure_type_to_string (param $idx i32) (result (ref $STRING))
-  (local $offset i32)
-  (local $prefix (ref $STRING))
-  (local $typename (ref $STRING))
-  (local $suffix (ref $STRING))
-  (local $result (ref $STRING))
-
-  ;; Initialize $typename with empty string as default
-  (local.set $typename (struct.new $STRING (i32.const 0) (i32.const 0)))
-
-  ;; Create "<class '" prefix (8 chars)
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 60))   ;; <
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 99))   ;; c
-  (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 108))  ;; l
-  (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 97))   ;; a
-  (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 115))  ;; s
-  (i32.store8 (i32.add (local.get $offset) (i32.const 5)) (i32.const 115))  ;; s
-  (i32.store8 (i32.add (local.get $offset) (i32.const 6)) (i32.const 32))   ;; space
-  (i32.store8 (i32.add (local.get $offset) (i32.const 7)) (i32.const 39))   ;; '
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 8)))
-  (local.set $prefix (struct.new $STRING (local.get $offset) (i32.const 8)))
-
-  ;; Get type name based on index
-  (local.set $offset (global.get $string_heap))
-  (if (i32.eq (local.get $idx) (i32.const 6))  ;; int
+  (local $cls_str (ref null $STRING))
+  (if (i32.lt_u (local.get $idx) (array.len (global.get $builtin_class_strings)))
     (then
-      (i32.store8 (local.get $offset) (i32.const 105))  ;; i
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 110))  ;; n
-      (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 116))  ;; t
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 3)))
-      (local.set $typename (struct.new $STRING (local.get $offset) (i32.const 3)))
+      (local.set $cls_str (array.get $ARRAY_STRING (global.get $builtin_class_strings) (local.get $idx)))
     )
   )
-  (if (i32.eq (local.get $idx) (i32.const 7))  ;; bool
-    (then
-      (i32.store8 (local.get $offset) (i32.const 98))   ;; b
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 111))  ;; o
-      (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 111))  ;; o
-      (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 108))  ;; l
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 4)))
-      (local.set $typename (struct.new $STRING (local.get $offset) (i32.const 4)))
-    )
+  (if (ref.is_null (local.get $cls_str))
+    (then (return (global.get $str_empty)))
   )
-  (if (i32.eq (local.get $idx) (i32.const 8))  ;; str
-    (then
-      (i32.store8 (local.get $offset) (i32.const 115))  ;; s
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 116))  ;; t
-      (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 114))  ;; r
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 3)))
-      (local.set $typename (struct.new $STRING (local.get $offset) (i32.const 3)))
-    )
-  )
-  (if (i32.eq (local.get $idx) (i32.const 11))  ;; float
-    (then
-      (i32.store8 (local.get $offset) (i32.const 102))  ;; f
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 108))  ;; l
-      (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 111))  ;; o
-      (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 97))   ;; a
-      (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 116))  ;; t
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 5)))
-      (local.set $typename (struct.new $STRING (local.get $offset) (i32.const 5)))
-    )
-  )
-  (if (i32.eq (local.get $idx) (i32.const 13))  ;; list
-    (then
-      (i32.store8 (local.get $offset) (i32.const 108))  ;; l
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 105))  ;; i
-      (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 115))  ;; s
-      (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 116))  ;; t
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 4)))
-      (local.set $typename (struct.new $STRING (local.get $offset) (i32.const 4)))
-    )
-  )
-  (if (i32.eq (local.get $idx) (i32.const 18))  ;; dict
-    (then
-      (i32.store8 (local.get $offset) (i32.const 100))  ;; d
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 105))  ;; i
-      (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 99))   ;; c
-      (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 116))  ;; t
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 4)))
-      (local.set $typename (struct.new $STRING (local.get $offset) (i32.const 4)))
-    )
-  )
-  (if (i32.eq (local.get $idx) (i32.const 19))  ;; tuple
-    (then
-      (i32.store8 (local.get $offset) (i32.const 116))  ;; t
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 117))  ;; u
-      (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 112))  ;; p
-      (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 108))  ;; l
-      (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 101))  ;; e
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 5)))
-      (local.set $typename (struct.new $STRING (local.get $offset) (i32.const 5)))
-    )
-  )
-  (if (i32.eq (local.get $idx) (i32.const 30))  ;; bytes
-    (then
-      (i32.store8 (local.get $offset) (i32.const 98))   ;; b
-      (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 121))  ;; y
-      (i32.store8 (i32.add (local.get $offset) (i32.const 2)) (i32.const 116))  ;; t
-      (i32.store8 (i32.add (local.get $offset) (i32.const 3)) (i32.const 101))  ;; e
-      (i32.store8 (i32.add (local.get $offset) (i32.const 4)) (i32.const 115))  ;; s
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 5)))
-      (local.set $typename (struct.new $STRING (local.get $offset) (i32.const 5)))
-    )
-  )
-
-  ;; Create "'>" suffix (2 chars)
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 39))   ;; '
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 62))   ;; >
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 2)))
-  (local.set $suffix (struct.new $STRING (local.get $offset) (i32.const 2)))
-
-  ;; Concatenate: "<class '" + typename + "'>"
-  (local.set $result (call $string_concat (local.get $prefix) (local.get $typename)))
-  (call $string_concat (local.get $result) (local.get $suffix))
+  (ref.as_non_null (local.get $cls_str))
 )
 
 
 ;; value_to_string_repr: convert value to string with repr-style quoting for strings
 (func $value_to_string_repr (param $v (ref null eq)) (result (ref $STRING))
-  (local $offset i32)
   ;; For strings, add quotes
   (if (ref.test (ref $STRING) (local.get $v))
     (then
@@ -838,20 +813,13 @@ STRINGS_CODE = """
 
 ;; float_to_string_precision: convert float to string with specified precision
 (func $float_to_string_precision (param $v (ref null eq)) (param $precision i32) (result (ref $STRING))
-  (local $offset i32)
-  (local $len i32)
   (if (ref.is_null (local.get $v))
-    (then (return (struct.new $STRING (i32.const 0) (i32.const 0))))
+    (then (return (global.get $str_empty)))
   )
   (if (ref.test (ref $FLOAT) (local.get $v))
     (then
-      (local.set $offset (global.get $string_heap))
-      (local.set $len (call $f64_format_precision
-        (struct.get $FLOAT 0 (ref.cast (ref $FLOAT) (local.get $v)))
-        (local.get $precision)
-        (local.get $offset)))
-      (global.set $string_heap (i32.add (local.get $offset) (local.get $len)))
-      (return (struct.new $STRING (local.get $offset) (local.get $len)))
+      (return_call $f64_format_precision_str
+        (struct.get $FLOAT 0 (ref.cast (ref $FLOAT) (local.get $v))) (local.get $precision))
     )
   )
   ;; Not a float - use regular value_to_string
@@ -860,32 +828,24 @@ STRINGS_CODE = """
 
 
 ;; format_precision: format value with specified decimal precision
-;; Handles both floats (uses precision) and integers (ignores precision for now)
+;; Floats use the precision; integers are formatted as floats, like Python
 (func $format_precision (param $v (ref null eq)) (param $precision i32) (result (ref $STRING))
-  (local $offset i32)
-  (local $len i32)
-  ;; For floats, use the precision
   (if (ref.test (ref $FLOAT) (local.get $v))
     (then
-      (local.set $offset (global.get $string_heap))
-      (local.set $len (call $f64_format_precision
-        (struct.get $FLOAT 0 (ref.cast (ref $FLOAT) (local.get $v)))
-        (local.get $precision)
-        (local.get $offset)))
-      (global.set $string_heap (i32.add (local.get $offset) (local.get $len)))
-      (return (struct.new $STRING (local.get $offset) (local.get $len)))
+      (return_call $f64_format_precision_str
+        (struct.get $FLOAT 0 (ref.cast (ref $FLOAT) (local.get $v))) (local.get $precision))
     )
   )
-  ;; For integers with precision, treat as float
   (if (ref.test (ref i31) (local.get $v))
     (then
-      (local.set $offset (global.get $string_heap))
-      (local.set $len (call $f64_format_precision
-        (f64.convert_i32_s (i31.get_s (ref.cast (ref i31) (local.get $v))))
-        (local.get $precision)
-        (local.get $offset)))
-      (global.set $string_heap (i32.add (local.get $offset) (local.get $len)))
-      (return (struct.new $STRING (local.get $offset) (local.get $len)))
+      (return_call $f64_format_precision_str
+        (f64.convert_i32_s (i31.get_s (ref.cast (ref i31) (local.get $v)))) (local.get $precision))
+    )
+  )
+  (if (ref.test (ref $INT64) (local.get $v))
+    (then
+      (return_call $f64_format_precision_str
+        (f64.convert_i64_s (struct.get $INT64 0 (ref.cast (ref $INT64) (local.get $v)))) (local.get $precision))
     )
   )
   ;; Default: use value_to_string
@@ -900,9 +860,8 @@ STRINGS_CODE = """
   (local $dst_off i32)
   (local $i i32)
   (local $j i32)
-  (local $digit_count i32)
-  (local $char i32)
-  (local $neg i32)
+  (local $src_end i32)
+  (local $dst_end i32)
   (local $decimal_pos i32)
   (local $integer_len i32)
   (local $result_len i32)
@@ -916,25 +875,19 @@ STRINGS_CODE = """
     (then (return (local.get $s)))
   )
 
-  ;; Check for negative sign
-  (local.set $neg (i32.const 0))
-  (local.set $i (i32.const 0))
-  (if (i32.eq (i32.load8_u (local.get $src_off)) (i32.const 45))  ;; '-'
-    (then
-      (local.set $neg (i32.const 1))
-      (local.set $i (i32.const 1))
-    )
-  )
+  ;; Skip a negative sign (it is copied along with the leading group)
+  (local.set $i (i32.eq (i32.load8_u (local.get $src_off)) (i32.const 45)))  ;; '-'
 
   ;; Find decimal point (if any)
   (local.set $decimal_pos (local.get $src_len))  ;; default: no decimal
-  (local.set $j (local.get $i))
+  (local.set $j (i32.add (local.get $src_off) (local.get $i)))
+  (local.set $src_end (i32.add (local.get $src_off) (local.get $src_len)))
   (block $found
     (loop $find_dec
-      (br_if $found (i32.ge_u (local.get $j) (local.get $src_len)))
-      (if (i32.eq (i32.load8_u (i32.add (local.get $src_off) (local.get $j))) (i32.const 46))  ;; '.'
+      (br_if $found (i32.ge_u (local.get $j) (local.get $src_end)))
+      (if (i32.eq (i32.load8_u (local.get $j)) (i32.const 46))  ;; '.'
         (then
-          (local.set $decimal_pos (local.get $j))
+          (local.set $decimal_pos (i32.sub (local.get $j) (local.get $src_off)))
           (br $found)
         )
       )
@@ -947,72 +900,42 @@ STRINGS_CODE = """
   (local.set $integer_len (i32.sub (local.get $decimal_pos) (local.get $i)))
 
   ;; If integer part is 3 or less digits, no commas needed
-  (if (i32.le_s (local.get $integer_len) (i32.const 3))
-    (then (return (local.get $s)))
-  )
-
-  ;; Calculate number of commas needed
-  (local.set $num_commas (i32.div_u (i32.sub (local.get $integer_len) (i32.const 1)) (i32.const 3)))
-
-  ;; Allocate new string
-  (local.set $result_len (i32.add (local.get $src_len) (local.get $num_commas)))
-  (local.set $dst_off (global.get $string_heap))
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $result_len)))
-
-  ;; Copy negative sign if present
-  (local.set $j (i32.const 0))
-  (if (local.get $neg)
-    (then
-      (i32.store8 (local.get $dst_off) (i32.const 45))
-      (local.set $j (i32.const 1))
-    )
-  )
-
-  ;; Copy integer part with commas
-  ;; First group may be 1, 2, or 3 digits
-  (local.set $digit_count (i32.rem_u (local.get $integer_len) (i32.const 3)))
-  (if (i32.eqz (local.get $digit_count))
-    (then (local.set $digit_count (i32.const 3)))
-  )
-
-  ;; Copy first group
-  (block $int_done
-    (loop $int_loop
-      (br_if $int_done (i32.ge_u (local.get $i) (local.get $decimal_pos)))
-      ;; Copy digit
-      (local.set $char (i32.load8_u (i32.add (local.get $src_off) (local.get $i))))
-      (i32.store8 (i32.add (local.get $dst_off) (local.get $j)) (local.get $char))
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
-      (local.set $j (i32.add (local.get $j) (i32.const 1)))
-      (local.set $digit_count (i32.sub (local.get $digit_count) (i32.const 1)))
-
-      ;; If digit_count is 0 and more digits remain, add comma
-      (if (i32.and
-            (i32.eqz (local.get $digit_count))
-            (i32.lt_u (local.get $i) (local.get $decimal_pos)))
-        (then
-          (i32.store8 (i32.add (local.get $dst_off) (local.get $j)) (i32.const 44))  ;; ','
-          (local.set $j (i32.add (local.get $j) (i32.const 1)))
-          (local.set $digit_count (i32.const 3))
-        )
-      )
-      (br $int_loop)
-    )
+  (if (i32.le_s (local.get $integer_len) (i32.const 3))
+    (then (return (local.get $s)))
   )
 
-  ;; Copy decimal part if present
-  (block $dec_done
-    (loop $dec_loop
-      (br_if $dec_done (i32.ge_u (local.get $i) (local.get $src_len)))
-      (local.set $char (i32.load8_u (i32.add (local.get $src_off) (local.get $i))))
-      (i32.store8 (i32.add (local.get $dst_off) (local.get $j)) (local.get $char))
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
-      (local.set $j (i32.add (local.get $j) (i32.const 1)))
-      (br $dec_loop)
+  ;; Calculate number of commas needed
+  (local.set $num_commas (i32.div_u (i32.sub (local.get $integer_len) (i32.const 1)) (i32.const 3)))
+
+  ;; Allocate new string
+  (local.set $result_len (i32.add (local.get $src_len) (local.get $num_commas)))
+  (call $ensure_memory (local.get $result_len))
+  (local.set $dst_off (global.get $string_heap))
+  (global.set $string_heap (i32.add (local.get $dst_off) (local.get $result_len)))
+
+  ;; Fill right to left: the decimal tail first, then one store per group
+  ;; that writes a comma and three digits together
+  (local.set $src_end (i32.add (local.get $src_off) (local.get $decimal_pos)))
+  (local.set $dst_end (i32.add (local.get $dst_off) (i32.add (local.get $decimal_pos) (local.get $num_commas))))
+  (memory.copy (local.get $dst_end) (local.get $src_end) (i32.sub (local.get $src_len) (local.get $decimal_pos)))
+  (local.set $i (i32.add (local.get $src_off) (local.get $i)))  ;; first digit
+  (block $groups_done
+    (loop $groups
+      (br_if $groups_done (i32.le_u (i32.sub (local.get $src_end) (local.get $i)) (i32.const 3)))
+      (local.set $src_end (i32.sub (local.get $src_end) (i32.const 3)))
+      (local.set $dst_end (i32.sub (local.get $dst_end) (i32.const 4)))
+      ;; The byte before the group is another digit; replace it with ','
+      (i32.store (local.get $dst_end)
+        (i32.or
+          (i32.and (i32.load (i32.sub (local.get $src_end) (i32.const 1))) (i32.const 0xFFFFFF00))
+          (i32.const 44)))
+      (br $groups)
     )
   )
+  ;; Sign and leading group (1-3 digits) are already in order
+  (memory.copy (local.get $dst_off) (local.get $src_off) (i32.sub (local.get $src_end) (local.get $src_off)))
 
-  (struct.new $STRING (local.get $dst_off) (local.get $result_len))
+  (struct.new $STRING (local.get $dst_off) (local.get $result_len) (i32.const 0))
 )
 
 
@@ -1025,7 +948,6 @@ STRINGS_CODE = """
   (local $pad_total i32)
   (local $pad_left i32)
   (local $pad_right i32)
-  (local $i i32)
 
   (local.set $src_off (struct.get $STRING 0 (local.get $s)))
   (local.set $src_len (struct.get $STRING 1 (local.get $s)))
@@ -1038,68 +960,29 @@ STRINGS_CODE = """
   ;; Calculate padding
   (local.set $pad_total (i32.sub (local.get $width) (local.get $src_len)))
 
-  ;; Calculate left and right padding based on alignment
-  (if (i32.eq (local.get $align) (i32.const 0))  ;; right align
-    (then
-      (local.set $pad_left (local.get $pad_total))
-      (local.set $pad_right (i32.const 0))
-    )
-    (else
-      (if (i32.eq (local.get $align) (i32.const 1))  ;; left align
-        (then
-          (local.set $pad_left (i32.const 0))
-          (local.set $pad_right (local.get $pad_total))
-        )
-        (else  ;; center align
-          (local.set $pad_left (i32.div_u (local.get $pad_total) (i32.const 2)))
-          (local.set $pad_right (i32.sub (local.get $pad_total) (local.get $pad_left)))
-        )
-      )
-    )
-  )
+  ;; Left padding by alignment (0=right: all, 1=left: none, 2=center: half,
+  ;; rounded down); the rest goes on the right
+  (local.set $pad_left
+    (select
+      (i32.shr_u (local.get $pad_total) (i32.const 1))
+      (select (i32.const 0) (local.get $pad_total) (i32.eq (local.get $align) (i32.const 1)))
+      (i32.eq (local.get $align) (i32.const 2))))
+  (local.set $pad_right (i32.sub (local.get $pad_total) (local.get $pad_left)))
 
   ;; Allocate new string
+  (call $ensure_memory (local.get $width))
   (local.set $dst_off (global.get $string_heap))
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $width)))
-
-  ;; Write left padding
-  (local.set $i (i32.const 0))
-  (block $left_done
-    (loop $left_loop
-      (br_if $left_done (i32.ge_u (local.get $i) (local.get $pad_left)))
-      (i32.store8 (i32.add (local.get $dst_off) (local.get $i)) (local.get $fill))
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
-      (br $left_loop)
-    )
-  )
-
-  ;; Copy source string
-  (local.set $i (i32.const 0))
-  (block $copy_done
-    (loop $copy_loop
-      (br_if $copy_done (i32.ge_u (local.get $i) (local.get $src_len)))
-      (i32.store8
-        (i32.add (local.get $dst_off) (i32.add (local.get $pad_left) (local.get $i)))
-        (i32.load8_u (i32.add (local.get $src_off) (local.get $i))))
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
-      (br $copy_loop)
-    )
-  )
+  (global.set $string_heap (i32.add (local.get $dst_off) (local.get $width)))
 
-  ;; Write right padding
-  (local.set $i (i32.const 0))
-  (block $right_done
-    (loop $right_loop
-      (br_if $right_done (i32.ge_u (local.get $i) (local.get $pad_right)))
-      (i32.store8
-        (i32.add (local.get $dst_off) (i32.add (i32.add (local.get $pad_left) (local.get $src_len)) (local.get $i)))
-        (local.get $fill))
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
-      (br $right_loop)
-    )
-  )
+  ;; Left padding, source string, right padding
+  (memory.fill (local.get $dst_off) (local.get $fill) (local.get $pad_left))
+  (memory.copy (i32.add (local.get $dst_off) (local.get $pad_left)) (local.get $src_off) (local.get $src_len))
+  (memory.fill
+    (i32.add (local.get $dst_off) (i32.add (local.get $pad_left) (local.get $src_len)))
+    (local.get $fill)
+    (local.get $pad_right))
 
-  (struct.new $STRING (local.get $dst_off) (local.get $width))
+  (struct.new $STRING (local.get $dst_off) (local.get $width) (i32.const 0))
 )
 
 
@@ -1109,30 +992,20 @@ STRINGS_CODE = """
   (local $len i32)
   (local $new_off i32)
   (local $new_len i32)
-  (local $i i32)
   (local.set $off (struct.get $STRING 0 (local.get $s)))
   (local.set $len (struct.get $STRING 1 (local.get $s)))
   ;; New length = original + 2 (for quotes)
   (local.set $new_len (i32.add (local.get $len) (i32.const 2)))
+  (call $ensure_memory (local.get $new_len))
   (local.set $new_off (global.get $string_heap))
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $new_len)))
+  (global.set $string_heap (i32.add (local.get $new_off) (local.get $new_len)))
   ;; Write opening quote
   (i32.store8 (local.get $new_off) (i32.const 39))  ;; '
   ;; Copy original string
-  (local.set $i (i32.const 0))
-  (block $done
-    (loop $loop
-      (br_if $done (i32.ge_u (local.get $i) (local.get $len)))
-      (i32.store8
-        (i32.add (i32.add (local.get $new_off) (i32.const 1)) (local.get $i))
-        (i32.load8_u (i32.add (local.get $off) (local.get $i))))
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
-      (br $loop)
-    )
-  )
+  (memory.copy (i32.add (local.get $new_off) (i32.const 1)) (local.get $off) (local.get $len))
   ;; Write closing quote
   (i32.store8 (i32.add (local.get $new_off) (i32.add (local.get $len) (i32.const 1))) (i32.const 39))  ;; '
-  (struct.new $STRING (local.get $new_off) (local.get $new_len))
+  (struct.new $STRING (local.get $new_off) (local.get $new_len) (i32.const 0))
 )
 
 
@@ -1144,17 +1017,29 @@ STRINGS_CODE = """
   (local $b_len i32)
   (local $new_off i32)
   (local $new_len i32)
+  (local $heap i32)
   (local.set $a_off (struct.get $STRING 0 (local.get $a)))
   (local.set $a_len (struct.get $STRING 1 (local.get $a)))
   (local.set $b_off (struct.get $STRING 0 (local.get $b)))
   (local.set $b_len (struct.get $STRING 1 (local.get $b)))
   ;; Calculate new length
   (local.set $new_len (i32.add (local.get $a_len) (local.get $b_len)))
+  (local.set $heap (global.get $string_heap))
+  ;; If a ends at the top of the string heap, extend it in place: only b
+  ;; is copied. Strings are immutable views, so a itself keeps its length.
+  (if (i32.eq (i32.add (local.get $a_off) (local.get $a_len)) (local.get $heap))
+    (then
+      (call $ensure_memory (local.get $b_len))
+      (memory.copy (local.get $heap) (local.get $b_off) (local.get $b_len))
+      (global.set $string_heap (i32.add (local.get $heap) (local.get $b_len)))
+      (return (struct.new $STRING (local.get $a_off) (local.get $new_len) (i32.const 0)))
+    )
+  )
   ;; Ensure we have enough memory before allocating
   (call $ensure_memory (local.get $new_len))
   ;; Allocate space on the string heap
-  (local.set $new_off (global.get $string_heap))
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $new_len)))
+  (local.set $new_off (local.get $heap))
+  (global.set $string_heap (i32.add (local.get $new_off) (local.get $new_len)))
   ;; Copy first string using memory.copy (much faster than byte-by-byte)
   (memory.copy (local.get $new_off) (local.get $a_off) (local.get $a_len))
   ;; Copy second string
@@ -1163,62 +1048,113 @@ STRINGS_CODE = """
     (local.get $b_off)
     (local.get $b_len))
   ;; Return new STRING struct
-  (struct.new $STRING (local.get $new_off) (local.get $new_len))
+  (struct.new $STRING (local.get $new_off) (local.get $new_len) (i32.const 0))
 )
 
 
 ;; string_contains: check if needle is in haystack
 (func $string_contains (param $haystack (ref $STRING)) (param $needle (ref $STRING)) (result i32)
-  (local $h_off i32)
-  (local $h_len i32)
-  (local $n_off i32)
-  (local $n_len i32)
-  (local $i i32)
-  (local $j i32)
-  (local $match i32)
-  (local.set $h_off (struct.get $STRING 0 (local.get $haystack)))
-  (local.set $h_len (struct.get $STRING 1 (local.get $haystack)))
-  (local.set $n_off (struct.get $STRING 0 (local.get $needle)))
-  (local.set $n_len (struct.get $STRING 1 (local.get $needle)))
-  ;; Empty needle is always found
-  (if (i32.eqz (local.get $n_len))
-    (then (return (i32.const 1)))
-  )
-  ;; If needle is longer than haystack, not found
-  (if (i32.gt_u (local.get $n_len) (local.get $h_len))
-    (then (return (i32.const 0)))
-  )
-  ;; Search for needle
-  (local.set $i (i32.const 0))
-  (block $not_found
-    (loop $search
-      (br_if $not_found (i32.gt_u (i32.add (local.get $i) (local.get $n_len)) (local.get $h_len)))
-      ;; Check if needle matches at position i
-      (local.set $match (i32.const 1))
-      (local.set $j (i32.const 0))
-      (block $no_match
-        (loop $compare
-          (br_if $no_match (i32.ge_u (local.get $j) (local.get $n_len)))
-          (if (i32.ne
-                (i32.load8_u (i32.add (local.get $h_off) (i32.add (local.get $i) (local.get $j))))
-                (i32.load8_u (i32.add (local.get $n_off) (local.get $j))))
-            (then
-              (local.set $match (i32.const 0))
-              (br $no_match)
-            )
-          )
-          (local.set $j (i32.add (local.get $j) (i32.const 1)))
-          (br $compare)
+  (i32.ge_s
+    (call $string_index_of
+      (struct.get $STRING 0 (local.get $haystack)) (struct.get $STRING 1 (local.get $haystack))
+      (struct.get $STRING 0 (local.get $needle)) (struct.get $STRING 1 (local.get $needle)))
+    (i32.const 0))
+)
+
+
+;; bytes_equal: compare $len bytes at $a and $b, a word at a time. Short
+;; lengths compare their first and last 2 or 4 bytes (overlapping), and the
+;; word loop ends with the last 8 bytes, so no byte loop and no read past
+;; either span is needed.
+(func $bytes_equal (param $a i32) (param $b i32) (param $len i32) (result i32)
+  (local $a_last i32)
+  (local $b_last i32)
+  (if (i32.lt_u (local.get $len) (i32.const 8))
+    (then
+      (if (i32.ge_u (local.get $len) (i32.const 4))
+        (then
+          (return (i32.and
+            (i32.eq (i32.load (local.get $a)) (i32.load (local.get $b)))
+            (i32.eq
+              (i32.load (i32.sub (i32.add (local.get $a) (local.get $len)) (i32.const 4)))
+              (i32.load (i32.sub (i32.add (local.get $b) (local.get $len)) (i32.const 4))))))
         )
       )
-      (if (local.get $match)
-        (then (return (i32.const 1)))
+      (if (i32.ge_u (local.get $len) (i32.const 2))
+        (then
+          (return (i32.and
+            (i32.eq (i32.load16_u (local.get $a)) (i32.load16_u (local.get $b)))
+            (i32.eq
+              (i32.load16_u (i32.sub (i32.add (local.get $a) (local.get $len)) (i32.const 2)))
+              (i32.load16_u (i32.sub (i32.add (local.get $b) (local.get $len)) (i32.const 2))))))
+        )
       )
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
-      (br $search)
+      (if (local.get $len)
+        (then (return (i32.eq (i32.load8_u (local.get $a)) (i32.load8_u (local.get $b)))))
+      )
+      (return (i32.const 1))
     )
   )
-  (i32.const 0)
+  (local.set $a_last (i32.sub (i32.add (local.get $a) (local.get $len)) (i32.const 8)))
+  (local.set $b_last (i32.sub (i32.add (local.get $b) (local.get $len)) (i32.const 8)))
+  (block $words_done
+    (loop $words
+      (br_if $words_done (i32.ge_u (local.get $a) (local.get $a_last)))
+      (if (i64.ne (i64.load (local.get $a)) (i64.load (local.get $b)))
+        (then (return (i32.const 0)))
+      )
+      (local.set $a (i32.add (local.get $a) (i32.const 8)))
+      (local.set $b (i32.add (local.get $b) (i32.const 8)))
+      (br $words)
+    )
+  )
+  (i64.eq (i64.load (local.get $a_last)) (i64.load (local.get $b_last)))
+)
+
+
+;; ascii_range_mask64: 0x80 in each byte of $w that lies in [$lo, $hi], else 0.
+;; The high bit is cleared before adding the per-byte biases, so no sum
+;; carries into the next byte; bytes >= 0x80 (UTF-8) never match.
+(func $ascii_range_mask64 (param $w i64) (param $lo i32) (param $hi i32) (result i64)
+  (local $x i64)
+  (local.set $x (i64.and (local.get $w) (i64.const 0x7F7F7F7F7F7F7F7F)))
+  (i64.and
+    (i64.and
+      ;; x >= lo
+      (i64.add (local.get $x) (i64.mul (i64.extend_i32_u (i32.sub (i32.const 0x80) (local.get $lo)))
+                                       (i64.const 0x0101010101010101)))
+      ;; not x > hi
+      (i64.xor
+        (i64.add (local.get $x) (i64.mul (i64.extend_i32_u (i32.sub (i32.const 0x7F) (local.get $hi)))
+                                         (i64.const 0x0101010101010101)))
+        (i64.const -1)))
+    (i64.and (i64.xor (local.get $w) (i64.const -1)) (i64.const 0x8080808080808080)))
+)
+
+
+;; zero_bytes64: 0x80 in each byte of $v that is zero, else 0 (exact, no
+;; borrow between bytes, so the mask can be scanned from either end)
+(func $zero_bytes64 (param $v i64) (result i64)
+  (i64.and
+    (i64.xor
+      (i64.or
+        (i64.add (i64.and (local.get $v) (i64.const 0x7F7F7F7F7F7F7F7F)) (i64.const 0x7F7F7F7F7F7F7F7F))
+        (local.get $v))
+      (i64.const -1))
+    (i64.const 0x8080808080808080))
+)
+
+
+;; ascii_space_mask64: 0x80 in each byte of $w that strip() removes
+;; (space, tab, newline, carriage return), else 0
+(func $ascii_space_mask64 (param $w i64) (result i64)
+  (i64.or
+    (i64.or
+      (call $zero_bytes64 (i64.xor (local.get $w) (i64.const 0x2020202020202020)))
+      (call $zero_bytes64 (i64.xor (local.get $w) (i64.const 0x0909090909090909))))
+    (i64.or
+      (call $zero_bytes64 (i64.xor (local.get $w) (i64.const 0x0A0A0A0A0A0A0A0A)))
+      (call $zero_bytes64 (i64.xor (local.get $w) (i64.const 0x0D0D0D0D0D0D0D0D)))))
 )
 
 
@@ -1228,8 +1164,11 @@ STRINGS_CODE = """
   (local $src_off i32)
   (local $src_len i32)
   (local $dst_off i32)
-  (local $i i32)
+  (local $sp i32)
+  (local $dp i32)
+  (local $end i32)
   (local $c i32)
+  (local $w i64)
 
   (if (ref.is_null (local.get $s))
     (then (return (ref.null eq)))
@@ -1239,26 +1178,43 @@ STRINGS_CODE = """
   (local.set $src_len (struct.get $STRING 1 (local.get $str)))
 
   ;; Allocate new string in heap
+  (call $ensure_memory (local.get $src_len))
   (local.set $dst_off (global.get $string_heap))
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $src_len)))
+  (global.set $string_heap (i32.add (local.get $dst_off) (local.get $src_len)))
 
   ;; Copy and convert
-  (local.set $i (i32.const 0))
+  (local.set $sp (local.get $src_off))
+  (local.set $dp (local.get $dst_off))
+  (local.set $end (i32.add (local.get $src_off) (local.get $src_len)))
+  ;; Eight bytes at a time: flip bit 5 (0x80 >> 2) of every byte in a-z
+  (block $words_done
+    (loop $words
+      (br_if $words_done (i32.gt_u (i32.add (local.get $sp) (i32.const 8)) (local.get $end)))
+      (local.set $w (i64.load (local.get $sp)))
+      (i64.store (local.get $dp)
+        (i64.xor (local.get $w) (i64.shr_u (call $ascii_range_mask64 (local.get $w) (i32.const 97) (i32.const 122)) (i64.const 2))))
+      (local.set $sp (i32.add (local.get $sp) (i32.const 8)))
+      (local.set $dp (i32.add (local.get $dp) (i32.const 8)))
+      (br $words)
+    )
+  )
+  ;; Remaining bytes
   (block $done
     (loop $loop
-      (br_if $done (i32.ge_u (local.get $i) (local.get $src_len)))
-      (local.set $c (i32.load8_u (i32.add (local.get $src_off) (local.get $i))))
+      (br_if $done (i32.ge_u (local.get $sp) (local.get $end)))
+      (local.set $c (i32.load8_u (local.get $sp)))
       ;; Convert lowercase a-z to uppercase A-Z
       (if (i32.and (i32.ge_u (local.get $c) (i32.const 97))
                    (i32.le_u (local.get $c) (i32.const 122)))
         (then (local.set $c (i32.sub (local.get $c) (i32.const 32))))
       )
-      (i32.store8 (i32.add (local.get $dst_off) (local.get $i)) (local.get $c))
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (i32.store8 (local.get $dp) (local.get $c))
+      (local.set $sp (i32.add (local.get $sp) (i32.const 1)))
+      (local.set $dp (i32.add (local.get $dp) (i32.const 1)))
       (br $loop)
     )
   )
-  (struct.new $STRING (local.get $dst_off) (local.get $src_len))
+  (struct.new $STRING (local.get $dst_off) (local.get $src_len) (i32.const 0))
 )
 
 
@@ -1268,8 +1224,11 @@ STRINGS_CODE = """
   (local $src_off i32)
   (local $src_len i32)
   (local $dst_off i32)
-  (local $i i32)
+  (local $sp i32)
+  (local $dp i32)
+  (local $end i32)
   (local $c i32)
+  (local $w i64)
 
   (if (ref.is_null (local.get $s))
     (then (return (ref.null eq)))
@@ -1279,26 +1238,43 @@ STRINGS_CODE = """
   (local.set $src_len (struct.get $STRING 1 (local.get $str)))
 
   ;; Allocate new string in heap
+  (call $ensure_memory (local.get $src_len))
   (local.set $dst_off (global.get $string_heap))
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $src_len)))
+  (global.set $string_heap (i32.add (local.get $dst_off) (local.get $src_len)))
 
   ;; Copy and convert
-  (local.set $i (i32.const 0))
+  (local.set $sp (local.get $src_off))
+  (local.set $dp (local.get $dst_off))
+  (local.set $end (i32.add (local.get $src_off) (local.get $src_len)))
+  ;; Eight bytes at a time: flip bit 5 (0x80 >> 2) of every byte in A-Z
+  (block $words_done
+    (loop $words
+      (br_if $words_done (i32.gt_u (i32.add (local.get $sp) (i32.const 8)) (local.get $end)))
+      (local.set $w (i64.load (local.get $sp)))
+      (i64.store (local.get $dp)
+        (i64.xor (local.get $w) (i64.shr_u (call $ascii_range_mask64 (local.get $w) (i32.const 65) (i32.const 90)) (i64.const 2))))
+      (local.set $sp (i32.add (local.get $sp) (i32.const 8)))
+      (local.set $dp (i32.add (local.get $dp) (i32.const 8)))
+      (br $words)
+    )
+  )
+  ;; Remaining bytes
   (block $done
     (loop $loop
-      (br_if $done (i32.ge_u (local.get $i) (local.get $src_len)))
-      (local.set $c (i32.load8_u (i32.add (local.get $src_off) (local.get $i))))
+      (br_if $done (i32.ge_u (local.get $sp) (local.get $end)))
+      (local.set $c (i32.load8_u (local.get $sp)))
       ;; Convert uppercase A-Z to lowercase a-z
       (if (i32.and (i32.ge_u (local.get $c) (i32.const 65))
                    (i32.le_u (local.get $c) (i32.const 90)))
         (then (local.set $c (i32.add (local.get $c) (i32.const 32))))
       )
-      (i32.store8 (i32.add (local.get $dst_off) (local.get $i)) (local.get $c))
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (i32.store8 (local.get $dp) (local.get $c))
+      (local.set $sp (i32.add (local.get $sp) (i32.const 1)))
+      (local.set $dp (i32.add (local.get $dp) (i32.const 1)))
       (br $loop)
     )
   )
-  (struct.new $STRING (local.get $dst_off) (local.get $src_len))
+  (struct.new $STRING (local.get $dst_off) (local.get $src_len) (i32.const 0))
 )
 
 
@@ -1308,8 +1284,11 @@ STRINGS_CODE = """
   (local $src_off i32)
   (local $src_len i32)
   (local $dst_off i32)
-  (local $i i32)
+  (local $sp i32)
+  (local $dp i32)
+  (local $end i32)
   (local $c i32)
+  (local $w i64)
 
   (if (ref.is_null (local.get $s))
     (then (return (ref.null eq)))
@@ -1322,34 +1301,72 @@ STRINGS_CODE = """
     (then (return (local.get $s)))
   )
 
-  ;; Allocate new string in heap
+  ;; Already capitalized (first byte not a-z, no A-Z after it): return a new
+  ;; view over the same bytes, since capitalize() never returns its receiver
+  (block $convert
+    (br_if $convert (i32.le_u (i32.sub (i32.load8_u (local.get $src_off)) (i32.const 97)) (i32.const 25)))
+    (local.set $sp (i32.add (local.get $src_off) (i32.const 1)))
+    (local.set $end (i32.add (local.get $src_off) (local.get $src_len)))
+    (block $words_done
+      (loop $words
+        (br_if $words_done (i32.gt_u (i32.add (local.get $sp) (i32.const 8)) (local.get $end)))
+        (br_if $convert (i32.eqz (i64.eqz
+          (call $ascii_range_mask64 (i64.load (local.get $sp)) (i32.const 65) (i32.const 90)))))
+        (local.set $sp (i32.add (local.get $sp) (i32.const 8)))
+        (br $words)
+      )
+    )
+    (block $tail_done
+      (loop $tail
+        (br_if $tail_done (i32.ge_u (local.get $sp) (local.get $end)))
+        (br_if $convert (i32.le_u (i32.sub (i32.load8_u (local.get $sp)) (i32.const 65)) (i32.const 25)))
+        (local.set $sp (i32.add (local.get $sp) (i32.const 1)))
+        (br $tail)
+      )
+    )
+    (return (struct.new $STRING (local.get $src_off) (local.get $src_len) (i32.const 0)))
+  )
+
+  ;; Allocate new string in heap and bulk-copy, then convert in place
+  (call $ensure_memory (local.get $src_len))
   (local.set $dst_off (global.get $string_heap))
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $src_len)))
+  (global.set $string_heap (i32.add (local.get $dst_off) (local.get $src_len)))
+  (memory.copy (local.get $dst_off) (local.get $src_off) (local.get $src_len))
 
   ;; First character: uppercase
-  (local.set $c (i32.load8_u (local.get $src_off)))
+  (local.set $c (i32.load8_u (local.get $dst_off)))
   (if (i32.and (i32.ge_u (local.get $c) (i32.const 97))
                (i32.le_u (local.get $c) (i32.const 122)))
-    (then (local.set $c (i32.sub (local.get $c) (i32.const 32))))
+    (then (i32.store8 (local.get $dst_off) (i32.sub (local.get $c) (i32.const 32))))
   )
-  (i32.store8 (local.get $dst_off) (local.get $c))
 
-  ;; Rest: lowercase
-  (local.set $i (i32.const 1))
+  ;; Rest: lowercase, eight bytes at a time
+  (local.set $dp (i32.add (local.get $dst_off) (i32.const 1)))
+  (local.set $end (i32.add (local.get $dst_off) (local.get $src_len)))
+  (block $words_done
+    (loop $words
+      (br_if $words_done (i32.gt_u (i32.add (local.get $dp) (i32.const 8)) (local.get $end)))
+      (local.set $w (i64.load (local.get $dp)))
+      (i64.store (local.get $dp)
+        (i64.xor (local.get $w) (i64.shr_u (call $ascii_range_mask64 (local.get $w) (i32.const 65) (i32.const 90)) (i64.const 2))))
+      (local.set $dp (i32.add (local.get $dp) (i32.const 8)))
+      (br $words)
+    )
+  )
+  ;; Remaining bytes
   (block $done
     (loop $loop
-      (br_if $done (i32.ge_u (local.get $i) (local.get $src_len)))
-      (local.set $c (i32.load8_u (i32.add (local.get $src_off) (local.get $i))))
+      (br_if $done (i32.ge_u (local.get $dp) (local.get $end)))
+      (local.set $c (i32.load8_u (local.get $dp)))
       (if (i32.and (i32.ge_u (local.get $c) (i32.const 65))
                    (i32.le_u (local.get $c) (i32.const 90)))
-        (then (local.set $c (i32.add (local.get $c) (i32.const 32))))
+        (then (i32.store8 (local.get $dp) (i32.add (local.get $c) (i32.const 32))))
       )
-      (i32.store8 (i32.add (local.get $dst_off) (local.get $i)) (local.get $c))
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (local.set $dp (i32.add (local.get $dp) (i32.const 1)))
       (br $loop)
     )
   )
-  (struct.new $STRING (local.get $dst_off) (local.get $src_len))
+  (struct.new $STRING (local.get $dst_off) (local.get $src_len) (i32.const 0))
 )
 
 
@@ -1359,9 +1376,12 @@ STRINGS_CODE = """
   (local $src_off i32)
   (local $src_len i32)
   (local $dst_off i32)
-  (local $i i32)
+  (local $dp i32)
+  (local $end i32)
   (local $c i32)
   (local $new_word i32)
+  (local $cls i32)
+  (local $table i32)
 
   (if (ref.is_null (local.get $s))
     (then (return (ref.null eq)))
@@ -1374,50 +1394,38 @@ STRINGS_CODE = """
     (then (return (local.get $s)))
   )
 
-  ;; Allocate new string in heap
+  ;; Allocate new string in heap and bulk-copy, then convert in place
+  (call $ensure_memory (local.get $src_len))
   (local.set $dst_off (global.get $string_heap))
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $src_len)))
-
+  (global.set $string_heap (i32.add (local.get $dst_off) (local.get $src_len)))
+  (memory.copy (local.get $dst_off) (local.get $src_off) (local.get $src_len))
+
+  ;; Words are runs of cased characters. $cls is the byte's case bits from
+  ;; $str_ascii_case_bits (0x80 for UTF-8 bytes: cased, never converted);
+  ;; shifting right by $new_word turns "is lowercase" into the 0x20 flip
+  ;; at a word start and "is uppercase" into it elsewhere.
+  (local.set $table (struct.get $STRING 0 (global.get $str_ascii_case_bits)))
   (local.set $new_word (i32.const 1))  ;; Start of string = new word
-  (local.set $i (i32.const 0))
+  (local.set $dp (local.get $dst_off))
+  (local.set $end (i32.add (local.get $dst_off) (local.get $src_len)))
   (block $done
     (loop $loop
-      (br_if $done (i32.ge_u (local.get $i) (local.get $src_len)))
-      (local.set $c (i32.load8_u (i32.add (local.get $src_off) (local.get $i))))
-
-      ;; Check if whitespace (space, tab, newline)
-      (if (i32.or (i32.eq (local.get $c) (i32.const 32))
-            (i32.or (i32.eq (local.get $c) (i32.const 9))
-                    (i32.eq (local.get $c) (i32.const 10))))
-        (then
-          (local.set $new_word (i32.const 1))
-        )
-        (else
-          (if (local.get $new_word)
-            (then
-              ;; Uppercase
-              (if (i32.and (i32.ge_u (local.get $c) (i32.const 97))
-                           (i32.le_u (local.get $c) (i32.const 122)))
-                (then (local.set $c (i32.sub (local.get $c) (i32.const 32))))
-              )
-              (local.set $new_word (i32.const 0))
-            )
-            (else
-              ;; Lowercase
-              (if (i32.and (i32.ge_u (local.get $c) (i32.const 65))
-                           (i32.le_u (local.get $c) (i32.const 90)))
-                (then (local.set $c (i32.add (local.get $c) (i32.const 32))))
-              )
-            )
-          )
-        )
-      )
-      (i32.store8 (i32.add (local.get $dst_off) (local.get $i)) (local.get $c))
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (br_if $done (i32.ge_u (local.get $dp) (local.get $end)))
+      (local.set $c (i32.load8_u (local.get $dp)))
+      (local.set $cls
+        (select
+          (i32.load8_u (i32.add (local.get $table) (i32.and (local.get $c) (i32.const 127))))
+          (i32.const 0x80)
+          (i32.lt_u (local.get $c) (i32.const 0x80))))
+      (i32.store8 (local.get $dp)
+        (i32.xor (local.get $c)
+          (i32.and (i32.shr_u (local.get $cls) (local.get $new_word)) (i32.const 0x20))))
+      (local.set $new_word (i32.eqz (local.get $cls)))
+      (local.set $dp (i32.add (local.get $dp) (i32.const 1)))
       (br $loop)
     )
   )
-  (struct.new $STRING (local.get $dst_off) (local.get $src_len))
+  (struct.new $STRING (local.get $dst_off) (local.get $src_len) (i32.const 0))
 )
 
 
@@ -1427,8 +1435,11 @@ STRINGS_CODE = """
   (local $src_off i32)
   (local $src_len i32)
   (local $dst_off i32)
-  (local $i i32)
+  (local $sp i32)
+  (local $dp i32)
+  (local $end i32)
   (local $c i32)
+  (local $w i64)
 
   (if (ref.is_null (local.get $s))
     (then (return (ref.null eq)))
@@ -1437,14 +1448,32 @@ STRINGS_CODE = """
   (local.set $src_off (struct.get $STRING 0 (local.get $str)))
   (local.set $src_len (struct.get $STRING 1 (local.get $str)))
 
+  (call $ensure_memory (local.get $src_len))
   (local.set $dst_off (global.get $string_heap))
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $src_len)))
-
-  (local.set $i (i32.const 0))
+  (global.set $string_heap (i32.add (local.get $dst_off) (local.get $src_len)))
+
+  (local.set $sp (local.get $src_off))
+  (local.set $dp (local.get $dst_off))
+  (local.set $end (i32.add (local.get $src_off) (local.get $src_len)))
+  ;; Eight bytes at a time: flip bit 5 (0x80 >> 2) of every ASCII letter
+  (block $words_done
+    (loop $words
+      (br_if $words_done (i32.gt_u (i32.add (local.get $sp) (i32.const 8)) (local.get $end)))
+      (local.set $w (i64.load (local.get $sp)))
+      (i64.store (local.get $dp)
+        (i64.xor (local.get $w) (i64.shr_u (i64.or
+          (call $ascii_range_mask64 (local.get $w) (i32.const 65) (i32.const 90))
+          (call $ascii_range_mask64 (local.get $w) (i32.const 97) (i32.const 122))) (i64.const 2))))
+      (local.set $sp (i32.add (local.get $sp) (i32.const 8)))
+      (local.set $dp (i32.add (local.get $dp) (i32.const 8)))
+      (br $words)
+    )
+  )
+  ;; Remaining bytes
   (block $done
     (loop $loop
-      (br_if $done (i32.ge_u (local.get $i) (local.get $src_len)))
-      (local.set $c (i32.load8_u (i32.add (local.get $src_off) (local.get $i))))
+      (br_if $done (i32.ge_u (local.get $sp) (local.get $end)))
+      (local.set $c (i32.load8_u (local.get $sp)))
       ;; If uppercase, make lowercase
       (if (i32.and (i32.ge_u (local.get $c) (i32.const 65))
                    (i32.le_u (local.get $c) (i32.const 90)))
@@ -1457,12 +1486,13 @@ STRINGS_CODE = """
           )
         )
       )
-      (i32.store8 (i32.add (local.get $dst_off) (local.get $i)) (local.get $c))
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (i32.store8 (local.get $dp) (local.get $c))
+      (local.set $sp (i32.add (local.get $sp) (i32.const 1)))
+      (local.set $dp (i32.add (local.get $dp) (i32.const 1)))
       (br $loop)
     )
   )
-  (struct.new $STRING (local.get $dst_off) (local.get $src_len))
+  (struct.new $STRING (local.get $dst_off) (local.get $src_len) (i32.const 0))
 )
 
 
@@ -1474,8 +1504,8 @@ STRINGS_CODE = """
   (local $start i32)
   (local $end i32)
   (local $c i32)
-  (local $dst_off i32)
   (local $new_len i32)
+  (local $text i64)
 
   (if (ref.is_null (local.get $s))
     (then (return (ref.null eq)))
@@ -1484,8 +1514,27 @@ STRINGS_CODE = """
   (local.set $off (struct.get $STRING 0 (local.get $str)))
   (local.set $len (struct.get $STRING 1 (local.get $str)))
 
-  ;; Find start (first non-whitespace)
+  ;; Find start (first non-whitespace), eight bytes at a time while the
+  ;; words are all whitespace; $text marks the non-whitespace bytes
   (local.set $start (i32.const 0))
+  (block $words_done
+    (loop $words
+      (br_if $words_done (i32.gt_u (i32.add (local.get $start) (i32.const 8)) (local.get $len)))
+      (local.set $text (i64.xor
+        (call $ascii_space_mask64 (i64.load (i32.add (local.get $off) (local.get $start))))
+        (i64.const 0x8080808080808080)))
+      (if (i64.ne (local.get $text) (i64.const 0))
+        (then
+          ;; Lowest marked byte is the first non-whitespace (little endian)
+          (local.set $start (i32.add (local.get $start)
+            (i32.wrap_i64 (i64.shr_u (i64.ctz (local.get $text)) (i64.const 3)))))
+          (br $words_done)
+        )
+      )
+      (local.set $start (i32.add (local.get $start) (i32.const 8)))
+      (br $words)
+    )
+  )
   (block $found_start
     (loop $loop
       (br_if $found_start (i32.ge_u (local.get $start) (local.get $len)))
@@ -1501,8 +1550,26 @@ STRINGS_CODE = """
     )
   )
 
-  ;; Find end (last non-whitespace)
+  ;; Find end (last non-whitespace), likewise a word at a time
   (local.set $end (local.get $len))
+  (block $end_words_done
+    (loop $end_words
+      (br_if $end_words_done (i32.lt_s (i32.sub (local.get $end) (i32.const 8)) (local.get $start)))
+      (local.set $text (i64.xor
+        (call $ascii_space_mask64 (i64.load (i32.add (local.get $off) (i32.sub (local.get $end) (i32.const 8)))))
+        (i64.const 0x8080808080808080)))
+      (if (i64.ne (local.get $text) (i64.const 0))
+        (then
+          ;; Highest marked byte is the last non-whitespace
+          (local.set $end (i32.sub (local.get $end)
+            (i32.wrap_i64 (i64.shr_u (i64.clz (local.get $text)) (i64.const 3)))))
+          (br $end_words_done)
+        )
+      )
+      (local.set $end (i32.sub (local.get $end) (i32.const 8)))
+      (br $end_words)
+    )
+  )
   (block $found_end
     (loop $loop
       (br_if $found_end (i32.le_u (local.get $end) (local.get $start)))
@@ -1519,14 +1586,15 @@ STRINGS_CODE = """
 
   (local.set $new_len (i32.sub (local.get $end) (local.get $start)))
   (if (i32.le_s (local.get $new_len) (i32.const 0))
-    (then (return (struct.new $STRING (i32.const 0) (i32.const 0))))
+    (then (return (global.get $str_empty)))
   )
 
-  ;; Allocate and copy
-  (local.set $dst_off (global.get $string_heap))
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $new_len)))
-  (memory.copy (local.get $dst_off) (i32.add (local.get $off) (local.get $start)) (local.get $new_len))
-  (struct.new $STRING (local.get $dst_off) (local.get $new_len))
+  ;; Nothing stripped: keep the original (and its cached hash)
+  (if (i32.eq (local.get $new_len) (local.get $len))
+    (then (return (local.get $s)))
+  )
+  ;; Strings are immutable, so the result is a view into the original bytes
+  (struct.new $STRING (i32.add (local.get $off) (local.get $start)) (local.get $new_len) (i32.const 0))
 )
 
 
@@ -1538,7 +1606,6 @@ STRINGS_CODE = """
   (local $s_len i32)
   (local $p_off i32)
   (local $p_len i32)
-  (local $i i32)
 
   (if (i32.or (ref.is_null (local.get $s)) (ref.is_null (local.get $prefix)))
     (then (return (struct.new $BOOL (i32.const 0))))
@@ -1555,21 +1622,8 @@ STRINGS_CODE = """
     (then (return (struct.new $BOOL (i32.const 0))))
   )
 
-  ;; Compare prefix
-  (local.set $i (i32.const 0))
-  (block $mismatch
-    (loop $loop
-      (br_if $mismatch (i32.ge_u (local.get $i) (local.get $p_len)))
-      (if (i32.ne
-            (i32.load8_u (i32.add (local.get $s_off) (local.get $i)))
-            (i32.load8_u (i32.add (local.get $p_off) (local.get $i))))
-        (then (return (struct.new $BOOL (i32.const 0))))
-      )
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
-      (br $loop)
-    )
-  )
-  (struct.new $BOOL (i32.const 1))
+  ;; Compare prefix, a word at a time
+  (struct.new $BOOL (call $bytes_equal (local.get $s_off) (local.get $p_off) (local.get $p_len)))
 )
 
 
@@ -1581,8 +1635,6 @@ STRINGS_CODE = """
   (local $s_len i32)
   (local $x_off i32)
   (local $x_len i32)
-  (local $i i32)
-  (local $start i32)
 
   (if (i32.or (ref.is_null (local.get $s)) (ref.is_null (local.get $suffix)))
     (then (return (struct.new $BOOL (i32.const 0))))
@@ -1599,22 +1651,11 @@ STRINGS_CODE = """
     (then (return (struct.new $BOOL (i32.const 0))))
   )
 
-  ;; Compare suffix
-  (local.set $start (i32.sub (local.get $s_len) (local.get $x_len)))
-  (local.set $i (i32.const 0))
-  (block $mismatch
-    (loop $loop
-      (br_if $mismatch (i32.ge_u (local.get $i) (local.get $x_len)))
-      (if (i32.ne
-            (i32.load8_u (i32.add (local.get $s_off) (i32.add (local.get $start) (local.get $i))))
-            (i32.load8_u (i32.add (local.get $x_off) (local.get $i))))
-        (then (return (struct.new $BOOL (i32.const 0))))
-      )
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
-      (br $loop)
-    )
-  )
-  (struct.new $BOOL (i32.const 1))
+  ;; Compare suffix, a word at a time
+  (struct.new $BOOL (call $bytes_equal
+    (i32.add (local.get $s_off) (i32.sub (local.get $s_len) (local.get $x_len)))
+    (local.get $x_off)
+    (local.get $x_len)))
 )
 
 
@@ -1622,59 +1663,15 @@ STRINGS_CODE = """
 (func $string_find (param $s (ref null eq)) (param $sub (ref null eq)) (result (ref null eq))
   (local $str (ref null $STRING))
   (local $needle (ref null $STRING))
-  (local $h_off i32)
-  (local $h_len i32)
-  (local $n_off i32)
-  (local $n_len i32)
-  (local $i i32)
-  (local $j i32)
-  (local $match i32)
 
   (if (i32.or (ref.is_null (local.get $s)) (ref.is_null (local.get $sub)))
     (then (return (ref.i31 (i32.const -1))))
   )
   (local.set $str (ref.cast (ref $STRING) (local.get $s)))
   (local.set $needle (ref.cast (ref $STRING) (local.get $sub)))
-  (local.set $h_off (struct.get $STRING 0 (local.get $str)))
-  (local.set $h_len (struct.get $STRING 1 (local.get $str)))
-  (local.set $n_off (struct.get $STRING 0 (local.get $needle)))
-  (local.set $n_len (struct.get $STRING 1 (local.get $needle)))
-
-  ;; Empty needle always found at position 0
-  (if (i32.eqz (local.get $n_len))
-    (then (return (ref.i31 (i32.const 0))))
-  )
-
-  ;; Search
-  (local.set $i (i32.const 0))
-  (block $not_found
-    (loop $search
-      (br_if $not_found (i32.gt_u (i32.add (local.get $i) (local.get $n_len)) (local.get $h_len)))
-      (local.set $match (i32.const 1))
-      (local.set $j (i32.const 0))
-      (block $no_match
-        (loop $compare
-          (br_if $no_match (i32.ge_u (local.get $j) (local.get $n_len)))
-          (if (i32.ne
-                (i32.load8_u (i32.add (local.get $h_off) (i32.add (local.get $i) (local.get $j))))
-                (i32.load8_u (i32.add (local.get $n_off) (local.get $j))))
-            (then
-              (local.set $match (i32.const 0))
-              (br $no_match)
-            )
-          )
-          (local.set $j (i32.add (local.get $j) (i32.const 1)))
-          (br $compare)
-        )
-      )
-      (if (local.get $match)
-        (then (return (ref.i31 (local.get $i))))
-      )
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
-      (br $search)
-    )
-  )
-  (ref.i31 (i32.const -1))
+  (ref.i31 (call $string_index_of
+    (struct.get $STRING 0 (local.get $str)) (struct.get $STRING 1 (local.get $str))
+    (struct.get $STRING 0 (local.get $needle)) (struct.get $STRING 1 (local.get $needle))))
 )
 
 
@@ -1928,65 +1925,15 @@ STRINGS_CODE = """
 (func $string_rfind (param $s (ref null eq)) (param $sub (ref null eq)) (result (ref null eq))
   (local $str (ref null $STRING))
   (local $needle (ref null $STRING))
-  (local $h_off i32)
-  (local $h_len i32)
-  (local $n_off i32)
-  (local $n_len i32)
-  (local $i i32)
-  (local $j i32)
-  (local $match i32)
 
   (if (i32.or (ref.is_null (local.get $s)) (ref.is_null (local.get $sub)))
     (then (return (ref.i31 (i32.const -1))))
   )
   (local.set $str (ref.cast (ref $STRING) (local.get $s)))
   (local.set $needle (ref.cast (ref $STRING) (local.get $sub)))
-  (local.set $h_off (struct.get $STRING 0 (local.get $str)))
-  (local.set $h_len (struct.get $STRING 1 (local.get $str)))
-  (local.set $n_off (struct.get $STRING 0 (local.get $needle)))
-  (local.set $n_len (struct.get $STRING 1 (local.get $needle)))
-
-  ;; Empty needle always found at end
-  (if (i32.eqz (local.get $n_len))
-    (then (return (ref.i31 (local.get $h_len))))
-  )
-
-  ;; Start from last valid position
-  (if (i32.lt_u (local.get $h_len) (local.get $n_len))
-    (then (return (ref.i31 (i32.const -1))))
-  )
-  (local.set $i (i32.sub (local.get $h_len) (local.get $n_len)))
-
-  (block $not_found
-    (loop $search
-      ;; Check if match at position i
-      (local.set $match (i32.const 1))
-      (local.set $j (i32.const 0))
-      (block $no_match
-        (loop $compare
-          (br_if $no_match (i32.ge_u (local.get $j) (local.get $n_len)))
-          (if (i32.ne
-                (i32.load8_u (i32.add (local.get $h_off) (i32.add (local.get $i) (local.get $j))))
-                (i32.load8_u (i32.add (local.get $n_off) (local.get $j))))
-            (then
-              (local.set $match (i32.const 0))
-              (br $no_match)
-            )
-          )
-          (local.set $j (i32.add (local.get $j) (i32.const 1)))
-          (br $compare)
-        )
-      )
-      (if (local.get $match)
-        (then (return (ref.i31 (local.get $i))))
-      )
-      ;; Move backwards
-      (br_if $not_found (i32.eqz (local.get $i)))
-      (local.set $i (i32.sub (local.get $i) (i32.const 1)))
-      (br $search)
-    )
-  )
-  (ref.i31 (i32.const -1))
+  (ref.i31 (call $string_last_index_of
+    (struct.get $STRING 0 (local.get $str)) (struct.get $STRING 1 (local.get $str))
+    (struct.get $STRING 0 (local.get $needle)) (struct.get $STRING 1 (local.get $needle))))
 )
 
 
@@ -2041,7 +1988,7 @@ STRINGS_CODE = """
   )
 
   (global.set $string_heap (i32.add (local.get $new_off) (local.get $w)))
-  (struct.new $STRING (local.get $new_off) (local.get $w))
+  (struct.new $STRING (local.get $new_off) (local.get $w) (i32.const 0))
 )
 
 
@@ -2095,7 +2042,7 @@ STRINGS_CODE = """
   )
 
   (global.set $string_heap (i32.add (local.get $new_off) (local.get $w)))
-  (struct.new $STRING (local.get $new_off) (local.get $w))
+  (struct.new $STRING (local.get $new_off) (local.get $w) (i32.const 0))
 )
 
 
@@ -2165,7 +2112,7 @@ STRINGS_CODE = """
   )
 
   (global.set $string_heap (i32.add (local.get $new_off) (local.get $w)))
-  (struct.new $STRING (local.get $new_off) (local.get $w))
+  (struct.new $STRING (local.get $new_off) (local.get $w) (i32.const 0))
 )
 
 
@@ -2235,7 +2182,7 @@ STRINGS_CODE = """
   )
 
   (global.set $string_heap (i32.add (local.get $new_off) (local.get $w)))
-  (struct.new $STRING (local.get $new_off) (local.get $w))
+  (struct.new $STRING (local.get $new_off) (local.get $w) (i32.const 0))
 )
 
 
@@ -2246,7 +2193,6 @@ STRINGS_CODE = """
   (local $len i32)
   (local $start i32)
   (local $c i32)
-  (local $dst_off i32)
   (local $new_len i32)
 
   (if (ref.is_null (local.get $s))
@@ -2274,13 +2220,14 @@ STRINGS_CODE = """
 
   (local.set $new_len (i32.sub (local.get $len) (local.get $start)))
   (if (i32.le_s (local.get $new_len) (i32.const 0))
-    (then (return (struct.new $STRING (i32.const 0) (i32.const 0))))
+    (then (return (global.get $str_empty)))
   )
 
-  (local.set $dst_off (global.get $string_heap))
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $new_len)))
-  (memory.copy (local.get $dst_off) (i32.add (local.get $off) (local.get $start)) (local.get $new_len))
-  (struct.new $STRING (local.get $dst_off) (local.get $new_len))
+  ;; Nothing stripped: keep the original
+  (if (i32.eq (local.get $new_len) (local.get $len))
+    (then (return (local.get $s)))
+  )
+  (struct.new $STRING (i32.add (local.get $off) (local.get $start)) (local.get $new_len) (i32.const 0))
 )
 
 
@@ -2291,7 +2238,6 @@ STRINGS_CODE = """
   (local $len i32)
   (local $end i32)
   (local $c i32)
-  (local $dst_off i32)
 
   (if (ref.is_null (local.get $s))
     (then (return (ref.null eq)))
@@ -2317,13 +2263,13 @@ STRINGS_CODE = """
   )
 
   (if (i32.le_s (local.get $end) (i32.const 0))
-    (then (return (struct.new $STRING (i32.const 0) (i32.const 0))))
+    (then (return (global.get $str_empty)))
+  )
+
+  (if (i32.eq (local.get $end) (local.get $len))
+    (then (return (local.get $s)))
   )
-
-  (local.set $dst_off (global.get $string_heap))
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $end)))
-  (memory.copy (local.get $dst_off) (local.get $off) (local.get $end))
-  (struct.new $STRING (local.get $dst_off) (local.get $end))
+  (struct.new $STRING (local.get $off) (local.get $end) (i32.const 0))
 )
 
 
@@ -2360,7 +2306,6 @@ STRINGS_CODE = """
   (local $start i32)
   (local $end i32)
   (local $c i32)
-  (local $dst_off i32)
   (local $new_len i32)
 
   (if (ref.is_null (local.get $s))
@@ -2401,14 +2346,15 @@ STRINGS_CODE = """
 
   (local.set $new_len (i32.sub (local.get $end) (local.get $start)))
   (if (i32.le_s (local.get $new_len) (i32.const 0))
-    (then (return (struct.new $STRING (i32.const 0) (i32.const 0))))
+    (then (return (global.get $str_empty)))
   )
 
-  ;; Allocate and copy
-  (local.set $dst_off (global.get $string_heap))
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $new_len)))
-  (memory.copy (local.get $dst_off) (i32.add (local.get $off) (local.get $start)) (local.get $new_len))
-  (struct.new $STRING (local.get $dst_off) (local.get $new_len))
+  ;; Nothing stripped: keep the original (and its cached hash)
+  (if (i32.eq (local.get $new_len) (local.get $len))
+    (then (return (local.get $s)))
+  )
+  ;; Strings are immutable, so the result is a view into the original bytes
+  (struct.new $STRING (i32.add (local.get $off) (local.get $start)) (local.get $new_len) (i32.const 0))
 )
 
 
@@ -2420,7 +2366,6 @@ STRINGS_CODE = """
   (local $len i32)
   (local $start i32)
   (local $c i32)
-  (local $dst_off i32)
   (local $new_len i32)
 
   (if (ref.is_null (local.get $s))
@@ -2449,13 +2394,14 @@ STRINGS_CODE = """
 
   (local.set $new_len (i32.sub (local.get $len) (local.get $start)))
   (if (i32.le_s (local.get $new_len) (i32.const 0))
-    (then (return (struct.new $STRING (i32.const 0) (i32.const 0))))
+    (then (return (global.get $str_empty)))
   )
 
-  (local.set $dst_off (global.get $string_heap))
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $new_len)))
-  (memory.copy (local.get $dst_off) (i32.add (local.get $off) (local.get $start)) (local.get $new_len))
-  (struct.new $STRING (local.get $dst_off) (local.get $new_len))
+  ;; Nothing stripped: keep the original
+  (if (i32.eq (local.get $new_len) (local.get $len))
+    (then (return (local.get $s)))
+  )
+  (struct.new $STRING (i32.add (local.get $off) (local.get $start)) (local.get $new_len) (i32.const 0))
 )
 
 
@@ -2467,7 +2413,6 @@ STRINGS_CODE = """
   (local $len i32)
   (local $end i32)
   (local $c i32)
-  (local $dst_off i32)
 
   (if (ref.is_null (local.get $s))
     (then (return (ref.null eq)))
@@ -2494,13 +2439,13 @@ STRINGS_CODE = """
   )
 
   (if (i32.le_s (local.get $end) (i32.const 0))
-    (then (return (struct.new $STRING (i32.const 0) (i32.const 0))))
+    (then (return (global.get $str_empty)))
   )
 
-  (local.set $dst_off (global.get $string_heap))
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $end)))
-  (memory.copy (local.get $dst_off) (local.get $off) (local.get $end))
-  (struct.new $STRING (local.get $dst_off) (local.get $end))
+  (if (i32.eq (local.get $end) (local.get $len))
+    (then (return (local.get $s)))
+  )
+  (struct.new $STRING (local.get $off) (local.get $end) (i32.const 0))
 )
 
 
@@ -2517,7 +2462,6 @@ STRINGS_CODE = """
   (local $n_len i32)
   (local $dst_off i32)
   (local $i i32)
-  (local $j i32)
   (local $k i32)
   (local $match i32)
   (local $dst_pos i32)
@@ -2552,25 +2496,11 @@ STRINGS_CODE = """
       (br_if $done (i32.ge_u (local.get $i) (local.get $s_len)))
 
       ;; Check for match at position i
-      (local.set $match (i32.const 1))
       (if (i32.le_u (i32.add (local.get $i) (local.get $o_len)) (local.get $s_len))
         (then
-          (local.set $j (i32.const 0))
-          (block $no_match
-            (loop $cmp
-              (br_if $no_match (i32.ge_u (local.get $j) (local.get $o_len)))
-              (if (i32.ne
-                    (i32.load8_u (i32.add (local.get $s_off) (i32.add (local.get $i) (local.get $j))))
-                    (i32.load8_u (i32.add (local.get $o_off) (local.get $j))))
-                (then
-                  (local.set $match (i32.const 0))
-                  (br $no_match)
-                )
-              )
-              (local.set $j (i32.add (local.get $j) (i32.const 1)))
-              (br $cmp)
-            )
-          )
+          (local.set $match (call $bytes_equal
+            (i32.add (local.get $s_off) (local.get $i))
+            (local.get $o_off) (local.get $o_len)))
         )
         (else (local.set $match (i32.const 0)))
       )
@@ -2603,8 +2533,8 @@ STRINGS_CODE = """
     )
   )
 
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $dst_pos)))
-  (struct.new $STRING (local.get $dst_off) (local.get $dst_pos))
+  (global.set $string_heap (i32.add (local.get $dst_off) (local.get $dst_pos)))
+  (struct.new $STRING (local.get $dst_off) (local.get $dst_pos) (i32.const 0))
 )
 
 
@@ -2621,7 +2551,6 @@ STRINGS_CODE = """
   (local $n_len i32)
   (local $dst_off i32)
   (local $i i32)
-  (local $j i32)
   (local $k i32)
   (local $match i32)
   (local $dst_pos i32)
@@ -2684,25 +2613,11 @@ STRINGS_CODE = """
       )
 
       ;; Check for match at position i
-      (local.set $match (i32.const 1))
       (if (i32.le_u (i32.add (local.get $i) (local.get $o_len)) (local.get $s_len))
         (then
-          (local.set $j (i32.const 0))
-          (block $no_match
-            (loop $cmp
-              (br_if $no_match (i32.ge_u (local.get $j) (local.get $o_len)))
-              (if (i32.ne
-                    (i32.load8_u (i32.add (local.get $s_off) (i32.add (local.get $i) (local.get $j))))
-                    (i32.load8_u (i32.add (local.get $o_off) (local.get $j))))
-                (then
-                  (local.set $match (i32.const 0))
-                  (br $no_match)
-                )
-              )
-              (local.set $j (i32.add (local.get $j) (i32.const 1)))
-              (br $cmp)
-            )
-          )
+          (local.set $match (call $bytes_equal
+            (i32.add (local.get $s_off) (local.get $i))
+            (local.get $o_off) (local.get $o_len)))
         )
         (else (local.set $match (i32.const 0)))
       )
@@ -2736,8 +2651,8 @@ STRINGS_CODE = """
     )
   )
 
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $dst_pos)))
-  (struct.new $STRING (local.get $dst_off) (local.get $dst_pos))
+  (global.set $string_heap (i32.add (local.get $dst_off) (local.get $dst_pos)))
+  (struct.new $STRING (local.get $dst_off) (local.get $dst_pos) (i32.const 0))
 )
 
 
@@ -2750,7 +2665,6 @@ STRINGS_CODE = """
   (local $n_off i32)
   (local $n_len i32)
   (local $i i32)
-  (local $j i32)
   (local $match i32)
   (local $count i32)
 
@@ -2774,23 +2688,9 @@ STRINGS_CODE = """
   (block $done
     (loop $search
       (br_if $done (i32.gt_u (i32.add (local.get $i) (local.get $n_len)) (local.get $h_len)))
-      (local.set $match (i32.const 1))
-      (local.set $j (i32.const 0))
-      (block $no_match
-        (loop $compare
-          (br_if $no_match (i32.ge_u (local.get $j) (local.get $n_len)))
-          (if (i32.ne
-                (i32.load8_u (i32.add (local.get $h_off) (i32.add (local.get $i) (local.get $j))))
-                (i32.load8_u (i32.add (local.get $n_off) (local.get $j))))
-            (then
-              (local.set $match (i32.const 0))
-              (br $no_match)
-            )
-          )
-          (local.set $j (i32.add (local.get $j) (i32.const 1)))
-          (br $compare)
-        )
-      )
+      (local.set $match (call $bytes_equal
+        (i32.add (local.get $h_off) (local.get $i))
+        (local.get $n_off) (local.get $n_len)))
       (if (local.get $match)
         (then
           (local.set $count (i32.add (local.get $count) (i32.const 1)))
@@ -2816,12 +2716,12 @@ STRINGS_CODE = """
   (local $sep_off i32)
   (local $sep_len i32)
   (local $i i32)
-  (local $j i32)
   (local $start i32)
   (local $match i32)
   (local $result (ref null eq))
   (local $part_off i32)
   (local $part_len i32)
+  (local $heap i32)
 
   (if (i32.or (ref.is_null (local.get $s)) (ref.is_null (local.get $sep)))
     (then (return (ref.null eq)))
@@ -2843,6 +2743,8 @@ STRINGS_CODE = """
   (local.set $result (ref.null eq))
   (local.set $start (i32.const 0))
   (local.set $i (i32.const 0))
+  ;; Bump parts from a local copy of the heap pointer; written back once
+  (local.set $heap (global.get $string_heap))
 
   (block $done
     (loop $search
@@ -2851,8 +2753,8 @@ STRINGS_CODE = """
         (then
           ;; Add final part
           (local.set $part_len (i32.sub (local.get $s_len) (local.get $start)))
-          (local.set $part_off (global.get $string_heap))
-          (global.set $string_heap (i32.add (global.get $string_heap) (local.get $part_len)))
+          (local.set $part_off (local.get $heap))
+          (local.set $heap (i32.add (local.get $heap) (local.get $part_len)))
           (if (i32.gt_s (local.get $part_len) (i32.const 0))
             (then
               (memory.copy (local.get $part_off) (i32.add (local.get $s_off) (local.get $start)) (local.get $part_len))
@@ -2860,37 +2762,23 @@ STRINGS_CODE = """
           )
           (local.set $result
             (struct.new $PAIR
-              (struct.new $STRING (local.get $part_off) (local.get $part_len))
+              (struct.new $STRING (local.get $part_off) (local.get $part_len) (i32.const 0))
               (local.get $result)))
           (br $done)
         )
       )
 
       ;; Check for separator match at i
-      (local.set $match (i32.const 1))
-      (local.set $j (i32.const 0))
-      (block $no_match
-        (loop $cmp
-          (br_if $no_match (i32.ge_u (local.get $j) (local.get $sep_len)))
-          (if (i32.ne
-                (i32.load8_u (i32.add (local.get $s_off) (i32.add (local.get $i) (local.get $j))))
-                (i32.load8_u (i32.add (local.get $sep_off) (local.get $j))))
-            (then
-              (local.set $match (i32.const 0))
-              (br $no_match)
-            )
-          )
-          (local.set $j (i32.add (local.get $j) (i32.const 1)))
-          (br $cmp)
-        )
-      )
+      (local.set $match (call $bytes_equal
+        (i32.add (local.get $s_off) (local.get $i))
+        (local.get $sep_off) (local.get $sep_len)))
 
       (if (local.get $match)
         (then
           ;; Found separator - add part to result
           (local.set $part_len (i32.sub (local.get $i) (local.get $start)))
-          (local.set $part_off (global.get $string_heap))
-          (global.set $string_heap (i32.add (global.get $string_heap) (local.get $part_len)))
+          (local.set $part_off (local.get $heap))
+          (local.set $heap (i32.add (local.get $heap) (local.get $part_len)))
           (if (i32.gt_s (local.get $part_len) (i32.const 0))
             (then
               (memory.copy (local.get $part_off) (i32.add (local.get $s_off) (local.get $start)) (local.get $part_len))
@@ -2898,7 +2786,7 @@ STRINGS_CODE = """
           )
           (local.set $result
             (struct.new $PAIR
-              (struct.new $STRING (local.get $part_off) (local.get $part_len))
+              (struct.new $STRING (local.get $part_off) (local.get $part_len) (i32.const 0))
               (local.get $result)))
           (local.set $i (i32.add (local.get $i) (local.get $sep_len)))
           (local.set $start (local.get $i))
@@ -2911,6 +2799,8 @@ STRINGS_CODE = """
     )
   )
 
+  (global.set $string_heap (local.get $heap))
+
   ;; Reverse the result list (we built it backwards)
   (call $list_reverse (local.get $result))
 )
@@ -2925,12 +2815,12 @@ STRINGS_CODE = """
   (local $sep_off i32)
   (local $sep_len i32)
   (local $i i32)
-  (local $j i32)
   (local $start i32)
   (local $match i32)
   (local $result (ref null eq))
   (local $part_off i32)
   (local $part_len i32)
+  (local $heap i32)
   (local $max i32)
   (local $splits i32)
 
@@ -2960,6 +2850,8 @@ STRINGS_CODE = """
   (local.set $result (ref.null eq))
   (local.set $start (i32.const 0))
   (local.set $i (i32.const 0))
+  ;; Bump parts from a local copy of the heap pointer; written back once
+  (local.set $heap (global.get $string_heap))
   (local.set $splits (i32.const 0))
 
   (block $done
@@ -2970,8 +2862,8 @@ STRINGS_CODE = """
         (then
           ;; Add rest of string as final part
           (local.set $part_len (i32.sub (local.get $s_len) (local.get $start)))
-          (local.set $part_off (global.get $string_heap))
-          (global.set $string_heap (i32.add (global.get $string_heap) (local.get $part_len)))
+          (local.set $part_off (local.get $heap))
+          (local.set $heap (i32.add (local.get $heap) (local.get $part_len)))
           (if (i32.gt_s (local.get $part_len) (i32.const 0))
             (then
               (memory.copy (local.get $part_off) (i32.add (local.get $s_off) (local.get $start)) (local.get $part_len))
@@ -2979,7 +2871,7 @@ STRINGS_CODE = """
           )
           (local.set $result
             (struct.new $PAIR
-              (struct.new $STRING (local.get $part_off) (local.get $part_len))
+              (struct.new $STRING (local.get $part_off) (local.get $part_len) (i32.const 0))
               (local.get $result)))
           (br $done)
         )
@@ -2990,8 +2882,8 @@ STRINGS_CODE = """
         (then
           ;; Add final part
           (local.set $part_len (i32.sub (local.get $s_len) (local.get $start)))
-          (local.set $part_off (global.get $string_heap))
-          (global.set $string_heap (i32.add (global.get $string_heap) (local.get $part_len)))
+          (local.set $part_off (local.get $heap))
+          (local.set $heap (i32.add (local.get $heap) (local.get $part_len)))
           (if (i32.gt_s (local.get $part_len) (i32.const 0))
             (then
               (memory.copy (local.get $part_off) (i32.add (local.get $s_off) (local.get $start)) (local.get $part_len))
@@ -2999,37 +2891,23 @@ STRINGS_CODE = """
           )
           (local.set $result
             (struct.new $PAIR
-              (struct.new $STRING (local.get $part_off) (local.get $part_len))
+              (struct.new $STRING (local.get $part_off) (local.get $part_len) (i32.const 0))
               (local.get $result)))
           (br $done)
         )
       )
 
       ;; Check for separator match at i
-      (local.set $match (i32.const 1))
-      (local.set $j (i32.const 0))
-      (block $no_match
-        (loop $cmp
-          (br_if $no_match (i32.ge_u (local.get $j) (local.get $sep_len)))
-          (if (i32.ne
-                (i32.load8_u (i32.add (local.get $s_off) (i32.add (local.get $i) (local.get $j))))
-                (i32.load8_u (i32.add (local.get $sep_off) (local.get $j))))
-            (then
-              (local.set $match (i32.const 0))
-              (br $no_match)
-            )
-          )
-          (local.set $j (i32.add (local.get $j) (i32.const 1)))
-          (br $cmp)
-        )
-      )
+      (local.set $match (call $bytes_equal
+        (i32.add (local.get $s_off) (local.get $i))
+        (local.get $sep_off) (local.get $sep_len)))
 
       (if (local.get $match)
         (then
           ;; Found separator - add part to result
           (local.set $part_len (i32.sub (local.get $i) (local.get $start)))
-          (local.set $part_off (global.get $string_heap))
-          (global.set $string_heap (i32.add (global.get $string_heap) (local.get $part_len)))
+          (local.set $part_off (local.get $heap))
+          (local.set $heap (i32.add (local.get $heap) (local.get $part_len)))
           (if (i32.gt_s (local.get $part_len) (i32.const 0))
             (then
               (memory.copy (local.get $part_off) (i32.add (local.get $s_off) (local.get $start)) (local.get $part_len))
@@ -3037,7 +2915,7 @@ STRINGS_CODE = """
           )
           (local.set $result
             (struct.new $PAIR
-              (struct.new $STRING (local.get $part_off) (local.get $part_len))
+              (struct.new $STRING (local.get $part_off) (local.get $part_len) (i32.const 0))
               (local.get $result)))
           (local.set $i (i32.add (local.get $i) (local.get $sep_len)))
           (local.set $start (local.get $i))
@@ -3051,6 +2929,8 @@ STRINGS_CODE = """
     )
   )
 
+  (global.set $string_heap (local.get $heap))
+
   ;; Reverse the result list (we built it backwards)
   (call $list_reverse (local.get $result))
 )
@@ -3070,14 +2950,14 @@ STRINGS_CODE = """
   (local $data (ref null $ARRAY_ANY))
 
   (if (ref.is_null (local.get $sep))
-    (then (return (struct.new $STRING (i32.const 0) (i32.const 0))))
+    (then (return (global.get $str_empty)))
   )
   (local.set $sep_off (struct.get $STRING 0 (ref.cast (ref $STRING) (local.get $sep))))
   (local.set $sep_len (struct.get $STRING 1 (ref.cast (ref $STRING) (local.get $sep))))
 
   ;; Empty list -> empty string
   (if (ref.is_null (local.get $lst))
-    (then (return (struct.new $STRING (i32.const 0) (i32.const 0))))
+    (then (return (global.get $str_empty)))
   )
 
   (local.set $dst_off (global.get $string_heap))
@@ -3116,8 +2996,8 @@ STRINGS_CODE = """
           (br $loop_arr)
         )
       )
-      (global.set $string_heap (i32.add (global.get $string_heap) (local.get $dst_len)))
-      (return (struct.new $STRING (local.get $dst_off) (local.get $dst_len)))
+      (global.set $string_heap (i32.add (local.get $dst_off) (local.get $dst_len)))
+      (return (struct.new $STRING (local.get $dst_off) (local.get $dst_len) (i32.const 0)))
     )
   )
 
@@ -3154,8 +3034,8 @@ STRINGS_CODE = """
     )
   )
 
-  (global.set $string_heap (i32.add (global.get $string_heap) (local.get $dst_len)))
-  (struct.new $STRING (local.get $dst_off) (local.get $dst_len))
+  (global.set $string_heap (i32.add (local.get $dst_off) (local.get $dst_len)))
+  (struct.new $STRING (local.get $dst_off) (local.get $dst_len) (i32.const 0))
 )
 
 
@@ -3180,14 +3060,14 @@ STRINGS_CODE = """
   (local $segment_off i32)
 
   (if (ref.is_null (local.get $fmt))
-    (then (return (struct.new $STRING (i32.const 0) (i32.const 0))))
+    (then (return (global.get $str_empty)))
   )
   (local.set $fmt_str (ref.cast (ref $STRING) (local.get $fmt)))
   (local.set $fmt_off (struct.get $STRING 0 (local.get $fmt_str)))
   (local.set $fmt_len (struct.get $STRING 1 (local.get $fmt_str)))
 
   ;; Start with empty result
-  (local.set $result (struct.new $STRING (i32.const 0) (i32.const 0)))
+  (local.set $result (global.get $str_empty))
   (local.set $arg_idx (i32.const 0))
   (local.set $i (i32.const 0))
   (local.set $segment_start (i32.const 0))
@@ -3208,8 +3088,8 @@ STRINGS_CODE = """
               (call $memcpy (local.get $segment_off)
                 (i32.add (local.get $fmt_off) (local.get $segment_start))
                 (local.get $segment_len))
-              (global.set $string_heap (i32.add (global.get $string_heap) (local.get $segment_len)))
-              (local.set $tmp_str (struct.new $STRING (local.get $segment_off) (local.get $segment_len)))
+              (global.set $string_heap (i32.add (local.get $segment_off) (local.get $segment_len)))
+              (local.set $tmp_str (struct.new $STRING (local.get $segment_off) (local.get $segment_len) (i32.const 0)))
               (local.set $result (call $string_concat (local.get $result) (local.get $tmp_str)))
             )
           )
@@ -3342,8 +3222,8 @@ STRINGS_CODE = """
       (call $memcpy (local.get $segment_off)
         (i32.add (local.get $fmt_off) (local.get $segment_start))
         (local.get $segment_len))
-      (global.set $string_heap (i32.add (global.get $string_heap) (local.get $segment_len)))
-      (local.set $tmp_str (struct.new $STRING (local.get $segment_off) (local.get $segment_len)))
+      (global.set $string_heap (i32.add (local.get $segment_off) (local.get $segment_len)))
+      (local.set $tmp_str (struct.new $STRING (local.get $segment_off) (local.get $segment_len) (i32.const 0)))
       (local.set $result (call $string_concat (local.get $result) (local.get $tmp_str)))
     )
   )
@@ -3358,7 +3238,11 @@ STRINGS_CODE = """
   (local $a_len i32)
   (local $b_off i32)
   (local $b_len i32)
-  (local $i i32)
+
+  ;; Same struct -> equal
+  (if (ref.eq (local.get $a) (local.get $b))
+    (then (return (i32.const 1)))
+  )
 
   (local.set $a_off (struct.get $STRING 0 (local.get $a)))
   (local.set $a_len (struct.get $STRING 1 (local.get $a)))
@@ -3370,21 +3254,7 @@ STRINGS_CODE = """
     (then (return (i32.const 0)))
   )
 
-  ;; Compare bytes
-  (local.set $i (i32.const 0))
-  (block $not_equal
-    (loop $loop
-      (br_if $not_equal (i32.ge_u (local.get $i) (local.get $a_len)))
-      (if (i32.ne
-            (i32.load8_u (i32.add (local.get $a_off) (local.get $i)))
-            (i32.load8_u (i32.add (local.get $b_off) (local.get $i))))
-        (then (return (i32.const 0)))
-      )
-      (local.set $i (i32.add (local.get $i) (i32.const 1)))
-      (br $loop)
-    )
-  )
-  (i32.const 1)
+  (call $bytes_equal (local.get $a_off) (local.get $b_off) (local.get $a_len))
 )
 
 
@@ -3395,7 +3265,6 @@ STRINGS_CODE = """
   (local $len i32)
   (local $i i32)
   (local $result (ref null eq))
-  (local $char_off i32)
   (local $char_str (ref $STRING))
 
   (local.set $offset (struct.get $STRING 0 (local.get $str)))
@@ -3414,14 +3283,9 @@ STRINGS_CODE = """
     (loop $loop
       (br_if $done (i32.lt_s (local.get $i) (i32.const 0)))
 
-      ;; Allocate space for single character in string heap
-      (local.set $char_off (global.get $string_heap))
-      (i32.store8 (local.get $char_off)
-        (i32.load8_u (i32.add (local.get $offset) (local.get $i))))
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 1)))
-
-      ;; Create single-char STRING
-      (local.set $char_str (struct.new $STRING (local.get $char_off) (i32.const 1)))
+      ;; Single-char STRING viewing the source byte (strings are immutable,
+      ;; so no copy into the string heap is needed)
+      (local.set $char_str (struct.new $STRING (i32.add (local.get $offset) (local.get $i)) (i32.const 1) (i32.const 0)))
 
       ;; Prepend to result list
       (local.set $result (struct.new $PAIR (local.get $char_str) (local.get $result)))
@@ -3442,7 +3306,6 @@ STRINGS_CODE = """
   (local $len i32)
   (local $i i32)
   (local $result (ref null eq))
-  (local $char_off i32)
   (local $char_str (ref $STRING))
 
   (local.set $offset (struct.get $STRING 0 (local.get $str)))
@@ -3462,14 +3325,9 @@ STRINGS_CODE = """
     (loop $loop
       (br_if $done (i32.ge_s (local.get $i) (local.get $len)))
 
-      ;; Allocate space for single character in string heap
-      (local.set $char_off (global.get $string_heap))
-      (i32.store8 (local.get $char_off)
-        (i32.load8_u (i32.add (local.get $offset) (local.get $i))))
-      (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 1)))
-
-      ;; Create single-char STRING
-      (local.set $char_str (struct.new $STRING (local.get $char_off) (i32.const 1)))
+      ;; Single-char STRING viewing the source byte (strings are immutable,
+      ;; so no copy into the string heap is needed)
+      (local.set $char_str (struct.new $STRING (i32.add (local.get $offset) (local.get $i)) (i32.const 1) (i32.const 0)))
 
       ;; Prepend to result list (gives reversed order)
       (local.set $result (struct.new $PAIR (local.get $char_str) (local.get $result)))
@@ -3483,3 +3341,453 @@ STRINGS_CODE = """
 )
 
 """
+
+_DIGITS_SIMD_LOCALS = """\
+  (local $chunk v128)
+"""
+
+_DIGITS_SIMD = """\
+  ;; Consume 8 digits per step while 8 bytes remain and all of them are digits
+  (block $chunks_done
+    (loop $chunks
+      (br_if $chunks_done (i32.lt_u (i32.sub (local.get $end) (local.get $offset)) (i32.const 8)))
+      (local.set $chunk (i8x16.sub
+        (v128.load64_zero (local.get $offset))
+        (v128.const i8x16 48 48 48 48 48 48 48 48 48 48 48 48 48 48 48 48)))
+      (br_if $chunks_done (i32.ne
+        (i32.and
+          (i8x16.bitmask (i8x16.lt_u (local.get $chunk)
+            (v128.const i8x16 10 10 10 10 10 10 10 10 10 10 10 10 10 10 10 10)))
+          (i32.const 0xFF))
+        (i32.const 0xFF)))
+      (local.set $result (i32.add
+        (i32.mul (local.get $result) (i32.const 100000000))
+        (call $parse_8_digits (local.get $chunk))))
+      (local.set $offset (i32.add (local.get $offset) (i32.const 8)))
+      (br $chunks)
+    )
+  )
+"""
+
+_PARSE_8_DIGITS_CODE = """
+;; parse_8_digits: value of the 8 digits (0-9, most significant first) held
+;; in the low byte lanes of $digits
+(func $parse_8_digits (param $digits v128) (result i32)
+  (local $pairs v128)
+  ;; Four i32 lanes of d0*10+d1, d2*10+d3, ...
+  (local.set $pairs (i32x4.dot_i16x8_s
+    (i16x8.extend_low_i8x16_u (local.get $digits))
+    (v128.const i16x8 10 1 10 1 10 1 10 1)))
+  ;; Lanes 0 and 1 become the high and low groups of four digits
+  (local.set $pairs (i32x4.dot_i16x8_s
+    (i16x8.narrow_i32x4_u (local.get $pairs) (local.get $pairs))
+    (v128.const i16x8 100 1 100 1 100 1 100 1)))
+  (i32.add
+    (i32.mul (i32x4.extract_lane 0 (local.get $pairs)) (i32.const 10000))
+    (i32x4.extract_lane 1 (local.get $pairs)))
+)
+"""
+
+_PARSE_INT_BASE10_CODE = """
+;; parse_int_base10: parse string as a decimal integer.
+;; Fast path for int(s): no prefix handling and one unsigned range check per digit.
+(func $parse_int_base10 (param $str (ref $STRING)) (result i32)
+  (local $offset i32)
+  (local $end i32)
+  (local $result i32)
+  (local $digit i32)
+  (local $neg i32)
+{digits_simd_locals}  (local.set $offset (struct.get $STRING 0 (local.get $str)))
+  (local.set $end (i32.add (local.get $offset) (struct.get $STRING 1 (local.get $str))))
+  ;; Check for negative sign
+  (if (i32.and (i32.lt_u (local.get $offset) (local.get $end))
+               (i32.eq (i32.load8_u (local.get $offset)) (i32.const 45)))
+    (then
+      (local.set $neg (i32.const 1))
+      (local.set $offset (i32.add (local.get $offset) (i32.const 1)))
+    )
+  )
+{digits_simd}  (block $done
+    (loop $loop
+      (br_if $done (i32.ge_u (local.get $offset) (local.get $end)))
+      (local.set $digit (i32.sub (i32.load8_u (local.get $offset)) (i32.const 48)))
+      (br_if $done (i32.ge_u (local.get $digit) (i32.const 10)))
+      (local.set $result (i32.add
+        (i32.mul (local.get $result) (i32.const 10))
+        (local.get $digit)))
+      (local.set $offset (i32.add (local.get $offset) (i32.const 1)))
+      (br $loop)
+    )
+  )
+  (if (result i32) (local.get $neg)
+    (then (i32.sub (i32.const 0) (local.get $result)))
+    (else (local.get $result))
+  )
+)
+
+"""
+
+_INDEX_OF_SIMD_LOCALS = """\
+  (local $first_lanes v128)
+  (local $last_lanes v128)
+  (local $lanes i32)
+"""
+
+_INDEX_OF_SIMD = """\
+  ;; Sixteen candidate starts per step: a lane is set when both the needle's
+  ;; first byte and its last byte line up (hp + 15 <= h_last keeps both loads
+  ;; inside the haystack)
+  (local.set $first_lanes (i8x16.splat (local.get $n0)))
+  (local.set $last_lanes (i8x16.splat
+    (i32.load8_u (i32.sub (i32.add (local.get $n_off) (local.get $n_len)) (i32.const 1)))))
+  (block $vectors_done
+    (loop $vectors
+      (br_if $vectors_done (i32.gt_u (i32.add (local.get $hp) (i32.const 15)) (local.get $h_last)))
+      (local.set $lanes (i8x16.bitmask (v128.and
+        (i8x16.eq (v128.load (local.get $hp)) (local.get $first_lanes))
+        (i8x16.eq
+          (v128.load (i32.sub (i32.add (local.get $hp) (local.get $n_len)) (i32.const 1)))
+          (local.get $last_lanes)))))
+      (block $next_vector
+        (loop $candidates
+          (br_if $next_vector (i32.eqz (local.get $lanes)))
+          (local.set $cp (i32.add (local.get $hp) (i32.ctz (local.get $lanes))))
+          (if (call $bytes_equal (local.get $cp) (local.get $n_off) (local.get $n_len))
+            (then (return (i32.sub (local.get $cp) (local.get $h_off))))
+          )
+          ;; Clear the lowest candidate
+          (local.set $lanes (i32.and (local.get $lanes) (i32.sub (local.get $lanes) (i32.const 1))))
+          (br $candidates)
+        )
+      )
+      (local.set $hp (i32.add (local.get $hp) (i32.const 16)))
+      (br $vectors)
+    )
+  )
+"""
+
+_LAST_INDEX_OF_SIMD = """\
+  ;; Sixteen candidate starts per step, ending at $hp and taken highest first
+  (local.set $first_lanes (i8x16.splat (local.get $n0)))
+  (local.set $last_lanes (i8x16.splat
+    (i32.load8_u (i32.sub (i32.add (local.get $n_off) (local.get $n_len)) (i32.const 1)))))
+  (block $vectors_done
+    (loop $vectors
+      (br_if $vectors_done (i32.lt_s (i32.sub (local.get $hp) (i32.const 15)) (local.get $h_off)))
+      (local.set $lanes (i8x16.bitmask (v128.and
+        (i8x16.eq (v128.load (i32.sub (local.get $hp) (i32.const 15))) (local.get $first_lanes))
+        (i8x16.eq
+          (v128.load (i32.sub (i32.add (local.get $hp) (local.get $n_len)) (i32.const 16)))
+          (local.get $last_lanes)))))
+      (block $next_vector
+        (loop $candidates
+          (br_if $next_vector (i32.eqz (local.get $lanes)))
+          ;; Highest candidate: lane 15 is $hp itself
+          (local.set $cp (i32.sub (local.get $hp) (i32.sub (i32.clz (local.get $lanes)) (i32.const 16))))
+          (if (call $bytes_equal (local.get $cp) (local.get $n_off) (local.get $n_len))
+            (then (return (i32.sub (local.get $cp) (local.get $h_off))))
+          )
+          (local.set $lanes (i32.xor (local.get $lanes)
+            (i32.shl (i32.const 1) (i32.sub (local.get $cp) (i32.sub (local.get $hp) (i32.const 15))))))
+          (br $candidates)
+        )
+      )
+      (local.set $hp (i32.sub (local.get $hp) (i32.const 16)))
+      (br $vectors)
+    )
+  )
+"""
+
+_EQUAL_SIMD = """\
+  ;; Compare 16 bytes per step while a whole vector remains
+  (block $vectors_done
+    (loop $vectors
+      (br_if $vectors_done (i32.lt_u (i32.sub (local.get $len_a) (local.get $i)) (i32.const 16)))
+      (if (v128.any_true (v128.xor
+            (v128.load (i32.add (local.get $offset_a) (local.get $i)))
+            (v128.load (i32.add (local.get $offset_b) (local.get $i)))))
+        (then (return (i32.const 0)))
+      )
+      (local.set $i (i32.add (local.get $i) (i32.const 16)))
+      (br $vectors)
+    )
+  )
+"""
+
+_COMPARE_SIMD_LOCALS = """\
+  (local $equal_lanes i32)
+"""
+
+_COMPARE_SIMD = """\
+  ;; Skip the common prefix 16 bytes per step; on a mismatch the first
+  ;; differing lane is the lowest clear bit of the lane equality mask
+  (block $vectors_done
+    (loop $vectors
+      (br_if $vectors_done (i32.lt_u (i32.sub (local.get $min_len) (local.get $i)) (i32.const 16)))
+      (local.set $equal_lanes (i8x16.bitmask (i8x16.eq
+        (v128.load (i32.add (local.get $offset_a) (local.get $i)))
+        (v128.load (i32.add (local.get $offset_b) (local.get $i))))))
+      (if (i32.ne (local.get $equal_lanes) (i32.const 0xFFFF))
+        (then
+          (local.set $i (i32.add (local.get $i)
+            (i32.ctz (i32.xor (local.get $equal_lanes) (i32.const 0xFFFF)))))
+          (return (select (i32.const -1) (i32.const 1)
+            (i32.lt_u
+              (i32.load8_u (i32.add (local.get $offset_a) (local.get $i)))
+              (i32.load8_u (i32.add (local.get $offset_b) (local.get $i))))))
+        )
+      )
+      (local.set $i (i32.add (local.get $i) (i32.const 16)))
+      (br $vectors)
+    )
+  )
+"""
+
+_INDEX_OF_CODE = """
+;; string_index_of: position of the first occurrence of the needle bytes in the
+;; haystack bytes, or -1. Candidate starts are found eight at a time as the
+;; bytes equal to the needle's first byte (sixteen at a time, also matching
+;; the needle's last byte, with SIMD), then confirmed with bytes_equal.
+(func $string_index_of (param $h_off i32) (param $h_len i32) (param $n_off i32) (param $n_len i32) (result i32)
+  (local $hp i32)
+  (local $h_last i32)
+  (local $cp i32)
+  (local $n0 i32)
+  (local $first i64)
+  (local $cands i64)
+{index_of_simd_locals}  ;; Empty needle is always found at the start
+  (if (i32.eqz (local.get $n_len))
+    (then (return (i32.const 0)))
+  )
+  ;; If needle is longer than haystack, not found
+  (if (i32.gt_u (local.get $n_len) (local.get $h_len))
+    (then (return (i32.const -1)))
+  )
+  ;; Walk absolute addresses: $hp is the current start, $h_last the last one
+  (local.set $hp (local.get $h_off))
+  (local.set $h_last (i32.add (local.get $h_off) (i32.sub (local.get $h_len) (local.get $n_len))))
+  (local.set $n0 (i32.load8_u (local.get $n_off)))
+  (local.set $first (i64.mul (i64.extend_i32_u (local.get $n0)) (i64.const 0x0101010101010101)))
+{index_of_simd}  ;; Whole words of candidate starts (hp + 7 <= h_last also keeps the load in bounds)
+  (block $words_done
+    (loop $words
+      (br_if $words_done (i32.gt_u (i32.add (local.get $hp) (i32.const 7)) (local.get $h_last)))
+      (local.set $cands (call $zero_bytes64
+        (i64.xor (i64.load (local.get $hp)) (local.get $first))))
+      (block $next_word
+        (loop $candidates
+          (br_if $next_word (i64.eqz (local.get $cands)))
+          (local.set $cp (i32.add (local.get $hp)
+            (i32.wrap_i64 (i64.shr_u (i64.ctz (local.get $cands)) (i64.const 3)))))
+          (if (call $bytes_equal (local.get $cp) (local.get $n_off) (local.get $n_len))
+            (then (return (i32.sub (local.get $cp) (local.get $h_off))))
+          )
+          ;; Clear the lowest candidate
+          (local.set $cands (i64.and (local.get $cands) (i64.sub (local.get $cands) (i64.const 1))))
+          (br $candidates)
+        )
+      )
+      (local.set $hp (i32.add (local.get $hp) (i32.const 8)))
+      (br $words)
+    )
+  )
+  ;; Remaining starts one at a time
+  (block $not_found
+    (loop $tail
+      (br_if $not_found (i32.gt_u (local.get $hp) (local.get $h_last)))
+      (if (i32.eq (i32.load8_u (local.get $hp)) (local.get $n0))
+        (then
+          (if (call $bytes_equal (local.get $hp) (local.get $n_off) (local.get $n_len))
+            (then (return (i32.sub (local.get $hp) (local.get $h_off))))
+          )
+        )
+      )
+      (local.set $hp (i32.add (local.get $hp) (i32.const 1)))
+      (br $tail)
+    )
+  )
+  (i32.const -1)
+)
+
+
+;; string_last_index_of: position of the last occurrence of the needle bytes in
+;; the haystack bytes, or -1. Walks the candidate starts from the end down,
+;; confirming first-byte matches with bytes_equal.
+(func $string_last_index_of (param $h_off i32) (param $h_len i32) (param $n_off i32) (param $n_len i32) (result i32)
+  (local $hp i32)
+  (local $cp i32)
+  (local $n0 i32)
+{last_index_of_simd_locals}  ;; Empty needle is always found at the end
+  (if (i32.eqz (local.get $n_len))
+    (then (return (local.get $h_len)))
+  )
+  (if (i32.gt_u (local.get $n_len) (local.get $h_len))
+    (then (return (i32.const -1)))
+  )
+  ;; $hp is the current (absolute) start, beginning with the last one
+  (local.set $hp (i32.add (local.get $h_off) (i32.sub (local.get $h_len) (local.get $n_len))))
+  (local.set $n0 (i32.load8_u (local.get $n_off)))
+{last_index_of_simd}  ;; Remaining starts one at a time
+  (block $not_found
+    (loop $tail
+      (br_if $not_found (i32.lt_s (local.get $hp) (local.get $h_off)))
+      (if (i32.eq (i32.load8_u (local.get $hp)) (local.get $n0))
+        (then
+          (if (call $bytes_equal (local.get $hp) (local.get $n_off) (local.get $n_len))
+            (then (return (i32.sub (local.get $hp) (local.get $h_off))))
+          )
+        )
+      )
+      (local.set $hp (i32.sub (local.get $hp) (i32.const 1)))
+      (br $tail)
+    )
+  )
+  (i32.const -1)
+)
+"""
+
+_COMPARISONS_CODE = """
+;; strings_equal: compare two STRING structs for equality
+(func $strings_equal (param $a (ref $STRING)) (param $b (ref $STRING)) (result i32)
+  (local $offset_a i32)
+  (local $offset_b i32)
+  (local $len_a i32)
+  (local $len_b i32)
+  (local $i i32)
+  ;; Same struct (e.g. interned runtime names) - equal
+  (if (ref.eq (local.get $a) (local.get $b))
+    (then (return (i32.const 1)))
+  )
+  (local.set $offset_a (struct.get $STRING 0 (local.get $a)))
+  (local.set $len_a (struct.get $STRING 1 (local.get $a)))
+  (local.set $offset_b (struct.get $STRING 0 (local.get $b)))
+  (local.set $len_b (struct.get $STRING 1 (local.get $b)))
+  ;; Different lengths - not equal
+  (if (i32.ne (local.get $len_a) (local.get $len_b))
+    (then (return (i32.const 0)))
+  )
+  (local.set $i (i32.const 0))
+{equal_simd}  ;; Compare 8 bytes at a time while a whole word remains (only equality
+  ;; matters, so byte order does not)
+  (block $words_done
+    (loop $words
+      (br_if $words_done (i32.lt_u (i32.sub (local.get $len_a) (local.get $i)) (i32.const 8)))
+      (if (i64.ne
+            (i64.load (i32.add (local.get $offset_a) (local.get $i)))
+            (i64.load (i32.add (local.get $offset_b) (local.get $i))))
+        (then (return (i32.const 0)))
+      )
+      (local.set $i (i32.add (local.get $i) (i32.const 8)))
+      (br $words)
+    )
+  )
+  ;; Compare the remaining (< 8) bytes one by one
+  (block $done
+    (loop $loop
+      (br_if $done (i32.ge_u (local.get $i) (local.get $len_a)))
+      (if (i32.ne
+            (i32.load8_u (i32.add (local.get $offset_a) (local.get $i)))
+            (i32.load8_u (i32.add (local.get $offset_b) (local.get $i))))
+        (then (return (i32.const 0)))
+      )
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (br $loop)
+    )
+  )
+  (i32.const 1)
+)
+
+
+;; strings_compare: compare two STRING structs lexicographically
+;; Returns: -1 if a < b, 0 if a == b, 1 if a > b
+(func $strings_compare (param $a (ref $STRING)) (param $b (ref $STRING)) (result i32)
+  (local $offset_a i32)
+  (local $offset_b i32)
+  (local $len_a i32)
+  (local $len_b i32)
+  (local $min_len i32)
+  (local $i i32)
+  (local $char_a i32)
+  (local $char_b i32)
+  (local $word_a i64)
+  (local $word_b i64)
+  (local $shift i64)
+{compare_simd_locals}  (local.set $offset_a (struct.get $STRING 0 (local.get $a)))
+  (local.set $len_a (struct.get $STRING 1 (local.get $a)))
+  (local.set $offset_b (struct.get $STRING 0 (local.get $b)))
+  (local.set $len_b (struct.get $STRING 1 (local.get $b)))
+  ;; Get minimum length
+  (local.set $min_len (local.get $len_a))
+  (if (i32.lt_u (local.get $len_b) (local.get $len_a))
+    (then (local.set $min_len (local.get $len_b)))
+  )
+  (local.set $i (i32.const 0))
+{compare_simd}  ;; Skip the common prefix 8 bytes at a time. Memory is little-endian, so
+  ;; the first differing byte of two words is the lowest set byte of their
+  ;; xor; comparing just that byte gives the lexicographic order
+  (block $words_done
+    (loop $words
+      (br_if $words_done (i32.lt_u (i32.sub (local.get $min_len) (local.get $i)) (i32.const 8)))
+      (local.set $word_a (i64.load (i32.add (local.get $offset_a) (local.get $i))))
+      (local.set $word_b (i64.load (i32.add (local.get $offset_b) (local.get $i))))
+      (if (i64.ne (local.get $word_a) (local.get $word_b))
+        (then
+          (local.set $shift (i64.and
+            (i64.ctz (i64.xor (local.get $word_a) (local.get $word_b)))
+            (i64.const 56)))
+          (return (select (i32.const -1) (i32.const 1)
+            (i64.lt_u
+              (i64.and (i64.shr_u (local.get $word_a) (local.get $shift)) (i64.const 255))
+              (i64.and (i64.shr_u (local.get $word_b) (local.get $shift)) (i64.const 255)))))
+        )
+      )
+      (local.set $i (i32.add (local.get $i) (i32.const 8)))
+      (br $words)
+    )
+  )
+  ;; Compare the remaining (< 8) bytes one by one
+  (block $done
+    (loop $loop
+      (br_if $done (i32.ge_u (local.get $i) (local.get $min_len)))
+      (local.set $char_a (i32.load8_u (i32.add (local.get $offset_a) (local.get $i))))
+      (local.set $char_b (i32.load8_u (i32.add (local.get $offset_b) (local.get $i))))
+      (if (i32.lt_u (local.get $char_a) (local.get $char_b))
+        (then (return (i32.const -1)))
+      )
+      (if (i32.gt_u (local.get $char_a) (local.get $char_b))
+        (then (return (i32.const 1)))
+      )
+      (local.set $i (i32.add (local.get $i) (i32.const 1)))
+      (br $loop)
+    )
+  )
+  ;; All compared bytes are equal - shorter string is less
+  (if (i32.lt_u (local.get $len_a) (local.get $len_b))
+    (then (return (i32.const -1)))
+  )
+  (if (i32.gt_u (local.get $len_a) (local.get $len_b))
+    (then (return (i32.const 1)))
+  )
+  (i32.const 0)
+)
+"""
+
+STRINGS_CODE += _INDEX_OF_CODE.format(
+    index_of_simd=_INDEX_OF_SIMD if ENABLE_SIMD_STRINGS else "",
+    index_of_simd_locals=_INDEX_OF_SIMD_LOCALS if ENABLE_SIMD_STRINGS else "",
+    last_index_of_simd=_LAST_INDEX_OF_SIMD if ENABLE_SIMD_STRINGS else "",
+    last_index_of_simd_locals=_INDEX_OF_SIMD_LOCALS if ENABLE_SIMD_STRINGS else "",
+)
+
+STRINGS_CODE += _COMPARISONS_CODE.format(
+    equal_simd=_EQUAL_SIMD if ENABLE_SIMD_STRINGS else "",
+    compare_simd=_COMPARE_SIMD if ENABLE_SIMD_STRINGS else "",
+    compare_simd_locals=_COMPARE_SIMD_LOCALS if ENABLE_SIMD_STRINGS else "",
+)
+
+STRINGS_CODE += _PARSE_INT_BASE10_CODE.format(
+    digits_simd=_DIGITS_SIMD if ENABLE_SIMD_STRINGS else "",
+    digits_simd_locals=_DIGITS_SIMD_LOCALS if ENABLE_SIMD_STRINGS else "",
+)
+if ENABLE_SIMD_STRINGS:
+    STRINGS_CODE += _PARSE_8_DIGITS_CODE
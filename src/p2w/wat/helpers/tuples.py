@@ -285,44 +285,13 @@ TUPLES_CODE = """
   (local $i i32)
   (local $elem (ref null eq))
   (local $elem_str (ref $STRING))
-  (local $offset i32)
-  (local $comma_space (ref $STRING))
-  (local $paren_open (ref $STRING))
-  (local $paren_close (ref $STRING))
-  (local $trailing_comma (ref $STRING))
 
   (local.set $tuple_ref (ref.cast (ref $TUPLE) (local.get $tup)))
   (local.set $data (struct.get $TUPLE $data (local.get $tuple_ref)))
   (local.set $len (struct.get $TUPLE $len (local.get $tuple_ref)))
 
-  ;; Create "(" string
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 40))  ;; (
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 1)))
-  (local.set $paren_open (struct.new $STRING (local.get $offset) (i32.const 1)))
-
-  ;; Create ")" string
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 41))  ;; )
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 1)))
-  (local.set $paren_close (struct.new $STRING (local.get $offset) (i32.const 1)))
-
-  ;; Create ", " string
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 44))  ;; ,
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 32))  ;; space
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 2)))
-  (local.set $comma_space (struct.new $STRING (local.get $offset) (i32.const 2)))
-
-  ;; Create ",)" string for single-element tuple
-  (local.set $offset (global.get $string_heap))
-  (i32.store8 (local.get $offset) (i32.const 44))  ;; ,
-  (i32.store8 (i32.add (local.get $offset) (i32.const 1)) (i32.const 41))  ;; )
-  (global.set $string_heap (i32.add (global.get $string_heap) (i32.const 2)))
-  (local.set $trailing_comma (struct.new $STRING (local.get $offset) (i32.const 2)))
-
   ;; Start with "("
-  (local.set $result (local.get $paren_open))
+  (local.set $result (global.get $str_lparen))
   (local.set $i (i32.const 0))
 
   (block $done
@@ -332,7 +301,7 @@ TUPLES_CODE = """
       ;; Add ", " before non-first elements
       (if (i32.gt_s (local.get $i) (i32.const 0))
         (then
-          (local.set $result (call $string_concat (local.get $result) (local.get $comma_space)))
+          (local.set $result (call $string_concat (local.get $result) (global.get $str_comma_space)))
         )
       )
 
@@ -349,12 +318,12 @@ TUPLES_CODE = """
   ;; For single-element tuple, add trailing comma before closing paren
   (if (i32.eq (local.get $len) (i32.const 1))
     (then
-      (return (call $string_concat (local.get $result) (local.get $trailing_comma)))
+      (return (call $string_concat (local.get $result) (global.get $str_comma_rparen)))
     )
   )
 
   ;; Add ")"
-  (call $string_concat (local.get $result) (local.get $paren_close))
+  (call $string_concat (local.get $result) (global.get $str_rparen))
 )
 
 """
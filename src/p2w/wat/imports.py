@@ -70,11 +70,148 @@ IMPORTS_CODE = """
 
 ;; String heap for runtime-allocated strings
 (global $string_heap (mut i32) (i32.const 65536))
+;; Bytes of linear memory known to exist, cached by $ensure_memory so its
+;; common case is one compare (0 until the first call reads memory.size)
+(global $string_heap_limit (mut i32) (i32.const 0))
 
-;; Temporary storage for dict.pop() to cache updated dict between calls
-(global $tmp_pop_dict (mut (ref null eq)) (ref.null eq))
+;; Bumped on every class attribute assignment; invalidates $ATTR_IC entries
+(global $class_epoch (mut i32) (i32.const 1))
 """
 
+# Runtime string literals used by the helpers: global name -> text.
+# They live in a data segment below the user string pool (which starts at
+# offset 2048), so each one is a single immutable $STRING built at
+# instantiation instead of being re-stored byte by byte on every call.
+RUNTIME_STRINGS: dict[str, str] = {
+    "str___delitem__": "__delitem__",
+    "str___cause__": "__cause__",
+    "str_args": "args",
+    "str___matmul__": "__matmul__",
+    "str___rmatmul__": "__rmatmul__",
+    "str_class_prefix": "<class '",
+    "str_class_suffix": "'>",
+    "str_colon_space": ": ",
+    "str_AssertionError": "AssertionError",
+    "str_AttributeError": "AttributeError",
+    "str___init__": "__init__",
+    "str___eq__": "__eq__",
+    "str___lt__": "__lt__",
+    "str___gt__": "__gt__",
+    "str___le__": "__le__",
+    "str___ge__": "__ge__",
+    "str_lbracket": "[",
+    "str_rbracket": "]",
+    "str_comma_space": ", ",
+    "str_lbrace": "{",
+    "str_rbrace": "}",
+    "str_empty_set": "set()",
+    "str_GeneratorExit": "GeneratorExit",
+    "str_StopIteration": "StopIteration",
+    "str_close": "close",
+    "str_ValueError": "ValueError",
+    "str_TypeError": "TypeError",
+    "str_lparen": "(",
+    "str_rparen": ")",
+    "str_comma_rparen": ",)",
+    "str___str__": "__str__",
+    "str___repr__": "__repr__",
+    "str___len__": "__len__",
+    "str_digit_pairs": "".join(f"{n:02d}" for n in range(100)),
+    "str_None": "None",
+    "str_True": "True",
+    "str_False": "False",
+    "str_empty": "",
+    "str_empty_list": "[]",
+    "str_Ellipsis": "Ellipsis",
+    "str_super_prefix": "<super: <class '",
+    # Every ASCII byte in order, so chr(c) for c < 128 is a view at offset c
+    "str_ascii": "".join(chr(c) for c in range(128)),
+    # Indexed by an ASCII byte: the base whose prefix letter it is (0x/0b/0o)
+    "str_int_prefix_bases": "".join(
+        chr({"b": 2, "o": 8, "x": 16}.get(chr(c).lower(), 0)) for c in range(128)
+    ),
+    # Indexed by an ASCII byte: 0x20 for A-Z, 0x40 for a-z, 0 if uncased
+    "str_ascii_case_bits": "".join(
+        "\x20" if chr(c).isupper() else "\x40" if chr(c).islower() else "\x00"
+        for c in range(128)
+    ),
+}
+
+# Builtin type constructors by function table index (their position in
+# p2w.compiler.builtins.BUILTINS) -> type name. Each gets its full
+# "<class '...'>" text interned as $str_class_<name>.
+BUILTIN_TYPE_NAMES: dict[int, str] = {
+    6: "int",
+    7: "bool",
+    8: "str",
+    11: "float",
+    13: "list",
+    18: "dict",
+    19: "tuple",
+    20: "set",
+    30: "bytes",
+}
+RUNTIME_STRINGS.update({
+    f"str_class_{name}": f"<class '{name}'>" for name in BUILTIN_TYPE_NAMES.values()
+})
+
+RUNTIME_STRINGS_LIMIT = 2048
+
+
+def layout_runtime_strings() -> tuple[list[tuple[str, str, int]], str]:
+    """Assign linear-memory offsets to the runtime strings.
+
+    Longer texts are placed first, and a text that already occurs in the
+    placed data (e.g. "<class '" inside "<super: <class '", or "[" inside
+    str_ascii) reuses those bytes instead of being stored again. Returns
+    the layout and the data that backs it, starting at offset 0.
+    """
+    layout = []
+    data = ""
+    for name, text in sorted(RUNTIME_STRINGS.items(), key=lambda item: -len(item[1])):
+        start = data.find(text)
+        if start < 0:
+            start = len(data)
+            data += text
+        layout.append((name, text, len(data[:start].encode("utf-8"))))
+    assert len(data.encode("utf-8")) <= RUNTIME_STRINGS_LIMIT, (
+        "runtime strings overflow user pool"
+    )
+    return layout, data
+
+
+_RUNTIME_STRINGS_LAYOUT, _RUNTIME_STRINGS_BLOB = layout_runtime_strings()
+
+
+def _escape_wat_string(text: str) -> str:
+    return "".join(
+        f"\\{ord(c):02x}" if c < " " or c == "\x7f" else c
+        for c in text.replace("\\", "\\\\").replace('"', '\\"')
+    )
+
+
+RUNTIME_STRINGS_GLOBALS = "\n".join(
+    f"(global ${name} (ref $STRING) "
+    f"(struct.new $STRING (i32.const {offset}) (i32.const {len(text.encode())}) (i32.const 0)))"
+    for name, text, offset in _RUNTIME_STRINGS_LAYOUT
+)
+
+BUILTIN_CLASS_STRINGS_GLOBAL = (
+    "(global $builtin_class_strings (ref $ARRAY_STRING) "
+    f"(array.new_fixed $ARRAY_STRING {max(BUILTIN_TYPE_NAMES) + 1}\n  "
+    + "\n  ".join(
+        f"(global.get $str_class_{BUILTIN_TYPE_NAMES[idx]})"
+        if idx in BUILTIN_TYPE_NAMES
+        else "(ref.null $STRING)"
+        for idx in range(max(BUILTIN_TYPE_NAMES) + 1)
+    )
+    + "))"
+)
+
+RUNTIME_STRINGS_DATA = (
+    f'(data (i32.const 0) "{_escape_wat_string(_RUNTIME_STRINGS_BLOB)}")'
+)
+
 # These globals must come after type definitions
 POST_TYPES_GLOBALS = """
 ;; Ellipsis singleton (uses f32 field to be structurally unique)
@@ -83,4 +220,40 @@ POST_TYPES_GLOBALS = """
 ;; Boolean singletons for identity comparison (True is True, False is False)
 (global $TRUE (ref $BOOL) (struct.new $BOOL (i32.const 1)))
 (global $FALSE (ref $BOOL) (struct.new $BOOL (i32.const 0)))
+
+;; Set slot sentinels (see $SET_MARKER)
+(global $set_dummy (ref $SET_MARKER) (struct.new $SET_MARKER (i32.const 0)))
+(global $set_none (ref $SET_MARKER) (struct.new $SET_MARKER (i32.const 1)))
+
+;; Scratch args chains for property accessors flagged in $PROPERTY.flags:
+;; (self) for getters/deleters and (self, value) for setters. Not reentrant;
+;; only safe because such accessors copy their params out before anything else
+(global $scratch_args1 (ref $PAIR) (struct.new $PAIR (ref.null eq) (ref.null eq)))
+(global $scratch_args2_tail (ref $PAIR) (struct.new $PAIR (ref.null eq) (ref.null eq)))
+(global $scratch_args2 (ref $PAIR)
+  (struct.new $PAIR (ref.null eq) (global.get $scratch_args2_tail)))
+;; Head cell of the args chain for methods in $shared_args_methods, called
+;; through $call_method_ic (kind 4); the tail is the caller's own chain
+(global $scratch_method_args (ref $PAIR) (struct.new $PAIR (ref.null eq) (ref.null eq)))
+
+;; 10^0 .. 10^19 (the last as an unsigned i64), for $digits10_u64
+(global $pow10_u64 (ref $ARRAY_I64) (array.new_fixed $ARRAY_I64 20
+  (i64.const 1) (i64.const 10) (i64.const 100) (i64.const 1000)
+  (i64.const 10000) (i64.const 100000) (i64.const 1000000) (i64.const 10000000)
+  (i64.const 100000000) (i64.const 1000000000) (i64.const 10000000000) (i64.const 100000000000)
+  (i64.const 1000000000000) (i64.const 10000000000000) (i64.const 100000000000000) (i64.const 1000000000000000)
+  (i64.const 10000000000000000) (i64.const 100000000000000000) (i64.const 1000000000000000000) (i64.const 10000000000000000000)))
+
+;; 10^k for k in 0..22, every power of ten that is exact in an f64
+(global $pow10_f64 (ref $ARRAY_F64) (array.new_fixed $ARRAY_F64 23
+  (f64.const 1e0) (f64.const 1e1) (f64.const 1e2) (f64.const 1e3)
+  (f64.const 1e4) (f64.const 1e5) (f64.const 1e6) (f64.const 1e7)
+  (f64.const 1e8) (f64.const 1e9) (f64.const 1e10) (f64.const 1e11)
+  (f64.const 1e12) (f64.const 1e13) (f64.const 1e14) (f64.const 1e15)
+  (f64.const 1e16) (f64.const 1e17) (f64.const 1e18) (f64.const 1e19)
+  (f64.const 1e20) (f64.const 1e21) (f64.const 1e22)))
+
+;; Interned runtime string literals (see RUNTIME_STRINGS)
 """
+POST_TYPES_GLOBALS += RUNTIME_STRINGS_GLOBALS + "\n"
+POST_TYPES_GLOBALS += BUILTIN_CLASS_STRINGS_GLOBAL + "\n"
@@ -27,10 +27,11 @@ TYPES_CODE = """
 (type $INT64 (struct (field i64)))
 
 ;; STRING: offset in linear memory + length
-(type $STRING (struct (field i32) (field i32)))
+;; - hash: $hash_string of the contents, cached on first use (0 = not yet)
+(type $STRING (struct (field i32) (field i32) (field $hash (mut i32))))
 
 ;; BYTES: raw bytes in linear memory
-;; Has extra tag field to make it structurally distinct from STRING
+;; Has an immutable tag field to make it structurally distinct from STRING
 ;; (WASM GC uses structural typing, so identical structures are indistinguishable)
 (type $BYTES (struct (field i32) (field i32) (field i32)))
 
@@ -96,8 +97,58 @@ TYPES_CODE = """
 ;; DICT_V2: legacy alias for hash table dict (kept for backwards compat)
 (type $DICT_V2 (struct (field $table (ref $HASHTABLE))))
 
-;; SET: set using hash table for O(1) operations
-(type $SET (struct (field $table (ref $HASHTABLE))))
+;; =============================================================================
+;; Attribute Table Types
+;; =============================================================================
+;; NOTE: These must be defined BEFORE $CLASS/$OBJECT, which reference
+;; $ATTR_TABLE; the generic arrays live here for the same reason.
+
+;; ARRAY_ANY: growable array of any values (for array-backed lists)
+(type $ARRAY_ANY (array (mut (ref null eq))))
+
+;; ARRAY_I32: scratch array of indices (e.g. sort permutations)
+(type $ARRAY_I32 (array (mut i32)))
+
+;; ARRAY_I64: constant i64 tables (e.g. $pow10_u64)
+(type $ARRAY_I64 (array i64))
+
+;; ARRAY_F64: constant f64 tables (e.g. $pow10_f64)
+(type $ARRAY_F64 (array f64))
+
+;; ARRAY_STRING: constant string tables (e.g. $builtin_class_strings)
+(type $ARRAY_STRING (array (ref null $STRING)))
+
+;; ATTR_KEYS: attribute name slots (null = empty slot)
+(type $ATTR_KEYS (array (mut (ref null $STRING))))
+
+;; ATTR_TABLE: open-addressed (linear probing) name -> value map used for
+;; instance attributes and class dicts
+;; - keys/hashes/vals: parallel slot arrays (hashes caches $hash_string)
+;; - mask: capacity - 1 (capacity is a power of two)
+;; - count: number of occupied slots (grown at 75% load)
+(type $ATTR_TABLE (struct
+  (field $keys (mut (ref $ATTR_KEYS)))
+  (field $hashes (mut (ref $ARRAY_I32)))
+  (field $vals (mut (ref $ARRAY_ANY)))
+  (field $mask (mut i32))
+  (field $count (mut i32))
+))
+
+;; SET: open-addressed hash set probed like CPython's setobject.c
+;; - hashes/keys: parallel slot arrays (null key = free, $set_dummy = deleted)
+;; - mask: capacity - 1 (capacity is a power of two)
+;; - used: live entries; fill: live + deleted (drives resizing at 60% load)
+(type $SET (struct
+  (field $hashes (mut (ref $ARRAY_I32)))
+  (field $keys (mut (ref $ARRAY_ANY)))
+  (field $mask (mut i32))
+  (field $used (mut i32))
+  (field $fill (mut i32))
+))
+
+;; SET_MARKER: sentinel keys stored in $SET slots ($set_dummy marks a deleted
+;; slot, $set_none stands in for None so null can mean "free")
+(type $SET_MARKER (struct (field i8)))
 
 ;; =============================================================================
 ;; Class and Object Types
@@ -105,12 +156,21 @@ TYPES_CODE = """
 
 ;; CLASS: class metadata
 ;; - name: class name (STRING)
-;; - methods: method dict (PAIR chain of name->closure pairs)
+;; - methods: class dict (ATTR_TABLE of name -> closure/value)
 ;; - base: base class reference (for inheritance, null if none)
+;; - init/delitem: cached __init__ / __delitem__ lookups (dunder slots)
+;; - slots_epoch: $class_epoch value the slots were filled at (0 = never)
+;; - lookups: memo of inherited lookups (name -> value found along the MRO),
+;;   valid while lookups_epoch matches $class_epoch
 (type $CLASS (struct
   (field $name (ref $STRING))
-  (field $methods (mut (ref null eq)))
+  (field $methods (ref $ATTR_TABLE))
   (field $base (ref null $CLASS))
+  (field $init (mut (ref null eq)))
+  (field $delitem (mut (ref null eq)))
+  (field $slots_epoch (mut i32))
+  (field $lookups (mut (ref null $ATTR_TABLE)))
+  (field $lookups_epoch (mut i32))
 ))
 
 ;; INSTANCE_BASE: base type for all class instances (both regular and slotted)
@@ -122,12 +182,34 @@ TYPES_CODE = """
 
 ;; OBJECT: instance of a user-defined class (without __slots__)
 ;; - class: reference to the class
-;; - attrs: attribute dict (PAIR chain of name->value pairs)
+;; - attrs: attribute dict (ATTR_TABLE, allocated on first assignment)
 (type $OBJECT (sub final $INSTANCE_BASE (struct
   (field $class (ref $CLASS))
-  (field $attrs (mut (ref null eq)))
+  (field $attrs (mut (ref null $ATTR_TABLE)))
 )))
 
+;; ATTR_IC: per-call-site inline cache for attribute lookups on instances
+;; - class: class whose lookup result is cached (null = empty cache)
+;; - epoch: value of $class_epoch when the entry was filled
+;; - value: raw result of $class_lookup_method for that class and name
+;; - kind/closure: how method call sites invoke value (see $call_method_ic):
+;;   0 = generic dispatch, 1 = plain method, otherwise a $METHOD_WRAPPER kind,
+;;   or 4 = plain method listed in $shared_args_methods;
+;;   closure is value with any wrapper removed, func its table entry
+;; - next: older entries of a polymorphic method call site, most recently
+;;   used first (at most $call_ic_miss's limit; the global is the newest)
+;; - hash: $hash_string of the site's attribute name, computed at compile time
+(type $ATTR_IC (struct
+  (field $class (mut (ref null $CLASS)))
+  (field $epoch (mut i32))
+  (field $value (mut (ref null eq)))
+  (field $kind (mut i32))
+  (field $closure (mut (ref null $CLOSURE)))
+  (field $func (mut (ref null $FUNC)))
+  (field $next (mut (ref null $ATTR_IC)))
+  (field $hash i32)
+))
+
 ;; SUPER: super() proxy for calling parent methods
 ;; - class: the parent class to look up methods in
 ;; - self: the object instance to pass as self
@@ -136,31 +218,30 @@ TYPES_CODE = """
   (field $self (ref $OBJECT))
 ))
 
-;; STATICMETHOD: wrapper for static methods (no self parameter)
-;; Has extra padding field to distinguish from CLASSMETHOD (WASM GC uses structural typing)
-(type $STATICMETHOD (struct (field $closure (ref $CLOSURE)) (field $padding i32)))
-
-;; CLASSMETHOD: wrapper for class methods (receives class as first arg)
-;; Has different field order to distinguish from STATICMETHOD (WASM GC uses structural typing)
-(type $CLASSMETHOD (struct (field $padding i32) (field $closure (ref $CLOSURE))))
+;; METHOD_WRAPPER: @staticmethod / @classmethod wrapper around a closure
+;; - kind: 2 = staticmethod (no self), 3 = classmethod (receives the class);
+;;   the same codes as $ATTR_IC's kind, so dispatch branches on an i32
+;;   instead of testing one wrapper type per decorator
+(type $METHOD_WRAPPER (struct (field $kind i32) (field $closure (ref $CLOSURE))))
 
 ;; PROPERTY: property descriptor with getter, setter, and deleter
 ;; - getter: the getter closure (called on attribute access)
 ;; - setter: the setter closure (called on attribute assignment, null if read-only)
 ;; - deleter: the deleter closure (called on del, null if not deletable)
+;; - flags: 1/2/4 when the getter/setter/deleter never keeps its args chain
+;;   (it can then be called with scratch args); 8 for a cached_property,
+;;   whose getter result is stored as an instance attribute on first access
 (type $PROPERTY (struct
   (field $getter (ref null $CLOSURE))
   (field $setter (mut (ref null $CLOSURE)))
   (field $deleter (mut (ref null $CLOSURE)))
+  (field $flags i32)
 ))
 
 ;; =============================================================================
 ;; Collection Types
 ;; =============================================================================
 
-;; ARRAY_ANY: growable array of any values (for array-backed lists)
-(type $ARRAY_ANY (array (mut (ref null eq))))
-
 ;; LIST: array-backed list with O(1) indexed access
 ;; - data: the underlying array
 ;; - len: number of elements currently in use
@@ -5,7 +5,10 @@ from __future__ import annotations
 import ast
 
 from p2w.compiler.analysis import (
+    collect_assigned_attrs,
     collect_comprehension_locals,
+    collect_fixed_classes,
+    collect_fixed_instances,
     collect_iter_locals,
     collect_local_vars,
     collect_namedexpr_vars,
@@ -411,3 +414,89 @@ match x:
         names = collect_pattern_names(case.pattern)
         assert "first" in names
         assert "rest" in names
+
+
+class TestCollectFixedClasses:
+    """Test detection of classes whose name is never rebound."""
+
+    def test_plain_class(self):
+        tree = ast.parse("class A:\n    pass\nclass B:\n    pass\n")
+        assert collect_fixed_classes(tree.body) == {"A", "B"}
+
+    def test_rebound_names(self):
+        source = """
+class A:
+    pass
+class B:
+    pass
+class C:
+    pass
+class D:
+    pass
+A = None
+def f(B):
+    pass
+def C():
+    pass
+if True:
+    class D:
+        pass
+"""
+        tree = ast.parse(source)
+        assert collect_fixed_classes(tree.body) == set()
+
+
+class TestCollectAssignedAttrs:
+    """Test collection of assigned attribute names."""
+
+    def test_stores_and_deletes(self):
+        source = """
+a.x = 1
+b.y += 2
+del c.z
+print(d.w)
+"""
+        tree = ast.parse(source)
+        assert collect_assigned_attrs(tree.body) == {"x", "y", "z"}
+
+    def test_setattr(self):
+        tree = ast.parse("setattr(a, 'x', 1)\ndelattr(b, 'y')")
+        assert collect_assigned_attrs(tree.body) == {"x", "y"}
+
+    def test_computed_setattr_is_unknowable(self):
+        tree = ast.parse("setattr(a, name, 1)")
+        assert collect_assigned_attrs(tree.body) is None
+
+
+class TestCollectFixedInstances:
+    """Test collection of names bound to one class on every path."""
+
+    def test_every_binding_constructs_the_class(self):
+        source = """
+a = S(1)
+b = S(1)
+if flag:
+    b = T(2)
+c = S(1)
+c = S(2)
+d = S(1)
+d += 1
+e = S(1)
+for e in items:
+    pass
+f = S(1)
+def g():
+    global f
+    f = T(3)
+"""
+        tree = ast.parse(source)
+        assert collect_fixed_instances(tree.body, {"S", "T"}) == {"a": "S", "c": "S"}
+
+    def test_parameters(self):
+        func = ast.parse("""
+def m(self, p: S, q, r: T):
+    r = S(1)
+""").body[0]
+        assert isinstance(func, ast.FunctionDef)
+        fixed = collect_fixed_instances(func.body, {"S", "T"}, func.args, "T")
+        assert fixed == {"self": "T", "p": "S"}
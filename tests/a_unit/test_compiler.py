@@ -2,7 +2,18 @@
 
 from __future__ import annotations
 
+from io import StringIO
+
 from p2w.compiler import LexicalEnv, compile_to_wat
+from p2w.compiler.builtins import BUILTINS
+from p2w.compiler.compiler import hash_name
+from p2w.emitter import WATEmitter
+from p2w.wat.imports import (
+    BUILTIN_TYPE_NAMES,
+    RUNTIME_STRINGS,
+    RUNTIME_STRINGS_LIMIT,
+    layout_runtime_strings,
+)
 
 
 class TestLexicalEnv:
@@ -102,3 +113,73 @@ else:
         assert "if" in wat
         assert "else" in wat
         assert "end" in wat
+
+    def test_runtime_strings_below_user_pool(self) -> None:
+        wat = compile_to_wat('print("hello")')
+        # One segment at offset 0 holds every runtime string, longest first
+        assert '(data (i32.const 0) "00010203' in wat
+        assert "(global $str___delitem__ (ref $STRING)" in wat
+        # User literals are interned past the runtime pool
+        assert "(data (i32.const 2048) " in wat
+        assert '"hello")' in wat
+
+    def test_attr_inline_cache_carries_name_hash(self) -> None:
+        wat = compile_to_wat("""
+class A:
+    pass
+
+a = A()
+a.x = 1
+print(a.x)
+""")
+        assert f"(i32.const {hash_name('x')})))  ;; .x" in wat
+
+    def test_constant_string_slice_uses_fast_path(self) -> None:
+        wat = compile_to_wat("""
+s = "hello"
+print(s[1:3])
+print(s[-2:])
+""")
+        assert "(call $string_slice_fast)" in wat
+        assert "(call $slice)" in wat
+
+
+def test_hash_name_is_fnv1a() -> None:
+    assert hash_name("") == 2166136261
+    assert hash_name("a") == 0xE40C292C
+    assert hash_name("foobar") == 0xBF9CF968
+
+
+def test_runtime_text_matches_text() -> None:
+    code = "\n(func $f\n  (nop)\n)\n"
+    plain, cached = StringIO(), StringIO()
+    for stream, emit in ((plain, "text"), (cached, "runtime_text")):
+        emitter = WATEmitter(stream)
+        emitter.indent = 2
+        getattr(emitter, emit)(code)
+        getattr(emitter, emit)(code)
+    assert cached.getvalue() == plain.getvalue() == "  (func $f\n    (nop)\n  )\n" * 2
+
+
+def test_builtin_type_names_follow_builtin_order() -> None:
+    names = [builtin.name for builtin in BUILTINS]
+    for idx, name in BUILTIN_TYPE_NAMES.items():
+        assert names[idx] == name
+        assert RUNTIME_STRINGS[f"str_class_{name}"] == f"<class '{name}'>"
+
+
+def test_class_affixes_fit_fixed_stores() -> None:
+    # $type_name_to_string writes them with one i64 and one i16 store
+    assert len(RUNTIME_STRINGS["str_class_prefix"]) == 8
+    assert len(RUNTIME_STRINGS["str_class_suffix"]) == 2
+
+
+def test_runtime_strings_share_bytes() -> None:
+    layout, data = layout_runtime_strings()
+    raw = data.encode()
+    assert len(raw) <= RUNTIME_STRINGS_LIMIT
+    assert {name for name, _text, _offset in layout} == set(RUNTIME_STRINGS)
+    for _name, text, offset in layout:
+        assert raw[offset : offset + len(text.encode())] == text.encode()
+    offsets = {name: offset for name, _text, offset in layout}
+    assert offsets["str_class_prefix"] == offsets["str_super_prefix"] + 8
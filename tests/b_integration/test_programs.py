@@ -65,10 +65,14 @@ WORKING_PROGRAMS: set[str] = {
     "class.py",
     "closures_nested.py",
     "class_advanced.py",
+    "class_attr_cache.py",
+    "class_cached_property.py",
     "class_hierarchy.py",
     "class_inherit_super.py",
     "class_property_basic.py",
     "class_property.py",
+    "class_slots.py",
+    "class_slots_rebinding.py",
     "class_special_methods.py",
     "class_staticclassmethod.py",
     "class_super.py",
@@ -128,10 +132,13 @@ WORKING_PROGRAMS: set[str] = {
     "set_literals.py",
     "slices.py",
     "sort_advanced.py",
+    "sort_inplace.py",
     "sorted_comprehensive.py",
     "sorted_numbers.py",
     "special_methods.py",
     "starred.py",
+    "string_find_scan.py",
+    "string_heap_growth.py",
     "string_methods.py",
     "string_operations.py",
     "super_explicit.py",